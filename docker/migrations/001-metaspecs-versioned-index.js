@@ -0,0 +1,25 @@
+// Migração 001: índice único de metaspecs por (id, version) (IAD-7)
+//
+// Metaspecs passaram a ser versionadas com um documento por versão, então o
+// índice único { id: 1 } (id_1) impede gravar a versão 2 de uma metaspec.
+// mongo-init.js só roda em volumes novos; bancos existentes precisam desta
+// migração. Idempotente: pode ser executada mais de uma vez.
+//
+// Uso: pnpm db:migrate
+
+db = db.getSiblingDB('context_first_dev');
+
+const indexes = db.metaspecs.getIndexes().map((index) => index.name);
+
+// Cria o índice novo antes de remover o antigo, para nunca ficar sem unicidade
+if (!indexes.includes('id_1_version_-1')) {
+  db.metaspecs.createIndex({ id: 1, version: -1 }, { unique: true });
+  print('Created metaspecs index { id: 1, version: -1 } (unique)');
+}
+
+if (indexes.includes('id_1')) {
+  db.metaspecs.dropIndex('id_1');
+  print('Dropped metaspecs index id_1');
+}
+
+print('✅ Migration 001 complete: metaspecs unique on (id, version)');
@@ -0,0 +1,32 @@
+// Migração 002: índices de listagem com desempate por id (IAD-7)
+//
+// As listagens usam keyset pagination em (campo, id). Os índices antigos
+// terminavam no campo de ordenação, então páginas profundas precisavam de
+// SORT em memória. mongo-init.js só roda em volumes novos; bancos existentes
+// precisam desta migração. Idempotente: pode ser executada mais de uma vez.
+//
+// Uso: pnpm db:migrate
+
+db = db.getSiblingDB('context_first_dev');
+
+// [coleção, índice antigo, chave nova]
+const replacements = [
+  ['projects', 'user_id_1_created_at_-1', { user_id: 1, created_at: -1, id: -1 }],
+  ['demands', 'project_id_1_status_1', { project_id: 1, status: 1, created_at: -1, id: -1 }],
+  ['demands', 'project_id_1_created_at_-1', { project_id: 1, created_at: -1, id: -1 }],
+  ['metaspecs', 'demand_id_1_version_-1', { demand_id: 1, version: -1, id: -1 }],
+  ['checkpoints', 'demand_id_1_created_at_-1', { demand_id: 1, created_at: -1, id: -1 }],
+];
+
+for (const [collection, oldName, key] of replacements) {
+  // Cria o índice novo antes de remover o antigo (createIndex é idempotente)
+  db[collection].createIndex(key);
+
+  const names = db[collection].getIndexes().map((index) => index.name);
+  if (names.includes(oldName)) {
+    db[collection].dropIndex(oldName);
+    print(`Dropped ${collection} index ${oldName}`);
+  }
+}
+
+print('✅ Migration 002 complete: list indexes end with the id tiebreaker');
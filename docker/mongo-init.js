@@ -14,7 +14,8 @@ db.createCollection('projects', {
         name: { bsonType: 'string' },
         context_budget: { bsonType: 'object' },
         created_at: { bsonType: 'date' },
-        updated_at: { bsonType: 'date' }
+        updated_at: { bsonType: 'date' },
+        revision: { bsonType: ['int', 'long'] } // Controle de concorrência otimista
       }
     }
   }
@@ -33,7 +34,8 @@ db.createCollection('demands', {
         metaspecs: { bsonType: 'array' },
         context_budget: { bsonType: 'object' },
         created_at: { bsonType: 'date' },
-        updated_at: { bsonType: 'date' }
+        updated_at: { bsonType: 'date' },
+        revision: { bsonType: ['int', 'long'] } // Controle de concorrência otimista
       }
     }
   }
@@ -41,25 +43,33 @@ db.createCollection('demands', {
 
 db.createCollection('metaspecs');
 db.createCollection('checkpoints');
+db.createCollection('demand_status_rollups'); // Contagem de demands por status (por projeto)
 
 // Criar índices para performance (IAD-7)
+// Listagens usam keyset pagination em (campo, id): id no fim do índice evita SORT em memória
+// Bancos criados antes desta mudança: docker/migrations/002-keyset-list-indexes.js
 // projects collection
 db.projects.createIndex({ id: 1 }, { unique: true });
-db.projects.createIndex({ user_id: 1, created_at: -1 });
+db.projects.createIndex({ user_id: 1, created_at: -1, id: -1 }); // list_by_owner (keyset)
 
 // demands collection
 db.demands.createIndex({ id: 1 }, { unique: true });
-db.demands.createIndex({ project_id: 1, status: 1 });
-db.demands.createIndex({ project_id: 1, created_at: -1 });
+db.demands.createIndex({ project_id: 1, status: 1, created_at: -1, id: -1 }); // list_by_project(status), count_by_status
+db.demands.createIndex({ project_id: 1, created_at: -1, id: -1 }); // list_by_project (keyset)
+
+// demand_status_rollups collection
+db.demand_status_rollups.createIndex({ project_id: 1 }, { unique: true }); // get_status_rollup
 
 // metaspecs collection
-db.metaspecs.createIndex({ id: 1 }, { unique: true });
-db.metaspecs.createIndex({ demand_id: 1, version: -1 });
+db.metaspecs.createIndex({ id: 1, version: -1 }, { unique: true }); // one document per version (bancos antigos: migrations/001)
+db.metaspecs.createIndex({ demand_id: 1, version: -1, id: -1 }); // list_metaspecs (keyset), get_latest
 
 // checkpoints collection
 db.checkpoints.createIndex({ id: 1 }, { unique: true });
-db.checkpoints.createIndex({ demand_id: 1, created_at: -1 });
+db.checkpoints.createIndex({ demand_id: 1, created_at: -1, id: -1 }); // list_checkpoints (keyset)
 db.checkpoints.createIndex({ expires_at: 1 }, { expireAfterSeconds: 0 }); // TTL index
+db.checkpoints.createIndex({ keyframe_id: 1, chain_position: 1 }, { sparse: true }); // Delta chains
+db.checkpoints.createIndex({ parent_id: 1 }, { sparse: true }); // Delta chains
 
 // Criar usuário de aplicação (não root)
 db.createUser({
@@ -74,6 +84,6 @@ db.createUser({
 });
 
 print('✅ MongoDB initialization complete!');
-print('Collections created: projects, demands, metaspecs, checkpoints');
+print('Collections created: projects, demands, metaspecs, checkpoints, demand_status_rollups');
 print('Indexes created for performance (including unique indexes on id fields)');
 print('Application user created: context_first_app');
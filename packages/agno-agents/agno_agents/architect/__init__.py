@@ -2,16 +2,49 @@
 Architect Agent
 
 Generates architecture design from specs.
-TODO: Implement full agent in IAD-12
 """
 
+from typing import AsyncIterator, Optional
 
-class ArchitectAgent:
-    """Architect agent placeholder."""
+from agno_agents.base import BaseAgent, TokenBudget
 
-    def __init__(self):
-        pass
+
+class ArchitectAgent(BaseAgent):
+    """Designs the architecture that implements a spec."""
+
+    name = "architect"
+    system_prompt = (
+        "You are a software architect. Given a metaspec, describe the "
+        "components, data flow and interfaces needed to implement it."
+    )
 
     async def design(self, spec: str) -> dict:
-        """Generate architecture design."""
-        raise NotImplementedError("ArchitectAgent will be implemented in IAD-12")
+        """
+        Generate architecture design.
+
+        Args:
+            spec: Metaspec markdown
+
+        Returns:
+            {"content": design markdown, "usage": {...}, "model": name}
+        """
+        response = await self._complete(spec)
+        return self._result(response)
+
+    def stream_design(
+        self, spec: str, budget: Optional[TokenBudget] = None
+    ) -> AsyncIterator[dict]:
+        """
+        Generate architecture design, yielding it as it is written.
+
+        Args:
+            spec: Metaspec markdown
+            budget: Tokens the generation may use; None = unlimited
+
+        Yields:
+            {"delta": text, "usage": running totals, "cached": bool}
+
+        Raises:
+            TokenBudgetExceededError: When budget would be exceeded
+        """
+        return self._stream(spec, budget)
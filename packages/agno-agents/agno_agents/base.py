@@ -0,0 +1,132 @@
+"""
+Base Agent
+
+Shared plumbing of the SPARC+DD agents: each one renders a prompt, sends
+it to its ModelClient and returns the text with the tokens it used, or
+streams it piece by piece.
+"""
+
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Dict, Optional, Protocol
+
+from agno_agents.exceptions import TokenBudgetExceededError
+from agno_agents.models import (
+    DEFAULT_MAX_TOKENS,
+    ModelClient,
+    ModelRequest,
+    ModelResponse,
+)
+
+
+class TokenBudget(Protocol):
+    """What a stream needs from a budget (e.g. a project's ContextBudget)."""
+
+    @property
+    def remaining_tokens(self) -> int: ...
+
+
+class BaseAgent:
+    """
+    Agent bound to a model client.
+
+    Subclasses set name (used in requests and usage reports) and
+    system_prompt.
+    """
+
+    name = "agent"
+    system_prompt = ""
+
+    def __init__(
+        self,
+        model: ModelClient,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        temperature: float = 0.0,
+        cacheable: Optional[bool] = None,
+    ):
+        """
+        Initialize agent.
+
+        Args:
+            model: Client that runs the completions
+            max_tokens: Output token limit per call
+            temperature: Sampling temperature
+            cacheable: Whether a response cache may replay answers (None:
+                only when temperature is 0, i.e. for deterministic calls)
+        """
+        self.model = model
+        self.max_tokens = max_tokens
+        self.temperature = temperature
+        self.cacheable = temperature == 0.0 if cacheable is None else cacheable
+
+    def _request(self, prompt: str) -> ModelRequest:
+        """Completion request for prompt under this agent's system prompt."""
+        return ModelRequest(
+            agent=self.name,
+            system=self.system_prompt,
+            prompt=prompt,
+            max_tokens=self.max_tokens,
+            temperature=self.temperature,
+            cacheable=self.cacheable,
+        )
+
+    async def _complete(self, prompt: str) -> ModelResponse:
+        """Run one completion."""
+        return await self.model.complete(self._request(prompt))
+
+    async def _stream(
+        self, prompt: str, budget: Optional[TokenBudget] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run one completion as a stream, enforcing budget as it goes.
+
+        Args:
+            prompt: User prompt
+            budget: Tokens this generation may bill (None = unlimited);
+                replayed cache hits are not billed
+
+        Yields:
+            {"delta": new text, "usage": running totals, "cached": bool}
+
+        Raises:
+            TokenBudgetExceededError: As soon as the billed tokens would
+                pass budget.remaining_tokens; the generation is cancelled
+        """
+        remaining = None if budget is None else budget.remaining_tokens
+        usage = {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0}
+        billed = 0
+        async with aclosing(self.model.stream(self._request(prompt))) as chunks:
+            async for chunk in chunks:
+                usage["input_tokens"] += chunk.input_tokens
+                usage["output_tokens"] += chunk.output_tokens
+                tokens = chunk.input_tokens + chunk.output_tokens
+                usage["total_tokens"] += tokens
+                if not chunk.cached:
+                    billed += tokens
+                    if remaining is not None and billed > remaining:
+                        raise TokenBudgetExceededError(self.name, billed, remaining)
+                yield {
+                    "delta": chunk.text,
+                    "usage": dict(usage),
+                    "cached": chunk.cached,
+                }
+
+    @staticmethod
+    def _result(response: ModelResponse, **extra: Any) -> Dict[str, Any]:
+        """
+        Agent method result.
+
+        Returns:
+            {"content": text, "usage": {...}, "model": name, "cached": bool,
+            **extra}
+        """
+        return {
+            "content": response.text,
+            "usage": {
+                "input_tokens": response.input_tokens,
+                "output_tokens": response.output_tokens,
+                "total_tokens": response.total_tokens,
+            },
+            "model": response.model,
+            "cached": response.cached,
+            **extra,
+        }
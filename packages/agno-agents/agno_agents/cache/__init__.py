@@ -0,0 +1,16 @@
+"""
+LLM Response Caching
+
+Replays model answers for repeated identical requests (same agent,
+model, prompt and parameters) instead of paying for them again.
+"""
+
+from agno_agents.cache.cached_model import CachedModel
+from agno_agents.cache.response_cache import CacheStats, ResponseCache, cache_key
+
+__all__ = [
+    "CacheStats",
+    "CachedModel",
+    "ResponseCache",
+    "cache_key",
+]
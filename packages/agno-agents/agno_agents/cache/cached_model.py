@@ -0,0 +1,110 @@
+"""
+Cached Model
+
+ModelClient decorator that replays responses from a ResponseCache.
+Requests marked cacheable=False (non-deterministic calls) always reach
+the wrapped model. Replayed responses have cached=True, so callers can
+leave them out of token accounting: the tokens were billed once, by the
+call that filled the cache.
+
+A streamed answer is stored once the stream has been read to the end; a
+stream closed early leaves nothing behind. Cache hits are replayed as a
+single chunk.
+"""
+
+import dataclasses
+from contextlib import aclosing
+from typing import AsyncIterator, List
+
+from agno_agents.cache.response_cache import CacheStats, ResponseCache, cache_key
+from agno_agents.models import ModelChunk, ModelClient, ModelRequest, ModelResponse
+
+
+class CachedModel:
+    """
+    Read-through cache in front of a model client.
+
+    Usage:
+        model = CachedModel(claude, ResponseCache(directory=".agent-cache"))
+        spec = await SpecWriterAgent(model).generate(title, description)
+        model.stats.hit_rate
+    """
+
+    def __init__(self, model: ModelClient, cache: ResponseCache):
+        """
+        Initialize decorator.
+
+        Args:
+            model: Client that answers cache misses
+            cache: Where responses are kept
+        """
+        self._model = model
+        self._cache = cache
+        self.name = model.name
+
+    @property
+    def stats(self) -> CacheStats:
+        """Counters of the underlying cache."""
+        return self._cache.stats
+
+    async def complete(self, request: ModelRequest) -> ModelResponse:
+        """
+        Answer a request from cache when possible.
+
+        Args:
+            request: Completion request
+
+        Returns:
+            Cached response (cached=True) or a fresh one from the model
+        """
+        if not request.cacheable:
+            self._cache.stats.bypassed += 1
+            return await self._model.complete(request)
+
+        key = cache_key(request, self.name)
+        cached = await self._cache.get(key)
+        if cached is not None:
+            return dataclasses.replace(cached, cached=True)
+
+        response = await self._model.complete(request)
+        await self._cache.set(key, response)
+        return response
+
+    async def stream(self, request: ModelRequest) -> AsyncIterator[ModelChunk]:
+        """
+        Stream an answer, from cache when possible.
+
+        Args:
+            request: Completion request
+
+        Yields:
+            The cached answer as one chunk (cached=True), or the model's
+            chunks as they arrive
+        """
+        if not request.cacheable:
+            self._cache.stats.bypassed += 1
+            async with aclosing(self._model.stream(request)) as chunks:
+                async for chunk in chunks:
+                    yield chunk
+            return
+
+        key = cache_key(request, self.name)
+        cached = await self._cache.get(key)
+        if cached is not None:
+            yield ModelChunk(
+                cached.text, cached.input_tokens, cached.output_tokens, cached=True
+            )
+            return
+
+        parts: List[str] = []
+        input_tokens = output_tokens = 0
+        async with aclosing(self._model.stream(request)) as chunks:
+            async for chunk in chunks:
+                parts.append(chunk.text)
+                input_tokens += chunk.input_tokens
+                output_tokens += chunk.output_tokens
+                yield chunk
+        await self._cache.set(
+            key,
+            ModelResponse("".join(parts), input_tokens, output_tokens, self.name),
+        )
@@ -0,0 +1,307 @@
+"""
+Response Cache
+
+Content-addressed store of model responses. Keys are SHA-256 hashes of
+everything that determines the answer (agent, model, system prompt,
+prompt and sampling parameters), so identical requests share one entry
+and any change to the inputs is a different key.
+
+Two tiers:
+
+- memory: bounded LRU, evicts the least recently used entry when full;
+- disk (optional): one JSON file per key, survives restarts and is
+  shared by processes pointing at the same directory; the oldest files
+  are removed when the directory grows past max_disk_bytes.
+
+Entries older than ttl_seconds are treated as missing in both tiers.
+The disk tier is best effort: a failed write is logged and the answer is
+still returned, since the model has already paid for it.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+from agno_agents.models import ModelRequest, ModelResponse
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600.0
+DEFAULT_MAX_DISK_BYTES = 256 * 1024 * 1024
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheStats:
+    """
+    Cache counters.
+
+    Attributes:
+        memory_hits: Lookups answered by the memory tier
+        disk_hits: Lookups answered by the disk tier
+        misses: Lookups that went to the model
+        bypassed: Non-cacheable requests (not counted as lookups)
+        evictions: Entries dropped to stay within the size limits
+        expirations: Entries dropped because their TTL elapsed
+    """
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    bypassed: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hits(self) -> int:
+        """Lookups answered by either tier."""
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from cache (0.0 when unused)."""
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return self.hits / lookups
+
+
+def cache_key(request: ModelRequest, model: str) -> str:
+    """
+    Content address of a request.
+
+    Args:
+        request: Completion request (cacheable is not part of the key)
+        model: Name of the model that answers it
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    material = json.dumps(
+        [
+            request.agent,
+            model,
+            request.system,
+            request.prompt,
+            request.max_tokens,
+            request.temperature,
+        ],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Memory LRU in front of an optional on-disk store, both with TTL"""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS,
+        directory: Optional[str] = None,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Memory tier size
+            ttl_seconds: Entry lifetime (None = no expiry)
+            directory: Disk tier location (None = memory only)
+            max_disk_bytes: Disk tier size
+            clock: Wall-clock time in seconds (disk entries outlive the
+                process, so this must not be a monotonic clock)
+
+        Raises:
+            ValueError: If a size is < 1 or ttl_seconds <= 0
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        if max_disk_bytes < 1:
+            raise ValueError("max_disk_bytes must be >= 1")
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be > 0")
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._directory = Path(directory) if directory is not None else None
+        self._max_disk_bytes = max_disk_bytes
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, ModelResponse]]" = OrderedDict()
+        self._disk_bytes: Optional[int] = None  # Scanned on first write
+        # Disk I/O runs in worker threads: guards _disk_bytes and stats
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> Optional[ModelResponse]:
+        """
+        Look up a key, counting a hit or a miss.
+
+        Args:
+            key: cache_key() of the request
+
+        Returns:
+            Cached response, or None if absent or expired
+        """
+        response = self._get_memory(key)
+        if response is not None:
+            self._count("memory_hits")
+            return response
+
+        if self._directory is not None:
+            entry = await asyncio.to_thread(self._read_file, key)
+            if entry is not None:
+                stored_at, response = entry
+                self._set_memory(key, stored_at, response)
+                self._count("disk_hits")
+                return response
+
+        self._count("misses")
+        return None
+
+    async def set(self, key: str, response: ModelResponse) -> None:
+        """
+        Store a response in both tiers.
+
+        A disk write that fails is logged, not raised: the entry then only
+        lives in memory.
+
+        Args:
+            key: cache_key() of the request
+            response: Response to replay for that key
+        """
+        stored_at = self._clock()
+        self._set_memory(key, stored_at, response)
+        if self._directory is not None:
+            try:
+                await asyncio.to_thread(self._write_file, key, stored_at, response)
+            except OSError as exc:
+                logger.warning("response cache: disk write of %s failed: %s", key, exc)
+
+    def clear(self) -> None:
+        """Remove the memory entries (counters and disk files are kept)."""
+        self._entries.clear()
+
+    def _count(self, counter: str) -> None:
+        """Increment a stats counter (called from the loop and from threads)."""
+        with self._lock:
+            setattr(self.stats, counter, getattr(self.stats, counter) + 1)
+
+    # ---- memory tier ----
+
+    def _expired(self, stored_at: float) -> bool:
+        return self._ttl is not None and stored_at + self._ttl < self._clock()
+
+    def _get_memory(self, key: str) -> Optional[ModelResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, response = entry
+        if self._expired(stored_at):
+            del self._entries[key]
+            self._count("expirations")
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    def _set_memory(self, key: str, stored_at: float, response: ModelResponse) -> None:
+        self._entries[key] = (stored_at, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._count("evictions")
+
+    # ---- disk tier (runs in a worker thread) ----
+
+    def _path(self, key: str) -> Path:
+        return self._directory / key[:2] / f"{key}.json"
+
+    def _read_file(self, key: str) -> Optional[Tuple[float, ModelResponse]]:
+        path = self._path(key)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            stored_at = float(data["stored_at"])
+            response = ModelResponse(**data["response"])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError):
+            # Corrupt or from an incompatible version: treat as missing
+            self._remove(path)
+            return None
+        if self._expired(stored_at):
+            self._remove(path)
+            self._count("expirations")
+            return None
+        return stored_at, response
+
+    def _write_file(self, key: str, stored_at: float, response: ModelResponse) -> None:
+        path = self._path(key)
+        payload = json.dumps(
+            {"stored_at": stored_at, "response": asdict(response)},
+            ensure_ascii=False,
+        ).encode("utf-8")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write a uniquely named file then rename it, so readers never see
+        # a half-written file and concurrent writers of a key never collide
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent, prefix=f".{key}.", suffix=".tmp", delete=False
+        ) as partial:
+            partial.write(payload)
+        try:
+            with self._lock:
+                if self._disk_bytes is None:
+                    self._disk_bytes = sum(size for _, size, _ in self._scan())
+                previous = path.stat().st_size if path.exists() else 0
+                os.replace(partial.name, path)
+                self._disk_bytes += len(payload) - previous
+                if self._disk_bytes > self._max_disk_bytes:
+                    self._shrink(keep=path)
+        finally:
+            self._remove(Path(partial.name))
+
+    def _scan(self):
+        """(mtime, size, path) of every cache file."""
+        files = []
+        for path in self._directory.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        return files
+
+    def _shrink(self, keep: Path) -> None:
+        """
+        Remove the oldest files until the directory fits max_disk_bytes.
+
+        Called with _lock held.
+        """
+        files = sorted(self._scan())
+        self._disk_bytes = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if self._disk_bytes <= self._max_disk_bytes:
+                break
+            if path == keep:
+                continue
+            self._remove(path)
+            self._disk_bytes -= size
+            self.stats.evictions += 1  # _lock is held
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
@@ -2,16 +2,55 @@
 Coder Agent
 
 Generates code from architecture and specs.
-TODO: Implement full agent in IAD-12
 """
 
+from typing import AsyncIterator, Optional
 
-class CoderAgent:
-    """Coder agent placeholder."""
+from agno_agents.base import BaseAgent, TokenBudget
 
-    def __init__(self):
-        pass
+
+class CoderAgent(BaseAgent):
+    """Implements an architecture design."""
+
+    name = "coder"
+    system_prompt = (
+        "You are a senior engineer. Implement the architecture so that it "
+        "satisfies the spec. Answer with code only."
+    )
 
     async def code(self, architecture: str, spec: str) -> dict:
-        """Generate code implementation."""
-        raise NotImplementedError("CoderAgent will be implemented in IAD-12")
+        """
+        Generate code implementation.
+
+        Args:
+            architecture: Architecture design markdown
+            spec: Metaspec markdown
+
+        Returns:
+            {"content": code, "usage": {...}, "model": name}
+        """
+        response = await self._complete(_prompt(architecture, spec))
+        return self._result(response)
+
+    def stream_code(
+        self, architecture: str, spec: str, budget: Optional[TokenBudget] = None
+    ) -> AsyncIterator[dict]:
+        """
+        Generate code implementation, yielding it as it is written.
+
+        Args:
+            architecture: Architecture design markdown
+            spec: Metaspec markdown
+            budget: Tokens the generation may use; None = unlimited
+
+        Yields:
+            {"delta": text, "usage": running totals, "cached": bool}
+
+        Raises:
+            TokenBudgetExceededError: When budget would be exceeded
+        """
+        return self._stream(_prompt(architecture, spec), budget)
+
+
+def _prompt(architecture: str, spec: str) -> str:
+    return f"## Spec\n\n{spec}\n\n## Architecture\n\n{architecture}"
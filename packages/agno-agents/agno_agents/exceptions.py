@@ -0,0 +1,24 @@
+"""
+Agent Exceptions
+"""
+
+
+class TokenBudgetExceededError(Exception):
+    """
+    Raised when a streamed generation would use more tokens than the
+    budget it was given; the generation is cancelled.
+
+    Attributes:
+        agent: Name of the agent whose stream was aborted
+        used: Tokens the stream had billed when it was aborted
+        remaining: Tokens the budget allowed
+    """
+
+    def __init__(self, agent: str, used: int, remaining: int):
+        super().__init__(
+            f"{agent} stream aborted: {used} tokens used, "
+            f"only {remaining} remaining in the context budget"
+        )
+        self.agent = agent
+        self.used = used
+        self.remaining = remaining
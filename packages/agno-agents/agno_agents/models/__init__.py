@@ -0,0 +1,26 @@
+"""
+Model Clients
+
+What the agents need from an LLM: one completion per request, with its
+token usage. Agents receive a ModelClient instead of building their own,
+so the same agent runs against Claude in production and against
+FakeModel in tests.
+"""
+
+from agno_agents.models.base import (
+    DEFAULT_MAX_TOKENS,
+    ModelChunk,
+    ModelClient,
+    ModelRequest,
+    ModelResponse,
+)
+from agno_agents.models.fake import FakeModel
+
+__all__ = [
+    "DEFAULT_MAX_TOKENS",
+    "FakeModel",
+    "ModelChunk",
+    "ModelClient",
+    "ModelRequest",
+    "ModelResponse",
+]
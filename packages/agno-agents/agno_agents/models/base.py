@@ -0,0 +1,96 @@
+"""
+Model Client Types
+
+Request/response shapes and the ModelClient protocol.
+"""
+
+from dataclasses import dataclass
+from typing import AsyncIterator, Protocol
+
+DEFAULT_MAX_TOKENS = 4096
+
+
+@dataclass(frozen=True)
+class ModelRequest:
+    """
+    One completion request.
+
+    Attributes:
+        agent: Name of the calling agent (e.g. "spec_writer")
+        system: System prompt
+        prompt: User prompt
+        max_tokens: Output token limit
+        temperature: Sampling temperature (0.0 = as deterministic as possible)
+        cacheable: False for calls whose answer must not be reused (e.g.
+            sampling several different drafts)
+    """
+
+    agent: str
+    system: str
+    prompt: str
+    max_tokens: int = DEFAULT_MAX_TOKENS
+    temperature: float = 0.0
+    cacheable: bool = True
+
+
+@dataclass(frozen=True)
+class ModelResponse:
+    """
+    Completed generation and what it cost.
+
+    Attributes:
+        text: Generated text
+        input_tokens: Prompt tokens billed
+        output_tokens: Generated tokens billed
+        model: Model that produced the text
+        cached: True if replayed from a response cache (the tokens were
+            billed by the original call, not by this one)
+    """
+
+    text: str
+    input_tokens: int
+    output_tokens: int
+    model: str
+    cached: bool = False
+
+    @property
+    def total_tokens(self) -> int:
+        """Input plus output tokens."""
+        return self.input_tokens + self.output_tokens
+
+
+@dataclass(frozen=True)
+class ModelChunk:
+    """
+    Piece of a streamed generation.
+
+    Token counts are increments: summing them over a stream gives the
+    usage of the whole generation (input tokens usually arrive with the
+    first chunk).
+
+    Attributes:
+        text: Text generated since the previous chunk
+        input_tokens: Prompt tokens billed with this chunk
+        output_tokens: Generated tokens billed with this chunk
+        cached: True if replayed from a response cache
+    """
+
+    text: str
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached: bool = False
+
+
+class ModelClient(Protocol):
+    """
+    Anything that turns a ModelRequest into a ModelResponse.
+
+    stream() yields the same generation as complete() in pieces; closing
+    the iterator early cancels the generation.
+    """
+
+    name: str
+
+    async def complete(self, request: ModelRequest) -> ModelResponse: ...
+
+    def stream(self, request: ModelRequest) -> AsyncIterator[ModelChunk]: ...
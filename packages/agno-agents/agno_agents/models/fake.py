@@ -0,0 +1,121 @@
+"""
+Fake Model
+
+Deterministic, offline ModelClient for tests and local runs. The same
+request always produces the same text and token counts, so pipelines
+built on the agents can be tested end to end without network or cost.
+"""
+
+import asyncio
+import hashlib
+import re
+from typing import AsyncIterator, Dict, List, Mapping, Optional
+
+from agno_agents.models.base import ModelChunk, ModelRequest, ModelResponse
+
+
+class FakeModel:
+    """
+    ModelClient that answers from canned replies.
+
+    Each agent gets replies[agent] if set, otherwise a stable text derived
+    from a hash of the request. Tokens are counted as whitespace-separated
+    words; stream() yields one word (one output token) per chunk.
+
+    Usage:
+        model = FakeModel(replies={"reviewer": "APPROVED"})
+        spec = await SpecWriterAgent(model).generate("Login", "OAuth login")
+    """
+
+    name = "fake"
+
+    def __init__(self, replies: Optional[Mapping[str, str]] = None, delay: float = 0.0):
+        """
+        Initialize fake model.
+
+        Args:
+            replies: Fixed reply per agent name
+            delay: Seconds each completion takes (to exercise concurrency)
+        """
+        self._replies: Dict[str, str] = dict(replies or {})
+        self._delay = delay
+        self.requests: List[ModelRequest] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.streams_cancelled = 0
+
+    async def complete(self, request: ModelRequest) -> ModelResponse:
+        """
+        Answer a request.
+
+        Args:
+            request: Completion request
+
+        Returns:
+            Deterministic response for the request
+        """
+        self._start(request)
+        try:
+            if self._delay:
+                await asyncio.sleep(self._delay)
+            text = self._reply(request)
+        finally:
+            self.in_flight -= 1
+        return ModelResponse(
+            text=text,
+            input_tokens=_input_tokens(request),
+            output_tokens=_count_tokens(text),
+            model=self.name,
+        )
+
+    async def stream(self, request: ModelRequest) -> AsyncIterator[ModelChunk]:
+        """
+        Answer a request word by word.
+
+        Args:
+            request: Completion request
+
+        Yields:
+            Chunks whose concatenation is the complete() text
+        """
+        self._start(request)
+        finished = False
+        try:
+            if self._delay:
+                await asyncio.sleep(self._delay)
+            input_tokens = _input_tokens(request)
+            for word in re.findall(r"\S+\s*", self._reply(request)):
+                yield ModelChunk(word, input_tokens=input_tokens, output_tokens=1)
+                input_tokens = 0
+                await asyncio.sleep(0)
+            finished = True
+        finally:
+            self.in_flight -= 1
+            if not finished:
+                self.streams_cancelled += 1
+
+    def _start(self, request: ModelRequest) -> None:
+        self.requests.append(request)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def _reply(self, request: ModelRequest) -> str:
+        return self._replies.get(request.agent) or _echo(request)
+
+
+def _echo(request: ModelRequest) -> str:
+    """Stable placeholder text for a request."""
+    digest = hashlib.sha256(
+        f"{request.agent}\0{request.system}\0{request.prompt}".encode()
+    ).hexdigest()[:12]
+    return f"{request.agent} output {digest}"
+
+
+def _input_tokens(request: ModelRequest) -> int:
+    """Prompt tokens of a request."""
+    return _count_tokens(request.system) + _count_tokens(request.prompt)
+
+
+def _count_tokens(text: str) -> int:
+    """Rough token count (words)."""
+    return len(text.split())
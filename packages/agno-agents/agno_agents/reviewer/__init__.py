@@ -2,16 +2,119 @@
 Reviewer Agent
 
 Reviews code and validates against specs (Jidoka principle).
-TODO: Implement full agent in IAD-12
+
+ReviewerAgent checks spec conformance. SecurityReviewerAgent and
+StyleReviewerAgent look at the same code from other angles, and
+ReviewerEnsemble runs several of them at once with one merged report.
 """
 
+from typing import List
+
+from agno_agents.base import BaseAgent
+from agno_agents.models import ModelClient
+from agno_agents.reviewer.ensemble import (
+    DEFAULT_CHECK_TIMEOUT,
+    CheckResult,
+    CheckStatus,
+    ReviewCheck,
+    ReviewerEnsemble,
+    ReviewReport,
+)
+
+APPROVED = "APPROVED"
+CHANGES_REQUESTED = "CHANGES REQUESTED"
+
+_VERDICT_FORMAT = (
+    f"Start your answer with a line containing only {APPROVED} or "
+    f"{CHANGES_REQUESTED}, followed by your comments."
+)
+
 
-class ReviewerAgent:
-    """Reviewer agent placeholder."""
+class ReviewerAgent(BaseAgent):
+    """Reviews code against its spec."""
 
-    def __init__(self):
-        pass
+    name = "reviewer"
+    # A rejection from a blocking reviewer stops the line
+    blocking = True
+    system_prompt = (
+        "You are a strict code reviewer. Check the code against the spec. "
+        + _VERDICT_FORMAT
+    )
 
     async def review(self, code: str, spec: str) -> dict:
-        """Review code against spec."""
-        raise NotImplementedError("ReviewerAgent will be implemented in IAD-12")
+        """
+        Review code against spec.
+
+        Jidoka: anything but an explicit APPROVED verdict counts as a
+        rejection, so an unparseable answer stops the line.
+
+        Args:
+            code: Code to review
+            spec: Metaspec markdown
+
+        Returns:
+            {"approved": bool, "comments": str, "content": full answer,
+            "usage": {...}, "model": name}
+        """
+        response = await self._complete(f"## Spec\n\n{spec}\n\n## Code\n\n{code}")
+        verdict, _, comments = response.text.strip().partition("\n")
+        return self._result(
+            response,
+            approved=verdict.strip().upper() == APPROVED,
+            comments=comments.strip(),
+        )
+
+
+class SecurityReviewerAgent(ReviewerAgent):
+    """Looks for vulnerabilities in the code."""
+
+    name = "security"
+    system_prompt = (
+        "You are an application security reviewer. Look for injection, "
+        "authentication and authorization flaws, secrets in code and unsafe "
+        "handling of untrusted input. " + _VERDICT_FORMAT
+    )
+
+
+class StyleReviewerAgent(ReviewerAgent):
+    """Checks readability and conventions; advisory only."""
+
+    name = "style"
+    blocking = False
+    system_prompt = (
+        "You are a code style reviewer. Check naming, structure, "
+        "duplication and readability. " + _VERDICT_FORMAT
+    )
+
+
+def default_checks(model: ModelClient) -> List[ReviewerAgent]:
+    """
+    The Jidoka gate's checks: spec conformance, security, style.
+
+    Args:
+        model: Client shared by the checks
+
+    Returns:
+        One reviewer per check
+    """
+    return [
+        ReviewerAgent(model),
+        SecurityReviewerAgent(model),
+        StyleReviewerAgent(model),
+    ]
+
+
+__all__ = [
+    "APPROVED",
+    "CHANGES_REQUESTED",
+    "DEFAULT_CHECK_TIMEOUT",
+    "CheckResult",
+    "CheckStatus",
+    "ReviewCheck",
+    "ReviewReport",
+    "ReviewerAgent",
+    "ReviewerEnsemble",
+    "SecurityReviewerAgent",
+    "StyleReviewerAgent",
+    "default_checks",
+]
@@ -0,0 +1,280 @@
+"""
+Reviewer Ensemble
+
+Runs several independent review checks over the same code at once
+(asyncio.gather), each under its own timeout, and merges their verdicts
+into one typed ReviewReport.
+
+Jidoka: as soon as a blocking check fails (rejects, times out or
+errors), the checks still running are cancelled, since their verdicts
+can no longer change the outcome. Non-blocking checks (e.g. style) are
+reported but never stop the line.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, List, Mapping, Optional, Protocol, Sequence
+
+DEFAULT_CHECK_TIMEOUT = 120.0
+
+
+class ReviewCheck(Protocol):
+    """A reviewer agent as seen by the ensemble."""
+
+    name: str
+    blocking: bool
+
+    async def review(self, code: str, spec: str) -> dict: ...
+
+
+class CheckStatus(str, Enum):
+    """How a check ended."""
+
+    PASSED = "passed"
+    FAILED = "failed"
+    TIMED_OUT = "timed_out"
+    ERROR = "error"
+    CANCELLED = "cancelled"  # Stopped by another check's blocking failure
+
+
+@dataclass(frozen=True)
+class CheckResult:
+    """
+    Verdict of one check.
+
+    Attributes:
+        check: Check name (the reviewer agent's name)
+        status: How the check ended
+        blocking: Whether a failure of this check rejects the code
+        comments: Reviewer comments, or what went wrong
+        usage: Token usage of the check ({} if it did not finish)
+        cached: True if the answer was replayed from a response cache
+        elapsed: Seconds the check ran
+    """
+
+    check: str
+    status: CheckStatus
+    blocking: bool
+    comments: str = ""
+    usage: Dict[str, int] = field(default_factory=dict)
+    cached: bool = False
+    elapsed: float = 0.0
+
+    @property
+    def passed(self) -> bool:
+        """True if the reviewer approved."""
+        return self.status == CheckStatus.PASSED
+
+    @property
+    def stops_the_line(self) -> bool:
+        """True if this result alone rejects the code."""
+        return self.blocking and self.status in (
+            CheckStatus.FAILED,
+            CheckStatus.TIMED_OUT,
+            CheckStatus.ERROR,
+        )
+
+
+@dataclass(frozen=True)
+class ReviewReport:
+    """
+    Merged outcome of an ensemble review.
+
+    Attributes:
+        results: One result per check, in the ensemble's check order
+        blocking_failure: First blocking failure, which cancelled the
+            checks still running (None if there was none)
+    """
+
+    results: List[CheckResult]
+    blocking_failure: Optional[CheckResult] = None
+
+    @property
+    def approved(self) -> bool:
+        """True if every blocking check passed."""
+        return all(result.passed for result in self.results if result.blocking)
+
+    @property
+    def failures(self) -> List[CheckResult]:
+        """Checks that did not pass (cancelled ones excluded)."""
+        return [
+            result
+            for result in self.results
+            if not result.passed and result.status != CheckStatus.CANCELLED
+        ]
+
+    @property
+    def usage(self) -> Dict[str, int]:
+        """Token usage summed over the checks."""
+        return _sum_usage(self.results)
+
+    @property
+    def billable_usage(self) -> Dict[str, int]:
+        """Token usage of the checks not replayed from a response cache."""
+        return _sum_usage([result for result in self.results if not result.cached])
+
+    @property
+    def comments(self) -> str:
+        """Every check's status and comments, one section per check."""
+        return "\n\n".join(
+            f"[{result.check}] {result.status.value}"
+            + (f"\n{result.comments}" if result.comments else "")
+            for result in self.results
+        )
+
+    def to_dict(self) -> dict:
+        """
+        Same shape as ReviewerAgent.review(), plus the typed report.
+
+        "cached" is True only when every finished check was replayed; when
+        just some were, "billable_usage" leaves their tokens out.
+
+        Returns:
+            {"approved", "comments", "content", "usage", "billable_usage",
+            "cached", "report"}
+        """
+        finished = [r for r in self.results if r.status != CheckStatus.CANCELLED]
+        return {
+            "approved": self.approved,
+            "comments": self.comments,
+            "content": self.comments,
+            "usage": self.usage,
+            "billable_usage": self.billable_usage,
+            "cached": bool(finished) and all(r.cached for r in finished),
+            "report": self,
+        }
+
+
+def _sum_usage(results: Sequence[CheckResult]) -> Dict[str, int]:
+    """Token usage summed over results, per counter."""
+    total: Dict[str, int] = {}
+    for result in results:
+        for name, tokens in result.usage.items():
+            total[name] = total.get(name, 0) + tokens
+    return total
+
+
+class ReviewerEnsemble:
+    """
+    Concurrent review by several checks with early exit.
+
+    Usage:
+        ensemble = ReviewerEnsemble(default_checks(model), timeout=60)
+        report = await ensemble.run(code, spec)
+        if not report.approved:
+            print(report.comments)
+    """
+
+    def __init__(
+        self,
+        checks: Sequence[ReviewCheck],
+        timeout: Optional[float] = DEFAULT_CHECK_TIMEOUT,
+        timeouts: Optional[Mapping[str, float]] = None,
+    ):
+        """
+        Initialize ensemble.
+
+        Args:
+            checks: Reviewers to run (names must be unique)
+            timeout: Seconds each check may take (None = no limit)
+            timeouts: Per-check overrides of timeout, by check name
+
+        Raises:
+            ValueError: If checks is empty, names repeat or a timeout <= 0
+        """
+        names = [check.name for check in checks]
+        if not names:
+            raise ValueError("at least one check is required")
+        if len(set(names)) != len(names):
+            raise ValueError("check names must be unique")
+        self._checks = list(checks)
+        self._timeouts = {name: timeout for name in names}
+        self._timeouts.update(timeouts or {})
+        if any(value is not None and value <= 0 for value in self._timeouts.values()):
+            raise ValueError("timeouts must be > 0")
+
+    async def review(self, code: str, spec: str) -> dict:
+        """
+        Review like ReviewerAgent.review(), so the ensemble can replace it.
+
+        Args:
+            code: Code to review
+            spec: Metaspec markdown
+
+        Returns:
+            ReviewReport.to_dict() of run()
+        """
+        return (await self.run(code, spec)).to_dict()
+
+    async def run(self, code: str, spec: str) -> ReviewReport:
+        """
+        Run every check concurrently, stopping at the first blocking failure.
+
+        Args:
+            code: Code to review
+            spec: Metaspec markdown
+
+        Returns:
+            Merged report (checks cancelled by the early exit are CANCELLED)
+        """
+        first_failure: List[CheckResult] = []
+        tasks: List["asyncio.Task[CheckResult]"] = []
+
+        async def run_check(check: ReviewCheck) -> CheckResult:
+            result = await self._run_check(check, code, spec)
+            if result.stops_the_line and not first_failure:
+                first_failure.append(result)
+                for task in tasks:
+                    if task is not asyncio.current_task():
+                        task.cancel()
+            return result
+
+        tasks.extend(asyncio.ensure_future(run_check(c)) for c in self._checks)
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+
+        results = []
+        for check, outcome in zip(self._checks, outcomes):
+            if isinstance(outcome, asyncio.CancelledError):
+                outcome = CheckResult(check.name, CheckStatus.CANCELLED, check.blocking)
+            elif isinstance(outcome, BaseException):
+                raise outcome  # pragma: no cover - _run_check catches errors
+            results.append(outcome)
+        return ReviewReport(
+            results=results,
+            blocking_failure=first_failure[0] if first_failure else None,
+        )
+
+    async def _run_check(self, check: ReviewCheck, code: str, spec: str) -> CheckResult:
+        """One check under its timeout; errors become results."""
+        blocking = check.blocking
+        timeout = self._timeouts[check.name]
+        started = time.monotonic()
+        try:
+            review = await asyncio.wait_for(check.review(code, spec), timeout)
+        except asyncio.TimeoutError:
+            return CheckResult(
+                check.name,
+                CheckStatus.TIMED_OUT,
+                blocking,
+                comments=f"no verdict within {timeout:g}s",
+                elapsed=time.monotonic() - started,
+            )
+        except Exception as exc:
+            return CheckResult(
+                check.name,
+                CheckStatus.ERROR,
+                blocking,
+                comments=f"{type(exc).__name__}: {exc}",
+                elapsed=time.monotonic() - started,
+            )
+        return CheckResult(
+            check.name,
+            CheckStatus.PASSED if review.get("approved") else CheckStatus.FAILED,
+            blocking,
+            comments=review.get("comments", ""),
+            usage=dict(review.get("usage", {})),
+            cached=bool(review.get("cached")),
+            elapsed=time.monotonic() - started,
+        )
@@ -2,21 +2,57 @@
 Spec Writer Agent
 
 Generates metaspecs following SPARC+DD methodology.
-TODO: Implement full agent in IAD-12
 """
 
+from typing import AsyncIterator, Optional
 
-class SpecWriterAgent:
-    """Spec Writer agent placeholder."""
+from agno_agents.base import BaseAgent, TokenBudget
 
-    def __init__(self):
-        # TODO: Initialize Agno agent with Claude Sonnet
-        pass
+
+class SpecWriterAgent(BaseAgent):
+    """Writes the specification of a demand."""
+
+    name = "spec_writer"
+    system_prompt = (
+        "You are a senior product engineer following the SPARC+DD method. "
+        "Write a Markdown metaspec for the demand: context, requirements, "
+        "acceptance criteria and out-of-scope items."
+    )
 
     async def generate(self, title: str, description: str) -> dict:
         """
         Generate metaspec from title and description.
 
-        TODO: Implement actual generation logic in IAD-12
+        Args:
+            title: Demand title
+            description: Demand description
+
+        Returns:
+            {"content": spec markdown, "usage": {...}, "model": name}
         """
-        raise NotImplementedError("SpecWriterAgent will be implemented in IAD-12")
+        response = await self._complete(_prompt(title, description))
+        return self._result(response)
+
+    def stream_generate(
+        self, title: str, description: str, budget: Optional[TokenBudget] = None
+    ) -> AsyncIterator[dict]:
+        """
+        Generate metaspec, yielding it as it is written.
+
+        Args:
+            title: Demand title
+            description: Demand description
+            budget: Tokens the generation may use (e.g. the project's
+                ContextBudget); None = unlimited
+
+        Yields:
+            {"delta": text, "usage": running totals, "cached": bool}
+
+        Raises:
+            TokenBudgetExceededError: When budget would be exceeded
+        """
+        return self._stream(_prompt(title, description), budget)
+
+
+def _prompt(title: str, description: str) -> str:
+    return f"# {title}\n\n{description}"
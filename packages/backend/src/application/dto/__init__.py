@@ -0,0 +1,41 @@
+"""
+Data Transfer Objects
+
+Result types returned by repository interfaces (ports).
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+from application.dto.bulk_write_result import (
+    DUPLICATE_ERROR,
+    NOT_FOUND_ERROR,
+    REVISION_CONFLICT_ERROR,
+    BulkItemResult,
+    BulkWriteResult,
+    bulk_result,
+)
+from application.dto.lazy import LazyCheckpoint, LazyField, LazyMetaspec
+from application.dto.page import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Page
+from application.dto.status_counts import status_counts
+from application.dto.status_transition import STATUS_CONFLICT_ERROR, StatusTransition
+from application.dto.summaries import CheckpointSummary, MetaspecSummary
+
+__all__ = [
+    "BulkItemResult",
+    "BulkWriteResult",
+    "CheckpointSummary",
+    "DEFAULT_PAGE_SIZE",
+    "DUPLICATE_ERROR",
+    "LazyCheckpoint",
+    "LazyField",
+    "LazyMetaspec",
+    "MAX_PAGE_SIZE",
+    "MetaspecSummary",
+    "NOT_FOUND_ERROR",
+    "Page",
+    "REVISION_CONFLICT_ERROR",
+    "STATUS_CONFLICT_ERROR",
+    "StatusTransition",
+    "bulk_result",
+    "status_counts",
+]
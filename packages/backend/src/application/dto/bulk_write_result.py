@@ -0,0 +1,92 @@
+"""
+BulkWriteResult DTO
+
+Per-item outcome of a batched repository write (create_many, update_many,
+delete_many). Failed ids can be collected and retried on their own
+(items failing with REVISION_CONFLICT_ERROR after re-reading them).
+The error constants and bulk_result() are shared by every backend, so
+the same failure reads the same whichever database wrote it.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+# BulkItemResult.error of an update based on a stale revision
+REVISION_CONFLICT_ERROR = "revision conflict"
+# BulkItemResult.error of a create whose id is already taken
+DUPLICATE_ERROR = "duplicate key"
+# BulkItemResult.error of an update of a missing entity
+NOT_FOUND_ERROR = "document not found"
+
+
+@dataclass(frozen=True)
+class BulkItemResult:
+    """
+    Outcome of a single item inside a batch.
+
+    Attributes:
+        index: Position of the item in the input sequence
+        id: Entity UUID string
+        ok: True if the item was written
+        error: Error message when the item failed
+    """
+
+    index: int
+    id: str
+    ok: bool
+    error: Optional[str] = None
+
+
+@dataclass
+class BulkWriteResult:
+    """
+    Outcome of a batched write, one BulkItemResult per input item.
+
+    Attributes:
+        items: Item results in input order
+    """
+
+    items: List[BulkItemResult] = field(default_factory=list)
+
+    @property
+    def succeeded_ids(self) -> List[str]:
+        """Ids of items that were written."""
+        return [item.id for item in self.items if item.ok]
+
+    @property
+    def failed_ids(self) -> List[str]:
+        """Ids of items that failed (candidates for retry)."""
+        return [item.id for item in self.items if not item.ok]
+
+    @property
+    def failures(self) -> List[BulkItemResult]:
+        """Item results of failed items."""
+        return [item for item in self.items if not item.ok]
+
+    @property
+    def has_failures(self) -> bool:
+        """True if at least one item failed."""
+        return any(not item.ok for item in self.items)
+
+
+def bulk_result(ids: List[str], errors: Dict[int, str]) -> BulkWriteResult:
+    """
+    Per-item BulkWriteResult from ids and per-index errors.
+
+    Args:
+        ids: Entity ids in input order
+        errors: Error message by index of the items that failed
+
+    Returns:
+        One BulkItemResult per id
+    """
+    return BulkWriteResult(
+        items=[
+            BulkItemResult(
+                index=index, id=id_, ok=index not in errors, error=errors.get(index)
+            )
+            for index, id_ in enumerate(ids)
+        ]
+    )
@@ -0,0 +1,147 @@
+"""
+Lazy-field Entity Variants
+
+Summaries that fetch their heavy field from the repository on first
+access. Useful when most callers only need ids, token counts or versions
+but a few need the full snapshot/content.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Generic, Optional, TypeVar
+
+from application.dto.summaries import CheckpointSummary, MetaspecSummary
+from domain.entities.checkpoint import Checkpoint
+from domain.entities.metaspec import Metaspec
+
+T = TypeVar("T")
+
+
+class LazyField(Generic[T]):
+    """
+    Value loaded once, on first get(); concurrent callers share the load.
+
+    A failed load is not cached: the next get() retries.
+    """
+
+    def __init__(self, loader: Callable[[], Awaitable[T]]):
+        """
+        Initialize lazy field.
+
+        Args:
+            loader: Coroutine function returning the value
+        """
+        self._loader = loader
+        self._pending: Optional["asyncio.Future[T]"] = None
+        self._loaded = False
+        self._value: Optional[T] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """True once the value has been fetched."""
+        return self._loaded
+
+    async def get(self) -> T:
+        """
+        Value of the field, fetching it on first call.
+
+        Returns:
+            Loaded value
+        """
+        if not self._loaded:
+            if self._pending is None:
+                self._pending = asyncio.ensure_future(self._loader())
+            pending = self._pending
+            try:
+                value = await pending
+            except Exception:
+                if self._pending is pending:
+                    self._pending = None
+                raise
+            self._value = value
+            self._loaded = True
+            self._pending = None
+        return self._value
+
+
+@dataclass
+class LazyCheckpoint(CheckpointSummary):
+    """Checkpoint whose context_snapshot is fetched on first access."""
+
+    snapshot_field: Optional[LazyField[str]] = field(
+        default=None, repr=False, compare=False
+    )
+
+    @property
+    def is_loaded(self) -> bool:
+        """True once context_snapshot has been fetched."""
+        return self.snapshot_field is not None and self.snapshot_field.is_loaded
+
+    async def context_snapshot(self) -> str:
+        """
+        Snapshot JSON, fetched from the repository on first call.
+
+        Returns:
+            Context snapshot (JSON string)
+        """
+        return await self.snapshot_field.get()
+
+    async def to_entity(self) -> Checkpoint:
+        """
+        Full Checkpoint entity (loads context_snapshot if needed).
+
+        Returns:
+            Checkpoint entity
+        """
+        return Checkpoint.from_trusted(
+            id=self.id,
+            demand_id=self.demand_id,
+            context_snapshot=await self.context_snapshot(),
+            tokens_used=self.tokens_used,
+            created_at=self.created_at,
+            expires_at=self.expires_at,
+            revision=self.revision,
+        )
+
+
+@dataclass
+class LazyMetaspec(MetaspecSummary):
+    """Metaspec whose Markdown content is fetched on first access."""
+
+    content_field: Optional[LazyField[str]] = field(
+        default=None, repr=False, compare=False
+    )
+
+    @property
+    def is_loaded(self) -> bool:
+        """True once content has been fetched."""
+        return self.content_field is not None and self.content_field.is_loaded
+
+    async def content(self) -> str:
+        """
+        Markdown content, fetched from the repository on first call.
+
+        Returns:
+            Metaspec content (Markdown)
+        """
+        return await self.content_field.get()
+
+    async def to_entity(self) -> Metaspec:
+        """
+        Full Metaspec entity (loads content if needed).
+
+        Returns:
+            Metaspec entity
+        """
+        return Metaspec.from_trusted(
+            id=self.id,
+            demand_id=self.demand_id,
+            type=self.type,
+            content=await self.content(),
+            version=self.version,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            revision=self.revision,
+        )
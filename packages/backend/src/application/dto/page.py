@@ -0,0 +1,35 @@
+"""
+Page DTO
+
+One page of a keyset-paginated listing. Pass next_cursor back as `after`
+to fetch the following page; it is None on the last page.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+from dataclasses import dataclass, field
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+@dataclass
+class Page(Generic[T]):
+    """
+    Page of entities plus an opaque cursor for the next page.
+
+    Attributes:
+        items: Entities of this page, in listing order
+        next_cursor: Cursor of the next page, None if this is the last one
+    """
+
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+    @property
+    def has_more(self) -> bool:
+        """True if another page follows."""
+        return self.next_cursor is not None
@@ -0,0 +1,25 @@
+"""
+Status Counts DTO
+
+Number of demands per DemandStatus for one project, as returned by
+count_by_status / get_status_rollup.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+from typing import Dict, Mapping
+
+from domain.value_objects.demand_status import DemandStatus
+
+
+def status_counts(counts: Mapping[str, int]) -> Dict[DemandStatus, int]:
+    """
+    Complete per-status counts from raw storage counts.
+
+    Args:
+        counts: Status value (e.g. "draft") -> count; missing statuses are 0
+
+    Returns:
+        Every DemandStatus, in workflow order, mapped to its count
+    """
+    return {status: counts.get(status.value, 0) for status in DemandStatus}
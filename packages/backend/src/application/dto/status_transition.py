@@ -0,0 +1,30 @@
+"""
+StatusTransition DTO
+
+One compare-and-set status change for IDemandRepository.transition_many.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+from dataclasses import dataclass
+
+from domain.value_objects.demand_status import DemandStatus
+
+# BulkItemResult.error of an item whose demand left from_status first
+STATUS_CONFLICT_ERROR = "status conflict"
+
+
+@dataclass(frozen=True)
+class StatusTransition:
+    """
+    Move a demand from the status the caller saw to the next one.
+
+    Attributes:
+        demand_id: Demand UUID string
+        from_status: Status the caller last saw
+        to_status: Next status (must follow from_status)
+    """
+
+    demand_id: str
+    from_status: DemandStatus
+    to_status: DemandStatus
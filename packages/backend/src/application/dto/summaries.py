@@ -0,0 +1,61 @@
+"""
+Summary DTOs
+
+Lightweight read models without the heavy fields (Checkpoint
+context_snapshot, Metaspec content). Repositories load them with
+projections so the large strings never leave the database.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from domain.entities.metaspec import MetaspecType
+
+
+@dataclass
+class CheckpointSummary:
+    """
+    Checkpoint without context_snapshot.
+
+    Attributes:
+        id: Checkpoint UUID string
+        demand_id: Demand UUID string
+        tokens_used: Tokens consumed up to this checkpoint
+        created_at: Creation date/time
+        expires_at: Expiration date/time (TTL)
+        revision: Stored revision (pass it back when updating)
+    """
+
+    id: str
+    demand_id: str
+    tokens_used: int
+    created_at: datetime
+    expires_at: Optional[datetime] = None
+    revision: int = 0
+
+
+@dataclass
+class MetaspecSummary:
+    """
+    Metaspec without its Markdown content.
+
+    Attributes:
+        id: Metaspec UUID string
+        demand_id: Demand UUID string
+        type: Metaspec type
+        version: Metaspec version
+        created_at: Creation date/time
+        updated_at: Last update date/time
+        revision: Stored revision (pass it back when updating)
+    """
+
+    id: str
+    demand_id: str
+    type: MetaspecType
+    version: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    revision: int = 0
@@ -0,0 +1,75 @@
+"""
+Application Layer Exceptions
+
+Errors raised by repository implementations (adapters) through the ports.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+from domain.value_objects.demand_status import DemandStatus
+
+
+class RepositoryError(Exception):
+    """Base exception for persistence failures."""
+
+    pass
+
+
+class ProjectNotFoundError(RepositoryError):
+    """Raised when an operation targets a project that does not exist."""
+
+    pass
+
+
+class DuplicateEntityError(RepositoryError):
+    """Raised when creating an entity whose id already exists."""
+
+    pass
+
+
+class DemandNotFoundError(RepositoryError):
+    """Raised when an operation targets a demand that does not exist."""
+
+    pass
+
+
+class DemandStatusConflictError(RepositoryError):
+    """
+    Raised when a compare-and-set status transition finds the demand in a
+    different status than expected (another writer moved it first).
+
+    Attributes:
+        demand_id: Demand UUID string
+        expected: Status the caller expected (from_status)
+        actual: Status found in storage
+    """
+
+    def __init__(self, demand_id: str, expected: DemandStatus, actual: DemandStatus):
+        super().__init__(
+            f"Demand '{demand_id}' is {actual.value}, expected {expected.value}"
+        )
+        self.demand_id = demand_id
+        self.expected = expected
+        self.actual = actual
+
+
+class RevisionConflictError(RepositoryError):
+    """
+    Raised when an update was based on a stale revision (another writer
+    saved the entity after it was read).
+
+    Attributes:
+        entity_type: Entity class name (e.g. "Project")
+        entity_id: Entity UUID string
+        expected: Revision the caller read (entity.revision)
+        actual: Revision found in storage
+    """
+
+    def __init__(self, entity_type: str, entity_id: str, expected: int, actual: int):
+        super().__init__(
+            f"{entity_type} '{entity_id}' is at revision {actual}, expected {expected}"
+        )
+        self.entity_type = entity_type
+        self.entity_id = entity_id
+        self.expected = expected
+        self.actual = actual
@@ -8,8 +8,12 @@ IAD-7: Repository Pattern + MongoDB
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, Iterable, List, Optional
 
+from application.dto.bulk_write_result import BulkWriteResult
+from application.dto.lazy import LazyCheckpoint
+from application.dto.page import DEFAULT_PAGE_SIZE, Page
+from application.dto.summaries import CheckpointSummary
 from domain.entities.checkpoint import Checkpoint
 
 
@@ -28,7 +32,7 @@ class ICheckpointRepository(ABC):
             The persisted checkpoint entity
 
         Raises:
-            DuplicateCheckpointError: If checkpoint with same ID already exists
+            DuplicateEntityError: If checkpoint with same ID already exists
             RepositoryError: If persistence fails
         """
         pass
@@ -49,10 +53,109 @@ class ICheckpointRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_many(self, checkpoint_ids: List[str]) -> Dict[str, Checkpoint]:
+        """
+        Retrieve many checkpoints by UUID in a single query.
+
+        Args:
+            checkpoint_ids: Checkpoint UUID strings (duplicates allowed)
+
+        Returns:
+            Mapping of id to Checkpoint entity; ids not found are absent
+
+        Raises:
+            RepositoryError: If retrieval fails
+        """
+        pass
+
+    @abstractmethod
+    async def list_checkpoints(
+        self,
+        demand_id: str,
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[Checkpoint]:
+        """
+        List checkpoints with keyset (cursor) pagination, newest first.
+
+        Args:
+            demand_id: Demand UUID string
+            after: next_cursor of the previous page (None for the first page)
+            limit: Page size
+
+        Returns:
+            Page of Checkpoint entities
+
+        Raises:
+            ValueError: If limit or cursor is invalid
+            RepositoryError: If retrieval fails
+        """
+        pass
+
+    @abstractmethod
+    async def get_summary(self, checkpoint_id: str) -> Optional[CheckpointSummary]:
+        """
+        Retrieve a checkpoint without its context_snapshot.
+
+        Args:
+            checkpoint_id: Checkpoint UUID string
+
+        Returns:
+            CheckpointSummary if found, None otherwise
+
+        Raises:
+            RepositoryError: If retrieval fails
+        """
+        pass
+
+    @abstractmethod
+    async def list_checkpoint_summaries(
+        self,
+        demand_id: str,
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[CheckpointSummary]:
+        """
+        Same as list_checkpoints, without context_snapshot.
+
+        Args:
+            demand_id: Demand UUID string
+            after: next_cursor of the previous page (None for the first page)
+            limit: Page size
+
+        Returns:
+            Page of CheckpointSummary
+
+        Raises:
+            ValueError: If limit or cursor is invalid
+            RepositoryError: If retrieval fails
+        """
+        pass
+
+    @abstractmethod
+    async def get_lazy(self, checkpoint_id: str) -> Optional[LazyCheckpoint]:
+        """
+        Retrieve a checkpoint whose context_snapshot is fetched on first access.
+
+        Args:
+            checkpoint_id: Checkpoint UUID string
+
+        Returns:
+            LazyCheckpoint if found, None otherwise
+
+        Raises:
+            RepositoryError: If retrieval fails
+        """
+        pass
+
     @abstractmethod
     async def update(self, checkpoint: Checkpoint) -> Checkpoint:
         """
-        Update an existing checkpoint.
+        Update an existing checkpoint if nobody saved it since it was read.
+
+        The stored checkpoint must still be at checkpoint.revision; on success
+        the revision of the passed entity is incremented.
 
         Args:
             checkpoint: Checkpoint entity with updated data
@@ -62,6 +165,32 @@ class ICheckpointRepository(ABC):
 
         Raises:
             CheckpointNotFoundError: If checkpoint does not exist
+            RevisionConflictError: If another writer saved the checkpoint first
+            RepositoryError: If update fails
+        """
+        pass
+
+    @abstractmethod
+    async def patch(self, checkpoint: Checkpoint, fields: Iterable[str]) -> Checkpoint:
+        """
+        Write only some attributes of an existing checkpoint.
+
+        Same revision check as update(); cheaper when a few small fields
+        changed, since the other attributes are not sent. Fields not
+        named keep their stored value. No-op if the checkpoint does not exist.
+
+        Patching "context_snapshot" rewrites the snapshot like update().
+
+        Args:
+            checkpoint: Checkpoint entity holding the new values
+            fields: Attribute names to write (not id or revision)
+
+        Returns:
+            The checkpoint entity (revision incremented if written)
+
+        Raises:
+            ValueError: If a field is unknown or protected
+            RevisionConflictError: If another writer saved the checkpoint first
             RepositoryError: If update fails
         """
         pass
@@ -79,3 +208,59 @@ class ICheckpointRepository(ABC):
             RepositoryError: If deletion fails
         """
         pass
+
+    @abstractmethod
+    async def create_many(self, checkpoints: List[Checkpoint]) -> BulkWriteResult:
+        """
+        Persist many new checkpoints in a single unordered batch.
+
+        A failing item does not stop the others from being written.
+
+        Args:
+            checkpoints: Checkpoint entities to persist
+
+        Returns:
+            Per-item result in input order (failed_ids can be retried)
+
+        Raises:
+            RepositoryError: If the batch cannot be sent
+        """
+        pass
+
+    @abstractmethod
+    async def update_many(self, checkpoints: List[Checkpoint]) -> BulkWriteResult:
+        """
+        Update many existing checkpoints in a single unordered batch.
+
+        Checkpoints that do not exist or are no longer at their revision are
+        reported as failed items; written entities get their revision
+        incremented.
+
+        Args:
+            checkpoints: Checkpoint entities with updated data
+
+        Returns:
+            Per-item result in input order (failed_ids can be retried)
+
+        Raises:
+            RepositoryError: If the batch cannot be sent
+        """
+        pass
+
+    @abstractmethod
+    async def delete_many(self, checkpoint_ids: List[str]) -> BulkWriteResult:
+        """
+        Remove many checkpoints in a single unordered batch.
+
+        Ids that do not exist are not an error.
+
+        Args:
+            checkpoint_ids: Checkpoint UUID strings
+
+        Returns:
+            Per-item result in input order (failed_ids can be retried)
+
+        Raises:
+            RepositoryError: If the batch cannot be sent
+        """
+        pass
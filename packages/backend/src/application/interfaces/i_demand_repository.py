@@ -8,9 +8,13 @@ IAD-7: Repository Pattern + MongoDB
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, Iterable, List, Optional
 
+from application.dto.bulk_write_result import BulkWriteResult
+from application.dto.page import DEFAULT_PAGE_SIZE, Page
+from application.dto.status_transition import StatusTransition
 from domain.entities.demand import Demand
+from domain.value_objects.demand_status import DemandStatus
 
 
 class IDemandRepository(ABC):
@@ -28,7 +32,7 @@ class IDemandRepository(ABC):
             The persisted demand entity
 
         Raises:
-            DuplicateDemandError: If demand with same ID already exists
+            DuplicateEntityError: If demand with same ID already exists
             RepositoryError: If persistence fails
         """
         pass
@@ -49,10 +53,93 @@ class IDemandRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_many(self, demand_ids: List[str]) -> Dict[str, Demand]:
+        """
+        Retrieve many demands by UUID in a single query.
+
+        Args:
+            demand_ids: Demand UUID strings (duplicates allowed)
+
+        Returns:
+            Mapping of id to Demand entity; ids not found are absent
+
+        Raises:
+            RepositoryError: If retrieval fails
+        """
+        pass
+
+    @abstractmethod
+    async def list_by_project(
+        self,
+        project_id: str,
+        status: Optional[DemandStatus] = None,
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[Demand]:
+        """
+        List demands with keyset (cursor) pagination, newest first.
+
+        Args:
+            project_id: Project UUID string
+            status: Only demands in this status (optional)
+            after: next_cursor of the previous page (None for the first page)
+            limit: Page size
+
+        Returns:
+            Page of Demand entities
+
+        Raises:
+            ValueError: If limit or cursor is invalid
+            RepositoryError: If retrieval fails
+        """
+        pass
+
+    @abstractmethod
+    async def count_by_status(self, project_id: str) -> Dict[DemandStatus, int]:
+        """
+        Count a project's demands per status, from the demands themselves.
+
+        Served by the {project_id, status} index; use get_status_rollup for
+        dashboards that poll.
+
+        Args:
+            project_id: Project UUID string
+
+        Returns:
+            Every DemandStatus, in workflow order, mapped to its count
+
+        Raises:
+            RepositoryError: If retrieval fails
+        """
+        pass
+
+    @abstractmethod
+    async def get_status_rollup(self, project_id: str) -> Dict[DemandStatus, int]:
+        """
+        Per-status counts from the rollup maintained on every write.
+
+        Constant-time read; equal to count_by_status as long as all writes
+        go through the repository.
+
+        Args:
+            project_id: Project UUID string
+
+        Returns:
+            Every DemandStatus, in workflow order, mapped to its count
+
+        Raises:
+            RepositoryError: If retrieval fails
+        """
+        pass
+
     @abstractmethod
     async def update(self, demand: Demand) -> Demand:
         """
-        Update an existing demand.
+        Update an existing demand if nobody saved it since it was read.
+
+        The stored demand must still be at demand.revision; on success
+        the revision of the passed entity is incremented.
 
         Args:
             demand: Demand entity with updated data
@@ -62,6 +149,54 @@ class IDemandRepository(ABC):
 
         Raises:
             DemandNotFoundError: If demand does not exist
+            RevisionConflictError: If another writer saved the demand first
+            RepositoryError: If update fails
+        """
+        pass
+
+    @abstractmethod
+    async def transition(
+        self, demand_id: str, from_status: DemandStatus, to_status: DemandStatus
+    ) -> None:
+        """
+        Move a demand to to_status only if it is still in from_status.
+
+        Compare-and-set in one atomic write that touches only status and
+        updated_at, so two workers cannot both advance the same demand.
+
+        Args:
+            demand_id: Demand UUID string
+            from_status: Status the caller last saw
+            to_status: Next status (must follow from_status)
+
+        Raises:
+            InvalidStatusTransitionError: If to_status does not follow from_status
+            DemandAlreadyCompletedError: If from_status is final
+            DemandNotFoundError: If demand does not exist
+            DemandStatusConflictError: If the demand is no longer in from_status
+            RepositoryError: If the update fails
+        """
+        pass
+
+    @abstractmethod
+    async def patch(self, demand: Demand, fields: Iterable[str]) -> Demand:
+        """
+        Write only some attributes of an existing demand.
+
+        Same revision check as update(); cheaper when a few small fields
+        changed, since the other attributes are not sent. Fields not
+        named keep their stored value. No-op if the demand does not exist.
+
+        Args:
+            demand: Demand entity holding the new values
+            fields: Attribute names to write (not id or revision)
+
+        Returns:
+            The demand entity (revision incremented if written)
+
+        Raises:
+            ValueError: If a field is unknown or protected
+            RevisionConflictError: If another writer saved the demand first
             RepositoryError: If update fails
         """
         pass
@@ -79,3 +214,81 @@ class IDemandRepository(ABC):
             RepositoryError: If deletion fails
         """
         pass
+
+    @abstractmethod
+    async def create_many(self, demands: List[Demand]) -> BulkWriteResult:
+        """
+        Persist many new demands in a single unordered batch.
+
+        A failing item does not stop the others from being written.
+
+        Args:
+            demands: Demand entities to persist
+
+        Returns:
+            Per-item result in input order (failed_ids can be retried)
+
+        Raises:
+            RepositoryError: If the batch cannot be sent
+        """
+        pass
+
+    @abstractmethod
+    async def update_many(self, demands: List[Demand]) -> BulkWriteResult:
+        """
+        Update many existing demands in a single unordered batch.
+
+        Demands that do not exist or are no longer at their revision are
+        reported as failed items; written entities get their revision
+        incremented.
+
+        Args:
+            demands: Demand entities with updated data
+
+        Returns:
+            Per-item result in input order (failed_ids can be retried)
+
+        Raises:
+            RepositoryError: If the batch cannot be sent
+        """
+        pass
+
+    @abstractmethod
+    async def transition_many(
+        self, transitions: List[StatusTransition]
+    ) -> BulkWriteResult:
+        """
+        Compare-and-set the status of many demands in one batched write.
+
+        Each item is applied like transition(); items never abort the
+        batch. Invalid pairs fail without being written.
+
+        Args:
+            transitions: Status changes (at most one per demand)
+
+        Returns:
+            Per-item result in input order; an item fails with
+            NOT_FOUND_ERROR, STATUS_CONFLICT_ERROR or the validation message
+
+        Raises:
+            RepositoryError: If the batch cannot be written
+        """
+        pass
+
+    @abstractmethod
+    async def delete_many(self, demand_ids: List[str]) -> BulkWriteResult:
+        """
+        Remove many demands in a single unordered batch.
+
+        Ids that do not exist are not an error.
+
+        Args:
+            demand_ids: Demand UUID strings
+
+        Returns:
+            Per-item result in input order (failed_ids can be retried)
+
+        Raises:
+            RepositoryError: If the batch cannot be sent
+        """
+        pass
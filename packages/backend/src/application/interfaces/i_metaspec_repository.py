@@ -4,13 +4,20 @@ IMetaspecRepository Interface
 Port (interface) for Metaspec persistence operations.
 Adapter (implementation) will be in Infrastructure Layer.
 
+Storage is append-only per version: updating a metaspec to a higher
+version keeps the previous versions readable through get_version.
+
 IAD-7: Repository Pattern + MongoDB
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, Iterable, List, Optional
 
-from domain.entities.metaspec import Metaspec
+from application.dto.bulk_write_result import BulkWriteResult
+from application.dto.lazy import LazyMetaspec
+from application.dto.page import DEFAULT_PAGE_SIZE, Page
+from application.dto.summaries import MetaspecSummary
+from domain.entities.metaspec import Metaspec, MetaspecType
 
 
 class IMetaspecRepository(ABC):
@@ -28,7 +35,7 @@ class IMetaspecRepository(ABC):
             The persisted metaspec entity
 
         Raises:
-            DuplicateMetaspecError: If metaspec with same ID already exists
+            DuplicateEntityError: If metaspec with same ID already exists
             RepositoryError: If persistence fails
         """
         pass
@@ -49,10 +56,151 @@ class IMetaspecRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_many(self, metaspec_ids: List[str]) -> Dict[str, Metaspec]:
+        """
+        Retrieve many metaspecs by UUID in a single query.
+
+        Args:
+            metaspec_ids: Metaspec UUID strings (duplicates allowed)
+
+        Returns:
+            Mapping of id to Metaspec entity; ids not found are absent
+
+        Raises:
+            RepositoryError: If retrieval fails
+        """
+        pass
+
+    @abstractmethod
+    async def get_latest(
+        self, demand_id: str, metaspec_type: MetaspecType
+    ) -> Optional[Metaspec]:
+        """
+        Retrieve the current (highest version) metaspec of a demand and type.
+
+        Args:
+            demand_id: Demand UUID string
+            metaspec_type: Metaspec type
+
+        Returns:
+            Latest Metaspec if any, None otherwise
+
+        Raises:
+            RepositoryError: If retrieval fails
+        """
+        pass
+
+    @abstractmethod
+    async def get_version(
+        self, demand_id: str, metaspec_type: MetaspecType, version: int
+    ) -> Optional[Metaspec]:
+        """
+        Retrieve a specific (possibly superseded) version.
+
+        Args:
+            demand_id: Demand UUID string
+            metaspec_type: Metaspec type
+            version: Version number
+
+        Returns:
+            Metaspec at that version if stored, None otherwise
+
+        Raises:
+            RepositoryError: If retrieval fails
+        """
+        pass
+
+    @abstractmethod
+    async def list_metaspecs(
+        self,
+        demand_id: str,
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[Metaspec]:
+        """
+        List metaspecs with keyset (cursor) pagination, highest version first.
+
+        Args:
+            demand_id: Demand UUID string
+            after: next_cursor of the previous page (None for the first page)
+            limit: Page size
+
+        Returns:
+            Page of Metaspec entities
+
+        Raises:
+            ValueError: If limit or cursor is invalid
+            RepositoryError: If retrieval fails
+        """
+        pass
+
+    @abstractmethod
+    async def get_summary(self, metaspec_id: str) -> Optional[MetaspecSummary]:
+        """
+        Retrieve a metaspec without its content.
+
+        Args:
+            metaspec_id: Metaspec UUID string
+
+        Returns:
+            MetaspecSummary if found, None otherwise
+
+        Raises:
+            RepositoryError: If retrieval fails
+        """
+        pass
+
+    @abstractmethod
+    async def list_metaspec_summaries(
+        self,
+        demand_id: str,
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[MetaspecSummary]:
+        """
+        Same as list_metaspecs, without content.
+
+        Args:
+            demand_id: Demand UUID string
+            after: next_cursor of the previous page (None for the first page)
+            limit: Page size
+
+        Returns:
+            Page of MetaspecSummary
+
+        Raises:
+            ValueError: If limit or cursor is invalid
+            RepositoryError: If retrieval fails
+        """
+        pass
+
+    @abstractmethod
+    async def get_lazy(self, metaspec_id: str) -> Optional[LazyMetaspec]:
+        """
+        Retrieve a metaspec whose content is fetched on first access.
+
+        Args:
+            metaspec_id: Metaspec UUID string
+
+        Returns:
+            LazyMetaspec if found, None otherwise
+
+        Raises:
+            RepositoryError: If retrieval fails
+        """
+        pass
+
     @abstractmethod
     async def update(self, metaspec: Metaspec) -> Metaspec:
         """
-        Update an existing metaspec.
+        Update an existing metaspec if nobody saved it since it was read.
+
+        The stored metaspec must still be at metaspec.revision; on success
+        the revision of the passed entity is incremented.
+
+        A higher version is appended as a new stored version; the same
+        version is overwritten in place.
 
         Args:
             metaspec: Metaspec entity with updated data
@@ -62,6 +210,32 @@ class IMetaspecRepository(ABC):
 
         Raises:
             MetaspecNotFoundError: If metaspec does not exist
+            RevisionConflictError: If another writer saved the metaspec first
+            RepositoryError: If update fails
+        """
+        pass
+
+    @abstractmethod
+    async def patch(self, metaspec: Metaspec, fields: Iterable[str]) -> Metaspec:
+        """
+        Write only some attributes of an existing metaspec.
+
+        Same revision check as update(); cheaper when a few small fields
+        changed, since the other attributes are not sent. Fields not
+        named keep their stored value. No-op if the metaspec does not exist.
+
+        Patching "version" stores a new version like update() does.
+
+        Args:
+            metaspec: Metaspec entity holding the new values
+            fields: Attribute names to write (not id or revision)
+
+        Returns:
+            The metaspec entity (revision incremented if written)
+
+        Raises:
+            ValueError: If a field is unknown or protected
+            RevisionConflictError: If another writer saved the metaspec first
             RepositoryError: If update fails
         """
         pass
@@ -69,7 +243,7 @@ class IMetaspecRepository(ABC):
     @abstractmethod
     async def delete(self, metaspec_id: str) -> None:
         """
-        Remove a metaspec.
+        Remove a metaspec (all of its versions).
 
         Args:
             metaspec_id: Metaspec UUID string
@@ -79,3 +253,59 @@ class IMetaspecRepository(ABC):
             RepositoryError: If deletion fails
         """
         pass
+
+    @abstractmethod
+    async def create_many(self, metaspecs: List[Metaspec]) -> BulkWriteResult:
+        """
+        Persist many new metaspecs in a single unordered batch.
+
+        A failing item does not stop the others from being written.
+
+        Args:
+            metaspecs: Metaspec entities to persist
+
+        Returns:
+            Per-item result in input order (failed_ids can be retried)
+
+        Raises:
+            RepositoryError: If the batch cannot be sent
+        """
+        pass
+
+    @abstractmethod
+    async def update_many(self, metaspecs: List[Metaspec]) -> BulkWriteResult:
+        """
+        Update many existing metaspecs in a single unordered batch.
+
+        Metaspecs that do not exist or are no longer at their revision are
+        reported as failed items; written entities get their revision
+        incremented.
+
+        Args:
+            metaspecs: Metaspec entities with updated data
+
+        Returns:
+            Per-item result in input order (failed_ids can be retried)
+
+        Raises:
+            RepositoryError: If the batch cannot be sent
+        """
+        pass
+
+    @abstractmethod
+    async def delete_many(self, metaspec_ids: List[str]) -> BulkWriteResult:
+        """
+        Remove many metaspecs in a single unordered batch.
+
+        Ids that do not exist are not an error.
+
+        Args:
+            metaspec_ids: Metaspec UUID strings
+
+        Returns:
+            Per-item result in input order (failed_ids can be retried)
+
+        Raises:
+            RepositoryError: If the batch cannot be sent
+        """
+        pass
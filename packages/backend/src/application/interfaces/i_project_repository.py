@@ -8,9 +8,12 @@ IAD-7: Repository Pattern + MongoDB
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, Iterable, List, Optional
 
+from application.dto.bulk_write_result import BulkWriteResult
+from application.dto.page import DEFAULT_PAGE_SIZE, Page
 from domain.entities.project import Project
+from domain.value_objects.context_budget import ContextBudget
 
 
 class IProjectRepository(ABC):
@@ -28,7 +31,7 @@ class IProjectRepository(ABC):
             The persisted project entity
 
         Raises:
-            DuplicateProjectError: If project with same ID already exists
+            DuplicateEntityError: If project with same ID already exists
             RepositoryError: If persistence fails
         """
         pass
@@ -49,10 +52,53 @@ class IProjectRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_many(self, project_ids: List[str]) -> Dict[str, Project]:
+        """
+        Retrieve many projects by UUID in a single query.
+
+        Args:
+            project_ids: Project UUID strings (duplicates allowed)
+
+        Returns:
+            Mapping of id to Project entity; ids not found are absent
+
+        Raises:
+            RepositoryError: If retrieval fails
+        """
+        pass
+
+    @abstractmethod
+    async def list_by_owner(
+        self,
+        owner_id: str,
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[Project]:
+        """
+        List projects with keyset (cursor) pagination, newest first.
+
+        Args:
+            owner_id: Owner (user) ID
+            after: next_cursor of the previous page (None for the first page)
+            limit: Page size
+
+        Returns:
+            Page of Project entities
+
+        Raises:
+            ValueError: If limit or cursor is invalid
+            RepositoryError: If retrieval fails
+        """
+        pass
+
     @abstractmethod
     async def update(self, project: Project) -> Project:
         """
-        Update an existing project.
+        Update an existing project if nobody saved it since it was read.
+
+        The stored project must still be at project.revision; on success
+        the revision of the passed entity is incremented.
 
         Args:
             project: Project entity with updated data
@@ -62,6 +108,30 @@ class IProjectRepository(ABC):
 
         Raises:
             ProjectNotFoundError: If project does not exist
+            RevisionConflictError: If another writer saved the project first
+            RepositoryError: If update fails
+        """
+        pass
+
+    @abstractmethod
+    async def patch(self, project: Project, fields: Iterable[str]) -> Project:
+        """
+        Write only some attributes of an existing project.
+
+        Same revision check as update(); cheaper when a few small fields
+        changed, since the other attributes are not sent. Fields not
+        named keep their stored value. No-op if the project does not exist.
+
+        Args:
+            project: Project entity holding the new values
+            fields: Attribute names to write (not id or revision)
+
+        Returns:
+            The project entity (revision incremented if written)
+
+        Raises:
+            ValueError: If a field is unknown or protected
+            RevisionConflictError: If another writer saved the project first
             RepositoryError: If update fails
         """
         pass
@@ -79,3 +149,82 @@ class IProjectRepository(ABC):
             RepositoryError: If deletion fails
         """
         pass
+
+    @abstractmethod
+    async def create_many(self, projects: List[Project]) -> BulkWriteResult:
+        """
+        Persist many new projects in a single unordered batch.
+
+        A failing item does not stop the others from being written.
+
+        Args:
+            projects: Project entities to persist
+
+        Returns:
+            Per-item result in input order (failed_ids can be retried)
+
+        Raises:
+            RepositoryError: If the batch cannot be sent
+        """
+        pass
+
+    @abstractmethod
+    async def update_many(self, projects: List[Project]) -> BulkWriteResult:
+        """
+        Update many existing projects in a single unordered batch.
+
+        Projects that do not exist or are no longer at their revision are
+        reported as failed items; written entities get their revision
+        incremented.
+
+        Args:
+            projects: Project entities with updated data
+
+        Returns:
+            Per-item result in input order (failed_ids can be retried)
+
+        Raises:
+            RepositoryError: If the batch cannot be sent
+        """
+        pass
+
+    @abstractmethod
+    async def delete_many(self, project_ids: List[str]) -> BulkWriteResult:
+        """
+        Remove many projects in a single unordered batch.
+
+        Ids that do not exist are not an error.
+
+        Args:
+            project_ids: Project UUID strings
+
+        Returns:
+            Per-item result in input order (failed_ids can be retried)
+
+        Raises:
+            RepositoryError: If the batch cannot be sent
+        """
+        pass
+
+    @abstractmethod
+    async def consume_tokens(self, project_id: str, tokens: int) -> ContextBudget:
+        """
+        Atomically charge tokens against a project's ContextBudget.
+
+        Safe under concurrent agent runs: the check and the increment happen
+        in a single write, so charges are never lost or over-committed.
+
+        Args:
+            project_id: Project UUID string
+            tokens: Quantity of tokens to consume (>= 0)
+
+        Returns:
+            The project's ContextBudget after consumption
+
+        Raises:
+            ValueError: If tokens < 0
+            ContextBudgetExceededError: If the budget has not enough tokens left
+            ProjectNotFoundError: If project does not exist
+            RepositoryError: If update fails
+        """
+        pass
@@ -0,0 +1,13 @@
+"""
+Request-scoped Loaders
+
+Coalesce concurrent single-entity reads into batched repository queries.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+from application.loaders.entity_loader import EntityLoader
+
+__all__ = [
+    "EntityLoader",
+]
@@ -0,0 +1,191 @@
+"""
+EntityLoader
+
+Dataloader-style coalescer on top of a repository get_many(ids).
+Every load()/get_by_id() call made in the same event-loop tick is
+collected and resolved by a single batched query.
+
+Create one loader per request: results are memoized for the loader's
+lifetime, so a long-lived instance would serve stale entities.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import asyncio
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Protocol,
+    Set,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+BatchLoadFn = Callable[[List[str]], Awaitable[Dict[str, T]]]
+
+
+class SupportsGetMany(Protocol[T]):
+    """Any repository exposing get_many(ids) -> {id: entity}."""
+
+    async def get_many(self, ids: List[str]) -> Dict[str, T]: ...
+
+
+class EntityLoader(Generic[T]):
+    """
+    Batches and memoizes entity lookups by id.
+
+    Usage:
+        loader = EntityLoader.for_repository(demand_repository)
+        demands = await asyncio.gather(*(loader.get_by_id(i) for i in ids))
+        # -> one get_many() call for all ids
+    """
+
+    def __init__(self, batch_load_fn: BatchLoadFn, max_batch_size: int = 1000):
+        """
+        Initialize loader.
+
+        Args:
+            batch_load_fn: Coroutine function ids -> {id: entity}
+            max_batch_size: Maximum ids sent in a single batch
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        self._batch_load_fn = batch_load_fn
+        self._max_batch_size = max_batch_size
+        self._cache: Dict[str, "asyncio.Future[Optional[T]]"] = {}
+        self._pending: Dict[str, "asyncio.Future[Optional[T]]"] = {}
+        self._dispatch_scheduled = False
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    @classmethod
+    def for_repository(
+        cls, repository: SupportsGetMany[T], max_batch_size: int = 1000
+    ) -> "EntityLoader[T]":
+        """
+        Build a loader backed by a repository's get_many.
+
+        Args:
+            repository: Any I*Repository implementation
+            max_batch_size: Maximum ids sent in a single batch
+
+        Returns:
+            New EntityLoader
+        """
+        return cls(repository.get_many, max_batch_size=max_batch_size)
+
+    def load(self, entity_id: str) -> "asyncio.Future[Optional[T]]":
+        """
+        Schedule a lookup; resolved together with other loads of this tick.
+
+        Args:
+            entity_id: Entity UUID string
+
+        Returns:
+            Future resolving to the entity, or None if not found
+        """
+        future = self._cache.get(entity_id)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._cache[entity_id] = future
+        self._pending[entity_id] = future
+
+        if not self._dispatch_scheduled:
+            self._dispatch_scheduled = True
+            # call_soon runs after every callback already queued for this tick,
+            # i.e. after all concurrently started tasks registered their ids.
+            loop.call_soon(self._dispatch)
+
+        return future
+
+    async def get_by_id(self, entity_id: str) -> Optional[T]:
+        """
+        Repository-compatible single lookup (batched under the hood).
+
+        Args:
+            entity_id: Entity UUID string
+
+        Returns:
+            Entity if found, None otherwise
+        """
+        return await self.load(entity_id)
+
+    async def load_many(self, entity_ids: List[str]) -> List[Optional[T]]:
+        """
+        Look up many ids at once.
+
+        Args:
+            entity_ids: Entity UUID strings
+
+        Returns:
+            Entities (or None) in input order
+        """
+        return list(await asyncio.gather(*(self.load(i) for i in entity_ids)))
+
+    def prime(self, entity_id: str, entity: T) -> None:
+        """
+        Seed the cache with an already-loaded entity.
+
+        Args:
+            entity_id: Entity UUID string
+            entity: Entity to return for this id
+        """
+        if entity_id in self._cache:
+            return
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(entity)
+        self._cache[entity_id] = future
+
+    def clear(self, entity_id: Optional[str] = None) -> None:
+        """
+        Forget memoized results (e.g. after a write).
+
+        Args:
+            entity_id: Id to forget; all ids when None
+        """
+        if entity_id is None:
+            self._cache = {
+                key: future
+                for key, future in self._cache.items()
+                if key in self._pending
+            }
+        elif entity_id not in self._pending:
+            self._cache.pop(entity_id, None)
+
+    def _dispatch(self) -> None:
+        """Send pending ids to the batch function in chunks."""
+        self._dispatch_scheduled = False
+        pending = list(self._pending.items())
+        self._pending = {}
+
+        for start in range(0, len(pending), self._max_batch_size):
+            batch = dict(pending[start : start + self._max_batch_size])
+            task = asyncio.ensure_future(self._load_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _load_batch(
+        self, batch: Dict[str, "asyncio.Future[Optional[T]]"]
+    ) -> None:
+        """Resolve one batch of futures from a single batch_load_fn call."""
+        try:
+            entities = await self._batch_load_fn(list(batch))
+        except Exception as exc:
+            for entity_id, future in batch.items():
+                # Failed lookups are not memoized so a later load can retry.
+                if self._cache.get(entity_id) is future:
+                    del self._cache[entity_id]
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for entity_id, future in batch.items():
+            if not future.done():
+                future.set_result(entities.get(entity_id))
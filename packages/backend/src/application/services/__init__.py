@@ -0,0 +1,41 @@
+"""
+Application Services
+
+Use cases that orchestrate several repository calls.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+from application.services.demand_pipeline_service import (
+    DEFAULT_MAX_PER_PROJECT,
+    DEFAULT_MAX_WORKERS,
+    DemandPipelineService,
+    PipelineAgents,
+    PipelineOutcome,
+    PipelineRunResult,
+)
+from application.services.demand_transition_service import (
+    BulkTransitionResult,
+    DemandTransitionService,
+    TransitionOutcome,
+)
+from application.services.optimistic_update import (
+    DEFAULT_MAX_ATTEMPTS,
+    changed_fields,
+    update_with_retry,
+)
+
+__all__ = [
+    "BulkTransitionResult",
+    "DEFAULT_MAX_ATTEMPTS",
+    "DEFAULT_MAX_PER_PROJECT",
+    "DEFAULT_MAX_WORKERS",
+    "DemandPipelineService",
+    "DemandTransitionService",
+    "PipelineAgents",
+    "PipelineOutcome",
+    "PipelineRunResult",
+    "TransitionOutcome",
+    "changed_fields",
+    "update_with_retry",
+]
@@ -0,0 +1,413 @@
+"""
+DemandPipelineService
+
+Runs demands through the SPARC+DD agent pipeline:
+
+    DRAFT --spec--> SPEC_APPROVED --architecture--> ARCHITECTURE_DONE
+          --code--> CODE_COMPLETE --review (approved)--> PR_MERGED
+
+Each step calls one agent and then advances the demand with a
+compare-and-set transition(), so a demand moved by someone else while
+its agents were running is reported instead of overwritten. A rejected
+review stops the demand at CODE_COMPLETE (Jidoka).
+
+Many demands run concurrently: at most max_workers pipelines at once,
+and at most max_per_project of them for the same project. The limits
+belong to the service, so they also hold across overlapping run() calls. A demand
+waiting for its project's slot does not hold a worker slot, so one busy
+project cannot starve the others. A failing demand never stops the run.
+
+When a project repository is given, the tokens of every agent call are
+charged to the demand's project with consume_tokens(); a demand whose
+project runs out of budget stops before advancing. Answers replayed by
+a response cache (result "cached": True) were paid for by the original
+call and are not charged again; an ensemble review whose checks were
+only partly replayed is charged its "billable_usage". The spec,
+architecture and code steps are streamed with the project's remaining
+ContextBudget, so a generation that would overrun it is cancelled as
+soon as it does instead of being paid for in full.
+
+Tokens are spent even when a step fails: an aborted stream is charged
+what it used before it stopped, and a finished step the project can no
+longer pay for still counts in tokens_used. Either way the budget is
+left exhausted, since it cannot record more than its max_tokens.
+
+IAD-12: Agno Agents (SPARC+DD pipeline)
+"""
+
+import asyncio
+from contextlib import aclosing, asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional, Protocol, Tuple
+
+from application.exceptions import DemandNotFoundError, DemandStatusConflictError
+from application.interfaces.i_demand_repository import IDemandRepository
+from application.interfaces.i_project_repository import IProjectRepository
+from domain.entities.demand import Demand
+from domain.exceptions import ContextBudgetExceededError
+from domain.value_objects.context_budget import ContextBudget
+from domain.value_objects.demand_status import DemandStatus
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MAX_PER_PROJECT = 1
+
+
+class SpecWriter(Protocol):
+    """SpecWriterAgent as seen by the pipeline."""
+
+    def stream_generate(
+        self, title: str, description: str, budget: Optional[ContextBudget] = None
+    ) -> AsyncIterator[dict]: ...
+
+
+class Architect(Protocol):
+    """ArchitectAgent as seen by the pipeline."""
+
+    def stream_design(
+        self, spec: str, budget: Optional[ContextBudget] = None
+    ) -> AsyncIterator[dict]: ...
+
+
+class Coder(Protocol):
+    """CoderAgent as seen by the pipeline."""
+
+    def stream_code(
+        self, architecture: str, spec: str, budget: Optional[ContextBudget] = None
+    ) -> AsyncIterator[dict]: ...
+
+
+class Reviewer(Protocol):
+    """ReviewerAgent as seen by the pipeline."""
+
+    async def review(self, code: str, spec: str) -> dict: ...
+
+
+@dataclass(frozen=True)
+class PipelineAgents:
+    """
+    The four agents of the pipeline (agno_agents or compatible).
+
+    Streams yield dicts with "delta", running "usage" and "cached"; the
+    review is a dict with "content", "usage", "approved" and "comments".
+    The reviewer can be a single ReviewerAgent or a ReviewerEnsemble of
+    several checks, whose "billable_usage" leaves out replayed checks.
+    """
+
+    spec_writer: SpecWriter
+    architect: Architect
+    coder: Coder
+    reviewer: Reviewer
+
+
+@dataclass
+class PipelineOutcome:
+    """
+    Outcome of one demand inside a pipeline run.
+
+    Attributes:
+        demand_id: Demand UUID string
+        status: Status the demand was left in (None if not found)
+        artifacts: Agent output per step ("spec", "architecture", "code",
+            "review"), for the steps that ran
+        tokens_used: Tokens billed for this demand, including those of
+            aborted streams and of steps the budget refused (cache hits
+            excluded)
+        cache_hits: Agent calls answered by a response cache
+        approved: Review verdict (None if the review did not run)
+        error: Why the pipeline stopped early (None if every step ran),
+            e.g. DemandNotFoundError, DemandStatusConflictError,
+            ContextBudgetExceededError, the TokenBudgetExceededError of an
+            aborted stream or the exception raised by an agent
+    """
+
+    demand_id: str
+    status: Optional[DemandStatus]
+    artifacts: Dict[str, str] = field(default_factory=dict)
+    tokens_used: int = 0
+    cache_hits: int = 0
+    approved: Optional[bool] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """True if every step ran (the review may still have rejected)."""
+        return self.error is None
+
+    @property
+    def merged(self) -> bool:
+        """True if the demand reached PR_MERGED."""
+        return self.status == DemandStatus.PR_MERGED
+
+
+@dataclass
+class PipelineRunResult:
+    """
+    Outcome of a pipeline run, one PipelineOutcome per demand.
+
+    Attributes:
+        outcomes: Outcomes in input order (duplicate ids appear once)
+    """
+
+    outcomes: List[PipelineOutcome] = field(default_factory=list)
+
+    @property
+    def merged_ids(self) -> List[str]:
+        """Ids of demands that reached PR_MERGED."""
+        return [outcome.demand_id for outcome in self.outcomes if outcome.merged]
+
+    @property
+    def rejected_ids(self) -> List[str]:
+        """Ids of demands whose review requested changes."""
+        return [
+            outcome.demand_id for outcome in self.outcomes if outcome.approved is False
+        ]
+
+    @property
+    def failures(self) -> List[PipelineOutcome]:
+        """Outcomes of demands that stopped on an error."""
+        return [outcome for outcome in self.outcomes if not outcome.ok]
+
+    @property
+    def tokens_used(self) -> int:
+        """Tokens billed for the whole run."""
+        return sum(outcome.tokens_used for outcome in self.outcomes)
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Fraction of agent calls answered by a cache (0.0 when none ran)."""
+        calls = sum(len(outcome.artifacts) for outcome in self.outcomes)
+        if calls == 0:
+            return 0.0
+        return sum(outcome.cache_hits for outcome in self.outcomes) / calls
+
+
+class DemandPipelineService:
+    """Runs many demands through spec, architecture, code and review"""
+
+    def __init__(
+        self,
+        demands: IDemandRepository,
+        agents: PipelineAgents,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_per_project: int = DEFAULT_MAX_PER_PROJECT,
+        projects: Optional[IProjectRepository] = None,
+    ):
+        """
+        Initialize service.
+
+        Args:
+            demands: Demand repository (transition() advances each step)
+            agents: Agents that run the steps
+            max_workers: Demands processed at the same time, over all runs
+            max_per_project: Demands of one project processed at the same
+                time, over all runs
+            projects: Project repository to charge agent tokens to (None:
+                tokens are only reported)
+
+        Raises:
+            ValueError: If a limit is < 1
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        if max_per_project < 1:
+            raise ValueError("max_per_project must be >= 1")
+        self._demands = demands
+        self._agents = agents
+        self._max_per_project = max_per_project
+        self._projects = projects
+        self._workers = asyncio.Semaphore(max_workers)
+        # project_id -> (slots, demands holding or waiting for one)
+        self._project_slots: Dict[str, Tuple[asyncio.Semaphore, int]] = {}
+
+    async def run(self, demand_ids: List[str]) -> PipelineRunResult:
+        """
+        Run DRAFT demands through the whole pipeline.
+
+        Args:
+            demand_ids: Demand UUID strings (duplicates run once)
+
+        Returns:
+            One outcome per demand, in input order
+        """
+        unique_ids = list(dict.fromkeys(demand_ids))
+        stored = await self._demands.get_many(unique_ids)
+
+        async def run_slot(demand: Demand) -> PipelineOutcome:
+            # Project slot first: waiting on it must not hold a worker
+            async with self._project_slot(demand.project_id):
+                async with self._workers:
+                    return await self._process(demand)
+
+        async def run_one(demand_id: str) -> PipelineOutcome:
+            demand = stored.get(demand_id)
+            if demand is None:
+                return PipelineOutcome(
+                    demand_id,
+                    None,
+                    error=DemandNotFoundError(f"Demand '{demand_id}' not found"),
+                )
+            return await run_slot(demand)
+
+        outcomes = await asyncio.gather(*(run_one(i) for i in unique_ids))
+        return PipelineRunResult(outcomes=list(outcomes))
+
+    @asynccontextmanager
+    async def _project_slot(self, project_id: str) -> AsyncIterator[None]:
+        """Hold one of a project's slots (dropped once the project is idle)."""
+        slots, users = self._project_slots.get(
+            project_id, (asyncio.Semaphore(self._max_per_project), 0)
+        )
+        self._project_slots[project_id] = (slots, users + 1)
+        try:
+            async with slots:
+                yield
+        finally:
+            slots, users = self._project_slots[project_id]
+            if users == 1:
+                del self._project_slots[project_id]
+            else:
+                self._project_slots[project_id] = (slots, users - 1)
+
+    async def _process(self, demand: Demand) -> PipelineOutcome:
+        """Run every step of one demand, stopping at the first error."""
+        outcome = PipelineOutcome(demand.id, demand.status)
+        if demand.status != DemandStatus.DRAFT:
+            outcome.error = DemandStatusConflictError(
+                demand.id, DemandStatus.DRAFT, demand.status
+            )
+            return outcome
+
+        agents = self._agents
+        try:
+            spec = await self._collect(
+                demand,
+                outcome,
+                agents.spec_writer.stream_generate(
+                    demand.title, demand.description, await self._budget(demand)
+                ),
+            )
+            await self._advance(demand, outcome, "spec", spec)
+
+            architecture = await self._collect(
+                demand,
+                outcome,
+                agents.architect.stream_design(
+                    spec["content"], await self._budget(demand)
+                ),
+            )
+            await self._advance(demand, outcome, "architecture", architecture)
+
+            code = await self._collect(
+                demand,
+                outcome,
+                agents.coder.stream_code(
+                    architecture["content"],
+                    spec["content"],
+                    await self._budget(demand),
+                ),
+            )
+            await self._advance(demand, outcome, "code", code)
+
+            review = await agents.reviewer.review(code["content"], spec["content"])
+            outcome.approved = bool(review.get("approved"))
+            if outcome.approved:
+                await self._advance(demand, outcome, "review", review)
+            else:
+                await self._record(demand, outcome, "review", review)
+        except Exception as exc:  # one demand never stops the run
+            outcome.error = exc
+        return outcome
+
+    async def _budget(self, demand: Demand) -> Optional[ContextBudget]:
+        """Budget left for the demand's next step (None = not enforced)."""
+        if self._projects is None:
+            return None
+        project = await self._projects.get_by_id(demand.project_id)
+        return None if project is None else project.context_budget
+
+    async def _advance(
+        self,
+        demand: Demand,
+        outcome: PipelineOutcome,
+        step: str,
+        result: Dict[str, Any],
+    ) -> None:
+        """Record a finished step and move the demand to its next status."""
+        await self._record(demand, outcome, step, result)
+        target = outcome.status.next_status()
+        await self._demands.transition(outcome.demand_id, outcome.status, target)
+        outcome.status = target
+
+    async def _record(
+        self,
+        demand: Demand,
+        outcome: PipelineOutcome,
+        step: str,
+        result: Dict[str, Any],
+    ) -> None:
+        """Keep an agent's output on the outcome and bill its tokens."""
+        outcome.artifacts[step] = result["content"]
+        if result.get("cached"):
+            outcome.cache_hits += 1
+            return
+        usage = result.get("billable_usage", result.get("usage", {}))
+        await self._bill(demand, outcome, usage.get("total_tokens", 0))
+
+    async def _bill(
+        self, demand: Demand, outcome: PipelineOutcome, tokens: int
+    ) -> None:
+        """
+        Count tokens on the outcome and charge them to the demand's project.
+
+        Raises:
+            ContextBudgetExceededError: If the project cannot pay for them;
+                what it had left is charged before raising
+        """
+        outcome.tokens_used += tokens
+        if self._projects is None or not tokens:
+            return
+        try:
+            await self._projects.consume_tokens(demand.project_id, tokens)
+        except ContextBudgetExceededError:
+            budget = await self._budget(demand)
+            if budget is not None and budget.remaining_tokens:
+                try:
+                    await self._projects.consume_tokens(
+                        demand.project_id, min(tokens, budget.remaining_tokens)
+                    )
+                except ContextBudgetExceededError:
+                    pass  # another demand drained it first
+            raise
+
+    async def _collect(
+        self,
+        demand: Demand,
+        outcome: PipelineOutcome,
+        chunks: AsyncIterator[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Read an agent stream into a result like its non-streaming method's.
+
+        If the stream fails, the tokens it had used are billed before the
+        error is re-raised: TokenBudgetExceededError carries them as
+        "used"; for other errors the last running usage is taken.
+        """
+        parts: List[str] = []
+        usage: Dict[str, int] = {}
+        cached = False
+        try:
+            async with aclosing(chunks) as stream:
+                async for chunk in stream:
+                    parts.append(chunk["delta"])
+                    usage = chunk["usage"]
+                    cached = chunk["cached"]
+        except Exception as exc:
+            spent = getattr(exc, "used", None)
+            if spent is None:
+                spent = 0 if cached else usage.get("total_tokens", 0)
+            try:
+                await self._bill(demand, outcome, spent)
+            except ContextBudgetExceededError:
+                pass  # the stream's own error is the one to report
+            raise
+        return {"content": "".join(parts), "usage": usage, "cached": cached}
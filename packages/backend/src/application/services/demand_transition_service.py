@@ -0,0 +1,181 @@
+"""
+DemandTransitionService
+
+Bulk workflow advancement (e.g. a release moving every CODE_COMPLETE
+demand to PR_MERGED). Instead of advance_to_next_status() + update() per
+demand, the service:
+
+1. loads all demands with one get_many,
+2. checks each transition against DemandStatus.next_status,
+3. applies the valid ones with one transition_many (compare-and-set
+   bulk write),
+
+and reports a typed outcome per demand. Invalid or losing items never
+abort the batch.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from application.dto.status_transition import StatusTransition
+from application.exceptions import (
+    DemandNotFoundError,
+    DemandStatusConflictError,
+    RepositoryError,
+)
+from application.interfaces.i_demand_repository import IDemandRepository
+from domain.exceptions import DomainException
+from domain.value_objects.demand_status import DemandStatus
+
+
+@dataclass(frozen=True)
+class TransitionOutcome:
+    """
+    Outcome of one demand inside a bulk transition.
+
+    Attributes:
+        demand_id: Demand UUID string
+        from_status: Status before the transition (None if not found)
+        to_status: Requested status (None if there was none to move to)
+        error: Why the demand was not moved (None on success), one of
+            DemandNotFoundError, InvalidStatusTransitionError,
+            DemandAlreadyCompletedError, DemandStatusConflictError or
+            the RepositoryError of a failed write
+    """
+
+    demand_id: str
+    from_status: Optional[DemandStatus]
+    to_status: Optional[DemandStatus]
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the demand was moved to to_status."""
+        return self.error is None
+
+
+@dataclass
+class BulkTransitionResult:
+    """
+    Outcome of a bulk transition, one TransitionOutcome per demand.
+
+    Attributes:
+        outcomes: Outcomes in input order (duplicate ids appear once)
+    """
+
+    outcomes: List[TransitionOutcome] = field(default_factory=list)
+
+    @property
+    def succeeded_ids(self) -> List[str]:
+        """Ids of demands that were moved."""
+        return [outcome.demand_id for outcome in self.outcomes if outcome.ok]
+
+    @property
+    def failed_ids(self) -> List[str]:
+        """Ids of demands that were not moved."""
+        return [outcome.demand_id for outcome in self.outcomes if not outcome.ok]
+
+    @property
+    def failures(self) -> List[TransitionOutcome]:
+        """Outcomes of demands that were not moved."""
+        return [outcome for outcome in self.outcomes if not outcome.ok]
+
+    @property
+    def has_failures(self) -> bool:
+        """True if at least one demand was not moved."""
+        return any(not outcome.ok for outcome in self.outcomes)
+
+
+class DemandTransitionService:
+    """Moves many demands through the workflow in one batched write"""
+
+    def __init__(self, demands: IDemandRepository):
+        """
+        Initialize service.
+
+        Args:
+            demands: Demand repository (transition_many does the writing)
+        """
+        self._demands = demands
+
+    async def advance_many(
+        self, demand_ids: List[str], to_status: Optional[DemandStatus] = None
+    ) -> BulkTransitionResult:
+        """
+        Advance many demands one workflow step.
+
+        Args:
+            demand_ids: Demand UUID strings (duplicates are moved once)
+            to_status: Status every demand must move to (e.g. PR_MERGED);
+                None moves each demand to its own next status
+
+        Returns:
+            One outcome per demand, in input order
+        """
+        unique_ids = list(dict.fromkeys(demand_ids))
+        stored = await self._demands.get_many(unique_ids)
+
+        outcomes: Dict[str, TransitionOutcome] = {}
+        transitions: List[StatusTransition] = []
+        for demand_id in unique_ids:
+            demand = stored.get(demand_id)
+            if demand is None:
+                outcomes[demand_id] = TransitionOutcome(
+                    demand_id, None, to_status, _not_found(demand_id)
+                )
+                continue
+            target = to_status or demand.status.next_status()
+            try:
+                demand.status.validate_transition(target)
+            except DomainException as exc:
+                outcomes[demand_id] = TransitionOutcome(
+                    demand_id, demand.status, target, exc
+                )
+                continue
+            transitions.append(StatusTransition(demand_id, demand.status, target))
+
+        if transitions:
+            result = await self._demands.transition_many(transitions)
+            lost = await self._current_statuses(result.failed_ids)
+            for transition, item in zip(transitions, result.items):
+                error = None if item.ok else _write_error(transition, item.error, lost)
+                outcomes[transition.demand_id] = TransitionOutcome(
+                    transition.demand_id,
+                    transition.from_status,
+                    transition.to_status,
+                    error,
+                )
+
+        return BulkTransitionResult(
+            outcomes=[outcomes[demand_id] for demand_id in unique_ids]
+        )
+
+    async def _current_statuses(self, demand_ids: List[str]) -> Dict[str, DemandStatus]:
+        """Statuses of demands whose write failed (one read, only on races)."""
+        if not demand_ids:
+            return {}
+        found = await self._demands.get_many(demand_ids)
+        return {demand_id: demand.status for demand_id, demand in found.items()}
+
+
+def _not_found(demand_id: str) -> DemandNotFoundError:
+    """DemandNotFoundError for demand_id."""
+    return DemandNotFoundError(f"Demand '{demand_id}' not found")
+
+
+def _write_error(
+    transition: StatusTransition,
+    message: Optional[str],
+    current: Dict[str, DemandStatus],
+) -> Exception:
+    """Typed error of an item that transition_many did not write."""
+    actual = current.get(transition.demand_id)
+    if actual is None:
+        return _not_found(transition.demand_id)
+    if actual != transition.from_status:
+        return DemandStatusConflictError(
+            transition.demand_id, transition.from_status, actual
+        )
+    return RepositoryError(message or "write failed")
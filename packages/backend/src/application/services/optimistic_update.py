@@ -0,0 +1,101 @@
+"""
+Optimistic Update Helper
+
+Read-modify-write of one entity on top of the revision check done by
+every repository write: the entity is read, a domain operation is
+applied to it and only the attributes it changed are saved with patch().
+If another writer saved the entity in between (RevisionConflictError),
+the fresh state is read again and the operation re-applied, so the
+operation must be safe to run more than once on different inputs (it
+should only depend on the entity it receives).
+
+Example:
+
+    demand = await update_with_retry(
+        demands, demand_id, lambda demand: demand.advance_to_next_status()
+    )
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import copy
+import dataclasses
+import inspect
+from typing import Any, Callable, List, Optional, TypeVar
+
+from application.exceptions import RevisionConflictError
+
+E = TypeVar("E")
+
+DEFAULT_MAX_ATTEMPTS = 5
+
+
+def changed_fields(before: Any, after: Any) -> List[str]:
+    """
+    Attributes that differ between two states of the same entity.
+
+    Args:
+        before: Copy taken before the change
+        after: Entity after the change
+
+    Returns:
+        Dataclass field names, in declaration order
+    """
+    return [
+        field.name
+        for field in dataclasses.fields(after)
+        if getattr(before, field.name) != getattr(after, field.name)
+    ]
+
+
+async def update_with_retry(
+    repository: Any,
+    entity_id: str,
+    operation: Callable[[E], Any],
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+) -> Optional[E]:
+    """
+    Apply a domain operation to the stored entity and save its changes.
+
+    Args:
+        repository: Any I*Repository (get_by_id + patch)
+        entity_id: Entity UUID string
+        operation: Mutates the entity it receives; may be a coroutine
+            function. Domain errors it raises propagate unchanged.
+        max_attempts: Reads/writes tried before giving up
+
+    Returns:
+        The saved entity (revision incremented unless the operation
+        changed nothing), None if it does not exist or was deleted
+        meanwhile
+
+    Raises:
+        ValueError: If max_attempts < 1
+        RevisionConflictError: If every attempt lost against another writer
+    """
+    if max_attempts < 1:
+        raise ValueError("max_attempts must be >= 1")
+
+    for attempt in range(1, max_attempts + 1):
+        entity = await repository.get_by_id(entity_id)
+        if entity is None:
+            return None
+        read_revision = entity.revision
+        original = copy.copy(entity)
+
+        result = operation(entity)
+        if inspect.isawaitable(result):
+            await result
+        fields = changed_fields(original, entity)
+        if not fields:
+            return entity
+
+        try:
+            await repository.patch(entity, fields)
+        except RevisionConflictError:
+            if attempt == max_attempts:
+                raise
+            continue
+        # patch() of a missing entity is a no-op: deleted after the read
+        return entity if entity.revision > read_revision else None
+    return None  # pragma: no cover - the loop returns or raises
@@ -14,6 +14,7 @@ Princípios:
 - Regras de negócio como métodos
 - Type hints completo
 - Imutabilidade onde aplicável (Value Objects)
+- Dataclasses com __slots__ (menos memória por instância)
 """
 
 # Entities
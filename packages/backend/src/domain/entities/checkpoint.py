@@ -9,9 +9,10 @@ from datetime import datetime
 from typing import Optional
 
 from ..exceptions import InvalidCheckpointError
+from ..hydration import trusted_constructor
 
 
-@dataclass
+@dataclass(slots=True)
 class Checkpoint:
     """
     Checkpoint que armazena estado de conversa.
@@ -25,6 +26,7 @@ class Checkpoint:
         tokens_used: Tokens consumidos até este checkpoint
         created_at: Data/hora de criação
         expires_at: Data/hora de expiração (TTL)
+        revision: Revisão gravada (controle de concorrência otimista)
     """
 
     id: str
@@ -33,11 +35,17 @@ class Checkpoint:
     tokens_used: int
     created_at: datetime = field(default_factory=datetime.utcnow)
     expires_at: Optional[datetime] = None
+    revision: int = 0  # Incrementada pelo repositório a cada escrita
+
+    # Reconstrói a partir de dados já validados (ex.: lidos do banco)
+    from_trusted = trusted_constructor()
 
     def __post_init__(self) -> None:
         """Valida invariantes após inicialização."""
         if not self.id:
             raise ValueError("id cannot be empty")
+        if self.revision < 0:
+            raise ValueError("revision must be >= 0")
         if not self.demand_id:
             raise ValueError("demand_id cannot be empty")
 
@@ -14,9 +14,10 @@ from ..exceptions import (
     InvalidStatusTransitionError,
     DemandAlreadyCompletedError,
 )
+from ..hydration import trusted_constructor
 
 
-@dataclass
+@dataclass(slots=True)
 class Demand:
     """
     Demanda de desenvolvimento seguindo workflow SPARC+DD.
@@ -30,6 +31,7 @@ class Demand:
         context_budget: Orçamento de contexto específico da demand
         created_at: Data/hora de criação
         updated_at: Data/hora de última atualização
+        revision: Revisão gravada (controle de concorrência otimista)
     """
 
     id: str
@@ -40,11 +42,17 @@ class Demand:
     context_budget: Optional[ContextBudget] = None
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: Optional[datetime] = None
+    revision: int = 0  # Incrementada pelo repositório a cada escrita
+
+    # Reconstrói a partir de dados já validados (ex.: lidos do banco)
+    from_trusted = trusted_constructor()
 
     def __post_init__(self) -> None:
         """Valida invariantes após inicialização."""
         if not self.id:
             raise ValueError("id cannot be empty")
+        if self.revision < 0:
+            raise ValueError("revision must be >= 0")
         if not self.project_id:
             raise ValueError("project_id cannot be empty")
         if not self.title or not self.title.strip():
@@ -10,6 +10,7 @@ from enum import Enum
 from typing import Optional
 
 from ..exceptions import InvalidMetaspecError
+from ..hydration import trusted_constructor
 
 
 class MetaspecType(str, Enum):
@@ -26,7 +27,7 @@ class MetaspecType(str, Enum):
     ARCHITECTURE = "architecture"
 
 
-@dataclass
+@dataclass(slots=True)
 class Metaspec:
     """
     Metaspecification que define requisitos e constraints de uma demand.
@@ -39,6 +40,7 @@ class Metaspec:
         version: Versão da metaspec (incremental)
         created_at: Data/hora de criação
         updated_at: Data/hora de última atualização
+        revision: Revisão gravada (controle de concorrência otimista)
     """
 
     id: str
@@ -48,11 +50,17 @@ class Metaspec:
     version: int = 1
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: Optional[datetime] = None
+    revision: int = 0  # Incrementada pelo repositório a cada escrita
+
+    # Reconstrói a partir de dados já validados (ex.: lidos do banco)
+    from_trusted = trusted_constructor()
 
     def __post_init__(self) -> None:
         """Valida invariantes após inicialização."""
         if not self.id:
             raise ValueError("id cannot be empty")
+        if self.revision < 0:
+            raise ValueError("revision must be >= 0")
         if not self.demand_id:
             raise ValueError("demand_id cannot be empty")
         if self.version < 1:
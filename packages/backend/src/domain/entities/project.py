@@ -10,9 +10,10 @@ from typing import Optional
 
 from ..value_objects.context_budget import ContextBudget
 from ..exceptions import ContextBudgetExceededError
+from ..hydration import trusted_constructor
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """
     Projeto que agrupa demands relacionadas.
@@ -25,6 +26,7 @@ class Project:
         context_budget: Orçamento de contexto (tokens)
         created_at: Data/hora de criação
         updated_at: Data/hora de última atualização
+        revision: Revisão gravada (controle de concorrência otimista)
     """
 
     id: str
@@ -34,11 +36,17 @@ class Project:
     context_budget: ContextBudget
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: Optional[datetime] = None
+    revision: int = 0  # Incrementada pelo repositório a cada escrita
+
+    # Reconstrói a partir de dados já validados (ex.: lidos do banco)
+    from_trusted = trusted_constructor()
 
     def __post_init__(self) -> None:
         """Valida invariantes após inicialização."""
         if not self.id:
             raise ValueError("id cannot be empty")
+        if self.revision < 0:
+            raise ValueError("revision must be >= 0")
         if not self.name or not self.name.strip():
             raise ValueError("name cannot be empty")
         if not self.owner_id:
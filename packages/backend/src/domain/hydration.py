@@ -0,0 +1,86 @@
+"""
+Hydration
+
+Reconstrução de objetos de domínio a partir de dados já persistidos.
+
+Entities e Value Objects validam invariantes em __post_init__. Dados lidos
+do banco já passaram por essa validação quando foram gravados, então
+revalidar em toda leitura só custa tempo (ex.: varrer o Markdown de uma
+Metaspec ou o snapshot de um Checkpoint). Use apenas com dados confiáveis.
+"""
+
+from dataclasses import MISSING, fields
+from typing import Any, Callable, Dict
+
+
+class trusted_constructor:
+    """
+    Descriptor que expõe Classe.from_trusted(**campos).
+
+    Cria a instância sem executar __post_init__; campos ausentes recebem o
+    default declarado no dataclass. Campo obrigatório faltando ou campo
+    desconhecido levantam TypeError, como no construtor.
+
+    No primeiro acesso compila uma função específica da classe e se
+    substitui por ela, então chamadas seguintes não têm custo extra.
+
+    Exemplo:
+        @dataclass
+        class Project:
+            ...
+            from_trusted = trusted_constructor()
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(self, instance: Any, owner: type) -> Callable[..., Any]:
+        builder = _compile_builder(owner)
+        setattr(owner, self._name, staticmethod(builder))
+        return builder
+
+
+def _compile_builder(cls: type) -> Callable[..., Any]:
+    """
+    Gera função com a mesma assinatura do __init__ do dataclass, mas que
+    só atribui os campos (mesma técnica usada por dataclasses para __init__).
+    """
+    frozen = cls.__dataclass_params__.frozen
+    namespace: Dict[str, Any] = {
+        "_cls": cls,
+        "_new": object.__new__,
+        "_setattr": object.__setattr__,
+        "_MISSING": MISSING,
+    }
+    parameters = []
+    body = ["    self = _new(_cls)"]
+    for item in fields(cls):
+        if not item.init:
+            continue
+        name = item.name
+        if item.default_factory is not MISSING:
+            namespace[f"_factory_{name}"] = item.default_factory
+            parameters.append(f"{name}=_MISSING")
+            body.append(f"    if {name} is _MISSING:")
+            body.append(f"        {name} = _factory_{name}()")
+        elif item.default is not MISSING:
+            namespace[f"_default_{name}"] = item.default
+            parameters.append(f"{name}=_default_{name}")
+        else:
+            parameters.append(name)
+        if frozen:
+            body.append(f"    _setattr(self, {name!r}, {name})")
+        else:
+            body.append(f"    self.{name} = {name}")
+    body.append("    return self")
+
+    # Parâmetros keyword-only: obrigatórios podem vir depois de opcionais
+    source = f"def build(*, {', '.join(parameters)}):\n" + "\n".join(body)
+    exec(source, namespace)
+    build = namespace["build"]
+    build.__qualname__ = f"{cls.__qualname__}.from_trusted"
+    build.__doc__ = (
+        f"Reconstrói {cls.__name__} a partir de dados já validados "
+        "(ex.: lidos do banco), sem executar __post_init__."
+    )
+    return build
@@ -6,8 +6,10 @@ Representa o orçamento de contexto (tokens) de um Project ou Demand.
 
 from dataclasses import dataclass
 
+from ..hydration import trusted_constructor
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ContextBudget:
     """
     Orçamento de contexto para gerenciar uso de tokens.
@@ -22,6 +24,9 @@ class ContextBudget:
     max_tokens: int
     used_tokens: int
 
+    # Reconstrói a partir de dados já validados (ex.: lidos do banco)
+    from_trusted = trusted_constructor()
+
     def __post_init__(self) -> None:
         """Valida invariantes após inicialização."""
         if self.max_tokens < 0:
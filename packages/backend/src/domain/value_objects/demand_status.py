@@ -7,6 +7,8 @@ Representa os possíveis estados de uma Demand no workflow SPARC+DD.
 from enum import Enum
 from typing import Optional
 
+from ..exceptions import DemandAlreadyCompletedError, InvalidStatusTransitionError
+
 
 class DemandStatus(str, Enum):
     """
@@ -50,6 +52,29 @@ class DemandStatus(str, Enum):
         """
         return target == self.next_status()
 
+    def validate_transition(self, target: 'DemandStatus') -> None:
+        """
+        Garante que transição para target é permitida.
+
+        Mesmas regras de Demand.transition_to, para quem persiste a
+        transição sem carregar a Demand (ex.: repository.transition).
+
+        Args:
+            target: Status de destino
+
+        Raises:
+            DemandAlreadyCompletedError: Se status atual é final
+            InvalidStatusTransitionError: Se target não é o próximo status
+        """
+        if self.is_final():
+            raise DemandAlreadyCompletedError(
+                f"Cannot transition from {self.value} - already completed (PR_MERGED)"
+            )
+        if not self.can_transition_to(target):
+            raise InvalidStatusTransitionError(
+                f"Cannot transition from {self.value} to {target.value}"
+            )
+
     def is_final(self) -> bool:
         """
         Verifica se é o status final do workflow.
@@ -0,0 +1,19 @@
+"""
+Entity Caching
+
+Read-through cache decorator for repositories, with an in-process
+LRU/TTL tier and an optional Redis-protocol second tier.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+from infrastructure.cache.cached_repository import CachedRepository
+from infrastructure.cache.lru_ttl_cache import CacheStats, LRUTTLCache
+from infrastructure.cache.redis_tier import RedisCacheTier
+
+__all__ = [
+    "CachedRepository",
+    "CacheStats",
+    "LRUTTLCache",
+    "RedisCacheTier",
+]
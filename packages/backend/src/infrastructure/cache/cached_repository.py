@@ -0,0 +1,238 @@
+"""
+CachedRepository Decorator
+
+Read-through cache in front of any I*Repository (projects, demands,
+metaspecs, checkpoints). get_by_id and get_many are served from a bounded
+LRU with TTL, then from an optional Redis-protocol tier, and only then
+from the wrapped repository. Writes made through the decorator invalidate
+the written ids in both tiers.
+
+Writes made by other processes are only picked up when the entry expires,
+so keep the TTL short for data that must be fresh.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import copy
+import time
+from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, TypeVar
+
+from application.dto.bulk_write_result import BulkWriteResult
+from infrastructure.cache.lru_ttl_cache import CacheStats, LRUTTLCache
+from infrastructure.cache.redis_tier import RedisCacheTier
+
+E = TypeVar("E")
+
+
+class CachedRepository(Generic[E]):
+    """Caching decorator; other repository methods are passed through"""
+
+    # Entity-specific writes whose first argument is the entity id
+    INVALIDATING_METHODS = frozenset({"consume_tokens", "transition"})
+    # Entity-specific batch writes -> ids written, from their first argument
+    INVALIDATING_BATCH_METHODS: Dict[str, Callable[[Any], List[str]]] = {
+        "transition_many": lambda transitions: [
+            transition.demand_id for transition in transitions
+        ],
+    }
+
+    def __init__(
+        self,
+        repository: Any,
+        max_entries: int = 1024,
+        ttl_seconds: Optional[float] = 30.0,
+        second_tier: Optional[RedisCacheTier] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize decorator.
+
+        Args:
+            repository: Repository to wrap (any I*Repository)
+            max_entries: In-process cache size
+            ttl_seconds: In-process entry lifetime (None = no expiry)
+            second_tier: Optional shared tier consulted on local misses
+            clock: Time source in seconds (injectable for tests)
+        """
+        self._repository = repository
+        self._cache: LRUTTLCache[E] = LRUTTLCache(max_entries, ttl_seconds, clock)
+        self._second_tier = second_tier
+        # Bumped after every write, so a read racing a write is not cached
+        self._writes = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """Counters of the in-process tier."""
+        return self._cache.stats
+
+    @property
+    def second_tier_stats(self) -> Optional[CacheStats]:
+        """Counters of the shared tier (None when not configured)."""
+        if self._second_tier is None:
+            return None
+        return self._second_tier.stats
+
+    async def get_by_id(self, entity_id: str) -> Optional[E]:
+        """
+        Retrieve an entity, from cache when possible.
+
+        Args:
+            entity_id: Entity UUID string
+
+        Returns:
+            Entity if found, None otherwise
+        """
+        cached = self._cache.get(entity_id)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        writes = self._writes
+        if self._second_tier is not None:
+            shared = await self._second_tier.get(entity_id)
+            if shared is not None:
+                self._store_local(writes, {entity_id: shared})
+                return shared
+
+        entity = await self._repository.get_by_id(entity_id)
+        if entity is not None:
+            await self._store(writes, {entity_id: entity})
+        return entity
+
+    async def get_many(self, entity_ids: List[str]) -> Dict[str, E]:
+        """
+        Retrieve many entities; only cache misses reach the repository.
+
+        Args:
+            entity_ids: Entity UUID strings (duplicates allowed)
+
+        Returns:
+            Mapping of id to entity; ids not found are absent
+        """
+        found: Dict[str, E] = {}
+        missing: List[str] = []
+        for entity_id in dict.fromkeys(entity_ids):
+            cached = self._cache.get(entity_id)
+            if cached is None:
+                missing.append(entity_id)
+            else:
+                found[entity_id] = copy.deepcopy(cached)
+        if not missing:
+            return found
+
+        writes = self._writes
+        if self._second_tier is not None:
+            shared = await self._second_tier.get_many(missing)
+            self._store_local(writes, shared)
+            found.update(shared)
+            missing = [entity_id for entity_id in missing if entity_id not in shared]
+            if not missing:
+                return found
+
+        loaded = await self._repository.get_many(missing)
+        await self._store(writes, loaded)
+        found.update(loaded)
+        return found
+
+    async def create(self, entity: E) -> E:
+        """Persist a new entity (pass-through, invalidates its id)."""
+        try:
+            return await self._repository.create(entity)
+        finally:
+            await self._invalidate([entity.id])
+
+    async def update(self, entity: E) -> E:
+        """Update an entity and invalidate its cache entries."""
+        try:
+            return await self._repository.update(entity)
+        finally:
+            await self._invalidate([entity.id])
+
+    async def patch(self, entity: E, fields: Iterable[str]) -> E:
+        """Write some attributes of an entity and invalidate its cache entries."""
+        try:
+            return await self._repository.patch(entity, fields)
+        finally:
+            await self._invalidate([entity.id])
+
+    async def delete(self, entity_id: str) -> None:
+        """Remove an entity and invalidate its cache entries."""
+        try:
+            await self._repository.delete(entity_id)
+        finally:
+            await self._invalidate([entity_id])
+
+    async def create_many(self, entities: List[E]) -> BulkWriteResult:
+        """Persist many entities (pass-through, invalidates their ids)."""
+        try:
+            return await self._repository.create_many(entities)
+        finally:
+            await self._invalidate([entity.id for entity in entities])
+
+    async def update_many(self, entities: List[E]) -> BulkWriteResult:
+        """Update many entities and invalidate their cache entries."""
+        try:
+            return await self._repository.update_many(entities)
+        finally:
+            await self._invalidate([entity.id for entity in entities])
+
+    async def delete_many(self, entity_ids: List[str]) -> BulkWriteResult:
+        """Remove many entities and invalidate their cache entries."""
+        try:
+            return await self._repository.delete_many(entity_ids)
+        finally:
+            await self._invalidate(entity_ids)
+
+    def __getattr__(self, name: str) -> Any:
+        """Pass other methods through; wrap entity-specific writes."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        attribute = getattr(self._repository, name)
+        batch_ids = self.INVALIDATING_BATCH_METHODS.get(name)
+        if batch_ids is not None:
+
+            async def invalidating_batch(items: Any, *args: Any, **kwargs: Any) -> Any:
+                try:
+                    return await attribute(items, *args, **kwargs)
+                finally:
+                    await self._invalidate(batch_ids(items))
+
+            return invalidating_batch
+        if name not in self.INVALIDATING_METHODS:
+            return attribute
+
+        async def invalidating(entity_id: str, *args: Any, **kwargs: Any) -> Any:
+            try:
+                return await attribute(entity_id, *args, **kwargs)
+            finally:
+                await self._invalidate([entity_id])
+
+        return invalidating
+
+    def clear(self) -> None:
+        """Drop every in-process entry (the shared tier expires by TTL)."""
+        self._writes += 1
+        self._cache.clear()
+
+    def _store_local(self, writes: int, entities: Dict[str, E]) -> None:
+        """Cache loaded entities unless a write happened during the load."""
+        if writes != self._writes:
+            return
+        for entity_id, entity in entities.items():
+            self._cache.set(entity_id, copy.deepcopy(entity))
+
+    async def _store(self, writes: int, entities: Dict[str, E]) -> None:
+        """Cache loaded entities in both tiers (see _store_local)."""
+        if writes != self._writes or not entities:
+            return
+        self._store_local(writes, entities)
+        if self._second_tier is not None:
+            await self._second_tier.set_many(entities)
+
+    async def _invalidate(self, entity_ids: Iterable[str]) -> None:
+        """Drop written ids from both tiers."""
+        ids = list(entity_ids)
+        self._writes += 1
+        for entity_id in ids:
+            self._cache.delete(entity_id)
+        if self._second_tier is not None:
+            await self._second_tier.delete(ids)
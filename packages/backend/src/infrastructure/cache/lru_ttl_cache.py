@@ -0,0 +1,138 @@
+"""
+LRU/TTL Cache
+
+Bounded in-process cache: least recently used entries are evicted when
+full, and entries older than the TTL are treated as missing.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+@dataclass
+class CacheStats:
+    """
+    Cache counters.
+
+    Attributes:
+        hits: Lookups answered by the cache
+        misses: Lookups that fell through to the repository
+        evictions: Entries dropped to stay within max_entries
+        expirations: Entries dropped because their TTL elapsed
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from cache (0.0 when unused)."""
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return self.hits / lookups
+
+
+class LRUTTLCache(Generic[V]):
+    """Bounded LRU cache whose entries expire after ttl_seconds"""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: Optional[float] = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum number of entries kept
+            ttl_seconds: Entry lifetime (None = no expiry)
+            clock: Time source in seconds (injectable for tests)
+
+        Raises:
+            ValueError: If max_entries < 1 or ttl_seconds <= 0
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be > 0")
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Optional[V]:
+        """
+        Look up a key, counting a hit or a miss.
+
+        Args:
+            key: Cache key
+            default: Returned on miss
+
+        Returns:
+            Cached value, or default if absent or expired
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at >= self._clock():
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return value
+            del self._entries[key]
+            self.stats.expirations += 1
+
+        self.stats.misses += 1
+        return default
+
+    def set(self, key: Hashable, value: V) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        expires_at = float("inf") if self._ttl is None else self._clock() + self._ttl
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def items(self) -> List[Tuple[Hashable, V]]:
+        """
+        Unexpired entries, least recently used first.
+
+        Does not count hits or misses, nor change the LRU order.
+
+        Returns:
+            (key, value) pairs
+        """
+        now = self._clock()
+        return [
+            (key, value)
+            for key, (expires_at, value) in self._entries.items()
+            if expires_at >= now
+        ]
+
+    def delete(self, key: Hashable) -> None:
+        """Remove a key (no-op if absent)."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries (counters are kept)."""
+        self._entries.clear()
@@ -0,0 +1,132 @@
+"""
+Redis Cache Tier
+
+Optional second cache tier shared between processes. Talks to any client
+exposing the redis.asyncio subset get / mget / set(ex=) / delete, so it
+works with redis-py, compatible servers (KeyDB, Dragonfly, Valkey) and
+in-process stand-ins for tests.
+
+Values are pickled by default: only point it at a Redis you trust, or
+pass your own encode/decode.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import pickle
+from typing import Any, Callable, Dict, Iterable, List, Optional, Protocol
+
+from infrastructure.cache.lru_ttl_cache import CacheStats
+
+
+class RedisLike(Protocol):
+    """Subset of the redis.asyncio client used by RedisCacheTier"""
+
+    async def get(self, name: str) -> Optional[bytes]: ...
+
+    async def mget(self, keys: List[str]) -> List[Optional[bytes]]: ...
+
+    async def set(self, name: str, value: bytes, ex: Optional[int] = None) -> Any: ...
+
+    async def delete(self, *names: str) -> int: ...
+
+
+class RedisCacheTier:
+    """Key/value tier backed by a Redis-protocol client"""
+
+    def __init__(
+        self,
+        client: RedisLike,
+        prefix: str,
+        ttl_seconds: Optional[int] = 300,
+        encode: Callable[[Any], bytes] = pickle.dumps,
+        decode: Callable[[bytes], Any] = pickle.loads,
+    ):
+        """
+        Initialize tier.
+
+        Args:
+            client: redis.asyncio.Redis (or compatible) instance
+            prefix: Key namespace, e.g. "context-first:projects"
+            ttl_seconds: Key expiry sent with SET (None = no expiry)
+            encode: Value serializer
+            decode: Value deserializer
+        """
+        self._client = client
+        self._prefix = prefix
+        self._ttl = ttl_seconds
+        self._encode = encode
+        self._decode = decode
+        self.stats = CacheStats()
+
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        Fetch a value.
+
+        Args:
+            key: Entity id
+
+        Returns:
+            Decoded value, or None if absent
+        """
+        data = await self._client.get(self._key(key))
+        if data is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return self._decode(data)
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Fetch many values with one MGET.
+
+        Args:
+            keys: Entity ids
+
+        Returns:
+            Mapping of key to decoded value; absent keys are omitted
+        """
+        if not keys:
+            return {}
+        values = await self._client.mget([self._key(key) for key in keys])
+        found = {
+            key: self._decode(data)
+            for key, data in zip(keys, values)
+            if data is not None
+        }
+        self.stats.hits += len(found)
+        self.stats.misses += len(keys) - len(found)
+        return found
+
+    async def set(self, key: str, value: Any) -> None:
+        """
+        Store a value with the tier TTL.
+
+        Args:
+            key: Entity id
+            value: Value to store
+        """
+        await self._client.set(self._key(key), self._encode(value), ex=self._ttl)
+
+    async def set_many(self, values: Dict[str, Any]) -> None:
+        """
+        Store many values with the tier TTL.
+
+        Args:
+            values: Mapping of entity id to value
+        """
+        for key, value in values.items():
+            await self.set(key, value)
+
+    async def delete(self, keys: Iterable[str]) -> None:
+        """
+        Remove values.
+
+        Args:
+            keys: Entity ids
+        """
+        names = [self._key(key) for key in keys]
+        if names:
+            await self._client.delete(*names)
+
+    def _key(self, key: str) -> str:
+        return f"{self._prefix}:{key}"
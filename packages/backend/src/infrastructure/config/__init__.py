@@ -0,0 +1,9 @@
+"""
+Configuration
+
+Environment-driven settings (pydantic-settings).
+"""
+
+from infrastructure.config.settings import MongoSettings, get_mongo_settings
+
+__all__ = ["MongoSettings", "get_mongo_settings"]
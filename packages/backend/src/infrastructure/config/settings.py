@@ -0,0 +1,77 @@
+"""
+Settings
+
+MongoDB connection, pool and checkpoint storage settings, read from
+MONGODB_* environment variables (or a .env file). See .env.example.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from infrastructure.persistence.snapshot_codecs import DEFAULT_CODEC
+
+
+class MongoSettings(BaseSettings):
+    """
+    MongoDB client settings.
+
+    Pool defaults match pymongo, except the connect/server-selection
+    timeouts, which are lowered so an unreachable database fails fast.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="MONGODB_", env_file=".env", extra="ignore"
+    )
+
+    uri: str = "mongodb://localhost:27017"
+    db_name: str = "context_first_dev"
+
+    # Connection pool
+    max_pool_size: int = Field(default=100, ge=0)  # 0 = unbounded
+    min_pool_size: int = Field(default=0, ge=0)
+    max_idle_time_ms: Optional[int] = Field(default=None, gt=0)
+    max_connecting: int = Field(default=2, ge=1)
+
+    # Wire compression, comma-separated in order of preference ("zstd,zlib")
+    compressors: str = ""
+
+    # Timeouts
+    connect_timeout_ms: int = Field(default=5_000, gt=0)
+    server_selection_timeout_ms: int = Field(default=5_000, gt=0)
+    socket_timeout_ms: Optional[int] = Field(default=None, gt=0)
+    wait_queue_timeout_ms: Optional[int] = Field(default=None, gt=0)
+
+    # Checkpoint storage (MongoCheckpointRepository)
+    checkpoint_codec: Optional[str] = DEFAULT_CODEC  # "" = uncompressed
+    checkpoint_keyframe_interval: Optional[int] = Field(default=None, ge=1)
+
+    @field_validator("checkpoint_codec")
+    @classmethod
+    def _empty_codec_is_none(cls, value):
+        """An empty codec name stores snapshots uncompressed."""
+        return value or None
+
+    @field_validator("min_pool_size")
+    @classmethod
+    def _min_within_max(cls, value, info):
+        """min_pool_size cannot exceed a bounded max_pool_size."""
+        max_pool_size = info.data.get("max_pool_size")
+        if max_pool_size and value > max_pool_size:
+            raise ValueError("min_pool_size must be <= max_pool_size")
+        return value
+
+
+@lru_cache
+def get_mongo_settings() -> MongoSettings:
+    """
+    Process-wide MongoSettings (read once).
+
+    Returns:
+        MongoSettings instance
+    """
+    return MongoSettings()
@@ -0,0 +1,38 @@
+"""
+Partial Updates
+
+Backend-neutral part of the repositories' patch(): checking which
+attributes a caller asked to write. Every backend then writes only those
+attributes (MongoDB $set / $unset, SQLite "SET column = ?", in-memory
+attribute copy), filtered on the entity revision like update().
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import dataclasses
+from typing import Any, Iterable, Tuple
+
+# Managed by the repositories, never written by a patch
+PROTECTED_FIELDS = frozenset({"id", "revision"})
+
+
+def patch_fields(entity: Any, fields: Iterable[str]) -> Tuple[str, ...]:
+    """
+    Validated attribute names of a patch, without duplicates.
+
+    Args:
+        entity: Entity passed to patch()
+        fields: Attribute names the caller wants written
+
+    Returns:
+        Names in first-seen order (empty: nothing to write)
+
+    Raises:
+        ValueError: If a name is unknown or in PROTECTED_FIELDS
+    """
+    names = tuple(dict.fromkeys(fields))
+    known = {field.name for field in dataclasses.fields(entity)}
+    for name in names:
+        if name not in known or name in PROTECTED_FIELDS:
+            raise ValueError(f"{type(entity).__name__}.{name} cannot be patched")
+    return names
@@ -0,0 +1,29 @@
+"""
+In-memory Persistence
+
+Dict-backed repositories sharing one InMemoryStore.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+from infrastructure.persistence.memory.memory_checkpoint_repository import (
+    InMemoryCheckpointRepository,
+)
+from infrastructure.persistence.memory.memory_demand_repository import (
+    InMemoryDemandRepository,
+)
+from infrastructure.persistence.memory.memory_metaspec_repository import (
+    InMemoryMetaspecRepository,
+)
+from infrastructure.persistence.memory.memory_project_repository import (
+    InMemoryProjectRepository,
+)
+from infrastructure.persistence.memory.memory_store import InMemoryStore
+
+__all__ = [
+    "InMemoryCheckpointRepository",
+    "InMemoryDemandRepository",
+    "InMemoryMetaspecRepository",
+    "InMemoryProjectRepository",
+    "InMemoryStore",
+]
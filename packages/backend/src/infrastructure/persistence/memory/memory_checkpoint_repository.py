@@ -0,0 +1,167 @@
+"""
+InMemoryCheckpointRepository Implementation
+
+In-memory adapter for Checkpoint persistence (benchmarks, tests and
+single-node deployments). Implements ICheckpointRepository.
+
+Snapshots are kept as plain strings; expires_at is stored but expired
+checkpoints are not purged (no TTL monitor).
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+from application.dto.bulk_write_result import BulkWriteResult
+from application.dto.lazy import LazyCheckpoint, LazyField
+from application.dto.page import DEFAULT_PAGE_SIZE, Page
+from application.dto.summaries import CheckpointSummary
+from application.exceptions import DuplicateEntityError, RepositoryError
+from application.interfaces.i_checkpoint_repository import ICheckpointRepository
+from domain.entities.checkpoint import Checkpoint
+from infrastructure.persistence.field_patches import patch_fields
+from infrastructure.persistence.memory.memory_store import (
+    InMemoryStore,
+    clone,
+    delete_rows,
+    fetch_page,
+    get_rows,
+    insert_rows,
+    patch_row,
+    replace_row,
+    replace_rows,
+)
+
+
+class InMemoryCheckpointRepository(ICheckpointRepository):
+    """In-memory implementation of ICheckpointRepository"""
+
+    def __init__(self, store: InMemoryStore):
+        """
+        Initialize repository.
+
+        Args:
+            store: Shared in-memory store
+        """
+        self._table = store.checkpoints
+
+    async def create(self, checkpoint: Checkpoint) -> Checkpoint:
+        """
+        Persist a new checkpoint.
+
+        Raises:
+            DuplicateEntityError: If a checkpoint with the same ID exists
+        """
+        if checkpoint.id in self._table:
+            raise DuplicateEntityError(f"Checkpoint '{checkpoint.id}' already exists")
+        self._table.put(checkpoint.id, checkpoint)
+        return checkpoint
+
+    async def get_by_id(self, checkpoint_id: str) -> Optional[Checkpoint]:
+        """Retrieve a copy of a checkpoint by its UUID."""
+        checkpoint = self._table.get(checkpoint_id)
+        return None if checkpoint is None else clone(checkpoint)
+
+    async def get_many(self, checkpoint_ids: List[str]) -> Dict[str, Checkpoint]:
+        """Retrieve copies of many checkpoints; ids not found are absent."""
+        return get_rows(self._table, checkpoint_ids)
+
+    async def list_checkpoints(
+        self,
+        demand_id: str,
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[Checkpoint]:
+        """
+        List a demand's checkpoints, newest first (keyset pagination).
+
+        Raises:
+            ValueError: If limit or cursor is invalid
+        """
+        return fetch_page(self._table, "demand", demand_id, after, limit)
+
+    async def get_summary(self, checkpoint_id: str) -> Optional[CheckpointSummary]:
+        """Retrieve a checkpoint without its context_snapshot."""
+        checkpoint = self._table.get(checkpoint_id)
+        return None if checkpoint is None else self._to_summary(checkpoint)
+
+    async def list_checkpoint_summaries(
+        self,
+        demand_id: str,
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[CheckpointSummary]:
+        """
+        Same as list_checkpoints, without context_snapshot.
+
+        Raises:
+            ValueError: If limit or cursor is invalid
+        """
+        return fetch_page(
+            self._table, "demand", demand_id, after, limit, convert=self._to_summary
+        )
+
+    async def get_lazy(self, checkpoint_id: str) -> Optional[LazyCheckpoint]:
+        """Retrieve a checkpoint whose context_snapshot is read on access."""
+        checkpoint = self._table.get(checkpoint_id)
+        if checkpoint is None:
+            return None
+        return LazyCheckpoint(
+            **vars(self._to_summary(checkpoint)),
+            snapshot_field=LazyField(lambda: self._load_snapshot(checkpoint_id)),
+        )
+
+    async def update(self, checkpoint: Checkpoint) -> Checkpoint:
+        """
+        Replace a stored checkpoint if nobody saved it since it was read
+        (no-op if it does not exist).
+
+        Raises:
+            RevisionConflictError: If the stored revision is not checkpoint.revision
+        """
+        replace_row(self._table, checkpoint)
+        return checkpoint
+
+    async def patch(self, checkpoint: Checkpoint, fields: Iterable[str]) -> Checkpoint:
+        """
+        Copy only some attributes onto the stored checkpoint (no-op if missing).
+
+        Raises:
+            ValueError: If a field is unknown or protected
+            RevisionConflictError: If the stored revision is not checkpoint.revision
+        """
+        patch_row(self._table, checkpoint, patch_fields(checkpoint, fields))
+        return checkpoint
+
+    async def delete(self, checkpoint_id: str) -> None:
+        """Remove a checkpoint (no-op if it does not exist)."""
+        self._table.pop(checkpoint_id)
+
+    async def create_many(self, checkpoints: List[Checkpoint]) -> BulkWriteResult:
+        """Persist many new checkpoints; duplicates are reported per item."""
+        return insert_rows(self._table, checkpoints)
+
+    async def update_many(self, checkpoints: List[Checkpoint]) -> BulkWriteResult:
+        """Update many checkpoints; unknown ids are reported per item."""
+        return replace_rows(self._table, checkpoints)
+
+    async def delete_many(self, checkpoint_ids: List[str]) -> BulkWriteResult:
+        """Remove many checkpoints; unknown ids are not an error."""
+        return delete_rows(self._table, checkpoint_ids)
+
+    async def _load_snapshot(self, checkpoint_id: str) -> str:
+        """Snapshot of a stored checkpoint (for LazyCheckpoint)."""
+        checkpoint = self._table.get(checkpoint_id)
+        if checkpoint is None:
+            raise RepositoryError(f"Checkpoint '{checkpoint_id}' no longer exists")
+        return checkpoint.context_snapshot
+
+    def _to_summary(self, checkpoint: Checkpoint) -> CheckpointSummary:
+        return CheckpointSummary(
+            id=checkpoint.id,
+            demand_id=checkpoint.demand_id,
+            tokens_used=checkpoint.tokens_used,
+            created_at=checkpoint.created_at,
+            expires_at=checkpoint.expires_at,
+            revision=checkpoint.revision,
+        )
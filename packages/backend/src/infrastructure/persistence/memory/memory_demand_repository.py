@@ -0,0 +1,193 @@
+"""
+InMemoryDemandRepository Implementation
+
+In-memory adapter for Demand persistence (benchmarks, tests and
+single-node deployments). Implements IDemandRepository.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from application.dto.bulk_write_result import (
+    NOT_FOUND_ERROR,
+    BulkWriteResult,
+    bulk_result,
+)
+from application.dto.page import DEFAULT_PAGE_SIZE, Page
+from application.dto.status_counts import status_counts
+from application.dto.status_transition import STATUS_CONFLICT_ERROR, StatusTransition
+from application.exceptions import (
+    DemandNotFoundError,
+    DemandStatusConflictError,
+    DuplicateEntityError,
+)
+from application.interfaces.i_demand_repository import IDemandRepository
+from domain.entities.demand import Demand
+from domain.value_objects.demand_status import DemandStatus
+from infrastructure.persistence.field_patches import patch_fields
+from infrastructure.persistence.memory.memory_store import (
+    InMemoryStore,
+    clone,
+    delete_rows,
+    fetch_page,
+    get_rows,
+    insert_rows,
+    patch_row,
+    replace_row,
+    replace_rows,
+)
+from infrastructure.persistence.status_transitions import rejected_transitions
+
+
+class InMemoryDemandRepository(IDemandRepository):
+    """In-memory implementation of IDemandRepository"""
+
+    def __init__(self, store: InMemoryStore):
+        """
+        Initialize repository.
+
+        Args:
+            store: Shared in-memory store
+        """
+        self._table = store.demands
+
+    async def create(self, demand: Demand) -> Demand:
+        """
+        Persist a new demand.
+
+        Raises:
+            DuplicateEntityError: If a demand with the same ID exists
+        """
+        if demand.id in self._table:
+            raise DuplicateEntityError(f"Demand '{demand.id}' already exists")
+        self._table.put(demand.id, demand)
+        return demand
+
+    async def get_by_id(self, demand_id: str) -> Optional[Demand]:
+        """Retrieve a copy of a demand by its UUID."""
+        demand = self._table.get(demand_id)
+        return None if demand is None else clone(demand)
+
+    async def get_many(self, demand_ids: List[str]) -> Dict[str, Demand]:
+        """Retrieve copies of many demands; ids not found are absent."""
+        return get_rows(self._table, demand_ids)
+
+    async def list_by_project(
+        self,
+        project_id: str,
+        status: Optional[DemandStatus] = None,
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[Demand]:
+        """
+        List a project's demands, newest first, optionally by status.
+
+        Raises:
+            ValueError: If limit or cursor is invalid
+        """
+        if status is None:
+            return fetch_page(self._table, "project", project_id, after, limit)
+        return fetch_page(
+            self._table, "project_status", (project_id, status.value), after, limit
+        )
+
+    async def count_by_status(self, project_id: str) -> Dict[DemandStatus, int]:
+        """Count a project's demands per status (sizes of the status index)."""
+        index = self._table.index("project_status")
+        return status_counts(
+            {
+                status.value: index.count((project_id, status.value))
+                for status in DemandStatus
+            }
+        )
+
+    async def get_status_rollup(self, project_id: str) -> Dict[DemandStatus, int]:
+        """Same as count_by_status: the status index is kept up to date."""
+        return await self.count_by_status(project_id)
+
+    async def update(self, demand: Demand) -> Demand:
+        """
+        Replace a stored demand if nobody saved it since it was read
+        (no-op if it does not exist).
+
+        Raises:
+            RevisionConflictError: If the stored revision is not demand.revision
+        """
+        replace_row(self._table, demand)
+        return demand
+
+    async def patch(self, demand: Demand, fields: Iterable[str]) -> Demand:
+        """
+        Copy only some attributes onto the stored demand (no-op if missing).
+
+        Raises:
+            ValueError: If a field is unknown or protected
+            RevisionConflictError: If the stored revision is not demand.revision
+        """
+        patch_row(self._table, demand, patch_fields(demand, fields))
+        return demand
+
+    async def transition(
+        self, demand_id: str, from_status: DemandStatus, to_status: DemandStatus
+    ) -> None:
+        """
+        Compare-and-set a demand's status (no await in between: atomic).
+
+        Raises:
+            InvalidStatusTransitionError: If to_status does not follow from_status
+            DemandAlreadyCompletedError: If from_status is final
+            DemandNotFoundError: If demand does not exist
+            DemandStatusConflictError: If the demand is no longer in from_status
+        """
+        from_status.validate_transition(to_status)
+        stored = self._table.get(demand_id)
+        if stored is None:
+            raise DemandNotFoundError(f"Demand '{demand_id}' not found")
+        if stored.status != from_status:
+            raise DemandStatusConflictError(demand_id, from_status, stored.status)
+
+        updated = clone(stored)
+        updated.status = to_status
+        updated.updated_at = datetime.utcnow()
+        updated.revision += 1
+        self._table.put(demand_id, updated)
+
+    async def delete(self, demand_id: str) -> None:
+        """Remove a demand (no-op if it does not exist)."""
+        self._table.pop(demand_id)
+
+    async def create_many(self, demands: List[Demand]) -> BulkWriteResult:
+        """Persist many new demands; duplicates are reported per item."""
+        return insert_rows(self._table, demands)
+
+    async def update_many(self, demands: List[Demand]) -> BulkWriteResult:
+        """Update many demands; unknown ids are reported per item."""
+        return replace_rows(self._table, demands)
+
+    async def transition_many(
+        self, transitions: List[StatusTransition]
+    ) -> BulkWriteResult:
+        """Compare-and-set many statuses; each item fails on its own."""
+        errors = rejected_transitions(transitions)
+        now = datetime.utcnow()
+        for index, transition in enumerate(transitions):
+            if index in errors:
+                continue
+            stored = self._table.get(transition.demand_id)
+            if stored is None:
+                errors[index] = NOT_FOUND_ERROR
+            elif stored.status != transition.from_status:
+                errors[index] = STATUS_CONFLICT_ERROR
+            else:
+                updated = clone(stored)
+                updated.status = transition.to_status
+                updated.updated_at = now
+                updated.revision += 1
+                self._table.put(transition.demand_id, updated)
+        return bulk_result([transition.demand_id for transition in transitions], errors)
+
+    async def delete_many(self, demand_ids: List[str]) -> BulkWriteResult:
+        """Remove many demands; unknown ids are not an error."""
+        return delete_rows(self._table, demand_ids)
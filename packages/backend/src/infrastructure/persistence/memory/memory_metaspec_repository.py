@@ -0,0 +1,278 @@
+"""
+InMemoryMetaspecRepository Implementation
+
+In-memory adapter for Metaspec persistence (benchmarks, tests and
+single-node deployments). Implements IMetaspecRepository.
+
+Same versioning rules as the MongoDB adapter: every version is kept in
+the metaspec_versions table; the metaspecs table holds the latest one.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+from application.dto.bulk_write_result import (
+    DUPLICATE_ERROR,
+    NOT_FOUND_ERROR,
+    REVISION_CONFLICT_ERROR,
+    BulkWriteResult,
+    bulk_result,
+)
+from application.dto.lazy import LazyField, LazyMetaspec
+from application.dto.page import DEFAULT_PAGE_SIZE, Page
+from application.dto.summaries import MetaspecSummary
+from application.exceptions import (
+    DuplicateEntityError,
+    RepositoryError,
+    RevisionConflictError,
+)
+from application.interfaces.i_metaspec_repository import IMetaspecRepository
+from domain.entities.metaspec import Metaspec, MetaspecType
+from infrastructure.persistence.field_patches import patch_fields
+from infrastructure.persistence.memory.memory_store import (
+    InMemoryStore,
+    clone,
+    fetch_page,
+    get_rows,
+)
+
+
+class InMemoryMetaspecRepository(IMetaspecRepository):
+    """In-memory implementation of IMetaspecRepository"""
+
+    def __init__(self, store: InMemoryStore):
+        """
+        Initialize repository.
+
+        Args:
+            store: Shared in-memory store
+        """
+        self._latest = store.metaspecs
+        self._versions = store.metaspec_versions
+
+    async def create(self, metaspec: Metaspec) -> Metaspec:
+        """
+        Persist a new metaspec.
+
+        Raises:
+            DuplicateEntityError: If a metaspec with the same ID exists
+        """
+        if metaspec.id in self._latest:
+            raise DuplicateEntityError(f"Metaspec '{metaspec.id}' already exists")
+        self._store(metaspec, latest=True)
+        return metaspec
+
+    async def get_by_id(self, metaspec_id: str) -> Optional[Metaspec]:
+        """Retrieve a copy of the latest version of a metaspec."""
+        metaspec = self._latest.get(metaspec_id)
+        return None if metaspec is None else clone(metaspec)
+
+    async def get_many(self, metaspec_ids: List[str]) -> Dict[str, Metaspec]:
+        """Retrieve the latest version of many metaspecs."""
+        return get_rows(self._latest, metaspec_ids)
+
+    async def get_latest(
+        self, demand_id: str, metaspec_type: MetaspecType
+    ) -> Optional[Metaspec]:
+        """Retrieve the highest version of a demand's metaspec of a type."""
+        entries = self._versions.index("demand_type").descending(
+            (demand_id, metaspec_type.value), limit=1
+        )
+        if not entries:
+            return None
+        return clone(self._versions.rows[entries[0][1]])
+
+    async def get_version(
+        self, demand_id: str, metaspec_type: MetaspecType, version: int
+    ) -> Optional[Metaspec]:
+        """Retrieve a specific (possibly superseded) version."""
+        # () sorts before every (id, version) key: first entry <= version
+        entries = self._versions.index("demand_type").descending(
+            (demand_id, metaspec_type.value), before=(version + 1, ()), limit=1
+        )
+        if not entries or entries[0][0] != version:
+            return None
+        return clone(self._versions.rows[entries[0][1]])
+
+    async def list_metaspecs(
+        self,
+        demand_id: str,
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[Metaspec]:
+        """
+        List metaspecs (latest versions), highest version first.
+
+        Raises:
+            ValueError: If limit or cursor is invalid
+        """
+        return fetch_page(self._latest, "demand", demand_id, after, limit)
+
+    async def get_summary(self, metaspec_id: str) -> Optional[MetaspecSummary]:
+        """Retrieve a metaspec without its content."""
+        metaspec = self._latest.get(metaspec_id)
+        return None if metaspec is None else self._to_summary(metaspec)
+
+    async def list_metaspec_summaries(
+        self,
+        demand_id: str,
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[MetaspecSummary]:
+        """
+        Same as list_metaspecs, without content.
+
+        Raises:
+            ValueError: If limit or cursor is invalid
+        """
+        return fetch_page(
+            self._latest, "demand", demand_id, after, limit, convert=self._to_summary
+        )
+
+    async def get_lazy(self, metaspec_id: str) -> Optional[LazyMetaspec]:
+        """Retrieve a metaspec whose content is read on first access."""
+        metaspec = self._latest.get(metaspec_id)
+        if metaspec is None:
+            return None
+        version = metaspec.version
+        return LazyMetaspec(
+            **vars(self._to_summary(metaspec)),
+            content_field=LazyField(lambda: self._load_content(metaspec_id, version)),
+        )
+
+    async def update(self, metaspec: Metaspec) -> Metaspec:
+        """
+        Store a new version or overwrite an existing one.
+
+        No-op if the metaspec does not exist.
+
+        Raises:
+            RevisionConflictError: If the version being superseded is not
+                at metaspec.revision
+        """
+        self._write_version(metaspec)
+        return metaspec
+
+    async def patch(self, metaspec: Metaspec, fields: Iterable[str]) -> Metaspec:
+        """
+        Copy only some attributes onto one stored version.
+
+        Patching "version" stores a new version through update().
+
+        Raises:
+            ValueError: If a field is unknown or protected
+            RevisionConflictError: If the version is not at metaspec.revision
+        """
+        names = patch_fields(metaspec, fields)
+        if "version" in names:
+            return await self.update(metaspec)
+        key = (metaspec.id, metaspec.version)
+        stored = self._versions.get(key)
+        if stored is None or not names:
+            return metaspec
+        if stored.revision != metaspec.revision:
+            raise RevisionConflictError(
+                "Metaspec", metaspec.id, metaspec.revision, stored.revision
+            )
+
+        patched = clone(stored)
+        for name in names:
+            setattr(patched, name, getattr(metaspec, name))
+        patched.revision += 1
+        latest = self._latest.get(metaspec.id)
+        self._store(patched, latest=latest.version == patched.version)
+        metaspec.revision += 1
+        return metaspec
+
+    async def delete(self, metaspec_id: str) -> None:
+        """Remove a metaspec and all of its versions."""
+        latest = self._latest.pop(metaspec_id)
+        if latest is None:
+            return
+        stale = [key for key in self._versions.rows if key[0] == metaspec_id]
+        for key in stale:
+            self._versions.pop(key)
+
+    async def create_many(self, metaspecs: List[Metaspec]) -> BulkWriteResult:
+        """Persist many new metaspecs; duplicates are reported per item."""
+        errors: Dict[int, str] = {}
+        for index, metaspec in enumerate(metaspecs):
+            if metaspec.id in self._latest:
+                errors[index] = DUPLICATE_ERROR
+            else:
+                self._store(metaspec, latest=True)
+        return bulk_result([metaspec.id for metaspec in metaspecs], errors)
+
+    async def update_many(self, metaspecs: List[Metaspec]) -> BulkWriteResult:
+        """Same rules as update(); unknown ids are reported per item."""
+        errors: Dict[int, str] = {}
+        for index, metaspec in enumerate(metaspecs):
+            try:
+                if not self._write_version(metaspec):
+                    errors[index] = NOT_FOUND_ERROR
+            except RevisionConflictError:
+                errors[index] = REVISION_CONFLICT_ERROR
+        return bulk_result([metaspec.id for metaspec in metaspecs], errors)
+
+    async def delete_many(self, metaspec_ids: List[str]) -> BulkWriteResult:
+        """Remove many metaspecs (all versions); unknown ids are not an error."""
+        for metaspec_id in metaspec_ids:
+            await self.delete(metaspec_id)
+        return bulk_result(list(metaspec_ids), {})
+
+    def _write_version(self, metaspec: Metaspec) -> bool:
+        """
+        Apply the versioning and revision rules of update().
+
+        Returns:
+            False if the metaspec does not exist
+
+        Raises:
+            RevisionConflictError: If the version being superseded is not
+                at metaspec.revision
+        """
+        current = self._latest.get(metaspec.id)
+        if current is None:
+            return False
+        # A higher version supersedes the latest one, others the version itself
+        # (an older version missing from history is simply added)
+        superseded = self._versions.get(
+            (metaspec.id, min(metaspec.version, current.version))
+        )
+        if superseded is not None and superseded.revision != metaspec.revision:
+            raise RevisionConflictError(
+                "Metaspec", metaspec.id, metaspec.revision, superseded.revision
+            )
+
+        if metaspec.version > current.version:
+            demoted = clone(current)
+            demoted.revision += 1
+            self._versions.put((current.id, current.version), demoted)
+        metaspec.revision += 1
+        # Higher or same version becomes latest; older rewrites history only
+        self._store(metaspec, latest=metaspec.version >= current.version)
+        return True
+
+    def _store(self, metaspec: Metaspec, latest: bool) -> None:
+        self._versions.put((metaspec.id, metaspec.version), metaspec)
+        if latest:
+            self._latest.put(metaspec.id, metaspec)
+
+    async def _load_content(self, metaspec_id: str, version: int) -> str:
+        """Content of one stored version (for LazyMetaspec)."""
+        metaspec = self._versions.get((metaspec_id, version))
+        if metaspec is None:
+            raise RepositoryError(f"Metaspec '{metaspec_id}' no longer exists")
+        return metaspec.content
+
+    def _to_summary(self, metaspec: Metaspec) -> MetaspecSummary:
+        return MetaspecSummary(
+            id=metaspec.id,
+            demand_id=metaspec.demand_id,
+            type=metaspec.type,
+            version=metaspec.version,
+            created_at=metaspec.created_at,
+            updated_at=metaspec.updated_at,
+            revision=metaspec.revision,
+        )
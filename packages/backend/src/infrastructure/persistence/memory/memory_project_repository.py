@@ -0,0 +1,151 @@
+"""
+InMemoryProjectRepository Implementation
+
+In-memory adapter for Project persistence (benchmarks, tests and
+single-node deployments). Implements IProjectRepository.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from application.dto.bulk_write_result import BulkWriteResult
+from application.dto.page import DEFAULT_PAGE_SIZE, Page
+from application.exceptions import DuplicateEntityError, ProjectNotFoundError
+from application.interfaces.i_project_repository import IProjectRepository
+from domain.entities.project import Project
+from domain.exceptions import ContextBudgetExceededError
+from domain.value_objects.context_budget import ContextBudget
+from infrastructure.persistence.field_patches import patch_fields
+from infrastructure.persistence.memory.memory_store import (
+    InMemoryStore,
+    clone,
+    delete_rows,
+    fetch_page,
+    get_rows,
+    insert_rows,
+    patch_row,
+    replace_row,
+    replace_rows,
+)
+
+
+class InMemoryProjectRepository(IProjectRepository):
+    """In-memory implementation of IProjectRepository"""
+
+    def __init__(self, store: InMemoryStore):
+        """
+        Initialize repository.
+
+        Args:
+            store: Shared in-memory store
+        """
+        self._table = store.projects
+
+    async def create(self, project: Project) -> Project:
+        """
+        Persist a new project.
+
+        Raises:
+            DuplicateEntityError: If a project with the same ID exists
+        """
+        if project.id in self._table:
+            raise DuplicateEntityError(f"Project '{project.id}' already exists")
+        self._table.put(project.id, project)
+        return project
+
+    async def get_by_id(self, project_id: str) -> Optional[Project]:
+        """Retrieve a copy of a project by its UUID."""
+        project = self._table.get(project_id)
+        return None if project is None else clone(project)
+
+    async def get_many(self, project_ids: List[str]) -> Dict[str, Project]:
+        """Retrieve copies of many projects; ids not found are absent."""
+        return get_rows(self._table, project_ids)
+
+    async def list_by_owner(
+        self,
+        owner_id: str,
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[Project]:
+        """
+        List an owner's projects, newest first (keyset pagination).
+
+        Raises:
+            ValueError: If limit or cursor is invalid
+        """
+        return fetch_page(self._table, "owner", owner_id, after, limit)
+
+    async def update(self, project: Project) -> Project:
+        """
+        Replace a stored project if nobody saved it since it was read
+        (no-op if it does not exist).
+
+        Raises:
+            RevisionConflictError: If the stored revision is not project.revision
+        """
+        replace_row(self._table, project)
+        return project
+
+    async def patch(self, project: Project, fields: Iterable[str]) -> Project:
+        """
+        Copy only some attributes onto the stored project (no-op if missing).
+
+        Raises:
+            ValueError: If a field is unknown or protected
+            RevisionConflictError: If the stored revision is not project.revision
+        """
+        patch_row(self._table, project, patch_fields(project, fields))
+        return project
+
+    async def delete(self, project_id: str) -> None:
+        """Remove a project (no-op if it does not exist)."""
+        self._table.pop(project_id)
+
+    async def create_many(self, projects: List[Project]) -> BulkWriteResult:
+        """Persist many new projects; duplicates are reported per item."""
+        return insert_rows(self._table, projects)
+
+    async def update_many(self, projects: List[Project]) -> BulkWriteResult:
+        """Update many projects; unknown ids are reported per item."""
+        return replace_rows(self._table, projects)
+
+    async def delete_many(self, project_ids: List[str]) -> BulkWriteResult:
+        """Remove many projects; unknown ids are not an error."""
+        return delete_rows(self._table, project_ids)
+
+    async def consume_tokens(self, project_id: str, tokens: int) -> ContextBudget:
+        """
+        Charge tokens to a project's budget.
+
+        Atomic: runs without yielding to the event loop.
+
+        Raises:
+            ValueError: If tokens < 0
+            ContextBudgetExceededError: If the budget has not enough tokens left
+            ProjectNotFoundError: If project does not exist
+        """
+        if tokens < 0:
+            raise ValueError("tokens must be >= 0")
+
+        project = self._table.get(project_id)
+        if project is None:
+            raise ProjectNotFoundError(f"Project '{project_id}' not found")
+
+        budget = project.context_budget
+        if budget.used_tokens + tokens > budget.max_tokens:
+            raise ContextBudgetExceededError(
+                f"Cannot consume {tokens} tokens from project '{project.name}'. "
+                f"Only {budget.remaining_tokens} remaining."
+            )
+
+        updated = clone(project)
+        updated.context_budget = ContextBudget(
+            max_tokens=budget.max_tokens, used_tokens=budget.used_tokens + tokens
+        )
+        updated.updated_at = datetime.utcnow()
+        updated.revision += 1
+        self._table.put(project_id, updated)
+        return updated.context_budget
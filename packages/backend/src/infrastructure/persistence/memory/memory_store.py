@@ -0,0 +1,448 @@
+"""
+In-memory Store
+
+Dict-based tables with sorted secondary indexes, shared by the in-memory
+repositories. Each table keeps its rows in a dict (primary key -> entity)
+and every index as per-group lists of (sort_value, key) kept in order
+with bisect, so keyset pages cost O(log n + limit).
+
+Isolation: entities are copied on the way in and on the way out, so
+callers never hold a reference to stored state. Entities only have
+immutable field values (ContextBudget is frozen), so a shallow copy is
+enough.
+
+Updates are compare-and-set on the entity revision, like the database
+adapters: replace_row only writes while the stored row is still at the
+revision the caller read.
+
+Persistence (optional): save() pickles the rows to a file (written
+atomically); the indexes are rebuilt on load. The file is trusted input,
+like any local database file.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import copy
+import os
+import pickle
+import tempfile
+from bisect import bisect_left, insort
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from application.dto.bulk_write_result import (
+    DUPLICATE_ERROR,
+    NOT_FOUND_ERROR,
+    REVISION_CONFLICT_ERROR,
+    BulkWriteResult,
+    bulk_result,
+)
+from application.dto.page import Page
+from application.exceptions import RevisionConflictError
+from domain.entities.checkpoint import Checkpoint
+from domain.entities.demand import Demand
+from domain.entities.metaspec import Metaspec
+from domain.entities.project import Project
+from infrastructure.persistence.pagination import (
+    decode_cursor,
+    encode_cursor,
+    validate_limit,
+)
+
+E = TypeVar("E")
+
+SNAPSHOT_FORMAT = 1
+
+
+def clone(entity: E) -> E:
+    """Copy of an entity (see module docstring on isolation)."""
+    return copy.copy(entity)
+
+
+class SortedIndex:
+    """Per-group sorted lists of (sort_value, key), ascending"""
+
+    def __init__(self):
+        self._groups: Dict[Hashable, List[Tuple[Any, Hashable]]] = {}
+
+    def add(self, group: Hashable, sort_value: Any, key: Hashable) -> None:
+        insort(self._groups.setdefault(group, []), (sort_value, key))
+
+    def remove(self, group: Hashable, sort_value: Any, key: Hashable) -> None:
+        entries = self._groups.get(group)
+        if not entries:
+            return
+        position = bisect_left(entries, (sort_value, key))
+        if position < len(entries) and entries[position] == (sort_value, key):
+            del entries[position]
+            if not entries:
+                del self._groups[group]
+
+    def count(self, group: Hashable) -> int:
+        """Number of entries in a group."""
+        return len(self._groups.get(group, ()))
+
+    def descending(
+        self,
+        group: Hashable,
+        before: Optional[Tuple[Any, Hashable]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[Any, Hashable]]:
+        """
+        Entries of a group, highest first.
+
+        Args:
+            group: Group key
+            before: Only entries strictly lower than this (keyset cursor)
+            limit: Maximum number of entries
+
+        Returns:
+            (sort_value, key) pairs in descending order
+        """
+        entries = self._groups.get(group, [])
+        end = len(entries) if before is None else bisect_left(entries, before)
+        start = 0 if limit is None else max(0, end - limit)
+        return entries[start:end][::-1]
+
+    def clear(self) -> None:
+        self._groups.clear()
+
+
+IndexSpec = Tuple[Callable[[Any], Optional[Hashable]], Callable[[Any], Any]]
+
+
+class Table(Generic[E]):
+    """Rows by primary key plus named sorted indexes"""
+
+    def __init__(self, indexes: Dict[str, IndexSpec]):
+        """
+        Initialize table.
+
+        Args:
+            indexes: name -> (group_fn, sort_fn); group_fn returning None
+                leaves the row out of that index
+        """
+        self.rows: Dict[Hashable, E] = {}
+        self._specs = indexes
+        self._indexes = {name: SortedIndex() for name in indexes}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.rows
+
+    def get(self, key: Hashable) -> Optional[E]:
+        """Stored entity (not a copy; repositories clone before returning)."""
+        return self.rows.get(key)
+
+    def put(self, key: Hashable, entity: E) -> None:
+        """Insert or replace a row (stores a copy) and update indexes."""
+        self.pop(key)
+        stored = clone(entity)
+        self.rows[key] = stored
+        self._index(key, stored)
+
+    def pop(self, key: Hashable) -> Optional[E]:
+        """Remove a row and its index entries; returns it if present."""
+        entity = self.rows.pop(key, None)
+        if entity is not None:
+            for name, (group_fn, sort_fn) in self._specs.items():
+                group = group_fn(entity)
+                if group is not None:
+                    self._indexes[name].remove(group, sort_fn(entity), key)
+        return entity
+
+    def index(self, name: str) -> SortedIndex:
+        return self._indexes[name]
+
+    def load(self, rows: Dict[Hashable, E]) -> None:
+        """Replace all rows (e.g. from a snapshot) and rebuild indexes."""
+        self.rows = dict(rows)
+        for index in self._indexes.values():
+            index.clear()
+        for key, entity in self.rows.items():
+            self._index(key, entity)
+
+    def _index(self, key: Hashable, entity: E) -> None:
+        for name, (group_fn, sort_fn) in self._specs.items():
+            group = group_fn(entity)
+            if group is not None:
+                self._indexes[name].add(group, sort_fn(entity), key)
+
+
+class InMemoryStore:
+    """Tables of the four aggregates, shared by the in-memory repositories"""
+
+    def __init__(self, snapshot_path: Optional[str] = None):
+        """
+        Initialize store, loading snapshot_path if the file exists.
+
+        Args:
+            snapshot_path: File used by save() / loaded at startup (optional)
+        """
+        self.snapshot_path = snapshot_path
+        self.projects: Table[Project] = Table(
+            {"owner": (lambda p: p.owner_id, lambda p: p.created_at)}
+        )
+        self.demands: Table[Demand] = Table(
+            {
+                "project": (lambda d: d.project_id, lambda d: d.created_at),
+                "project_status": (
+                    lambda d: (d.project_id, d.status.value),
+                    lambda d: d.created_at,
+                ),
+            }
+        )
+        # Latest version of each metaspec, by id
+        self.metaspecs: Table[Metaspec] = Table(
+            {"demand": (lambda m: m.demand_id, lambda m: m.version)}
+        )
+        # Every stored version, by (id, version)
+        self.metaspec_versions: Table[Metaspec] = Table(
+            {
+                "demand_type": (
+                    lambda m: (m.demand_id, m.type.value),
+                    lambda m: m.version,
+                )
+            }
+        )
+        self.checkpoints: Table[Checkpoint] = Table(
+            {"demand": (lambda c: c.demand_id, lambda c: c.created_at)}
+        )
+
+        if snapshot_path is not None and os.path.exists(snapshot_path):
+            self.load(snapshot_path)
+
+    def tables(self) -> Dict[str, Table]:
+        """Tables by name (snapshot layout)."""
+        return {
+            "projects": self.projects,
+            "demands": self.demands,
+            "metaspecs": self.metaspecs,
+            "metaspec_versions": self.metaspec_versions,
+            "checkpoints": self.checkpoints,
+        }
+
+    def save(self, path: Optional[str] = None) -> None:
+        """
+        Write all rows to disk atomically (temp file + rename).
+
+        Args:
+            path: Target file (defaults to snapshot_path)
+
+        Raises:
+            ValueError: If no path is given nor configured
+        """
+        path = path or self.snapshot_path
+        if path is None:
+            raise ValueError("No snapshot path configured")
+
+        payload = {
+            "format": SNAPSHOT_FORMAT,
+            "tables": {name: table.rows for name, table in self.tables().items()},
+        }
+        directory = os.path.dirname(os.path.abspath(path))
+        descriptor, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                pickle.dump(payload, file, protocol=pickle.HIGHEST_PROTOCOL)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temporary, path)
+        except BaseException:
+            if os.path.exists(temporary):
+                os.unlink(temporary)
+            raise
+
+    def load(self, path: str) -> None:
+        """
+        Replace all rows with a snapshot written by save().
+
+        Args:
+            path: Snapshot file
+
+        Raises:
+            ValueError: If the file format is unknown
+        """
+        with open(path, "rb") as file:
+            payload = pickle.load(file)
+        if payload.get("format") != SNAPSHOT_FORMAT:
+            raise ValueError(f"Unsupported snapshot format in '{path}'")
+        for name, table in self.tables().items():
+            table.load(payload["tables"].get(name, {}))
+
+
+def fetch_page(
+    table: Table[E],
+    index_name: str,
+    group: Hashable,
+    after: Optional[str],
+    limit: int,
+    convert: Callable[[E], Any] = clone,
+) -> Page:
+    """
+    One keyset page of a table index, highest (sort_value, id) first.
+
+    Same ordering and cursor format as the MongoDB repositories.
+
+    Args:
+        table: Table whose primary keys are entity ids
+        index_name: Index to walk
+        group: Index group (e.g. a demand id)
+        after: Cursor of the previous page, None for the first page
+        limit: Page size
+        convert: Applied to each stored entity (default: copy)
+
+    Returns:
+        Page of converted entities
+
+    Raises:
+        ValueError: If limit or cursor is invalid
+    """
+    validate_limit(limit)
+    before = None if after is None else decode_cursor(after)
+    entries = table.index(index_name).descending(group, before, limit + 1)
+
+    next_cursor = None
+    if len(entries) > limit:
+        entries = entries[:limit]
+        value, entity_id = entries[-1]
+        next_cursor = encode_cursor(value, entity_id)
+
+    return Page(
+        items=[convert(table.rows[key]) for _, key in entries],
+        next_cursor=next_cursor,
+    )
+
+
+def insert_rows(table: Table[E], entities: List[E]) -> BulkWriteResult:
+    """
+    Insert entities keyed by id; existing ids fail (like a unique index).
+
+    Args:
+        table: Target table
+        entities: Entities to insert
+
+    Returns:
+        Per-item result in input order
+    """
+    errors: Dict[int, str] = {}
+    for index, entity in enumerate(entities):
+        if entity.id in table:
+            errors[index] = DUPLICATE_ERROR
+        else:
+            table.put(entity.id, entity)
+    return bulk_result([entity.id for entity in entities], errors)
+
+
+def replace_row(table: Table[E], entity: E) -> bool:
+    """
+    Replace an entity keyed by id if the stored row is at entity.revision.
+
+    On success entity.revision is incremented (and stored).
+
+    Args:
+        table: Target table
+        entity: Entity with updated data
+
+    Returns:
+        False if the id is unknown
+
+    Raises:
+        RevisionConflictError: If the stored revision is not entity.revision
+    """
+    stored = table.get(entity.id)
+    if stored is None:
+        return False
+    if stored.revision != entity.revision:
+        raise RevisionConflictError(
+            type(entity).__name__, entity.id, entity.revision, stored.revision
+        )
+    entity.revision += 1
+    table.put(entity.id, entity)
+    return True
+
+
+def patch_row(table: Table[E], entity: E, names: Iterable[str]) -> bool:
+    """
+    Copy some attributes of entity onto its stored row (see replace_row).
+
+    Args:
+        table: Target table
+        entity: Entity holding the new values
+        names: Attribute names to copy (validated by the caller)
+
+    Returns:
+        False if the id is unknown
+
+    Raises:
+        RevisionConflictError: If the stored revision is not entity.revision
+    """
+    stored = table.get(entity.id)
+    if stored is None:
+        return False
+    if stored.revision != entity.revision:
+        raise RevisionConflictError(
+            type(entity).__name__, entity.id, entity.revision, stored.revision
+        )
+    patched = clone(stored)
+    for name in names:
+        setattr(patched, name, getattr(entity, name))
+    patched.revision += 1
+    table.put(entity.id, patched)
+    entity.revision += 1
+    return True
+
+
+def replace_rows(table: Table[E], entities: List[E]) -> BulkWriteResult:
+    """
+    Replace entities keyed by id (see replace_row); unknown ids and
+    revision conflicts fail.
+
+    Args:
+        table: Target table
+        entities: Entities with updated data
+
+    Returns:
+        Per-item result in input order
+    """
+    errors: Dict[int, str] = {}
+    for index, entity in enumerate(entities):
+        try:
+            if not replace_row(table, entity):
+                errors[index] = NOT_FOUND_ERROR
+        except RevisionConflictError:
+            errors[index] = REVISION_CONFLICT_ERROR
+    return bulk_result([entity.id for entity in entities], errors)
+
+
+def delete_rows(table: Table[E], ids: List[str]) -> BulkWriteResult:
+    """
+    Delete rows by id; unknown ids are not an error.
+
+    Args:
+        table: Target table
+        ids: Entity UUID strings
+
+    Returns:
+        Per-item result in input order
+    """
+    for id_ in ids:
+        table.pop(id_)
+    return bulk_result(list(ids), {})
+
+
+def get_rows(table: Table[E], ids: List[str]) -> Dict[str, E]:
+    """Copies of the rows found, by id (duplicates allowed in ids)."""
+    return {id_: clone(table.rows[id_]) for id_ in dict.fromkeys(ids) if id_ in table}
@@ -0,0 +1,224 @@
+"""
+MongoDB Bulk Write Helpers
+
+Unordered batch operations shared by the MongoDB repositories.
+Translates pymongo write errors into per-item BulkWriteResult entries so
+callers can retry only the failed ids.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import DeleteMany, DeleteOne, ReplaceOne, UpdateOne
+from pymongo.errors import BulkWriteError
+
+from application.dto.bulk_write_result import (
+    NOT_FOUND_ERROR,
+    REVISION_CONFLICT_ERROR,
+    BulkWriteResult,
+    bulk_result,
+)
+from infrastructure.persistence.mongodb.mongo_revision import (
+    as_stored,
+    revision_filter,
+)
+
+
+async def insert_documents(
+    collection: AsyncIOMotorCollection, documents: Sequence[dict]
+) -> BulkWriteResult:
+    """
+    Insert documents in one unordered insert_many.
+
+    Args:
+        collection: Target Motor collection
+        documents: MongoDB documents (each with an "id" field)
+
+    Returns:
+        Per-item result in input order
+    """
+    if not documents:
+        return BulkWriteResult()
+
+    ids = [document["id"] for document in documents]
+    errors: Dict[int, str] = {}
+    try:
+        await collection.insert_many(list(documents), ordered=False)
+    except BulkWriteError as exc:
+        errors = _write_errors(exc)
+
+    return bulk_result(ids, errors)
+
+
+async def replace_documents(
+    collection: AsyncIOMotorCollection, documents: Sequence[dict]
+) -> BulkWriteResult:
+    """
+    Replace documents (matched by "id" and revision) in one unordered bulk_write.
+
+    Each document carries its new revision; its filter expects the stored
+    one to be revision - 1 (optimistic concurrency). Items whose id does
+    not exist, or was saved by another writer meanwhile, are reported as
+    failed.
+
+    Args:
+        collection: Target Motor collection
+        documents: MongoDB documents from next_revision()
+
+    Returns:
+        Per-item result in input order
+    """
+    if not documents:
+        return BulkWriteResult()
+
+    ids = [document["id"] for document in documents]
+    operations = [
+        ReplaceOne(revision_filter(document), document) for document in documents
+    ]
+    errors: Dict[int, str] = {}
+    try:
+        result = await collection.bulk_write(operations, ordered=False)
+        matched = result.matched_count
+    except BulkWriteError as exc:
+        errors = _write_errors(exc)
+        matched = exc.details.get("nMatched", 0)
+
+    # bulk_write only reports aggregate counts; look up which items did not
+    # match only when some replacement did not.
+    if matched < len(ids) - len(errors):
+        candidates = [id_ for index, id_ in enumerate(ids) if index not in errors]
+        stored = await _stored_documents(collection, candidates)
+        for index, document in enumerate(documents):
+            if index in errors:
+                continue
+            current = stored.get(document["id"])
+            if current is None:
+                errors[index] = NOT_FOUND_ERROR
+            elif current != as_stored(document):
+                errors[index] = REVISION_CONFLICT_ERROR
+
+    return bulk_result(ids, errors)
+
+
+async def delete_documents(
+    collection: AsyncIOMotorCollection,
+    ids: Sequence[str],
+    all_matches: bool = False,
+) -> BulkWriteResult:
+    """
+    Delete documents (matched by "id") in one unordered bulk_write.
+
+    Deleting an id that does not exist is not an error (same as delete()).
+
+    Args:
+        collection: Target Motor collection
+        ids: Entity UUID strings
+        all_matches: Delete every document with the id (e.g. all versions)
+
+    Returns:
+        Per-item result in input order
+    """
+    if not ids:
+        return BulkWriteResult()
+
+    delete = DeleteMany if all_matches else DeleteOne
+    operations = [delete({"id": id_}) for id_ in ids]
+    errors: Dict[int, str] = {}
+    try:
+        await collection.bulk_write(operations, ordered=False)
+    except BulkWriteError as exc:
+        errors = _write_errors(exc)
+
+    return bulk_result(list(ids), errors)
+
+
+async def write_item_operations(
+    collection: AsyncIOMotorCollection,
+    ids: Sequence[str],
+    operations: Sequence[Sequence],
+    errors: Optional[Dict[int, str]] = None,
+) -> Tuple[BulkWriteResult, int]:
+    """
+    Run several write operations per item in one unordered bulk_write.
+
+    Write errors are reported on the item that owns the failing operation.
+    Conditional operations that match nothing are not errors: compare the
+    matched count with the number of filtered operations sent.
+
+    Args:
+        collection: Target Motor collection
+        ids: Entity UUID strings
+        operations: pymongo operations of each item, in input order
+            (empty for items that already failed)
+        errors: Errors already known, by item index
+
+    Returns:
+        (per-item result in input order, matched count)
+    """
+    errors = dict(errors or {})
+    matched = 0
+    flat: List = []
+    owners: List[int] = []
+    for index, item_operations in enumerate(operations):
+        flat.extend(item_operations)
+        owners.extend([index] * len(item_operations))
+
+    if flat:
+        try:
+            matched = (await collection.bulk_write(flat, ordered=False)).matched_count
+        except BulkWriteError as exc:
+            matched = exc.details.get("nMatched", 0)
+            for position, message in _write_errors(exc).items():
+                errors.setdefault(owners[position], message)
+
+    return bulk_result(list(ids), errors), matched
+
+
+async def update_items(
+    collection: AsyncIOMotorCollection, operations: Dict[int, UpdateOne]
+) -> Tuple[int, Dict[int, str]]:
+    """
+    Run one conditional UpdateOne per item in one unordered bulk_write.
+
+    bulk_write only reports how many filters matched, not which ones, so
+    callers compare the count with len(operations) and look up the
+    missing items themselves when it is lower.
+
+    Args:
+        collection: Target Motor collection
+        operations: UpdateOne of each item, by item index
+
+    Returns:
+        (matched count, write errors by item index)
+    """
+    if not operations:
+        return 0, {}
+
+    owners = list(operations)
+    try:
+        result = await collection.bulk_write(list(operations.values()), ordered=False)
+    except BulkWriteError as exc:
+        errors = {
+            owners[position]: message
+            for position, message in _write_errors(exc).items()
+        }
+        return exc.details.get("nMatched", 0), errors
+    return result.matched_count, {}
+
+
+async def _stored_documents(
+    collection: AsyncIOMotorCollection, ids: List[str]
+) -> Dict[str, dict]:
+    """Stored documents (without _id) of the ids that exist."""
+    cursor = collection.find({"id": {"$in": ids}}, {"_id": 0})
+    return {document["id"]: document async for document in cursor}
+
+
+def _write_errors(exc: BulkWriteError) -> Dict[int, str]:
+    """Map operation index -> error message from a BulkWriteError."""
+    return {
+        error["index"]: error.get("errmsg", "write error")
+        for error in exc.details.get("writeErrors", [])
+    }
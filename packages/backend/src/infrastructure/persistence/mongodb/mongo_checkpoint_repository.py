@@ -4,29 +4,122 @@ MongoCheckpointRepository Implementation
 MongoDB adapter for Checkpoint persistence.
 Implements ICheckpointRepository interface from Application Layer.
 
+context_snapshot is compressed transparently (zlib by default) and stored
+as binary with a "snapshot_codec" marker field. Documents without the marker
+are read as plain JSON strings.
+
+Delta mode (keyframe_interval=N): checkpoints of the same demand form a
+chain. Every Nth checkpoint is a full keyframe; the ones in between store
+only a delta against their parent (previous checkpoint of the demand).
+Reads rebuild the snapshot from the nearest keyframe with a single query.
+
+Chain fields: snapshot_kind ("keyframe" | "delta"), keyframe_id,
+chain_position and parent_id (deltas only). Documents without
+snapshot_kind hold a full snapshot and act as keyframes.
+
+Summary reads (get_summary, list_checkpoint_summaries, get_lazy) project
+context_snapshot away, so the payload is only sent when actually needed.
+
 IAD-7: Repository Pattern + MongoDB
 """
 
-from typing import Optional
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 from motor.motor_asyncio import AsyncIOMotorDatabase
-
+from pymongo.errors import DuplicateKeyError
+
+from application.dto.bulk_write_result import (
+    REVISION_CONFLICT_ERROR,
+    BulkItemResult,
+    BulkWriteResult,
+)
+from application.dto.lazy import LazyCheckpoint, LazyField
+from application.dto.page import DEFAULT_PAGE_SIZE, Page
+from application.dto.summaries import CheckpointSummary
+from application.exceptions import (
+    DuplicateEntityError,
+    RepositoryError,
+    RevisionConflictError,
+)
 from application.interfaces.i_checkpoint_repository import ICheckpointRepository
 from domain.entities.checkpoint import Checkpoint
+from infrastructure.persistence.field_patches import patch_fields
+from infrastructure.persistence.mongodb.mongo_bulk import (
+    delete_documents,
+    insert_documents,
+    replace_documents,
+)
+from infrastructure.persistence.mongodb.mongo_pagination import fetch_page
+from infrastructure.persistence.mongodb.mongo_revision import (
+    next_revision,
+    patch_operation,
+    raise_on_conflict,
+    revision_filter,
+)
+from infrastructure.persistence.snapshot_codecs import (
+    DEFAULT_CODEC,
+    SnapshotCodec,
+    SnapshotCodecStats,
+    decode_snapshot,
+    encode_snapshot,
+    get_codec,
+)
+from infrastructure.persistence.snapshot_delta import (
+    apply_snapshot_delta,
+    diff_snapshot,
+)
+from infrastructure.serialization.entity_codecs import CHECKPOINT_CODEC
+
+KEYFRAME = "keyframe"
+DELTA = "delta"
+
+# Latest snapshot per demand kept in memory to diff new checkpoints against
+MAX_CACHED_CHAIN_HEADS = 1024
+
+# Everything but the (possibly compressed) snapshot payload.
+SUMMARY_PROJECTION = {"_id": 0, "context_snapshot": 0}
 
 
 class MongoCheckpointRepository(ICheckpointRepository):
     """MongoDB implementation of ICheckpointRepository"""
 
-    def __init__(self, database: AsyncIOMotorDatabase):
+    def __init__(
+        self,
+        database: AsyncIOMotorDatabase,
+        codec: Optional[str] = DEFAULT_CODEC,
+        on_codec_stats: Optional[Callable[[SnapshotCodecStats], None]] = None,
+        keyframe_interval: Optional[int] = None,
+    ):
         """
         Initialize MongoDB repository.
 
         Args:
             database: Motor AsyncIOMotorDatabase instance
+            codec: Snapshot codec for writes ("zlib", "zstd", "lz4");
+                None stores snapshots uncompressed
+            on_codec_stats: Optional callback receiving compression ratio and
+                encode/decode time for every checkpoint written or read
+            keyframe_interval: Enables delta mode: every Nth checkpoint of a
+                demand is a full keyframe, the others store a delta.
+                None (default) stores every snapshot in full
+
+        Raises:
+            ValueError: If codec is unknown or its package is not installed,
+                or keyframe_interval < 1
         """
+        if keyframe_interval is not None and keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be >= 1")
+
         self._db = database
         self._collection = database["checkpoints"]
+        self._codec = get_codec(codec) if codec is not None else None
+        self._decoders: Dict[str, SnapshotCodec] = {}
+        if self._codec is not None:
+            self._decoders[self._codec.name] = self._codec
+        self._on_codec_stats = on_codec_stats
+        self._keyframe_interval = keyframe_interval
+        self._chain_heads: "OrderedDict[str, Tuple[str, str]]" = OrderedDict()
 
     async def create(self, checkpoint: Checkpoint) -> Checkpoint:
         """
@@ -39,11 +132,26 @@ class MongoCheckpointRepository(ICheckpointRepository):
             The persisted checkpoint entity
 
         Raises:
-            DuplicateCheckpointError: If checkpoint with same ID already exists
+            DuplicateEntityError: If checkpoint with same ID already exists
             RepositoryError: If persistence fails
         """
-        document = self._to_document(checkpoint)
-        await self._collection.insert_one(document)
+        if self._keyframe_interval is None:
+            document = self._to_document(checkpoint)
+        else:
+            document = await self._to_chain_document(checkpoint)
+
+        try:
+            await self._collection.insert_one(document)
+        except DuplicateKeyError as exc:
+            raise DuplicateEntityError(
+                f"Checkpoint '{checkpoint.id}' already exists"
+            ) from exc
+
+        if self._keyframe_interval is not None:
+            if document["snapshot_kind"] == DELTA:
+                await self._retain_ancestors(document)
+            self._remember_chain_head(checkpoint)
+
         return checkpoint
 
     async def get_by_id(self, checkpoint_id: str) -> Optional[Checkpoint]:
@@ -62,24 +170,239 @@ class MongoCheckpointRepository(ICheckpointRepository):
         document = await self._collection.find_one({"id": checkpoint_id})
         if document is None:
             return None
-        return self._to_entity(document)
+        snapshot = await self._resolve_snapshot(document, {}, {})
+        return self._to_entity(document, snapshot)
+
+    async def get_many(self, checkpoint_ids: List[str]) -> Dict[str, Checkpoint]:
+        """
+        Retrieve many checkpoints with one $in query.
+
+        Args:
+            checkpoint_ids: Checkpoint UUID strings (duplicates allowed)
+
+        Returns:
+            Mapping of id to Checkpoint entity; ids not found are absent
+        """
+        if not checkpoint_ids:
+            return {}
+        unique_ids = list(dict.fromkeys(checkpoint_ids))
+        documents = await self._collection.find({"id": {"$in": unique_ids}}).to_list(
+            length=None
+        )
+
+        # Shared across the batch so chain members are fetched/decoded once
+        known = {document["id"]: document for document in documents}
+        resolved: Dict[str, str] = {}
+        checkpoints = {}
+        for document in documents:
+            snapshot = await self._resolve_snapshot(document, known, resolved)
+            checkpoints[document["id"]] = self._to_entity(document, snapshot)
+        return checkpoints
+
+    async def list_checkpoints(
+        self,
+        demand_id: str,
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[Checkpoint]:
+        """
+        List checkpoints with keyset pagination, newest first.
+
+        Served by the {demand_id: 1, created_at: -1, id: -1} index:
+        no skip(), so deep pages cost the same as the first one.
+
+        Args:
+            demand_id: Demand UUID string
+            after: next_cursor of the previous page (None for the first page)
+            limit: Page size
+
+        Returns:
+            Page of Checkpoint entities
+
+        Raises:
+            ValueError: If limit or cursor is invalid
+        """
+        base_filter = {"demand_id": demand_id}
+        documents, next_cursor = await fetch_page(
+            self._collection, base_filter, "created_at", after, limit
+        )
+
+        known = {document["id"]: document for document in documents}
+        resolved: Dict[str, str] = {}
+        items = []
+        for document in documents:
+            snapshot = await self._resolve_snapshot(document, known, resolved)
+            items.append(self._to_entity(document, snapshot))
+        return Page(items=items, next_cursor=next_cursor)
+
+    async def get_summary(self, checkpoint_id: str) -> Optional[CheckpointSummary]:
+        """
+        Retrieve a checkpoint without its context_snapshot (projection).
+
+        Args:
+            checkpoint_id: Checkpoint UUID string
+
+        Returns:
+            CheckpointSummary if found, None otherwise
+        """
+        document = await self._collection.find_one(
+            {"id": checkpoint_id}, SUMMARY_PROJECTION
+        )
+        if document is None:
+            return None
+        return self._to_summary(document)
+
+    async def list_checkpoint_summaries(
+        self,
+        demand_id: str,
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[CheckpointSummary]:
+        """
+        Same as list_checkpoints, with context_snapshot excluded by projection.
+
+        No snapshot is decompressed or rebuilt from deltas.
+
+        Args:
+            demand_id: Demand UUID string
+            after: next_cursor of the previous page (None for the first page)
+            limit: Page size
+
+        Returns:
+            Page of CheckpointSummary
+
+        Raises:
+            ValueError: If limit or cursor is invalid
+        """
+        documents, next_cursor = await fetch_page(
+            self._collection,
+            {"demand_id": demand_id},
+            "created_at",
+            after,
+            limit,
+            projection=SUMMARY_PROJECTION,
+        )
+        return Page(
+            items=[self._to_summary(document) for document in documents],
+            next_cursor=next_cursor,
+        )
+
+    async def get_lazy(self, checkpoint_id: str) -> Optional[LazyCheckpoint]:
+        """
+        Retrieve a checkpoint whose context_snapshot is fetched on first access.
+
+        Args:
+            checkpoint_id: Checkpoint UUID string
+
+        Returns:
+            LazyCheckpoint if found, None otherwise
+        """
+        document = await self._collection.find_one(
+            {"id": checkpoint_id}, SUMMARY_PROJECTION
+        )
+        if document is None:
+            return None
+        return LazyCheckpoint(
+            **vars(self._to_summary(document)),
+            snapshot_field=LazyField(lambda: self._load_snapshot(checkpoint_id)),
+        )
 
     async def update(self, checkpoint: Checkpoint) -> Checkpoint:
         """
-        Update an existing checkpoint.
+        Update an existing checkpoint if nobody saved it since it was read.
 
         Args:
             checkpoint: Checkpoint entity with updated data
 
         Returns:
-            The updated checkpoint entity
+            The updated checkpoint entity (revision incremented)
 
         Raises:
-            CheckpointNotFoundError: If checkpoint does not exist
+            RevisionConflictError: If the stored revision is not
+                checkpoint.revision
             RepositoryError: If update fails
         """
-        document = self._to_document(checkpoint)
-        await self._collection.replace_one({"id": checkpoint.id}, document)
+        document = next_revision(self._to_document(checkpoint))
+        children = await self._delta_children([checkpoint.id])
+        if not children:
+            result = await self._collection.replace_one(
+                revision_filter(document), document
+            )
+            self._forget_chain_head(checkpoint.demand_id)
+            if result.matched_count == 0:
+                await raise_on_conflict(
+                    self._collection, "Checkpoint", checkpoint.id, checkpoint.revision
+                )
+                return checkpoint
+            checkpoint.revision = document["revision"]
+            return checkpoint
+
+        # Other checkpoints are deltas against this one: keep it in the chain
+        # (stored in full) and re-diff its children if the snapshot changed.
+        existing = await self._collection.find_one({"id": checkpoint.id})
+        if existing is None:
+            raise RepositoryError(f"Checkpoint '{checkpoint.id}' not found")
+        if existing.get("revision", 0) != checkpoint.revision:
+            await raise_on_conflict(
+                self._collection, "Checkpoint", checkpoint.id, checkpoint.revision
+            )
+        old_snapshot = await self._resolve_snapshot(existing, {}, {})
+
+        document["snapshot_kind"] = KEYFRAME
+        document["keyframe_id"] = existing.get("keyframe_id", checkpoint.id)
+        document["chain_position"] = existing.get("chain_position", 0)
+        self._retain_for_children(document, children)
+        result = await self._collection.replace_one(revision_filter(document), document)
+        if result.matched_count == 0:
+            self._forget_chain_head(checkpoint.demand_id)
+            await raise_on_conflict(
+                self._collection, "Checkpoint", checkpoint.id, checkpoint.revision
+            )
+            return checkpoint
+        checkpoint.revision = document["revision"]
+
+        if old_snapshot != checkpoint.context_snapshot:
+            await self._rebase_children(
+                children, old_snapshot, checkpoint.context_snapshot
+            )
+        self._forget_chain_head(checkpoint.demand_id)
+        return checkpoint
+
+    async def patch(self, checkpoint: Checkpoint, fields: Iterable[str]) -> Checkpoint:
+        """
+        Write only some attributes of a checkpoint with $set.
+
+        The stored snapshot (full or delta) is left alone. Patching
+        context_snapshot or demand_id, which touch the delta chains, goes
+        through update().
+
+        Args:
+            checkpoint: Checkpoint entity holding the new values
+            fields: Attribute names to write (not id or revision)
+
+        Returns:
+            The checkpoint entity (revision incremented if written)
+
+        Raises:
+            ValueError: If a field is unknown or protected
+            RevisionConflictError: If the stored revision is not
+                checkpoint.revision
+        """
+        names = patch_fields(checkpoint, fields)
+        if "context_snapshot" in names or "demand_id" in names:
+            return await self.update(checkpoint)
+        if not names:
+            return checkpoint
+
+        query, update = patch_operation(CHECKPOINT_CODEC, checkpoint, names)
+        result = await self._collection.update_one(query, update)
+        self._forget_chain_head(checkpoint.demand_id)
+        if result.matched_count == 0:
+            await raise_on_conflict(
+                self._collection, "Checkpoint", checkpoint.id, checkpoint.revision
+            )
+            return checkpoint
+        checkpoint.revision += 1
         return checkpoint
 
     async def delete(self, checkpoint_id: str) -> None:
@@ -93,47 +416,474 @@ class MongoCheckpointRepository(ICheckpointRepository):
             CheckpointNotFoundError: If checkpoint does not exist
             RepositoryError: If deletion fails
         """
+        await self._detach_children([checkpoint_id])
         await self._collection.delete_one({"id": checkpoint_id})
 
-    def _to_document(self, checkpoint: Checkpoint) -> dict:
+    async def create_many(self, checkpoints: List[Checkpoint]) -> BulkWriteResult:
+        """
+        Persist many new checkpoints with one unordered insert_many.
+
+        Snapshots are always stored in full (no delta chain), even in
+        delta mode; later create() calls chain onto them as keyframes.
+
+        Args:
+            checkpoints: Checkpoint entities to persist
+
+        Returns:
+            Per-item result in input order
+        """
+        documents = [self._to_document(checkpoint) for checkpoint in checkpoints]
+        return await insert_documents(self._collection, documents)
+
+    async def update_many(self, checkpoints: List[Checkpoint]) -> BulkWriteResult:
+        """
+        Update many checkpoints with one unordered bulk_write of ReplaceOne.
+
+        Each item is filtered on its revision, like update().
+
+        Args:
+            checkpoints: Checkpoint entities with updated data
+
+        Returns:
+            Per-item result in input order
+        """
+        for checkpoint in checkpoints:
+            self._forget_chain_head(checkpoint.demand_id)
+
+        parents = {
+            child["parent_id"]
+            for child in await self._delta_children([c.id for c in checkpoints])
+        }
+        plain = [(i, c) for i, c in enumerate(checkpoints) if c.id not in parents]
+        documents = [next_revision(self._to_document(c)) for _, c in plain]
+        result = await replace_documents(self._collection, documents)
+        items = []
+        for (index, checkpoint), document, item in zip(plain, documents, result.items):
+            if item.ok:
+                checkpoint.revision = document["revision"]
+            items.append(
+                BulkItemResult(index=index, id=item.id, ok=item.ok, error=item.error)
+            )
+
+        # Checkpoints with delta children need the chain-aware path
+        for index, checkpoint in enumerate(checkpoints):
+            if checkpoint.id not in parents:
+                continue
+            try:
+                await self.update(checkpoint)
+                items.append(BulkItemResult(index=index, id=checkpoint.id, ok=True))
+            except RevisionConflictError:
+                items.append(
+                    BulkItemResult(
+                        index=index,
+                        id=checkpoint.id,
+                        ok=False,
+                        error=REVISION_CONFLICT_ERROR,
+                    )
+                )
+            except Exception as exc:
+                items.append(
+                    BulkItemResult(
+                        index=index, id=checkpoint.id, ok=False, error=str(exc)
+                    )
+                )
+
+        return BulkWriteResult(items=sorted(items, key=lambda item: item.index))
+
+    async def delete_many(self, checkpoint_ids: List[str]) -> BulkWriteResult:
+        """
+        Remove many checkpoints with one unordered bulk_write of DeleteOne.
+
+        Args:
+            checkpoint_ids: Checkpoint UUID strings
+
+        Returns:
+            Per-item result in input order
+        """
+        await self._detach_children(checkpoint_ids)
+        return await delete_documents(self._collection, checkpoint_ids)
+
+    def _to_document(
+        self, checkpoint: Checkpoint, payload: Optional[str] = None
+    ) -> dict:
         """
         Convert Checkpoint entity to MongoDB document.
 
         Args:
             checkpoint: Checkpoint entity
+            payload: Stored snapshot text (a delta in delta mode);
+                defaults to the full context_snapshot
 
         Returns:
             MongoDB document dict
         """
-        document = {
-            "id": checkpoint.id,  # UUID string
-            "demand_id": checkpoint.demand_id,
-            "context_snapshot": checkpoint.context_snapshot,  # JSON string
-            "tokens_used": checkpoint.tokens_used,
-            "created_at": checkpoint.created_at,
-        }
+        if payload is None:
+            payload = checkpoint.context_snapshot
 
-        # Only include expires_at if not None (TTL index)
-        if checkpoint.expires_at is not None:
-            document["expires_at"] = checkpoint.expires_at
+        document = CHECKPOINT_CODEC.to_document(checkpoint)
 
+        # Compressed snapshot is stored as binary + codec marker
+        fields, _ = self._payload_fields(checkpoint.id, payload)
+        document.update(fields)
         return document
 
-    def _to_entity(self, document: dict) -> Checkpoint:
+    def _to_entity(self, document: dict, context_snapshot: str) -> Checkpoint:
         """
         Convert MongoDB document to Checkpoint entity.
 
         Args:
             document: MongoDB document dict
+            context_snapshot: Full snapshot (see _resolve_snapshot)
 
         Returns:
             Checkpoint entity
         """
-        return Checkpoint(
+        return CHECKPOINT_CODEC.from_document(
+            document, context_snapshot=context_snapshot
+        )
+
+    def _to_summary(self, document: dict) -> CheckpointSummary:
+        """
+        Convert a projected MongoDB document to CheckpointSummary.
+
+        Args:
+            document: MongoDB document dict (without context_snapshot)
+
+        Returns:
+            CheckpointSummary
+        """
+        return CheckpointSummary(
             id=document["id"],
             demand_id=document["demand_id"],
-            context_snapshot=document["context_snapshot"],
             tokens_used=document["tokens_used"],
             created_at=document["created_at"],
             expires_at=document.get("expires_at"),
+            revision=document.get("revision", 0),
+        )
+
+    async def _load_snapshot(self, checkpoint_id: str) -> str:
+        """
+        Fetch and rebuild the full snapshot of a checkpoint.
+
+        Raises:
+            RepositoryError: If the checkpoint was removed meanwhile
+        """
+        document = await self._collection.find_one({"id": checkpoint_id})
+        if document is None:
+            raise RepositoryError(f"Checkpoint '{checkpoint_id}' no longer exists")
+        return await self._resolve_snapshot(document, {}, {})
+
+    def _payload_fields(self, checkpoint_id: str, payload: str) -> Tuple[dict, dict]:
+        """
+        Storage fields for a snapshot payload (full snapshot or delta).
+
+        Args:
+            checkpoint_id: Checkpoint UUID string (for codec stats)
+            payload: Snapshot text to store
+
+        Returns:
+            Fields to $set and fields to $unset
+        """
+        if self._codec is None:
+            return (
+                {"context_snapshot": payload},  # JSON string
+                {"snapshot_codec": "", "snapshot_size": ""},
+            )
+
+        encoded, stats = encode_snapshot(self._codec, checkpoint_id, payload)
+        self._report(stats)
+        fields = {
+            "context_snapshot": encoded,
+            "snapshot_codec": self._codec.name,
+            "snapshot_size": stats.raw_size,
+        }
+        return fields, {}
+
+    def _read_payload(self, document: dict) -> str:
+        """
+        Stored snapshot text of a document, decompressed if needed.
+
+        Args:
+            document: MongoDB document dict
+
+        Returns:
+            Full snapshot, or delta for snapshot_kind == "delta"
+        """
+        payload = document["context_snapshot"]
+
+        # No marker: legacy uncompressed document
+        codec_name = document.get("snapshot_codec")
+        if codec_name is not None:
+            payload, stats = decode_snapshot(
+                self._decoder(codec_name), document["id"], payload
+            )
+            self._report(stats)
+
+        return payload
+
+    async def _resolve_snapshot(
+        self, document: dict, known: Dict[str, dict], resolved: Dict[str, str]
+    ) -> str:
+        """
+        Full snapshot of a document, walking delta parents to a keyframe.
+
+        Args:
+            document: MongoDB document dict
+            known: Documents already fetched, by id (filled in place)
+            resolved: Snapshots already rebuilt, by id (filled in place)
+
+        Returns:
+            Full context snapshot (JSON string)
+
+        Raises:
+            RepositoryError: If a parent of the chain is missing
+        """
+        chain = [document]
+        chain_loaded = False
+        while (
+            chain[-1]["id"] not in resolved and chain[-1].get("snapshot_kind") == DELTA
+        ):
+            current = chain[-1]
+            parent_id = current["parent_id"]
+            if parent_id not in known and not chain_loaded:
+                await self._load_chain(current, known)
+                chain_loaded = True
+            if parent_id not in known:
+                parent = await self._collection.find_one({"id": parent_id})
+                if parent is None:
+                    raise RepositoryError(
+                        f"Checkpoint '{document['id']}' cannot be rebuilt: "
+                        f"parent '{parent_id}' not found"
+                    )
+                known[parent_id] = parent
+            chain.append(known[parent_id])
+
+        base = chain[-1]
+        snapshot = resolved.get(base["id"])
+        if snapshot is None:
+            snapshot = self._read_payload(base)
+            resolved[base["id"]] = snapshot
+
+        for member in reversed(chain[:-1]):
+            snapshot = apply_snapshot_delta(snapshot, self._read_payload(member))
+            resolved[member["id"]] = snapshot
+
+        return snapshot
+
+    async def _load_chain(self, document: dict, known: Dict[str, dict]) -> None:
+        """
+        Fetch the keyframe and earlier chain members of a delta in one query.
+
+        Args:
+            document: Delta document
+            known: Documents already fetched, by id (filled in place)
+        """
+        cursor = self._collection.find(self._ancestors_filter(document))
+        async for member in cursor:
+            known.setdefault(member["id"], member)
+
+    def _ancestors_filter(self, document: dict) -> dict:
+        """Filter matching a chain member's keyframe and earlier members."""
+        keyframe_id = document["keyframe_id"]
+        return {
+            "$or": [
+                {"id": keyframe_id},
+                {
+                    "keyframe_id": keyframe_id,
+                    "chain_position": {"$lt": document["chain_position"]},
+                },
+            ]
+        }
+
+    async def _to_chain_document(self, checkpoint: Checkpoint) -> dict:
+        """
+        Build the document for a new checkpoint in delta mode.
+
+        The parent is the demand's latest checkpoint. A keyframe is written
+        when the interval is reached, when there is no parent, or when the
+        delta would not be smaller than the snapshot itself.
+
+        Args:
+            checkpoint: Checkpoint entity
+
+        Returns:
+            MongoDB document dict with chain fields
+        """
+        parent = await self._collection.find_one(
+            {"demand_id": checkpoint.demand_id},
+            {"context_snapshot": 0},
+            sort=[("created_at", -1)],
+        )
+        position = 0 if parent is None else parent.get("chain_position", 0) + 1
+        if parent is None or position >= self._keyframe_interval:
+            return self._to_keyframe_document(checkpoint)
+
+        parent_snapshot = self._cached_chain_head(checkpoint.demand_id, parent["id"])
+        if parent_snapshot is None:
+            full_parent = await self._collection.find_one({"id": parent["id"]})
+            if full_parent is None:
+                return self._to_keyframe_document(checkpoint)
+            parent_snapshot = await self._resolve_snapshot(full_parent, {}, {})
+
+        delta = diff_snapshot(parent_snapshot, checkpoint.context_snapshot)
+        if len(delta) >= len(checkpoint.context_snapshot):
+            return self._to_keyframe_document(checkpoint)
+
+        document = self._to_document(checkpoint, payload=delta)
+        document["snapshot_kind"] = DELTA
+        document["parent_id"] = parent["id"]
+        document["keyframe_id"] = parent.get("keyframe_id", parent["id"])
+        document["chain_position"] = position
+        return document
+
+    def _to_keyframe_document(self, checkpoint: Checkpoint) -> dict:
+        """Document storing the full snapshot as a new chain keyframe."""
+        document = self._to_document(checkpoint)
+        document["snapshot_kind"] = KEYFRAME
+        document["keyframe_id"] = checkpoint.id
+        document["chain_position"] = 0
+        return document
+
+    async def _retain_ancestors(self, document: dict) -> None:
+        """
+        Keep a delta's ancestors alive at least as long as the delta.
+
+        The TTL index on expires_at would otherwise remove a keyframe while
+        deltas that depend on it are still valid.
+
+        Args:
+            document: Newly inserted delta document
+        """
+        ancestors = self._ancestors_filter(document)
+        expires_at = document.get("expires_at")
+        if expires_at is None:
+            await self._collection.update_many(
+                {**ancestors, "expires_at": {"$exists": True}},
+                {"$unset": {"expires_at": ""}},
+            )
+        else:
+            await self._collection.update_many(
+                {**ancestors, "expires_at": {"$lt": expires_at}},
+                {"$set": {"expires_at": expires_at}},
+            )
+
+    def _retain_for_children(self, document: dict, children: List[dict]) -> None:
+        """Extend a parent document's expires_at to cover its children."""
+        if "expires_at" not in document:
+            return
+        if any(child.get("expires_at") is None for child in children):
+            del document["expires_at"]
+            return
+        document["expires_at"] = max(
+            [document["expires_at"]] + [child["expires_at"] for child in children]
+        )
+
+    async def _delta_children(self, parent_ids: List[str]) -> List[dict]:
+        """Delta documents whose parent is one of parent_ids."""
+        if not parent_ids:
+            return []
+        cursor = self._collection.find(
+            {"parent_id": {"$in": list(parent_ids)}, "snapshot_kind": DELTA}
+        )
+        return await cursor.to_list(length=None)
+
+    async def _rebase_children(
+        self, children: List[dict], old_base: str, new_base: Optional[str]
+    ) -> None:
+        """
+        Rewrite delta children after their parent snapshot changed.
+
+        Args:
+            children: Delta documents of the same parent
+            old_base: Parent snapshot the deltas were computed against
+            new_base: New parent snapshot; None stores children in full
+                (parent is being deleted)
+        """
+        for child in children:
+            snapshot = apply_snapshot_delta(old_base, self._read_payload(child))
+            if new_base is None:
+                fields, unset = self._payload_fields(child["id"], snapshot)
+                fields["snapshot_kind"] = KEYFRAME
+                unset["parent_id"] = ""
+            else:
+                delta = diff_snapshot(new_base, snapshot)
+                fields, unset = self._payload_fields(child["id"], delta)
+
+            update = {"$set": fields}
+            if unset:
+                update["$unset"] = unset
+            await self._collection.update_one({"id": child["id"]}, update)
+            self._forget_chain_head(child["demand_id"])
+
+    async def _detach_children(self, checkpoint_ids: List[str]) -> None:
+        """
+        Store in full the deltas that depend on checkpoints about to be deleted.
+
+        Args:
+            checkpoint_ids: Checkpoints being deleted
+        """
+        doomed = set(checkpoint_ids)
+        children = [
+            child
+            for child in await self._delta_children(checkpoint_ids)
+            if child["id"] not in doomed
+        ]
+        if not children:
+            return
+
+        parent_ids = list({child["parent_id"] for child in children})
+        parents = await self._collection.find({"id": {"$in": parent_ids}}).to_list(
+            length=None
+        )
+        known = {parent["id"]: parent for parent in parents}
+        resolved: Dict[str, str] = {}
+        for parent in parents:
+            base = await self._resolve_snapshot(parent, known, resolved)
+            await self._rebase_children(
+                [child for child in children if child["parent_id"] == parent["id"]],
+                base,
+                None,
+            )
+
+    def _cached_chain_head(self, demand_id: str, checkpoint_id: str) -> Optional[str]:
+        """Snapshot of the demand's latest checkpoint if cached and current."""
+        head = self._chain_heads.get(demand_id)
+        if head is None or head[0] != checkpoint_id:
+            return None
+        self._chain_heads.move_to_end(demand_id)
+        return head[1]
+
+    def _remember_chain_head(self, checkpoint: Checkpoint) -> None:
+        """Cache the snapshot of the demand's newest checkpoint."""
+        self._chain_heads[checkpoint.demand_id] = (
+            checkpoint.id,
+            checkpoint.context_snapshot,
         )
+        self._chain_heads.move_to_end(checkpoint.demand_id)
+        while len(self._chain_heads) > MAX_CACHED_CHAIN_HEADS:
+            self._chain_heads.popitem(last=False)
+
+    def _forget_chain_head(self, demand_id: str) -> None:
+        """Drop the cached head snapshot of a demand."""
+        self._chain_heads.pop(demand_id, None)
+
+    def _decoder(self, codec_name: str) -> SnapshotCodec:
+        """
+        Codec able to read documents written with codec_name.
+
+        Args:
+            codec_name: Value of the snapshot_codec marker
+
+        Returns:
+            Cached SnapshotCodec instance
+        """
+        codec = self._decoders.get(codec_name)
+        if codec is None:
+            codec = get_codec(codec_name)
+            self._decoders[codec_name] = codec
+        return codec
+
+    def _report(self, stats: SnapshotCodecStats) -> None:
+        """Forward codec stats to the configured callback, if any."""
+        if self._on_codec_stats is not None:
+            self._on_codec_stats(stats)
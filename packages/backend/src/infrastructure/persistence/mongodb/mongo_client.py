@@ -0,0 +1,51 @@
+"""
+MongoDB Client Factory
+
+Builds the single AsyncIOMotorClient shared by the application, tuned
+from MongoSettings, with an optional pool statistics listener.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+from typing import Optional
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from infrastructure.config.settings import MongoSettings
+from infrastructure.persistence.mongodb.mongo_pool_stats import MongoPoolStats
+
+
+def create_mongo_client(
+    settings: MongoSettings, pool_stats: Optional[MongoPoolStats] = None
+) -> AsyncIOMotorClient:
+    """
+    Create a Motor client with the configured pool and timeouts.
+
+    The client connects lazily; no I/O happens here.
+
+    Args:
+        settings: MongoDB settings
+        pool_stats: Listener collecting pool statistics (optional)
+
+    Returns:
+        AsyncIOMotorClient instance
+    """
+    options = {
+        "maxPoolSize": settings.max_pool_size,
+        "minPoolSize": settings.min_pool_size,
+        "maxConnecting": settings.max_connecting,
+        "connectTimeoutMS": settings.connect_timeout_ms,
+        "serverSelectionTimeoutMS": settings.server_selection_timeout_ms,
+    }
+    if settings.max_idle_time_ms is not None:
+        options["maxIdleTimeMS"] = settings.max_idle_time_ms
+    if settings.socket_timeout_ms is not None:
+        options["socketTimeoutMS"] = settings.socket_timeout_ms
+    if settings.wait_queue_timeout_ms is not None:
+        options["waitQueueTimeoutMS"] = settings.wait_queue_timeout_ms
+    if settings.compressors:
+        options["compressors"] = settings.compressors
+    if pool_stats is not None:
+        options["event_listeners"] = [pool_stats]
+
+    return AsyncIOMotorClient(settings.uri, **options)
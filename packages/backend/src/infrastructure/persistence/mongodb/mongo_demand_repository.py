@@ -4,17 +4,60 @@ MongoDemandRepository Implementation
 MongoDB adapter for Demand persistence.
 Implements IDemandRepository interface from Application Layer.
 
+Every write also updates the per-project status rollup
+(see mongo_status_rollup).
+
 IAD-7: Repository Pattern + MongoDB
 """
 
-from typing import Optional
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
 
 from motor.motor_asyncio import AsyncIOMotorDatabase
-
+from pymongo import UpdateOne
+from pymongo.errors import DuplicateKeyError
+
+from application.dto.bulk_write_result import (
+    NOT_FOUND_ERROR,
+    BulkWriteResult,
+    bulk_result,
+)
+from application.dto.page import DEFAULT_PAGE_SIZE, Page
+from application.dto.status_counts import status_counts
+from application.dto.status_transition import STATUS_CONFLICT_ERROR, StatusTransition
+from application.exceptions import (
+    DemandNotFoundError,
+    DemandStatusConflictError,
+    DuplicateEntityError,
+)
 from application.interfaces.i_demand_repository import IDemandRepository
 from domain.entities.demand import Demand
-from domain.value_objects.context_budget import ContextBudget
 from domain.value_objects.demand_status import DemandStatus
+from infrastructure.persistence.field_patches import patch_fields
+from infrastructure.persistence.mongodb.mongo_bulk import (
+    delete_documents,
+    insert_documents,
+    replace_documents,
+    update_items,
+)
+from infrastructure.persistence.mongodb.mongo_pagination import fetch_page
+from infrastructure.persistence.mongodb.mongo_revision import (
+    next_revision,
+    patch_operation,
+    raise_on_conflict,
+    revision_filter,
+)
+from infrastructure.persistence.mongodb.mongo_status_rollup import (
+    MongoStatusRollup,
+    StatusKey,
+    rollup_deltas,
+    status_key,
+)
+from infrastructure.persistence.status_transitions import rejected_transitions
+from infrastructure.serialization.entity_codecs import DEMAND_CODEC
+
+# Fields needed to keep the status rollup in sync
+STATUS_PROJECTION = {"_id": 0, "id": 1, "project_id": 1, "status": 1}
 
 
 class MongoDemandRepository(IDemandRepository):
@@ -29,6 +72,7 @@ class MongoDemandRepository(IDemandRepository):
         """
         self._db = database
         self._collection = database["demands"]
+        self._rollup = MongoStatusRollup(database["demand_status_rollups"])
 
     async def create(self, demand: Demand) -> Demand:
         """
@@ -41,11 +85,15 @@ class MongoDemandRepository(IDemandRepository):
             The persisted demand entity
 
         Raises:
-            DuplicateDemandError: If demand with same ID already exists
+            DuplicateEntityError: If demand with same ID already exists
             RepositoryError: If persistence fails
         """
         document = self._to_document(demand)
-        await self._collection.insert_one(document)
+        try:
+            await self._collection.insert_one(document)
+        except DuplicateKeyError as exc:
+            raise DuplicateEntityError(f"Demand '{demand.id}' already exists") from exc
+        await self._rollup.apply(rollup_deltas([], [status_key(document)]))
         return demand
 
     async def get_by_id(self, demand_id: str) -> Optional[Demand]:
@@ -66,24 +114,175 @@ class MongoDemandRepository(IDemandRepository):
             return None
         return self._to_entity(document)
 
+    async def get_many(self, demand_ids: List[str]) -> Dict[str, Demand]:
+        """
+        Retrieve many demands with one $in query.
+
+        Args:
+            demand_ids: Demand UUID strings (duplicates allowed)
+
+        Returns:
+            Mapping of id to Demand entity; ids not found are absent
+        """
+        if not demand_ids:
+            return {}
+        unique_ids = list(dict.fromkeys(demand_ids))
+        cursor = self._collection.find({"id": {"$in": unique_ids}})
+        return {document["id"]: self._to_entity(document) async for document in cursor}
+
+    async def list_by_project(
+        self,
+        project_id: str,
+        status: Optional[DemandStatus] = None,
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[Demand]:
+        """
+        List demands with keyset pagination, newest first.
+
+        Served by the {project_id: 1, created_at: -1, id: -1} index, or
+        {project_id: 1, status: 1, created_at: -1, id: -1} when filtering by
+        status: no skip(), so deep pages cost the same as the first one.
+
+        Args:
+            project_id: Project UUID string
+            status: Only demands in this status (optional)
+            after: next_cursor of the previous page (None for the first page)
+            limit: Page size
+
+        Returns:
+            Page of Demand entities
+
+        Raises:
+            ValueError: If limit or cursor is invalid
+        """
+        base_filter = {"project_id": project_id}
+        if status is not None:
+            base_filter["status"] = status.value
+        documents, next_cursor = await fetch_page(
+            self._collection, base_filter, "created_at", after, limit
+        )
+        return Page(
+            items=[self._to_entity(document) for document in documents],
+            next_cursor=next_cursor,
+        )
+
     async def update(self, demand: Demand) -> Demand:
         """
-        Update an existing demand.
+        Update an existing demand if nobody saved it since it was read.
 
         Args:
             demand: Demand entity with updated data
 
         Returns:
-            The updated demand entity
+            The updated demand entity (revision incremented)
 
         Raises:
-            DemandNotFoundError: If demand does not exist
+            RevisionConflictError: If the stored revision is not demand.revision
             RepositoryError: If update fails
         """
-        document = self._to_document(demand)
-        await self._collection.replace_one({"id": demand.id}, document)
+        document = next_revision(self._to_document(demand))
+        previous = await self._collection.find_one_and_replace(
+            revision_filter(document), document, projection=STATUS_PROJECTION
+        )
+        if previous is None:
+            await raise_on_conflict(
+                self._collection, "Demand", demand.id, demand.revision
+            )
+            return demand
+        demand.revision = document["revision"]
+        await self._rollup.apply(
+            rollup_deltas([status_key(previous)], [status_key(document)])
+        )
+        return demand
+
+    async def patch(self, demand: Demand, fields: Iterable[str]) -> Demand:
+        """
+        Write only some attributes of a demand with one $set update.
+
+        A status-only change sends status and updated_at instead of the
+        whole document; the projection returns the previous (project_id,
+        status) for the status rollup.
+
+        Args:
+            demand: Demand entity holding the new values
+            fields: Attribute names to write (not id or revision)
+
+        Returns:
+            The demand entity (revision incremented if written)
+
+        Raises:
+            ValueError: If a field is unknown or protected
+            RevisionConflictError: If the stored revision is not demand.revision
+        """
+        names = patch_fields(demand, fields)
+        if not names:
+            return demand
+        query, update = patch_operation(DEMAND_CODEC, demand, names)
+        previous = await self._collection.find_one_and_update(
+            query, update, projection=STATUS_PROJECTION
+        )
+        if previous is None:
+            await raise_on_conflict(
+                self._collection, "Demand", demand.id, demand.revision
+            )
+            return demand
+        demand.revision += 1
+
+        written = dict(previous)
+        if "project_id" in names:
+            written["project_id"] = demand.project_id
+        if "status" in names:
+            written["status"] = demand.status.value
+        await self._rollup.apply(
+            rollup_deltas([status_key(previous)], [status_key(written)])
+        )
         return demand
 
+    async def transition(
+        self, demand_id: str, from_status: DemandStatus, to_status: DemandStatus
+    ) -> None:
+        """
+        Compare-and-set a demand's status with one conditional update.
+
+        The filter {id, status: from_status} makes the write atomic: if
+        another writer changed the status first, nothing matches. Only
+        status and updated_at are sent; the projection returns project_id
+        for the status rollup.
+
+        Args:
+            demand_id: Demand UUID string
+            from_status: Status the caller last saw
+            to_status: Next status (must follow from_status)
+
+        Raises:
+            InvalidStatusTransitionError: If to_status does not follow from_status
+            DemandAlreadyCompletedError: If from_status is final
+            DemandNotFoundError: If demand does not exist
+            DemandStatusConflictError: If the demand is no longer in from_status
+        """
+        from_status.validate_transition(to_status)
+        previous = await self._collection.find_one_and_update(
+            {"id": demand_id, "status": from_status.value},
+            {
+                "$set": {"status": to_status.value, "updated_at": datetime.utcnow()},
+                "$inc": {"revision": 1},
+            },
+            projection=STATUS_PROJECTION,
+        )
+        if previous is None:
+            current = await self._collection.find_one(
+                {"id": demand_id}, STATUS_PROJECTION
+            )
+            if current is None:
+                raise DemandNotFoundError(f"Demand '{demand_id}' not found")
+            raise DemandStatusConflictError(
+                demand_id, from_status, DemandStatus(current["status"])
+            )
+
+        moved = (previous["project_id"], to_status.value)
+        await self._rollup.apply(rollup_deltas([status_key(previous)], [moved]))
+
     async def delete(self, demand_id: str) -> None:
         """
         Remove a demand.
@@ -95,7 +294,216 @@ class MongoDemandRepository(IDemandRepository):
             DemandNotFoundError: If demand does not exist
             RepositoryError: If deletion fails
         """
-        await self._collection.delete_one({"id": demand_id})
+        previous = await self._collection.find_one_and_delete(
+            {"id": demand_id}, projection=STATUS_PROJECTION
+        )
+        await self._rollup.apply(rollup_deltas([status_key(previous)], []))
+
+    async def create_many(self, demands: List[Demand]) -> BulkWriteResult:
+        """
+        Persist many new demands with one unordered insert_many.
+
+        Args:
+            demands: Demand entities to persist
+
+        Returns:
+            Per-item result in input order
+        """
+        documents = [self._to_document(demand) for demand in demands]
+        result = await insert_documents(self._collection, documents)
+        added = [
+            status_key(document)
+            for document, item in zip(documents, result.items)
+            if item.ok
+        ]
+        await self._rollup.apply(rollup_deltas([], added))
+        return result
+
+    async def update_many(self, demands: List[Demand]) -> BulkWriteResult:
+        """
+        Update many demands with one unordered bulk_write of ReplaceOne.
+
+        Each item is filtered on its revision, like update().
+
+        Args:
+            demands: Demand entities with updated data
+
+        Returns:
+            Per-item result in input order
+        """
+        documents = [next_revision(self._to_document(d)) for d in demands]
+        previous = await self._status_keys([demand.id for demand in demands])
+        result = await replace_documents(self._collection, documents)
+
+        removed, added = [], []
+        for demand, document, item in zip(demands, documents, result.items):
+            if item.ok:
+                demand.revision = document["revision"]
+            if item.ok and document["id"] in previous:
+                removed.append(previous.pop(document["id"]))
+                added.append(status_key(document))
+        await self._rollup.apply(rollup_deltas(removed, added))
+        return result
+
+    async def transition_many(
+        self, transitions: List[StatusTransition]
+    ) -> BulkWriteResult:
+        """
+        Compare-and-set many statuses with one unordered bulk_write.
+
+        One projected read finds the current (project_id, status) of every
+        demand, so missing demands and stale from_status fail without a
+        write. The rest are UpdateOne filtered on {id, status: from_status}.
+        If a concurrent writer got in between, fewer filters match; the
+        winners are then found by the batch's updated_at stamp (a writer
+        making the same transition in the same millisecond is
+        indistinguishable; rebuild_status_rollup repairs the counts).
+
+        Args:
+            transitions: Status changes (at most one per demand)
+
+        Returns:
+            Per-item result in input order
+        """
+        errors = rejected_transitions(transitions)
+        previous = await self._status_keys(
+            [
+                transition.demand_id
+                for index, transition in enumerate(transitions)
+                if index not in errors
+            ]
+        )
+        # BSON dates keep milliseconds: truncate so the stamp can be matched
+        now = datetime.utcnow()
+        now = now.replace(microsecond=now.microsecond // 1000 * 1000)
+
+        operations: Dict[int, UpdateOne] = {}
+        for index, transition in enumerate(transitions):
+            if index in errors:
+                continue
+            key = previous.get(transition.demand_id)
+            if key is None:
+                errors[index] = NOT_FOUND_ERROR
+            elif key[1] != transition.from_status.value:
+                errors[index] = STATUS_CONFLICT_ERROR
+            else:
+                operations[index] = UpdateOne(
+                    {"id": transition.demand_id, "status": key[1]},
+                    {
+                        "$set": {
+                            "status": transition.to_status.value,
+                            "updated_at": now,
+                        },
+                        "$inc": {"revision": 1},
+                    },
+                )
+
+        matched, write_errors = await update_items(self._collection, operations)
+        errors.update(write_errors)
+        if matched < len(operations) - len(write_errors):
+            stamped = await self._collection.find(
+                {
+                    "id": {"$in": [transitions[i].demand_id for i in operations]},
+                    "updated_at": now,
+                },
+                STATUS_PROJECTION,
+            ).to_list(None)
+            won = {(document["id"], document["status"]) for document in stamped}
+            for index in operations:
+                transition = transitions[index]
+                if index not in errors and (
+                    (transition.demand_id, transition.to_status.value) not in won
+                ):
+                    errors[index] = STATUS_CONFLICT_ERROR
+
+        removed, added = [], []
+        for index in operations:
+            if index not in errors:
+                project_id, status = previous[transitions[index].demand_id]
+                removed.append((project_id, status))
+                added.append((project_id, transitions[index].to_status.value))
+        await self._rollup.apply(rollup_deltas(removed, added))
+        return bulk_result([transition.demand_id for transition in transitions], errors)
+
+    async def delete_many(self, demand_ids: List[str]) -> BulkWriteResult:
+        """
+        Remove many demands with one unordered bulk_write of DeleteOne.
+
+        Args:
+            demand_ids: Demand UUID strings
+
+        Returns:
+            Per-item result in input order
+        """
+        previous = await self._status_keys(demand_ids)
+        result = await delete_documents(self._collection, demand_ids)
+
+        removed = [
+            previous.pop(item.id)
+            for item in result.items
+            if item.ok and item.id in previous
+        ]
+        await self._rollup.apply(rollup_deltas(removed, []))
+        return result
+
+    async def count_by_status(self, project_id: str) -> Dict[DemandStatus, int]:
+        """
+        Count a project's demands per status with one aggregation.
+
+        $match on project_id + $group on status is covered by the
+        {project_id: 1, status: 1, ...} index (no documents fetched).
+
+        Args:
+            project_id: Project UUID string
+
+        Returns:
+            Every DemandStatus, in workflow order, mapped to its count
+        """
+        cursor = self._collection.aggregate(
+            [
+                {"$match": {"project_id": project_id}},
+                {"$group": {"_id": "$status", "count": {"$sum": 1}}},
+            ]
+        )
+        return status_counts({group["_id"]: group["count"] async for group in cursor})
+
+    async def get_status_rollup(self, project_id: str) -> Dict[DemandStatus, int]:
+        """
+        Per-status counts from the project's rollup document (one read).
+
+        Args:
+            project_id: Project UUID string
+
+        Returns:
+            Every DemandStatus, in workflow order, mapped to its count
+        """
+        return await self._rollup.get(project_id)
+
+    async def rebuild_status_rollup(self, project_id: str) -> Dict[DemandStatus, int]:
+        """
+        Recompute a project's rollup from the demands collection.
+
+        Repairs drift left by a crash between a demand write and its
+        rollup update, or by writes made outside this repository.
+
+        Args:
+            project_id: Project UUID string
+
+        Returns:
+            The recomputed per-status counts
+        """
+        counts = await self.count_by_status(project_id)
+        await self._rollup.replace(project_id, counts)
+        return counts
+
+    async def _status_keys(self, demand_ids: List[str]) -> Dict[str, StatusKey]:
+        """Current (project_id, status) of stored demands, by id."""
+        if not demand_ids:
+            return {}
+        cursor = self._collection.find(
+            {"id": {"$in": list(dict.fromkeys(demand_ids))}}, STATUS_PROJECTION
+        )
+        return {document["id"]: status_key(document) async for document in cursor}
 
     def _to_document(self, demand: Demand) -> dict:
         """
@@ -107,27 +515,7 @@ class MongoDemandRepository(IDemandRepository):
         Returns:
             MongoDB document dict
         """
-        document = {
-            "id": demand.id,  # UUID string
-            "project_id": demand.project_id,
-            "title": demand.title,
-            "description": demand.description,
-            "status": demand.status.value,  # Enum → string
-            "created_at": demand.created_at,
-        }
-
-        # Optional ContextBudget as subdocument
-        if demand.context_budget is not None:
-            document["context_budget"] = {
-                "max_tokens": demand.context_budget.max_tokens,
-                "used_tokens": demand.context_budget.used_tokens,
-            }
-
-        # Only include updated_at if not None (MongoDB schema requires date type)
-        if demand.updated_at is not None:
-            document["updated_at"] = demand.updated_at
-
-        return document
+        return DEMAND_CODEC.to_document(demand)
 
     def _to_entity(self, document: dict) -> Demand:
         """
@@ -139,21 +527,4 @@ class MongoDemandRepository(IDemandRepository):
         Returns:
             Demand entity
         """
-        # Optional ContextBudget conversion
-        context_budget = None
-        if "context_budget" in document and document["context_budget"] is not None:
-            context_budget = ContextBudget(
-                max_tokens=document["context_budget"]["max_tokens"],
-                used_tokens=document["context_budget"]["used_tokens"],
-            )
-
-        return Demand(
-            id=document["id"],
-            project_id=document["project_id"],
-            title=document["title"],
-            description=document["description"],
-            status=DemandStatus(document["status"]),  # string → Enum
-            context_budget=context_budget,
-            created_at=document["created_at"],
-            updated_at=document.get("updated_at"),
-        )
+        return DEMAND_CODEC.from_document(document)
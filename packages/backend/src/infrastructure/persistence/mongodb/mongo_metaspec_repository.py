@@ -4,29 +4,114 @@ MongoMetaspecRepository Implementation
 MongoDB adapter for Metaspec persistence.
 Implements IMetaspecRepository interface from Application Layer.
 
+Versions are append-only: one document per (id, version). Updating to a
+higher version inserts a new document and clears the "latest" marker of
+the previous one, so history stays readable via get_version. Documents
+without the marker (written before versioning) count as latest.
+
+Every append tags the document it inserts and the one it demotes with a
+fresh write token. When two writers race for the same next version, the
+loser only rolls back documents carrying its own token, never the
+winner's.
+
+get_latest results are kept in a small in-process LRU cache, invalidated
+by every write made through this repository instance. Writes from other
+processes are not seen by it, so entries also expire after a few seconds
+(latest_cache_ttl); that is the longest a stale latest version is served.
+
 IAD-7: Repository Pattern + MongoDB
 """
 
-from typing import Optional
+import copy
+import time
+import uuid
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 from motor.motor_asyncio import AsyncIOMotorDatabase
-
+from pymongo import InsertOne, ReplaceOne, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from application.dto.bulk_write_result import (
+    NOT_FOUND_ERROR,
+    REVISION_CONFLICT_ERROR,
+    BulkWriteResult,
+    bulk_result,
+)
+from application.dto.lazy import LazyField, LazyMetaspec
+from application.dto.page import DEFAULT_PAGE_SIZE, Page
+from application.dto.summaries import MetaspecSummary
+from application.exceptions import (
+    DuplicateEntityError,
+    RepositoryError,
+    RevisionConflictError,
+)
 from application.interfaces.i_metaspec_repository import IMetaspecRepository
 from domain.entities.metaspec import Metaspec, MetaspecType
+from infrastructure.cache.lru_ttl_cache import LRUTTLCache
+from infrastructure.persistence.field_patches import patch_fields
+from infrastructure.persistence.mongodb.mongo_bulk import (
+    delete_documents,
+    insert_documents,
+    write_item_operations,
+)
+from infrastructure.persistence.mongodb.mongo_pagination import fetch_page
+from infrastructure.persistence.mongodb.mongo_revision import (
+    as_stored,
+    at_revision,
+    next_revision,
+    patch_operation,
+)
+from infrastructure.serialization.entity_codecs import METASPEC_CODEC
+
+# Everything but the Markdown body.
+SUMMARY_PROJECTION = {"_id": 0, "content": 0}
+
+# Current version of each metaspec (legacy documents have no marker).
+LATEST_FILTER = {"latest": {"$ne": False}}
+
+# Marks the documents an append inserted or demoted (see _undo_append).
+WRITE_TOKEN_FIELD = "write_token"
+
+# Highest version first; served by {demand_id: 1, version: -1, id: -1}.
+LATEST_SORT = [("version", -1), ("id", -1)]
+
+# Bound for the get_latest cache, entries per (demand_id, type)
+MAX_CACHED_LATEST = 1024
+
+# Seconds a cached get_latest result may hide writes of other processes
+LATEST_CACHE_TTL_SECONDS = 5.0
 
 
 class MongoMetaspecRepository(IMetaspecRepository):
     """MongoDB implementation of IMetaspecRepository"""
 
-    def __init__(self, database: AsyncIOMotorDatabase):
+    def __init__(
+        self,
+        database: AsyncIOMotorDatabase,
+        latest_cache_size: int = MAX_CACHED_LATEST,
+        latest_cache_ttl: Optional[float] = LATEST_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         """
         Initialize MongoDB repository.
 
         Args:
             database: Motor AsyncIOMotorDatabase instance
+            latest_cache_size: Max (demand_id, type) entries kept by the
+                get_latest cache; 0 disables it
+            latest_cache_ttl: Seconds a cached get_latest result is served
+                (None = until a write through this instance)
+            clock: Time source in seconds (injectable for tests)
         """
         self._db = database
         self._collection = database["metaspecs"]
+        self._latest: Optional[LRUTTLCache[Metaspec]] = (
+            LRUTTLCache(latest_cache_size, latest_cache_ttl, clock)
+            if latest_cache_size > 0
+            else None
+        )
+        # Bumped after every write, so a read racing a write is not cached
+        self._writes = 0
 
     async def create(self, metaspec: Metaspec) -> Metaspec:
         """
@@ -39,16 +124,23 @@ class MongoMetaspecRepository(IMetaspecRepository):
             The persisted metaspec entity
 
         Raises:
-            DuplicateMetaspecError: If metaspec with same ID already exists
+            DuplicateEntityError: If metaspec with same ID already exists
             RepositoryError: If persistence fails
         """
         document = self._to_document(metaspec)
-        await self._collection.insert_one(document)
+        try:
+            await self._collection.insert_one(document)
+        except DuplicateKeyError as exc:
+            raise DuplicateEntityError(
+                f"Metaspec '{metaspec.id}' already exists"
+            ) from exc
+        finally:
+            self._invalidate([metaspec])
         return metaspec
 
     async def get_by_id(self, metaspec_id: str) -> Optional[Metaspec]:
         """
-        Retrieve a metaspec by its UUID.
+        Retrieve the latest version of a metaspec by its UUID.
 
         Args:
             metaspec_id: Metaspec UUID string
@@ -59,32 +151,272 @@ class MongoMetaspecRepository(IMetaspecRepository):
         Raises:
             RepositoryError: If retrieval fails
         """
-        document = await self._collection.find_one({"id": metaspec_id})
+        document = await self._collection.find_one(
+            {"id": metaspec_id}, sort=[("version", -1)]
+        )
+        if document is None:
+            return None
+        return self._to_entity(document)
+
+    async def get_many(self, metaspec_ids: List[str]) -> Dict[str, Metaspec]:
+        """
+        Retrieve the latest version of many metaspecs with one $in query.
+
+        Args:
+            metaspec_ids: Metaspec UUID strings (duplicates allowed)
+
+        Returns:
+            Mapping of id to Metaspec entity; ids not found are absent
+        """
+        if not metaspec_ids:
+            return {}
+        unique_ids = list(dict.fromkeys(metaspec_ids))
+        # Ascending version: if an append is in flight, the newer one wins
+        cursor = self._collection.find(
+            {"id": {"$in": unique_ids}, **LATEST_FILTER}, sort=[("version", 1)]
+        )
+        return {document["id"]: self._to_entity(document) async for document in cursor}
+
+    async def get_latest(
+        self, demand_id: str, metaspec_type: MetaspecType
+    ) -> Optional[Metaspec]:
+        """
+        Retrieve the highest version of a demand's metaspec of a type.
+
+        Served by the {demand_id: 1, version: -1, id: -1} index: the scan
+        stops at the first document of the requested type.
+
+        Args:
+            demand_id: Demand UUID string
+            metaspec_type: Metaspec type
+
+        Returns:
+            Latest Metaspec if any, None otherwise
+        """
+        key = (demand_id, metaspec_type.value)
+        cached = None if self._latest is None else self._latest.get(key)
+        if cached is not None:
+            return copy.copy(cached)
+
+        writes = self._writes
+        document = await self._collection.find_one(
+            {"demand_id": demand_id, "type": metaspec_type.value}, sort=LATEST_SORT
+        )
+        if document is None:
+            return None
+
+        metaspec = self._to_entity(document)
+        if writes == self._writes:
+            self._remember_latest(key, metaspec)
+        return copy.copy(metaspec)
+
+    async def get_version(
+        self, demand_id: str, metaspec_type: MetaspecType, version: int
+    ) -> Optional[Metaspec]:
+        """
+        Retrieve a specific (possibly superseded) version.
+
+        Args:
+            demand_id: Demand UUID string
+            metaspec_type: Metaspec type
+            version: Version number
+
+        Returns:
+            Metaspec at that version if stored, None otherwise
+        """
+        document = await self._collection.find_one(
+            {"demand_id": demand_id, "type": metaspec_type.value, "version": version},
+            sort=[("id", -1)],
+        )
         if document is None:
             return None
         return self._to_entity(document)
 
+    async def list_metaspecs(
+        self,
+        demand_id: str,
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[Metaspec]:
+        """
+        List metaspecs (latest versions) with keyset pagination,
+        highest version first.
+
+        Served by the {demand_id: 1, version: -1, id: -1} index:
+        no skip(), so deep pages cost the same as the first one.
+
+        Args:
+            demand_id: Demand UUID string
+            after: next_cursor of the previous page (None for the first page)
+            limit: Page size
+
+        Returns:
+            Page of Metaspec entities
+
+        Raises:
+            ValueError: If limit or cursor is invalid
+        """
+        base_filter = {"demand_id": demand_id, **LATEST_FILTER}
+        documents, next_cursor = await fetch_page(
+            self._collection, base_filter, "version", after, limit
+        )
+        return Page(
+            items=[self._to_entity(document) for document in documents],
+            next_cursor=next_cursor,
+        )
+
+    async def get_summary(self, metaspec_id: str) -> Optional[MetaspecSummary]:
+        """
+        Retrieve a metaspec without its content (projection).
+
+        Args:
+            metaspec_id: Metaspec UUID string
+
+        Returns:
+            MetaspecSummary if found, None otherwise
+        """
+        document = await self._collection.find_one(
+            {"id": metaspec_id}, SUMMARY_PROJECTION, sort=[("version", -1)]
+        )
+        if document is None:
+            return None
+        return self._to_summary(document)
+
+    async def list_metaspec_summaries(
+        self,
+        demand_id: str,
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[MetaspecSummary]:
+        """
+        Same as list_metaspecs, with content excluded by projection.
+
+        Args:
+            demand_id: Demand UUID string
+            after: next_cursor of the previous page (None for the first page)
+            limit: Page size
+
+        Returns:
+            Page of MetaspecSummary
+
+        Raises:
+            ValueError: If limit or cursor is invalid
+        """
+        documents, next_cursor = await fetch_page(
+            self._collection,
+            {"demand_id": demand_id, **LATEST_FILTER},
+            "version",
+            after,
+            limit,
+            projection=SUMMARY_PROJECTION,
+        )
+        return Page(
+            items=[self._to_summary(document) for document in documents],
+            next_cursor=next_cursor,
+        )
+
+    async def get_lazy(self, metaspec_id: str) -> Optional[LazyMetaspec]:
+        """
+        Retrieve a metaspec whose content is fetched on first access.
+
+        Args:
+            metaspec_id: Metaspec UUID string
+
+        Returns:
+            LazyMetaspec if found, None otherwise
+        """
+        summary = await self.get_summary(metaspec_id)
+        if summary is None:
+            return None
+        version = summary.version
+        return LazyMetaspec(
+            **vars(summary),
+            content_field=LazyField(lambda: self._load_content(metaspec_id, version)),
+        )
+
     async def update(self, metaspec: Metaspec) -> Metaspec:
         """
-        Update an existing metaspec.
+        Update an existing metaspec if nobody saved it since it was read.
+
+        A higher version is appended (the previous one stays stored);
+        the current version is overwritten in place. Either way the
+        stored document being superseded must still be at
+        metaspec.revision.
 
         Args:
             metaspec: Metaspec entity with updated data
 
         Returns:
-            The updated metaspec entity
+            The updated metaspec entity (revision incremented)
 
         Raises:
-            MetaspecNotFoundError: If metaspec does not exist
+            RevisionConflictError: If another writer saved the metaspec first
             RepositoryError: If update fails
         """
-        document = self._to_document(metaspec)
-        await self._collection.replace_one({"id": metaspec.id}, document)
+        current = await self._current_versions([metaspec.id])
+        if metaspec.id not in current:
+            return metaspec
+
+        token = uuid.uuid4().hex
+        operations = self._version_operations(metaspec, current[metaspec.id], token)
+        try:
+            # Ordered: the new version is visible before the old loses its marker
+            result = await self._collection.bulk_write(operations, ordered=True)
+            matched = result.matched_count
+        except BulkWriteError as exc:
+            # A concurrent writer appended the same version first
+            if not _is_duplicate_key(exc):
+                raise
+            matched = 0
+        finally:
+            self._invalidate([metaspec])
+
+        if matched == 0:
+            await self._raise_conflict(metaspec, current[metaspec.id], token)
+            return metaspec
+        metaspec.revision += 1
+        return metaspec
+
+    async def patch(self, metaspec: Metaspec, fields: Iterable[str]) -> Metaspec:
+        """
+        Write only some attributes of one stored version with $set.
+
+        A content edit sends the content (and whatever else is named)
+        without re-encoding the document. Patching "version" appends a
+        new version through update().
+
+        Args:
+            metaspec: Metaspec entity holding the new values
+            fields: Attribute names to write (not id or revision)
+
+        Returns:
+            The metaspec entity (revision incremented if written)
+
+        Raises:
+            ValueError: If a field is unknown or protected
+            RevisionConflictError: If the version is not at metaspec.revision
+        """
+        names = patch_fields(metaspec, fields)
+        if "version" in names:
+            return await self.update(metaspec)
+        if not names:
+            return metaspec
+
+        query, update = patch_operation(METASPEC_CODEC, metaspec, names)
+        query["version"] = metaspec.version
+        try:
+            result = await self._collection.update_one(query, update)
+        finally:
+            self._invalidate([metaspec])
+        if result.matched_count == 0:
+            await self._raise_conflict(metaspec, metaspec.version)
+            return metaspec
+        metaspec.revision += 1
         return metaspec
 
     async def delete(self, metaspec_id: str) -> None:
         """
-        Remove a metaspec.
+        Remove a metaspec and all of its versions.
 
         Args:
             metaspec_id: Metaspec UUID string
@@ -93,31 +425,330 @@ class MongoMetaspecRepository(IMetaspecRepository):
             MetaspecNotFoundError: If metaspec does not exist
             RepositoryError: If deletion fails
         """
-        await self._collection.delete_one({"id": metaspec_id})
+        try:
+            await self._collection.delete_many({"id": metaspec_id})
+        finally:
+            self._invalidate_ids([metaspec_id])
 
-    def _to_document(self, metaspec: Metaspec) -> dict:
+    async def create_many(self, metaspecs: List[Metaspec]) -> BulkWriteResult:
         """
-        Convert Metaspec entity to MongoDB document.
+        Persist many new metaspecs with one unordered insert_many.
 
         Args:
-            metaspec: Metaspec entity
+            metaspecs: Metaspec entities to persist
 
         Returns:
-            MongoDB document dict
+            Per-item result in input order
+        """
+        documents = [self._to_document(metaspec) for metaspec in metaspecs]
+        try:
+            return await insert_documents(self._collection, documents)
+        finally:
+            self._invalidate(metaspecs)
+
+    async def update_many(self, metaspecs: List[Metaspec]) -> BulkWriteResult:
         """
-        document = {
-            "id": metaspec.id,  # UUID string
-            "demand_id": metaspec.demand_id,
-            "type": metaspec.type.value,  # Enum → string
-            "content": metaspec.content,
-            "version": metaspec.version,
-            "created_at": metaspec.created_at,
+        Update many metaspecs with one unordered bulk_write.
+
+        Same versioning and revision rules as update(); metaspecs that do
+        not exist are reported as failed.
+
+        Args:
+            metaspecs: Metaspec entities with updated data
+
+        Returns:
+            Per-item result in input order
+        """
+        if not metaspecs:
+            return BulkWriteResult()
+
+        current = await self._current_versions([metaspec.id for metaspec in metaspecs])
+        errors: Dict[int, str] = {}
+        operations = []
+        superseded: Dict[int, int] = {}
+        tokens: Dict[int, str] = {}
+        for index, metaspec in enumerate(metaspecs):
+            if metaspec.id not in current:
+                errors[index] = NOT_FOUND_ERROR
+                operations.append([])
+                continue
+            superseded[index] = current[metaspec.id]
+            tokens[index] = uuid.uuid4().hex
+            operations.append(
+                self._version_operations(metaspec, current[metaspec.id], tokens[index])
+            )
+            current[metaspec.id] = max(current[metaspec.id], metaspec.version)
+
+        try:
+            result, matched = await write_item_operations(
+                self._collection,
+                [metaspec.id for metaspec in metaspecs],
+                operations,
+                errors,
+            )
+        finally:
+            self._invalidate(metaspecs)
+
+        # One revision-filtered operation per item: fewer matches mean
+        # some items lost a race; find which ones. An append whose insert
+        # failed may still have demoted the previous version: undo that.
+        written = [item.index for item in result.items if item.ok]
+        failed_appends = [
+            item.index
+            for item in result.failures
+            if item.index in superseded
+            and metaspecs[item.index].version > superseded[item.index]
+        ]
+        for index in failed_appends:
+            await self._undo_append(metaspecs[index], superseded[index], tokens[index])
+        if matched < len(written) or failed_appends:
+            lost = await self._lost_updates(
+                {
+                    index: (metaspecs[index], superseded[index], tokens[index])
+                    for index in written
+                }
+            )
+            errors.update({index: REVISION_CONFLICT_ERROR for index in lost})
+            result = bulk_result(
+                [metaspec.id for metaspec in metaspecs],
+                {
+                    **{item.index: item.error for item in result.failures},
+                    **errors,
+                },
+            )
+
+        for item in result.items:
+            if item.ok:
+                metaspecs[item.index].revision += 1
+        return result
+
+    async def delete_many(self, metaspec_ids: List[str]) -> BulkWriteResult:
+        """
+        Remove many metaspecs (all versions) with one unordered bulk_write.
+
+        Args:
+            metaspec_ids: Metaspec UUID strings
+
+        Returns:
+            Per-item result in input order
+        """
+        try:
+            return await delete_documents(
+                self._collection, metaspec_ids, all_matches=True
+            )
+        finally:
+            self._invalidate_ids(metaspec_ids)
+
+    async def _current_versions(self, metaspec_ids: List[str]) -> Dict[str, int]:
+        """Latest stored version of each existing metaspec id."""
+        cursor = self._collection.find(
+            {"id": {"$in": list(dict.fromkeys(metaspec_ids))}, **LATEST_FILTER},
+            {"_id": 0, "id": 1, "version": 1},
+        )
+        versions: Dict[str, int] = {}
+        async for document in cursor:
+            versions[document["id"]] = max(
+                document["version"], versions.get(document["id"], 0)
+            )
+        return versions
+
+    def _version_operations(
+        self, metaspec: Metaspec, current_version: int, token: str
+    ) -> list:
+        """
+        Write operations storing a metaspec given its current stored version.
+
+        The one filtered operation (demote or replace) only matches while
+        the superseded document is at metaspec.revision.
+
+        Args:
+            metaspec: Metaspec entity with updated data
+            current_version: Latest version stored for its id
+            token: Write token set on the documents an append inserts and
+                demotes, so only this write can undo them
+
+        Returns:
+            pymongo operations (insert + demote for a new version,
+            a single replace otherwise)
+        """
+        if metaspec.version > current_version:
+            document = self._next_document(metaspec, current_version)
+            document[WRITE_TOKEN_FIELD] = token
+            return [
+                InsertOne(document),
+                UpdateOne(
+                    {
+                        "id": metaspec.id,
+                        "version": current_version,
+                        "revision": at_revision(metaspec.revision),
+                    },
+                    {
+                        "$set": {"latest": False, WRITE_TOKEN_FIELD: token},
+                        "$inc": {"revision": 1},
+                    },
+                ),
+            ]
+
+        # Same version: edit in place. Older version: rewrite that history entry.
+        return [
+            ReplaceOne(
+                {
+                    "id": metaspec.id,
+                    "version": metaspec.version,
+                    "revision": at_revision(metaspec.revision),
+                },
+                self._next_document(metaspec, current_version),
+            )
+        ]
+
+    def _next_document(self, metaspec: Metaspec, current_version: int) -> dict:
+        """Document written by _version_operations (revision + 1)."""
+        latest = metaspec.version >= current_version
+        return next_revision(self._to_document(metaspec, latest=latest))
+
+    def _superseded(self, metaspec: Metaspec, current_version: int) -> dict:
+        """Filter of the stored version an update of metaspec replaces."""
+        return {"id": metaspec.id, "version": min(metaspec.version, current_version)}
+
+    async def _raise_conflict(
+        self, metaspec: Metaspec, current_version: int, token: Optional[str] = None
+    ) -> None:
+        """
+        Undo an unmatched update and report the conflict.
+
+        Args:
+            metaspec: Metaspec entity passed to update()
+            current_version: Latest version stored when update() started
+            token: Write token of the update's operations (None: nothing
+                was appended)
+
+        Raises:
+            RevisionConflictError: Unless the metaspec was deleted meanwhile
+        """
+        if token is not None and metaspec.version > current_version:
+            await self._undo_append(metaspec, current_version, token)
+        stored = await self._collection.find_one(
+            self._superseded(metaspec, current_version), {"_id": 0, "revision": 1}
+        )
+        if stored is not None:
+            raise RevisionConflictError(
+                "Metaspec", metaspec.id, metaspec.revision, stored.get("revision", 0)
+            )
+
+    async def _lost_updates(
+        self, written: Dict[int, Tuple[Metaspec, int, str]]
+    ) -> List[int]:
+        """
+        Items of a batch whose revision-filtered operation matched nothing.
+
+        Appends that lost are undone (see _undo_append).
+
+        Args:
+            written: Item index -> (metaspec, version it superseded, write
+                token), for items sent without write error
+
+        Returns:
+            Indexes of the items that were not written
+        """
+        ids = {metaspec.id for metaspec, _, _ in written.values()}
+        cursor = self._collection.find(
+            {"id": {"$in": list(ids)}},
+            {"_id": 0},
+        )
+        stored = {
+            (document["id"], document["version"]): document async for document in cursor
         }
 
-        # Only include updated_at if not None (MongoDB schema requires date type)
-        if metaspec.updated_at is not None:
-            document["updated_at"] = metaspec.updated_at
+        lost = []
+        for index, (metaspec, current_version, token) in written.items():
+            if metaspec.version > current_version:
+                # Appended: won if both documents still carry our token
+                previous = stored.get((metaspec.id, current_version), {})
+                appended = stored.get((metaspec.id, metaspec.version), {})
+                won = (
+                    previous.get(WRITE_TOKEN_FIELD) == token
+                    and appended.get(WRITE_TOKEN_FIELD) == token
+                )
+                if not won:
+                    await self._undo_append(metaspec, current_version, token)
+            else:
+                document = self._next_document(metaspec, current_version)
+                won = stored.get((metaspec.id, metaspec.version)) == as_stored(document)
+            if not won:
+                lost.append(index)
+        return lost
+
+    async def _undo_append(
+        self, metaspec: Metaspec, current_version: int, token: str
+    ) -> None:
+        """
+        Roll back the parts of a losing append that this write made.
+
+        Deletes the new version only if this write inserted it, and marks
+        the previous version latest again only if this write demoted it.
+        Documents written by a concurrent winner are left untouched.
+        """
+        await self._collection.delete_one(
+            {"id": metaspec.id, "version": metaspec.version, WRITE_TOKEN_FIELD: token}
+        )
+        await self._collection.update_one(
+            {"id": metaspec.id, "version": current_version, WRITE_TOKEN_FIELD: token},
+            {
+                "$set": {"latest": True},
+                "$unset": {WRITE_TOKEN_FIELD: ""},
+                "$inc": {"revision": 1},
+            },
+        )
+
+    async def _load_content(self, metaspec_id: str, version: int) -> str:
+        """
+        Fetch only the content field of one metaspec version.
+
+        Raises:
+            RepositoryError: If the metaspec was removed meanwhile
+        """
+        document = await self._collection.find_one(
+            {"id": metaspec_id, "version": version}, {"_id": 0, "content": 1}
+        )
+        if document is None:
+            raise RepositoryError(f"Metaspec '{metaspec_id}' no longer exists")
+        return document["content"]
+
+    def _remember_latest(self, key: Tuple[str, str], metaspec: Metaspec) -> None:
+        """Cache a get_latest result (LRU/TTL, bounded by latest_cache_size)."""
+        if self._latest is not None:
+            self._latest.set(key, metaspec)
+
+    def _invalidate(self, metaspecs: List[Metaspec]) -> None:
+        """Drop cached latest versions touched by writes of these metaspecs."""
+        if self._latest is not None:
+            for metaspec in metaspecs:
+                self._latest.delete((metaspec.demand_id, metaspec.type.value))
+        self._invalidate_ids([metaspec.id for metaspec in metaspecs])
+
+    def _invalidate_ids(self, metaspec_ids: List[str]) -> None:
+        """Drop cached entries holding any of the given metaspec ids."""
+        self._writes += 1
+        if self._latest is None:
+            return
+        ids = set(metaspec_ids)
+        for key, cached in self._latest.items():
+            if cached.id in ids:
+                self._latest.delete(key)
+
+    def _to_document(self, metaspec: Metaspec, latest: bool = True) -> dict:
+        """
+        Convert Metaspec entity to MongoDB document.
 
+        Args:
+            metaspec: Metaspec entity
+            latest: Whether this is the current version of the metaspec
+
+        Returns:
+            MongoDB document dict
+        """
+        document = METASPEC_CODEC.to_document(metaspec)
+        document["latest"] = latest
         return document
 
     def _to_entity(self, document: dict) -> Metaspec:
@@ -130,12 +761,32 @@ class MongoMetaspecRepository(IMetaspecRepository):
         Returns:
             Metaspec entity
         """
-        return Metaspec(
+        return METASPEC_CODEC.from_document(document)
+
+    def _to_summary(self, document: dict) -> MetaspecSummary:
+        """
+        Convert a projected MongoDB document to MetaspecSummary.
+
+        Args:
+            document: MongoDB document dict (without content)
+
+        Returns:
+            MetaspecSummary
+        """
+        return MetaspecSummary(
             id=document["id"],
             demand_id=document["demand_id"],
-            type=MetaspecType(document["type"]),  # string → Enum
-            content=document["content"],
+            type=MetaspecType(document["type"]),
             version=document["version"],
             created_at=document["created_at"],
             updated_at=document.get("updated_at"),
+            revision=document.get("revision", 0),
         )
+
+
+def _is_duplicate_key(exc: BulkWriteError) -> bool:
+    """True if every write error of exc is a duplicate key (E11000)."""
+    write_errors = exc.details.get("writeErrors", [])
+    return bool(write_errors) and all(
+        error.get("code") == 11000 for error in write_errors
+    )
@@ -0,0 +1,93 @@
+"""
+MongoDB Keyset Pagination
+
+Cursor-based pagination shared by the MongoDB repositories. Pages are
+selected with a range filter on (sort_field, id) instead of skip(), so
+with a compound index ending in {sort_field: -1, id: -1} every page costs
+the same number of index keys, however deep it is.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+from typing import List, Optional, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+from infrastructure.persistence.pagination import (  # noqa: F401 (re-exported)
+    decode_cursor,
+    encode_cursor,
+    validate_limit,
+)
+
+
+def keyset_filter(base_filter: dict, sort_field: str, after: Optional[str]) -> dict:
+    """
+    Filter selecting the items that come after a cursor (descending order).
+
+    Args:
+        base_filter: Equality filter of the listing (index prefix)
+        sort_field: Field the listing is sorted by (descending)
+        after: Cursor of the previous page, None for the first page
+
+    Returns:
+        MongoDB filter
+    """
+    if after is None:
+        return dict(base_filter)
+
+    value, entity_id = decode_cursor(after)
+    return {
+        **base_filter,
+        "$or": [
+            {sort_field: {"$lt": value}},
+            {sort_field: value, "id": {"$lt": entity_id}},
+        ],
+    }
+
+
+def keyset_sort(sort_field: str) -> List[Tuple[str, int]]:
+    """Sort specification matching the {..., sort_field: -1, id: -1} index."""
+    return [(sort_field, -1), ("id", -1)]
+
+
+async def fetch_page(
+    collection: AsyncIOMotorCollection,
+    base_filter: dict,
+    sort_field: str,
+    after: Optional[str],
+    limit: int,
+    projection: Optional[dict] = None,
+) -> Tuple[List[dict], Optional[str]]:
+    """
+    Fetch one page of documents with keyset pagination.
+
+    Reads limit + 1 documents to know whether another page follows.
+
+    Args:
+        collection: Motor collection
+        base_filter: Equality filter of the listing (index prefix)
+        sort_field: Field the listing is sorted by (descending)
+        after: Cursor of the previous page, None for the first page
+        limit: Page size
+        projection: Optional MongoDB projection
+
+    Returns:
+        (documents of the page, cursor of the next page or None)
+
+    Raises:
+        ValueError: If limit or cursor is invalid
+    """
+    validate_limit(limit)
+    cursor = (
+        collection.find(keyset_filter(base_filter, sort_field, after), projection)
+        .sort(keyset_sort(sort_field))
+        .limit(limit + 1)
+    )
+    documents = await cursor.to_list(length=limit + 1)
+
+    if len(documents) <= limit:
+        return documents, None
+
+    documents = documents[:limit]
+    last = documents[-1]
+    return documents, encode_cursor(last[sort_field], last["id"])
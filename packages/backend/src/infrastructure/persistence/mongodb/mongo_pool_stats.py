@@ -0,0 +1,131 @@
+"""
+MongoDB Pool Statistics
+
+pymongo connection pool listener keeping live gauges (checked-out
+connections, waiters) and checkout wait times, to size pods and
+maxPoolSize under load.
+
+Pool events are emitted from the driver's worker threads, so counters
+are guarded by a lock and wait times are measured per thread.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+
+from pymongo import monitoring
+
+
+@dataclass(frozen=True)
+class PoolStatsSnapshot:
+    """
+    Point-in-time pool statistics (all servers combined).
+
+    Attributes:
+        open_connections: Connections currently open
+        checked_out: Connections currently in use
+        waiters: Operations currently waiting for a connection
+        checkouts: Successful checkouts since start
+        checkout_failures: Failed checkouts (timeouts, errors) since start
+        wait_time_avg_ms: Mean time to obtain a connection
+        wait_time_max_ms: Longest time to obtain a connection
+    """
+
+    open_connections: int
+    checked_out: int
+    waiters: int
+    checkouts: int
+    checkout_failures: int
+    wait_time_avg_ms: float
+    wait_time_max_ms: float
+
+
+class MongoPoolStats(monitoring.ConnectionPoolListener):
+    """Connection pool listener collecting PoolStatsSnapshot counters"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._open = 0
+        self._checked_out = 0
+        self._waiters = 0
+        self._checkouts = 0
+        self._failures = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def snapshot(self) -> PoolStatsSnapshot:
+        """
+        Current statistics.
+
+        Returns:
+            PoolStatsSnapshot
+        """
+        with self._lock:
+            average = self._wait_total / self._checkouts if self._checkouts else 0.0
+            return PoolStatsSnapshot(
+                open_connections=self._open,
+                checked_out=self._checked_out,
+                waiters=self._waiters,
+                checkouts=self._checkouts,
+                checkout_failures=self._failures,
+                wait_time_avg_ms=average * 1000,
+                wait_time_max_ms=self._wait_max * 1000,
+            )
+
+    def connection_check_out_started(self, event) -> None:
+        self._local.started = time.perf_counter()
+        with self._lock:
+            self._waiters += 1
+
+    def connection_checked_out(self, event) -> None:
+        waited = self._waited()
+        with self._lock:
+            self._waiters -= 1
+            self._checked_out += 1
+            self._checkouts += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+
+    def connection_check_out_failed(self, event) -> None:
+        self._waited()
+        with self._lock:
+            self._waiters -= 1
+            self._failures += 1
+
+    def connection_checked_in(self, event) -> None:
+        with self._lock:
+            self._checked_out -= 1
+
+    def connection_created(self, event) -> None:
+        with self._lock:
+            self._open += 1
+
+    def connection_closed(self, event) -> None:
+        with self._lock:
+            self._open -= 1
+
+    def connection_ready(self, event) -> None:
+        pass
+
+    def pool_created(self, event) -> None:
+        pass
+
+    def pool_ready(self, event) -> None:
+        pass
+
+    def pool_cleared(self, event) -> None:
+        pass
+
+    def pool_closed(self, event) -> None:
+        pass
+
+    def _waited(self) -> float:
+        """Seconds since this thread's checkout started."""
+        started = getattr(self._local, "started", None)
+        self._local.started = None
+        if started is None:
+            return 0.0
+        return time.perf_counter() - started
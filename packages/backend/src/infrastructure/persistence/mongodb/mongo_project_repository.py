@@ -7,13 +7,37 @@ Implements IProjectRepository interface from Application Layer.
 IAD-7: Repository Pattern + MongoDB
 """
 
-from typing import Optional
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
 
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 
+from application.dto.bulk_write_result import BulkWriteResult
+from application.dto.page import DEFAULT_PAGE_SIZE, Page
+from application.exceptions import DuplicateEntityError, ProjectNotFoundError
 from application.interfaces.i_project_repository import IProjectRepository
 from domain.entities.project import Project
+from domain.exceptions import ContextBudgetExceededError
 from domain.value_objects.context_budget import ContextBudget
+from infrastructure.persistence.field_patches import patch_fields
+from infrastructure.persistence.mongodb.mongo_bulk import (
+    delete_documents,
+    insert_documents,
+    replace_documents,
+)
+from infrastructure.persistence.mongodb.mongo_pagination import fetch_page
+from infrastructure.persistence.mongodb.mongo_revision import (
+    next_revision,
+    patch_operation,
+    raise_on_conflict,
+    revision_filter,
+)
+from infrastructure.serialization.entity_codecs import (
+    CONTEXT_BUDGET_CODEC,
+    PROJECT_CODEC,
+)
 
 
 class MongoProjectRepository(IProjectRepository):
@@ -40,11 +64,16 @@ class MongoProjectRepository(IProjectRepository):
             The persisted project entity
 
         Raises:
-            DuplicateProjectError: If project with same ID already exists
+            DuplicateEntityError: If project with same ID already exists
             RepositoryError: If persistence fails
         """
         document = self._to_document(project)
-        await self._collection.insert_one(document)
+        try:
+            await self._collection.insert_one(document)
+        except DuplicateKeyError as exc:
+            raise DuplicateEntityError(
+                f"Project '{project.id}' already exists"
+            ) from exc
         return project
 
     async def get_by_id(self, project_id: str) -> Optional[Project]:
@@ -65,22 +94,104 @@ class MongoProjectRepository(IProjectRepository):
             return None
         return self._to_entity(document)
 
+    async def get_many(self, project_ids: List[str]) -> Dict[str, Project]:
+        """
+        Retrieve many projects with one $in query.
+
+        Args:
+            project_ids: Project UUID strings (duplicates allowed)
+
+        Returns:
+            Mapping of id to Project entity; ids not found are absent
+        """
+        if not project_ids:
+            return {}
+        unique_ids = list(dict.fromkeys(project_ids))
+        cursor = self._collection.find({"id": {"$in": unique_ids}})
+        return {document["id"]: self._to_entity(document) async for document in cursor}
+
+    async def list_by_owner(
+        self,
+        owner_id: str,
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[Project]:
+        """
+        List projects with keyset pagination, newest first.
+
+        Served by the {user_id: 1, created_at: -1, id: -1} index:
+        no skip(), so deep pages cost the same as the first one.
+
+        Args:
+            owner_id: Owner (user) ID
+            after: next_cursor of the previous page (None for the first page)
+            limit: Page size
+
+        Returns:
+            Page of Project entities
+
+        Raises:
+            ValueError: If limit or cursor is invalid
+        """
+        base_filter = {"user_id": owner_id}
+        documents, next_cursor = await fetch_page(
+            self._collection, base_filter, "created_at", after, limit
+        )
+        return Page(
+            items=[self._to_entity(document) for document in documents],
+            next_cursor=next_cursor,
+        )
+
     async def update(self, project: Project) -> Project:
         """
-        Update an existing project.
+        Update an existing project if nobody saved it since it was read.
 
         Args:
             project: Project entity with updated data
 
         Returns:
-            The updated project entity
+            The updated project entity (revision incremented)
 
         Raises:
-            ProjectNotFoundError: If project does not exist
+            RevisionConflictError: If the stored revision is not project.revision
             RepositoryError: If update fails
         """
-        document = self._to_document(project)
-        await self._collection.replace_one({"id": project.id}, document)
+        document = next_revision(self._to_document(project))
+        result = await self._collection.replace_one(revision_filter(document), document)
+        if result.matched_count == 0:
+            await raise_on_conflict(
+                self._collection, "Project", project.id, project.revision
+            )
+            return project
+        project.revision = document["revision"]
+        return project
+
+    async def patch(self, project: Project, fields: Iterable[str]) -> Project:
+        """
+        Write only some attributes of a project with one $set update_one.
+
+        Args:
+            project: Project entity holding the new values
+            fields: Attribute names to write (not id or revision)
+
+        Returns:
+            The project entity (revision incremented if written)
+
+        Raises:
+            ValueError: If a field is unknown or protected
+            RevisionConflictError: If the stored revision is not project.revision
+        """
+        names = patch_fields(project, fields)
+        if not names:
+            return project
+        query, update = patch_operation(PROJECT_CODEC, project, names)
+        result = await self._collection.update_one(query, update)
+        if result.matched_count == 0:
+            await raise_on_conflict(
+                self._collection, "Project", project.id, project.revision
+            )
+            return project
+        project.revision += 1
         return project
 
     async def delete(self, project_id: str) -> None:
@@ -96,6 +207,104 @@ class MongoProjectRepository(IProjectRepository):
         """
         await self._collection.delete_one({"id": project_id})
 
+    async def create_many(self, projects: List[Project]) -> BulkWriteResult:
+        """
+        Persist many new projects with one unordered insert_many.
+
+        Args:
+            projects: Project entities to persist
+
+        Returns:
+            Per-item result in input order
+        """
+        documents = [self._to_document(project) for project in projects]
+        return await insert_documents(self._collection, documents)
+
+    async def update_many(self, projects: List[Project]) -> BulkWriteResult:
+        """
+        Update many projects with one unordered bulk_write of ReplaceOne.
+
+        Each item is filtered on its revision, like update().
+
+        Args:
+            projects: Project entities with updated data
+
+        Returns:
+            Per-item result in input order
+        """
+        documents = [next_revision(self._to_document(p)) for p in projects]
+        result = await replace_documents(self._collection, documents)
+        for project, document, item in zip(projects, documents, result.items):
+            if item.ok:
+                project.revision = document["revision"]
+        return result
+
+    async def delete_many(self, project_ids: List[str]) -> BulkWriteResult:
+        """
+        Remove many projects with one unordered bulk_write of DeleteOne.
+
+        Args:
+            project_ids: Project UUID strings
+
+        Returns:
+            Per-item result in input order
+        """
+        return await delete_documents(self._collection, project_ids)
+
+    async def consume_tokens(self, project_id: str, tokens: int) -> ContextBudget:
+        """
+        Atomically charge tokens with one conditional $inc.
+
+        The filter only matches while used_tokens + tokens <= max_tokens, so
+        concurrent charges cannot overrun the budget or overwrite each other.
+
+        Args:
+            project_id: Project UUID string
+            tokens: Quantity of tokens to consume (>= 0)
+
+        Returns:
+            The project's ContextBudget after consumption
+
+        Raises:
+            ValueError: If tokens < 0
+            ContextBudgetExceededError: If the budget has not enough tokens left
+            ProjectNotFoundError: If project does not exist
+        """
+        if tokens < 0:
+            raise ValueError("tokens must be >= 0")
+
+        document = await self._collection.find_one_and_update(
+            {
+                "id": project_id,
+                "$expr": {
+                    "$lte": [
+                        {"$add": ["$context_budget.used_tokens", tokens]},
+                        "$context_budget.max_tokens",
+                    ]
+                },
+            },
+            {
+                "$inc": {"context_budget.used_tokens": tokens, "revision": 1},
+                "$set": {"updated_at": datetime.utcnow()},
+            },
+            return_document=ReturnDocument.AFTER,
+        )
+        if document is not None:
+            return self._to_context_budget(document["context_budget"])
+
+        # Guard failed: tell "no such project" apart from "not enough budget"
+        current = await self._collection.find_one(
+            {"id": project_id}, {"_id": 0, "name": 1, "context_budget": 1}
+        )
+        if current is None:
+            raise ProjectNotFoundError(f"Project '{project_id}' not found")
+
+        budget = self._to_context_budget(current["context_budget"])
+        raise ContextBudgetExceededError(
+            f"Cannot consume {tokens} tokens from project '{current['name']}'. "
+            f"Only {budget.remaining_tokens} remaining."
+        )
+
     def _to_document(self, project: Project) -> dict:
         """
         Convert Project entity to MongoDB document.
@@ -106,23 +315,7 @@ class MongoProjectRepository(IProjectRepository):
         Returns:
             MongoDB document dict
         """
-        document = {
-            "id": project.id,  # UUID string
-            "name": project.name,
-            "description": project.description,
-            "user_id": project.owner_id,  # MongoDB schema uses user_id
-            "context_budget": {  # Subdocument for Value Object
-                "max_tokens": project.context_budget.max_tokens,
-                "used_tokens": project.context_budget.used_tokens,
-            },
-            "created_at": project.created_at,
-        }
-
-        # Only include updated_at if not None (MongoDB schema requires date type)
-        if project.updated_at is not None:
-            document["updated_at"] = project.updated_at
-
-        return document
+        return PROJECT_CODEC.to_document(project)
 
     def _to_entity(self, document: dict) -> Project:
         """
@@ -134,15 +327,16 @@ class MongoProjectRepository(IProjectRepository):
         Returns:
             Project entity
         """
-        return Project(
-            id=document["id"],
-            name=document["name"],
-            description=document["description"],
-            owner_id=document["user_id"],  # Convert back from user_id to owner_id
-            context_budget=ContextBudget(
-                max_tokens=document["context_budget"]["max_tokens"],
-                used_tokens=document["context_budget"]["used_tokens"],
-            ),
-            created_at=document["created_at"],
-            updated_at=document.get("updated_at"),
-        )
+        return PROJECT_CODEC.from_document(document)
+
+    def _to_context_budget(self, subdocument: dict) -> ContextBudget:
+        """
+        Convert context_budget subdocument to ContextBudget Value Object.
+
+        Args:
+            subdocument: {"max_tokens": int, "used_tokens": int}
+
+        Returns:
+            ContextBudget value object
+        """
+        return CONTEXT_BUDGET_CODEC.from_document(subdocument)
@@ -0,0 +1,93 @@
+"""
+MongoDB Optimistic Concurrency Helpers
+
+Every entity document has a "revision" that each write increments. An
+update encodes the entity, bumps the revision and only replaces a stored
+document still at the revision the caller read; when nothing matches,
+another writer saved the entity first (or it was deleted). Documents
+written before revisions existed count as revision 0.
+
+Partial writes (patch) use the same filter with a $set of the changed
+attributes and $inc of the revision.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+from typing import Any, Iterable, Tuple
+
+import bson
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+from application.exceptions import RevisionConflictError
+from infrastructure.serialization.entity_codecs import EntityCodec
+
+
+def next_revision(document: dict) -> dict:
+    """An entity's document as written by an update (revision + 1)."""
+    document["revision"] += 1
+    return document
+
+
+def revision_filter(document: dict) -> dict:
+    """Filter matching the stored document a next_revision() replaces."""
+    return {"id": document["id"], "revision": at_revision(document["revision"] - 1)}
+
+
+def at_revision(revision: int) -> object:
+    """Query value for "revision" (documents written before it count as 0)."""
+    return {"$in": [0, None]} if revision == 0 else revision
+
+
+def as_stored(document: dict) -> dict:
+    """A document as MongoDB returns it (BSON round trip: datetimes in ms)."""
+    return bson.decode(bson.encode(document))
+
+
+def patch_operation(
+    codec: EntityCodec, entity: Any, fields: Iterable[str]
+) -> Tuple[dict, dict]:
+    """
+    Filter and update of a revision-checked partial write.
+
+    Only the named attributes are sent ($set, or $unset for optional
+    attributes that are None) plus the revision increment.
+
+    Args:
+        codec: Codec of the entity class
+        entity: Entity holding the new values (at the revision read)
+        fields: Stored attribute names to write
+
+    Returns:
+        (filter, update) for update_one / find_one_and_update
+    """
+    update = codec.to_update(entity, fields)
+    update["$inc"] = {"revision": 1}
+    return {"id": entity.id, "revision": at_revision(entity.revision)}, update
+
+
+async def raise_on_conflict(
+    collection: AsyncIOMotorCollection,
+    entity_type: str,
+    entity_id: str,
+    expected: int,
+) -> None:
+    """
+    Explain an update whose revision filter matched nothing.
+
+    Returns quietly when the document does not exist (updates of missing
+    entities are no-ops).
+
+    Args:
+        collection: Target Motor collection
+        entity_type: Entity class name for the error message
+        entity_id: Entity UUID string
+        expected: Revision the caller read
+
+    Raises:
+        RevisionConflictError: If the entity exists at another revision
+    """
+    current = await collection.find_one({"id": entity_id}, {"_id": 0, "revision": 1})
+    if current is not None:
+        raise RevisionConflictError(
+            entity_type, entity_id, expected, current.get("revision", 0)
+        )
@@ -0,0 +1,125 @@
+"""
+Demand Status Rollups (MongoDB)
+
+One document per project in `demand_status_rollups` holding the number of
+demands in each status:
+
+    {"project_id": "...", "counts": {"draft": 3, "spec_approved": 1, ...}}
+
+MongoDemandRepository applies $inc deltas after each write that changes a
+demand's (project_id, status), so dashboards read one small document
+instead of aggregating the demands collection.
+
+The rollup is updated after the demand write, not in the same
+transaction: a crash in between (or writes bypassing the repository)
+leaves it off until rebuild_status_rollup() recomputes it.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+from collections import Counter
+from typing import Dict, Iterable, Optional, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import UpdateOne
+
+from application.dto.status_counts import status_counts
+from domain.value_objects.demand_status import DemandStatus
+
+# (project_id, status value) of one stored demand
+StatusKey = Tuple[str, str]
+
+
+def status_key(document: Optional[dict]) -> Optional[StatusKey]:
+    """(project_id, status) of a demand document, None if absent."""
+    if document is None:
+        return None
+    return document["project_id"], document["status"]
+
+
+def rollup_deltas(
+    removed: Iterable[Optional[StatusKey]], added: Iterable[Optional[StatusKey]]
+) -> Counter:
+    """
+    Count changes for demands leaving and entering (project, status) slots.
+
+    Args:
+        removed: Previous keys of written demands (None = did not exist)
+        added: New keys of written demands (None = deleted)
+
+    Returns:
+        Counter of key -> delta, without zero entries
+    """
+    deltas: Counter = Counter()
+    for key in removed:
+        if key is not None:
+            deltas[key] -= 1
+    for key in added:
+        if key is not None:
+            deltas[key] += 1
+    return Counter({key: delta for key, delta in deltas.items() if delta})
+
+
+class MongoStatusRollup:
+    """Reads and increments the per-project status rollup documents"""
+
+    def __init__(self, collection: AsyncIOMotorCollection):
+        """
+        Initialize rollup store.
+
+        Args:
+            collection: `demand_status_rollups` collection
+        """
+        self._collection = collection
+
+    async def apply(self, deltas: Counter) -> None:
+        """
+        Apply count deltas with one upserting $inc per project.
+
+        Args:
+            deltas: (project_id, status value) -> delta (see rollup_deltas)
+        """
+        increments: Dict[str, Dict[str, int]] = {}
+        for (project_id, status), delta in deltas.items():
+            increments.setdefault(project_id, {})[f"counts.{status}"] = delta
+        if not increments:
+            return
+        await self._collection.bulk_write(
+            [
+                UpdateOne({"project_id": project_id}, {"$inc": inc}, upsert=True)
+                for project_id, inc in increments.items()
+            ],
+            ordered=False,
+        )
+
+    async def get(self, project_id: str) -> Dict[DemandStatus, int]:
+        """
+        Per-status counts of a project (all zero if it has no rollup yet).
+
+        Args:
+            project_id: Project UUID string
+
+        Returns:
+            Every DemandStatus, in workflow order, mapped to its count
+        """
+        document = await self._collection.find_one(
+            {"project_id": project_id}, {"_id": 0, "counts": 1}
+        )
+        return status_counts({} if document is None else document["counts"])
+
+    async def replace(self, project_id: str, counts: Dict[DemandStatus, int]) -> None:
+        """
+        Overwrite a project's rollup (used to repair drift).
+
+        Args:
+            project_id: Project UUID string
+            counts: Per-status counts (e.g. from count_by_status)
+        """
+        await self._collection.replace_one(
+            {"project_id": project_id},
+            {
+                "project_id": project_id,
+                "counts": {status.value: count for status, count in counts.items()},
+            },
+            upsert=True,
+        )
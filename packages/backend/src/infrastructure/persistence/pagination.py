@@ -0,0 +1,71 @@
+"""
+Keyset Pagination Cursors
+
+Backend-neutral part of keyset pagination: page size validation and the
+opaque cursor format. Every backend sorts listings by (sort_field, id)
+descending and encodes the last item of a page the same way, so cursors
+mean the same thing whatever the storage.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Tuple
+
+from application.dto.page import MAX_PAGE_SIZE
+
+
+def validate_limit(limit: int) -> None:
+    """
+    Validate a page size.
+
+    Raises:
+        ValueError: If limit is not between 1 and MAX_PAGE_SIZE
+    """
+    if limit < 1 or limit > MAX_PAGE_SIZE:
+        raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+
+
+def encode_cursor(value: Any, entity_id: str) -> str:
+    """
+    Encode the sort key of the last item of a page as an opaque cursor.
+
+    Args:
+        value: Sort field value (datetime or int)
+        entity_id: Entity UUID string (tie-breaker)
+
+    Returns:
+        URL-safe cursor string
+    """
+    if isinstance(value, datetime):
+        payload = {"t": "datetime", "v": value.isoformat(), "id": entity_id}
+    else:
+        payload = {"t": "int", "v": value, "id": entity_id}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, str]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        (sort field value, entity id)
+
+    Raises:
+        ValueError: If cursor is malformed
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        value = payload["v"]
+        if payload["t"] == "datetime":
+            value = datetime.fromisoformat(value)
+        return value, payload["id"]
+    except (binascii.Error, ValueError, KeyError, TypeError) as exc:
+        raise ValueError("Invalid pagination cursor") from exc
@@ -0,0 +1,221 @@
+"""
+Checkpoint Snapshot Codecs
+
+Pluggable compression for Checkpoint.context_snapshot at the storage layer.
+The domain entity stays storage-agnostic: it always holds the JSON string.
+
+Codecs:
+- zlib (stdlib, default)
+- zstd (requires `zstandard`)
+- lz4 (requires `lz4`)
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import time
+import zlib
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple
+
+try:  # Optional codec
+    import zstandard
+except ImportError:  # pragma: no cover - depends on environment
+    zstandard = None
+
+try:  # Optional codec
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover - depends on environment
+    lz4_frame = None
+
+DEFAULT_CODEC = "zlib"
+
+
+class SnapshotCodec(ABC):
+    """Byte-level compression codec for snapshots."""
+
+    name: str
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Compress raw bytes."""
+        pass
+
+    @abstractmethod
+    def decompress(self, data: bytes) -> bytes:
+        """Decompress bytes produced by compress()."""
+        pass
+
+
+class ZlibCodec(SnapshotCodec):
+    """zlib (DEFLATE) codec from the standard library."""
+
+    name = "zlib"
+
+    def __init__(self, level: int = 6):
+        self._level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return zlib.compress(data, self._level)
+
+    def decompress(self, data: bytes) -> bytes:
+        return zlib.decompress(data)
+
+
+class ZstdCodec(SnapshotCodec):
+    """Zstandard codec (requires `zstandard`)."""
+
+    name = "zstd"
+
+    def __init__(self, level: int = 3):
+        if zstandard is None:
+            raise ValueError("zstd codec requires the 'zstandard' package")
+        self._compressor = zstandard.ZstdCompressor(level=level)
+        self._decompressor = zstandard.ZstdDecompressor()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._decompressor.decompress(data)
+
+
+class Lz4Codec(SnapshotCodec):
+    """LZ4 frame codec (requires `lz4`)."""
+
+    name = "lz4"
+
+    def __init__(self):
+        if lz4_frame is None:
+            raise ValueError("lz4 codec requires the 'lz4' package")
+
+    def compress(self, data: bytes) -> bytes:
+        return lz4_frame.compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return lz4_frame.decompress(data)
+
+
+_CODECS: Dict[str, Callable[[], SnapshotCodec]] = {
+    ZlibCodec.name: ZlibCodec,
+    ZstdCodec.name: ZstdCodec,
+    Lz4Codec.name: Lz4Codec,
+}
+
+
+def available_codecs() -> List[str]:
+    """
+    Names of codecs usable in this environment.
+
+    Returns:
+        Codec names whose dependencies are installed
+    """
+    names = [ZlibCodec.name]
+    if zstandard is not None:
+        names.append(ZstdCodec.name)
+    if lz4_frame is not None:
+        names.append(Lz4Codec.name)
+    return names
+
+
+def get_codec(name: str) -> SnapshotCodec:
+    """
+    Instantiate a codec by name.
+
+    Args:
+        name: Codec name ("zlib", "zstd", "lz4")
+
+    Returns:
+        SnapshotCodec instance
+
+    Raises:
+        ValueError: If codec is unknown or its package is not installed
+    """
+    factory = _CODECS.get(name)
+    if factory is None:
+        raise ValueError(f"Unknown snapshot codec '{name}'")
+    return factory()
+
+
+@dataclass(frozen=True)
+class SnapshotCodecStats:
+    """
+    Measurement of one snapshot encode or decode.
+
+    Attributes:
+        checkpoint_id: Checkpoint UUID string
+        codec: Codec name
+        operation: "encode" or "decode"
+        raw_size: Snapshot size in bytes (UTF-8)
+        encoded_size: Compressed size in bytes
+        seconds: Time spent in the codec
+    """
+
+    checkpoint_id: str
+    codec: str
+    operation: str
+    raw_size: int
+    encoded_size: int
+    seconds: float
+
+    @property
+    def ratio(self) -> float:
+        """Compression ratio (raw / encoded); higher is better."""
+        if self.encoded_size == 0:
+            return 0.0
+        return self.raw_size / self.encoded_size
+
+
+def encode_snapshot(
+    codec: SnapshotCodec, checkpoint_id: str, snapshot: str
+) -> Tuple[bytes, SnapshotCodecStats]:
+    """
+    Compress a JSON snapshot string.
+
+    Args:
+        codec: Codec to use
+        checkpoint_id: Checkpoint UUID string (for stats)
+        snapshot: JSON snapshot string
+
+    Returns:
+        Compressed bytes and encode stats
+    """
+    raw = snapshot.encode("utf-8")
+    start = time.perf_counter()
+    encoded = codec.compress(raw)
+    seconds = time.perf_counter() - start
+    return encoded, SnapshotCodecStats(
+        checkpoint_id=checkpoint_id,
+        codec=codec.name,
+        operation="encode",
+        raw_size=len(raw),
+        encoded_size=len(encoded),
+        seconds=seconds,
+    )
+
+
+def decode_snapshot(
+    codec: SnapshotCodec, checkpoint_id: str, data: bytes
+) -> Tuple[str, SnapshotCodecStats]:
+    """
+    Decompress a snapshot back to its JSON string.
+
+    Args:
+        codec: Codec the data was compressed with
+        checkpoint_id: Checkpoint UUID string (for stats)
+        data: Compressed bytes
+
+    Returns:
+        JSON snapshot string and decode stats
+    """
+    start = time.perf_counter()
+    raw = codec.decompress(bytes(data))
+    seconds = time.perf_counter() - start
+    return raw.decode("utf-8"), SnapshotCodecStats(
+        checkpoint_id=checkpoint_id,
+        codec=codec.name,
+        operation="decode",
+        raw_size=len(raw),
+        encoded_size=len(data),
+        seconds=seconds,
+    )
@@ -0,0 +1,70 @@
+"""
+Checkpoint Snapshot Deltas
+
+Diff/patch for successive context snapshots of the same demand.
+
+Snapshots mostly grow by appending conversation turns, so the delta keeps
+the common prefix and suffix of the parent snapshot and stores only the
+replaced middle. Works on the JSON text itself, so the rebuilt snapshot is
+byte-for-byte identical to the original.
+
+Delta format (JSON): {"p": prefix_len, "s": suffix_len, "i": inserted_text}
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+from infrastructure.serialization.entity_codecs import dumps_snapshot, loads_snapshot
+
+
+def diff_snapshot(base: str, target: str) -> str:
+    """
+    Compute the delta turning base into target.
+
+    Args:
+        base: Parent snapshot (JSON string)
+        target: New snapshot (JSON string)
+
+    Returns:
+        Delta as a JSON string
+    """
+    limit = min(len(base), len(target))
+    prefix = _common_length(lambda n: base[:n] == target[:n], limit)
+    suffix = _common_length(
+        lambda n: base[len(base) - n :] == target[len(target) - n :],
+        limit - prefix,
+    )
+
+    inserted = target[prefix : len(target) - suffix]
+    return dumps_snapshot({"p": prefix, "s": suffix, "i": inserted})
+
+
+def apply_snapshot_delta(base: str, delta: str) -> str:
+    """
+    Rebuild a snapshot from its parent and a delta.
+
+    Args:
+        base: Parent snapshot (JSON string)
+        delta: Delta produced by diff_snapshot(base, ...)
+
+    Returns:
+        Rebuilt snapshot (JSON string)
+    """
+    patch = loads_snapshot(delta)
+    return base[: patch["p"]] + patch["i"] + base[len(base) - patch["s"] :]
+
+
+def _common_length(matches, limit: int) -> int:
+    """
+    Largest n <= limit such that matches(n) is True (matches is monotonic).
+
+    Binary search over slice comparisons keeps the work in C instead of a
+    per-character Python loop, which matters for multi-megabyte snapshots.
+    """
+    low, high = 0, limit
+    while low < high:
+        middle = (low + high + 1) // 2
+        if matches(middle):
+            low = middle
+        else:
+            high = middle - 1
+    return low
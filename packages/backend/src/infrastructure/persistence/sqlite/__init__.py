@@ -0,0 +1,30 @@
+"""
+SQLite Repository Implementations
+
+Embedded backend (WAL mode) for single-box installs; all repositories
+share one SQLiteDatabase.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+from infrastructure.persistence.sqlite.sqlite_checkpoint_repository import (
+    SQLiteCheckpointRepository,
+)
+from infrastructure.persistence.sqlite.sqlite_database import SQLiteDatabase
+from infrastructure.persistence.sqlite.sqlite_demand_repository import (
+    SQLiteDemandRepository,
+)
+from infrastructure.persistence.sqlite.sqlite_metaspec_repository import (
+    SQLiteMetaspecRepository,
+)
+from infrastructure.persistence.sqlite.sqlite_project_repository import (
+    SQLiteProjectRepository,
+)
+
+__all__ = [
+    "SQLiteCheckpointRepository",
+    "SQLiteDatabase",
+    "SQLiteDemandRepository",
+    "SQLiteMetaspecRepository",
+    "SQLiteProjectRepository",
+]
@@ -0,0 +1,111 @@
+"""
+SQLite Bulk Write Helpers
+
+Batch operations shared by the SQLite repositories. They run inside one
+SQLiteDatabase.write() transaction and report per-item results, like the
+MongoDB bulk helpers.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import sqlite3
+from typing import Dict, Iterable, List, Sequence
+
+from application.dto.bulk_write_result import (
+    DUPLICATE_ERROR,
+    NOT_FOUND_ERROR,
+    REVISION_CONFLICT_ERROR,
+    BulkWriteResult,
+    bulk_result,
+)
+
+# Stay well below SQLITE_MAX_VARIABLE_NUMBER on old builds
+MAX_VARIABLES = 900
+
+
+def insert_rows(
+    connection: sqlite3.Connection, statement: str, ids: List[str], rows: List[tuple]
+) -> BulkWriteResult:
+    """
+    Run an INSERT OR IGNORE per row; ignored rows are duplicates.
+
+    Args:
+        connection: Connection inside a transaction
+        statement: INSERT OR IGNORE statement
+        ids: Entity id of each row
+        rows: Statement parameters, one tuple per entity
+
+    Returns:
+        Per-item result in input order
+    """
+    errors: Dict[int, str] = {}
+    for index, row in enumerate(rows):
+        if connection.execute(statement, row).rowcount == 0:
+            errors[index] = DUPLICATE_ERROR
+    return bulk_result(ids, errors)
+
+
+def update_rows(
+    connection: sqlite3.Connection,
+    statement: str,
+    table: str,
+    ids: List[str],
+    rows: List[tuple],
+) -> BulkWriteResult:
+    """
+    Run a revision-checked UPDATE per row (see sqlite_revision).
+
+    Rows matching nothing are reported as not found, or as a revision
+    conflict when the id exists.
+
+    Args:
+        connection: Connection inside a transaction
+        statement: UPDATE statement
+        table: Table name (trusted, not user input)
+        ids: Entity id of each row
+        rows: Statement parameters, one tuple per entity
+
+    Returns:
+        Per-item result in input order
+    """
+    errors: Dict[int, str] = {}
+    for index, row in enumerate(rows):
+        if connection.execute(statement, row).rowcount == 1:
+            continue
+        exists = connection.execute(
+            f"SELECT 1 FROM {table} WHERE id = ?", (ids[index],)
+        ).fetchone()
+        errors[index] = REVISION_CONFLICT_ERROR if exists else NOT_FOUND_ERROR
+    return bulk_result(ids, errors)
+
+
+def delete_rows(
+    connection: sqlite3.Connection, table: str, ids: List[str]
+) -> BulkWriteResult:
+    """
+    Delete rows by id; unknown ids are not an error.
+
+    Args:
+        connection: Connection inside a transaction
+        table: Table name (trusted, not user input)
+        ids: Entity UUID strings
+
+    Returns:
+        Per-item result in input order
+    """
+    for chunk in chunks(list(dict.fromkeys(ids))):
+        connection.execute(
+            f"DELETE FROM {table} WHERE id IN ({placeholders(len(chunk))})", chunk
+        )
+    return bulk_result(list(ids), {})
+
+
+def chunks(values: Sequence[str], size: int = MAX_VARIABLES) -> Iterable[list]:
+    """Split values for IN (...) clauses."""
+    for start in range(0, len(values), size):
+        yield list(values[start : start + size])
+
+
+def placeholders(count: int) -> str:
+    """ "?, ?, ..." for count parameters."""
+    return ", ".join("?" * count)
@@ -0,0 +1,391 @@
+"""
+SQLiteCheckpointRepository Implementation
+
+SQLite adapter for Checkpoint persistence (single-box installs).
+Implements ICheckpointRepository interface from Application Layer.
+
+context_snapshot is stored as a compressed BLOB (zlib by default) with a
+snapshot_codec column; NULL means UTF-8 JSON stored as is. Summary reads
+never select the BLOB column.
+
+Expired checkpoints are not purged automatically (no TTL monitor).
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import sqlite3
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from application.dto.bulk_write_result import BulkWriteResult
+from application.dto.lazy import LazyCheckpoint, LazyField
+from application.dto.page import DEFAULT_PAGE_SIZE, Page
+from application.dto.summaries import CheckpointSummary
+from application.exceptions import DuplicateEntityError, RepositoryError
+from application.interfaces.i_checkpoint_repository import ICheckpointRepository
+from domain.entities.checkpoint import Checkpoint
+from infrastructure.persistence.field_patches import patch_fields
+from infrastructure.persistence.snapshot_codecs import (
+    DEFAULT_CODEC,
+    SnapshotCodec,
+    SnapshotCodecStats,
+    decode_snapshot,
+    encode_snapshot,
+    get_codec,
+)
+from infrastructure.persistence.sqlite.sqlite_bulk import (
+    chunks,
+    delete_rows,
+    insert_rows,
+    placeholders,
+    update_rows,
+)
+from infrastructure.persistence.sqlite.sqlite_database import (
+    SQLiteDatabase,
+    from_text,
+    to_text,
+)
+from infrastructure.persistence.sqlite.sqlite_pagination import fetch_page
+from infrastructure.persistence.sqlite.sqlite_revision import (
+    patch_row,
+    raise_on_conflict,
+)
+
+SELECT = "SELECT * FROM checkpoints"
+
+# Everything but the snapshot BLOB
+SELECT_SUMMARY = (
+    "SELECT id, demand_id, tokens_used, created_at, expires_at, revision "
+    "FROM checkpoints"
+)
+
+INSERT = (
+    "INSERT OR IGNORE INTO checkpoints (demand_id, tokens_used, snapshot, "
+    "snapshot_codec, created_at, expires_at, id, revision) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+UPDATE = (
+    "UPDATE checkpoints SET demand_id = ?, tokens_used = ?, snapshot = ?, "
+    "snapshot_codec = ?, created_at = ?, expires_at = ?, "
+    "revision = revision + 1 WHERE id = ? AND revision = ?"
+)
+
+
+class SQLiteCheckpointRepository(ICheckpointRepository):
+    """SQLite implementation of ICheckpointRepository"""
+
+    def __init__(
+        self,
+        database: SQLiteDatabase,
+        codec: Optional[str] = DEFAULT_CODEC,
+        on_codec_stats: Optional[Callable[[SnapshotCodecStats], None]] = None,
+    ):
+        """
+        Initialize SQLite repository.
+
+        Args:
+            database: Shared SQLiteDatabase
+            codec: Snapshot codec for writes ("zlib", "zstd", "lz4");
+                None stores snapshots uncompressed
+            on_codec_stats: Optional callback receiving compression ratio and
+                encode/decode time for every checkpoint written or read
+                (listings decode on the database worker thread)
+
+        Raises:
+            ValueError: If codec is unknown or its package is not installed
+        """
+        self._db = database
+        self._codec = get_codec(codec) if codec is not None else None
+        self._decoders: Dict[str, SnapshotCodec] = {}
+        if self._codec is not None:
+            self._decoders[self._codec.name] = self._codec
+        self._on_codec_stats = on_codec_stats
+
+    async def create(self, checkpoint: Checkpoint) -> Checkpoint:
+        """
+        Persist a new checkpoint.
+
+        Raises:
+            DuplicateEntityError: If a checkpoint with the same ID exists
+        """
+        row = self._to_row(checkpoint)
+
+        def insert(connection: sqlite3.Connection) -> None:
+            if connection.execute(INSERT, row).rowcount == 0:
+                raise DuplicateEntityError(
+                    f"Checkpoint '{checkpoint.id}' already exists"
+                )
+
+        await self._db.write(insert)
+        return checkpoint
+
+    async def get_by_id(self, checkpoint_id: str) -> Optional[Checkpoint]:
+        """Retrieve a checkpoint by its UUID."""
+        row = await self._db.read(
+            lambda connection: connection.execute(
+                f"{SELECT} WHERE id = ?", (checkpoint_id,)
+            ).fetchone()
+        )
+        return None if row is None else self._to_entity(row)
+
+    async def get_many(self, checkpoint_ids: List[str]) -> Dict[str, Checkpoint]:
+        """Retrieve many checkpoints; ids not found are absent."""
+
+        def select(connection: sqlite3.Connection) -> list:
+            rows = []
+            for chunk in chunks(list(dict.fromkeys(checkpoint_ids))):
+                rows += connection.execute(
+                    f"{SELECT} WHERE id IN ({placeholders(len(chunk))})", chunk
+                ).fetchall()
+            return rows
+
+        rows = await self._db.read(select)
+        return {row["id"]: self._to_entity(row) for row in rows}
+
+    async def list_checkpoints(
+        self,
+        demand_id: str,
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[Checkpoint]:
+        """
+        List a demand's checkpoints, newest first (keyset pagination).
+
+        Raises:
+            ValueError: If limit or cursor is invalid
+        """
+        return await self._list(SELECT, demand_id, after, limit, self._to_entity)
+
+    async def get_summary(self, checkpoint_id: str) -> Optional[CheckpointSummary]:
+        """Retrieve a checkpoint without reading its snapshot."""
+        row = await self._db.read(
+            lambda connection: connection.execute(
+                f"{SELECT_SUMMARY} WHERE id = ?", (checkpoint_id,)
+            ).fetchone()
+        )
+        return None if row is None else self._to_summary(row)
+
+    async def list_checkpoint_summaries(
+        self,
+        demand_id: str,
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[CheckpointSummary]:
+        """
+        Same as list_checkpoints, without reading snapshots.
+
+        Raises:
+            ValueError: If limit or cursor is invalid
+        """
+        return await self._list(
+            SELECT_SUMMARY, demand_id, after, limit, self._to_summary
+        )
+
+    async def get_lazy(self, checkpoint_id: str) -> Optional[LazyCheckpoint]:
+        """Retrieve a checkpoint whose snapshot is read on first access."""
+        summary = await self.get_summary(checkpoint_id)
+        if summary is None:
+            return None
+        return LazyCheckpoint(
+            **vars(summary),
+            snapshot_field=LazyField(lambda: self._load_snapshot(checkpoint_id)),
+        )
+
+    async def update(self, checkpoint: Checkpoint) -> Checkpoint:
+        """
+        Replace a stored checkpoint if nobody saved it since it was read
+        (no-op if it does not exist).
+
+        Raises:
+            RevisionConflictError: If the stored revision is not
+                checkpoint.revision
+        """
+        row = self._to_row(checkpoint)
+
+        def update(connection: sqlite3.Connection) -> bool:
+            if connection.execute(UPDATE, row).rowcount == 1:
+                return True
+            raise_on_conflict(
+                connection,
+                "checkpoints",
+                "Checkpoint",
+                checkpoint.id,
+                checkpoint.revision,
+            )
+            return False
+
+        if await self._db.write(update):
+            checkpoint.revision += 1
+        return checkpoint
+
+    async def patch(self, checkpoint: Checkpoint, fields: Iterable[str]) -> Checkpoint:
+        """
+        UPDATE only the columns of some attributes (no-op if missing).
+
+        The snapshot is only re-encoded when context_snapshot is named.
+
+        Raises:
+            ValueError: If a field is unknown or protected
+            RevisionConflictError: If the stored revision is not
+                checkpoint.revision
+        """
+        names = patch_fields(checkpoint, fields)
+        if not names:
+            return checkpoint
+        columns = self._patch_columns(checkpoint, names)
+        if await self._db.write(
+            lambda connection: patch_row(connection, "checkpoints", checkpoint, columns)
+        ):
+            checkpoint.revision += 1
+        return checkpoint
+
+    async def delete(self, checkpoint_id: str) -> None:
+        """Remove a checkpoint (no-op if it does not exist)."""
+        await self._db.write(
+            lambda connection: connection.execute(
+                "DELETE FROM checkpoints WHERE id = ?", (checkpoint_id,)
+            )
+        )
+
+    async def create_many(self, checkpoints: List[Checkpoint]) -> BulkWriteResult:
+        """Persist many new checkpoints in one transaction."""
+        ids = [checkpoint.id for checkpoint in checkpoints]
+        rows = [self._to_row(checkpoint) for checkpoint in checkpoints]
+        return await self._db.write(
+            lambda connection: insert_rows(connection, INSERT, ids, rows)
+        )
+
+    async def update_many(self, checkpoints: List[Checkpoint]) -> BulkWriteResult:
+        """Update many checkpoints in one transaction; unknown ids fail."""
+        ids = [checkpoint.id for checkpoint in checkpoints]
+        rows = [self._to_row(checkpoint) for checkpoint in checkpoints]
+        result = await self._db.write(
+            lambda connection: update_rows(connection, UPDATE, "checkpoints", ids, rows)
+        )
+        for checkpoint, item in zip(checkpoints, result.items):
+            if item.ok:
+                checkpoint.revision += 1
+        return result
+
+    async def delete_many(self, checkpoint_ids: List[str]) -> BulkWriteResult:
+        """Remove many checkpoints in one transaction."""
+        return await self._db.write(
+            lambda connection: delete_rows(connection, "checkpoints", checkpoint_ids)
+        )
+
+    async def _list(self, select, demand_id, after, limit, convert) -> Page:
+        """Keyset page of a demand's checkpoints (see fetch_page)."""
+        return await self._db.read(
+            lambda connection: fetch_page(
+                connection,
+                select,
+                "demand_id = ?",
+                (demand_id,),
+                "created_at",
+                after,
+                limit,
+                convert,
+            )
+        )
+
+    async def _load_snapshot(self, checkpoint_id: str) -> str:
+        """
+        Read and decode the snapshot of one checkpoint.
+
+        Raises:
+            RepositoryError: If the checkpoint was removed meanwhile
+        """
+        row = await self._db.read(
+            lambda connection: connection.execute(
+                "SELECT id, snapshot, snapshot_codec FROM checkpoints WHERE id = ?",
+                (checkpoint_id,),
+            ).fetchone()
+        )
+        if row is None:
+            raise RepositoryError(f"Checkpoint '{checkpoint_id}' no longer exists")
+        return self._read_snapshot(row)
+
+    def _to_row(self, checkpoint: Checkpoint) -> tuple:
+        """Statement parameters for INSERT / UPDATE (id, revision last)."""
+        snapshot, codec_name = self._encode_snapshot(checkpoint)
+        return (
+            checkpoint.demand_id,
+            checkpoint.tokens_used,
+            snapshot,
+            codec_name,
+            to_text(checkpoint.created_at),
+            to_text(checkpoint.expires_at),
+            checkpoint.id,
+            checkpoint.revision,
+        )
+
+    def _encode_snapshot(self, checkpoint: Checkpoint) -> Tuple[bytes, Optional[str]]:
+        """(snapshot BLOB, snapshot_codec) of a checkpoint."""
+        if self._codec is None:
+            return checkpoint.context_snapshot.encode("utf-8"), None
+        snapshot, stats = encode_snapshot(
+            self._codec, checkpoint.id, checkpoint.context_snapshot
+        )
+        self._report(stats)
+        return snapshot, self._codec.name
+
+    def _patch_columns(
+        self, checkpoint: Checkpoint, names: Iterable[str]
+    ) -> Dict[str, Any]:
+        """Column values written by patch() for some attributes."""
+        columns: Dict[str, Any] = {}
+        for name in names:
+            if name == "context_snapshot":
+                snapshot, codec_name = self._encode_snapshot(checkpoint)
+                columns["snapshot"] = snapshot
+                columns["snapshot_codec"] = codec_name
+            elif name in ("created_at", "expires_at"):
+                columns[name] = to_text(getattr(checkpoint, name))
+            else:
+                columns[name] = getattr(checkpoint, name)
+        return columns
+
+    def _read_snapshot(self, row: sqlite3.Row) -> str:
+        """Decoded snapshot of a row."""
+        codec_name = row["snapshot_codec"]
+        if codec_name is None:
+            return bytes(row["snapshot"]).decode("utf-8")
+        snapshot, stats = decode_snapshot(
+            self._decoder(codec_name), row["id"], row["snapshot"]
+        )
+        self._report(stats)
+        return snapshot
+
+    def _to_entity(self, row: sqlite3.Row) -> Checkpoint:
+        return Checkpoint.from_trusted(
+            id=row["id"],
+            demand_id=row["demand_id"],
+            context_snapshot=self._read_snapshot(row),
+            tokens_used=row["tokens_used"],
+            created_at=from_text(row["created_at"]),
+            expires_at=from_text(row["expires_at"]),
+            revision=row["revision"],
+        )
+
+    def _to_summary(self, row: sqlite3.Row) -> CheckpointSummary:
+        return CheckpointSummary(
+            id=row["id"],
+            demand_id=row["demand_id"],
+            tokens_used=row["tokens_used"],
+            created_at=from_text(row["created_at"]),
+            expires_at=from_text(row["expires_at"]),
+            revision=row["revision"],
+        )
+
+    def _decoder(self, codec_name: str) -> SnapshotCodec:
+        """Cached codec able to read rows written with codec_name."""
+        codec = self._decoders.get(codec_name)
+        if codec is None:
+            codec = get_codec(codec_name)
+            self._decoders[codec_name] = codec
+        return codec
+
+    def _report(self, stats: SnapshotCodecStats) -> None:
+        """Forward codec stats to the configured callback, if any."""
+        if self._on_codec_stats is not None:
+            self._on_codec_stats(stats)
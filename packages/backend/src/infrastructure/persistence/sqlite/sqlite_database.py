@@ -0,0 +1,352 @@
+"""
+SQLite Database
+
+Embedded storage for single-box installs where running MongoDB is too
+heavy. One connection in WAL mode, owned by a single worker thread so the
+event loop never blocks on disk I/O.
+
+Group commit: writes are queued and the worker applies everything queued
+so far in one transaction (each write in its own SAVEPOINT, so a failing
+write only rolls back itself). Under load, N concurrent writes cost one
+fsync instead of N.
+
+Datetimes are stored as fixed-width ISO-8601 text, so text order is time
+order and the (…, created_at, id) indexes serve keyset pagination.
+
+Requires SQLite 3.35+ (RETURNING).
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import asyncio
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+
+T = TypeVar("T")
+
+SCHEMA_VERSION = 3
+
+
+def add_column(table: str, definition: str) -> Callable[[sqlite3.Connection], None]:
+    """
+    Migration step adding a column unless the table already has it.
+
+    Tables created from the current SCHEMA have every column, so the step
+    only alters files written by older versions.
+
+    Args:
+        table: Table name (trusted, not user input)
+        definition: Column definition, name first
+    """
+    name = definition.split()[0]
+
+    def migrate(connection: sqlite3.Connection) -> None:
+        columns = {row[1] for row in connection.execute(f"PRAGMA table_info({table})")}
+        if name not in columns:
+            connection.execute(f"ALTER TABLE {table} ADD COLUMN {definition}")
+
+    return migrate
+
+
+SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS projects (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        description TEXT NOT NULL,
+        owner_id TEXT NOT NULL,
+        max_tokens INTEGER NOT NULL,
+        used_tokens INTEGER NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT,
+        revision INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS projects_owner ON projects (owner_id, created_at, id)",
+    """
+    CREATE TABLE IF NOT EXISTS demands (
+        id TEXT PRIMARY KEY,
+        project_id TEXT NOT NULL,
+        title TEXT NOT NULL,
+        description TEXT NOT NULL,
+        status TEXT NOT NULL,
+        max_tokens INTEGER,
+        used_tokens INTEGER,
+        created_at TEXT NOT NULL,
+        updated_at TEXT,
+        revision INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS demands_project
+    ON demands (project_id, created_at, id)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS demands_project_status
+    ON demands (project_id, status, created_at, id)
+    """,
+    # Demands per (project, status), maintained by the triggers below
+    """
+    CREATE TABLE IF NOT EXISTS demand_status_rollups (
+        project_id TEXT NOT NULL,
+        status TEXT NOT NULL,
+        count INTEGER NOT NULL,
+        PRIMARY KEY (project_id, status)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS demands_rollup_insert AFTER INSERT ON demands
+    BEGIN
+        INSERT INTO demand_status_rollups (project_id, status, count)
+        VALUES (NEW.project_id, NEW.status, 1)
+        ON CONFLICT (project_id, status) DO UPDATE SET count = count + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS demands_rollup_delete AFTER DELETE ON demands
+    BEGIN
+        UPDATE demand_status_rollups SET count = count - 1
+        WHERE project_id = OLD.project_id AND status = OLD.status;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS demands_rollup_update
+    AFTER UPDATE OF project_id, status ON demands
+    WHEN OLD.project_id IS NOT NEW.project_id OR OLD.status IS NOT NEW.status
+    BEGIN
+        UPDATE demand_status_rollups SET count = count - 1
+        WHERE project_id = OLD.project_id AND status = OLD.status;
+        INSERT INTO demand_status_rollups (project_id, status, count)
+        VALUES (NEW.project_id, NEW.status, 1)
+        ON CONFLICT (project_id, status) DO UPDATE SET count = count + 1;
+    END
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS metaspecs (
+        id TEXT NOT NULL,
+        version INTEGER NOT NULL,
+        demand_id TEXT NOT NULL,
+        type TEXT NOT NULL,
+        content TEXT NOT NULL,
+        latest INTEGER NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT,
+        revision INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (id, version)
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS metaspecs_demand_latest
+    ON metaspecs (demand_id, latest, version, id)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS metaspecs_demand_type
+    ON metaspecs (demand_id, type, version, id)
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS checkpoints (
+        id TEXT PRIMARY KEY,
+        demand_id TEXT NOT NULL,
+        tokens_used INTEGER NOT NULL,
+        snapshot BLOB NOT NULL,
+        snapshot_codec TEXT,
+        created_at TEXT NOT NULL,
+        expires_at TEXT,
+        revision INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS checkpoints_demand
+    ON checkpoints (demand_id, created_at, id)
+    """,
+]
+
+# Steps run once when opening a database older than the version: SQL
+# statements, or functions of the connection
+MIGRATIONS: Dict[int, List[Union[str, Callable[[sqlite3.Connection], None]]]] = {
+    2: [
+        # Rollups of demands written before the triggers existed
+        """
+        INSERT OR REPLACE INTO demand_status_rollups (project_id, status, count)
+        SELECT project_id, status, COUNT(*) FROM demands
+        GROUP BY project_id, status
+        """,
+    ],
+    3: [
+        # Optimistic concurrency: rows written before count as revision 0
+        add_column(table, "revision INTEGER NOT NULL DEFAULT 0")
+        for table in ("projects", "demands", "metaspecs", "checkpoints")
+    ],
+}
+
+# Writes applied per transaction at most
+DEFAULT_MAX_BATCH_SIZE = 512
+
+
+def to_text(value: Optional[datetime]) -> Optional[str]:
+    """Datetime as sortable ISO-8601 text (None stays None)."""
+    if value is None:
+        return None
+    return value.isoformat(timespec="microseconds")
+
+
+def from_text(value: Optional[str]) -> Optional[datetime]:
+    """Inverse of to_text."""
+    if value is None:
+        return None
+    return datetime.fromisoformat(value)
+
+
+class SQLiteDatabase:
+    """SQLite connection with a dedicated worker thread and group commit"""
+
+    def __init__(
+        self,
+        path: str,
+        synchronous: str = "NORMAL",
+        busy_timeout_ms: int = 5000,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ):
+        """
+        Open (and create if needed) the database.
+
+        Args:
+            path: Database file (":memory:" for a private in-memory database)
+            synchronous: PRAGMA synchronous; NORMAL is durable across
+                application crashes in WAL mode, FULL also across power loss
+            busy_timeout_ms: Wait for locks held by other processes
+            max_batch_size: Writes committed together at most
+
+        Raises:
+            ValueError: If max_batch_size < 1
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+
+        self.path = path
+        self._max_batch_size = max_batch_size
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+        self._pending: List[Tuple[Callable[[sqlite3.Connection], Any], Any]] = []
+        self._flusher: Optional[asyncio.Task] = None
+        self.committed_batches = 0
+        self.committed_writes = 0
+
+        # Only ever used from the worker thread after this point
+        self._connection = sqlite3.connect(
+            path, isolation_level=None, check_same_thread=False
+        )
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(f"PRAGMA synchronous={synchronous}")
+        self._connection.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
+        self._create_schema()
+
+    async def read(self, operation: Callable[[sqlite3.Connection], T]) -> T:
+        """
+        Run a read on the worker thread.
+
+        Args:
+            operation: Function receiving the connection
+
+        Returns:
+            Result of operation
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, operation, self._connection)
+
+    async def write(self, operation: Callable[[sqlite3.Connection], T]) -> T:
+        """
+        Queue a write; it is committed with the other writes queued so far.
+
+        Args:
+            operation: Function receiving the connection; runs inside a
+                transaction, and its changes are rolled back if it raises
+
+        Returns:
+            Result of operation, once committed
+
+        Raises:
+            Exception: Whatever operation raised, or the COMMIT error
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((operation, future))
+        if self._flusher is None:
+            self._flusher = loop.create_task(self._flush())
+        return await future
+
+    async def close(self) -> None:
+        """Commit queued writes, then close the connection."""
+        if self._flusher is not None:
+            await self._flusher
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._connection.close)
+        self._executor.shutdown(wait=True)
+
+    async def _flush(self) -> None:
+        """Commit queued writes in batches until the queue is empty."""
+        loop = asyncio.get_running_loop()
+        try:
+            while self._pending:
+                batch = self._pending[: self._max_batch_size]
+                del self._pending[: self._max_batch_size]
+                operations = [operation for operation, _ in batch]
+                try:
+                    outcomes = await loop.run_in_executor(
+                        self._executor, self._apply, operations
+                    )
+                except Exception as exc:
+                    outcomes = [(False, exc)] * len(batch)
+
+                for (_, future), (ok, value) in zip(batch, outcomes):
+                    if future.done():  # caller cancelled
+                        continue
+                    if ok:
+                        future.set_result(value)
+                    else:
+                        future.set_exception(value)
+        finally:
+            self._flusher = None
+
+    def _apply(
+        self, operations: List[Callable[[sqlite3.Connection], Any]]
+    ) -> List[Tuple[bool, Any]]:
+        """Run writes in one transaction (worker thread)."""
+        connection = self._connection
+        outcomes: List[Tuple[bool, Any]] = []
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            for operation in operations:
+                connection.execute("SAVEPOINT write")
+                try:
+                    outcomes.append((True, operation(connection)))
+                except Exception as exc:
+                    connection.execute("ROLLBACK TO write")
+                    outcomes.append((False, exc))
+                connection.execute("RELEASE write")
+            connection.execute("COMMIT")
+        except BaseException:
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            raise
+
+        self.committed_batches += 1
+        self.committed_writes += len(operations)
+        return outcomes
+
+    def _create_schema(self) -> None:
+        """Create tables and indexes (idempotent) and run pending migrations."""
+        with self._connection:
+            (version,) = self._connection.execute("PRAGMA user_version").fetchone()
+            for statement in SCHEMA:
+                self._connection.execute(statement)
+            for target in sorted(MIGRATIONS):
+                if version < target:
+                    for step in MIGRATIONS[target]:
+                        if callable(step):
+                            step(self._connection)
+                        else:
+                            self._connection.execute(step)
+            self._connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
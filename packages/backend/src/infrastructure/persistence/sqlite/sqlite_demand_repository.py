@@ -0,0 +1,379 @@
+"""
+SQLiteDemandRepository Implementation
+
+SQLite adapter for Demand persistence (single-box installs).
+Implements IDemandRepository interface from Application Layer.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from application.dto.bulk_write_result import (
+    NOT_FOUND_ERROR,
+    BulkWriteResult,
+    bulk_result,
+)
+from application.dto.page import DEFAULT_PAGE_SIZE, Page
+from application.dto.status_counts import status_counts
+from application.dto.status_transition import STATUS_CONFLICT_ERROR, StatusTransition
+from application.exceptions import (
+    DemandNotFoundError,
+    DemandStatusConflictError,
+    DuplicateEntityError,
+)
+from application.interfaces.i_demand_repository import IDemandRepository
+from domain.entities.demand import Demand
+from domain.value_objects.context_budget import ContextBudget
+from domain.value_objects.demand_status import DemandStatus
+from infrastructure.persistence.field_patches import patch_fields
+from infrastructure.persistence.sqlite.sqlite_bulk import (
+    chunks,
+    delete_rows,
+    insert_rows,
+    placeholders,
+    update_rows,
+)
+from infrastructure.persistence.sqlite.sqlite_database import (
+    SQLiteDatabase,
+    from_text,
+    to_text,
+)
+from infrastructure.persistence.sqlite.sqlite_pagination import fetch_page
+from infrastructure.persistence.sqlite.sqlite_revision import (
+    patch_row,
+    raise_on_conflict,
+)
+from infrastructure.persistence.status_transitions import rejected_transitions
+
+SELECT = "SELECT * FROM demands"
+
+INSERT = (
+    "INSERT OR IGNORE INTO demands (project_id, title, description, status, "
+    "max_tokens, used_tokens, created_at, updated_at, id, revision) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+UPDATE = (
+    "UPDATE demands SET project_id = ?, title = ?, description = ?, status = ?, "
+    "max_tokens = ?, used_tokens = ?, created_at = ?, updated_at = ?, "
+    "revision = revision + 1 WHERE id = ? AND revision = ?"
+)
+
+# Compare-and-set: only matches while the demand is still in from_status
+TRANSITION = (
+    "UPDATE demands SET status = ?, updated_at = ?, revision = revision + 1 "
+    "WHERE id = ? AND status = ?"
+)
+
+
+class SQLiteDemandRepository(IDemandRepository):
+    """SQLite implementation of IDemandRepository"""
+
+    def __init__(self, database: SQLiteDatabase):
+        """
+        Initialize SQLite repository.
+
+        Args:
+            database: Shared SQLiteDatabase
+        """
+        self._db = database
+
+    async def create(self, demand: Demand) -> Demand:
+        """
+        Persist a new demand.
+
+        Raises:
+            DuplicateEntityError: If a demand with the same ID exists
+        """
+        row = self._to_row(demand)
+
+        def insert(connection: sqlite3.Connection) -> None:
+            if connection.execute(INSERT, row).rowcount == 0:
+                raise DuplicateEntityError(f"Demand '{demand.id}' already exists")
+
+        await self._db.write(insert)
+        return demand
+
+    async def get_by_id(self, demand_id: str) -> Optional[Demand]:
+        """Retrieve a demand by its UUID."""
+        row = await self._db.read(
+            lambda connection: connection.execute(
+                f"{SELECT} WHERE id = ?", (demand_id,)
+            ).fetchone()
+        )
+        return None if row is None else self._to_entity(row)
+
+    async def get_many(self, demand_ids: List[str]) -> Dict[str, Demand]:
+        """Retrieve many demands; ids not found are absent."""
+
+        def select(connection: sqlite3.Connection) -> list:
+            rows = []
+            for chunk in chunks(list(dict.fromkeys(demand_ids))):
+                rows += connection.execute(
+                    f"{SELECT} WHERE id IN ({placeholders(len(chunk))})", chunk
+                ).fetchall()
+            return rows
+
+        rows = await self._db.read(select)
+        return {row["id"]: self._to_entity(row) for row in rows}
+
+    async def list_by_project(
+        self,
+        project_id: str,
+        status: Optional[DemandStatus] = None,
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[Demand]:
+        """
+        List a project's demands, newest first, optionally by status.
+
+        Served by the (project_id[, status], created_at, id) indexes.
+
+        Raises:
+            ValueError: If limit or cursor is invalid
+        """
+        where, parameters = "project_id = ?", (project_id,)
+        if status is not None:
+            where, parameters = "project_id = ? AND status = ?", (
+                project_id,
+                status.value,
+            )
+        return await self._db.read(
+            lambda connection: fetch_page(
+                connection,
+                SELECT,
+                where,
+                parameters,
+                "created_at",
+                after,
+                limit,
+                self._to_entity,
+            )
+        )
+
+    async def count_by_status(self, project_id: str) -> Dict[DemandStatus, int]:
+        """
+        Count a project's demands per status.
+
+        GROUP BY over the (project_id, status, ...) index, without reading
+        the rows themselves.
+        """
+        rows = await self._db.read(
+            lambda connection: connection.execute(
+                "SELECT status, COUNT(*) FROM demands WHERE project_id = ? "
+                "GROUP BY status",
+                (project_id,),
+            ).fetchall()
+        )
+        return status_counts({status: count for status, count in rows})
+
+    async def get_status_rollup(self, project_id: str) -> Dict[DemandStatus, int]:
+        """Per-status counts from demand_status_rollups (kept by triggers)."""
+        rows = await self._db.read(
+            lambda connection: connection.execute(
+                "SELECT status, count FROM demand_status_rollups WHERE project_id = ?",
+                (project_id,),
+            ).fetchall()
+        )
+        return status_counts({status: count for status, count in rows})
+
+    async def update(self, demand: Demand) -> Demand:
+        """
+        Replace a stored demand if nobody saved it since it was read
+        (no-op if it does not exist).
+
+        Raises:
+            RevisionConflictError: If the stored revision is not demand.revision
+        """
+        row = self._to_row(demand)
+
+        def update(connection: sqlite3.Connection) -> bool:
+            if connection.execute(UPDATE, row).rowcount == 1:
+                return True
+            raise_on_conflict(
+                connection, "demands", "Demand", demand.id, demand.revision
+            )
+            return False
+
+        if await self._db.write(update):
+            demand.revision += 1
+        return demand
+
+    async def patch(self, demand: Demand, fields: Iterable[str]) -> Demand:
+        """
+        UPDATE only the columns of some attributes (no-op if missing).
+
+        The status rollup triggers fire as for update().
+
+        Raises:
+            ValueError: If a field is unknown or protected
+            RevisionConflictError: If the stored revision is not demand.revision
+        """
+        names = patch_fields(demand, fields)
+        if not names:
+            return demand
+        columns = self._patch_columns(demand, names)
+        if await self._db.write(
+            lambda connection: patch_row(connection, "demands", demand, columns)
+        ):
+            demand.revision += 1
+        return demand
+
+    async def transition(
+        self, demand_id: str, from_status: DemandStatus, to_status: DemandStatus
+    ) -> None:
+        """
+        Compare-and-set a demand's status with one conditional UPDATE.
+
+        Raises:
+            InvalidStatusTransitionError: If to_status does not follow from_status
+            DemandAlreadyCompletedError: If from_status is final
+            DemandNotFoundError: If demand does not exist
+            DemandStatusConflictError: If the demand is no longer in from_status
+        """
+        from_status.validate_transition(to_status)
+        parameters = (
+            to_status.value,
+            to_text(datetime.utcnow()),
+            demand_id,
+            from_status.value,
+        )
+
+        def transition(connection: sqlite3.Connection) -> None:
+            updated = connection.execute(TRANSITION, parameters)
+            if updated.rowcount == 1:
+                return
+            row = connection.execute(
+                "SELECT status FROM demands WHERE id = ?", (demand_id,)
+            ).fetchone()
+            if row is None:
+                raise DemandNotFoundError(f"Demand '{demand_id}' not found")
+            raise DemandStatusConflictError(
+                demand_id, from_status, DemandStatus(row["status"])
+            )
+
+        await self._db.write(transition)
+
+    async def delete(self, demand_id: str) -> None:
+        """Remove a demand (no-op if it does not exist)."""
+        await self._db.write(
+            lambda connection: connection.execute(
+                "DELETE FROM demands WHERE id = ?", (demand_id,)
+            )
+        )
+
+    async def create_many(self, demands: List[Demand]) -> BulkWriteResult:
+        """Persist many new demands in one transaction."""
+        ids = [demand.id for demand in demands]
+        rows = [self._to_row(demand) for demand in demands]
+        return await self._db.write(
+            lambda connection: insert_rows(connection, INSERT, ids, rows)
+        )
+
+    async def update_many(self, demands: List[Demand]) -> BulkWriteResult:
+        """Update many demands in one transaction; unknown ids fail."""
+        ids = [demand.id for demand in demands]
+        rows = [self._to_row(demand) for demand in demands]
+        result = await self._db.write(
+            lambda connection: update_rows(connection, UPDATE, "demands", ids, rows)
+        )
+        for demand, item in zip(demands, result.items):
+            if item.ok:
+                demand.revision += 1
+        return result
+
+    async def transition_many(
+        self, transitions: List[StatusTransition]
+    ) -> BulkWriteResult:
+        """
+        Compare-and-set many statuses in one transaction.
+
+        Each item is a conditional UPDATE; items that match nothing are
+        reported as not found or as a status conflict.
+        """
+        ids = [transition.demand_id for transition in transitions]
+        rejected = rejected_transitions(transitions)
+        now = to_text(datetime.utcnow())
+
+        def transition_rows(connection: sqlite3.Connection) -> BulkWriteResult:
+            errors = dict(rejected)
+            for index, transition in enumerate(transitions):
+                if index in errors:
+                    continue
+                updated = connection.execute(
+                    TRANSITION,
+                    (
+                        transition.to_status.value,
+                        now,
+                        transition.demand_id,
+                        transition.from_status.value,
+                    ),
+                )
+                if updated.rowcount == 1:
+                    continue
+                exists = connection.execute(
+                    "SELECT 1 FROM demands WHERE id = ?", (transition.demand_id,)
+                ).fetchone()
+                errors[index] = STATUS_CONFLICT_ERROR if exists else NOT_FOUND_ERROR
+            return bulk_result(ids, errors)
+
+        return await self._db.write(transition_rows)
+
+    async def delete_many(self, demand_ids: List[str]) -> BulkWriteResult:
+        """Remove many demands in one transaction."""
+        return await self._db.write(
+            lambda connection: delete_rows(connection, "demands", demand_ids)
+        )
+
+    def _to_row(self, demand: Demand) -> tuple:
+        """Statement parameters for INSERT / UPDATE (id, revision last)."""
+        budget = demand.context_budget
+        return (
+            demand.project_id,
+            demand.title,
+            demand.description,
+            demand.status.value,
+            None if budget is None else budget.max_tokens,
+            None if budget is None else budget.used_tokens,
+            to_text(demand.created_at),
+            to_text(demand.updated_at),
+            demand.id,
+            demand.revision,
+        )
+
+    def _patch_columns(self, demand: Demand, names: Iterable[str]) -> Dict[str, Any]:
+        """Column values written by patch() for some attributes."""
+        columns: Dict[str, Any] = {}
+        for name in names:
+            if name == "context_budget":
+                budget = demand.context_budget
+                columns["max_tokens"] = None if budget is None else budget.max_tokens
+                columns["used_tokens"] = None if budget is None else budget.used_tokens
+            elif name == "status":
+                columns["status"] = demand.status.value
+            elif name in ("created_at", "updated_at"):
+                columns[name] = to_text(getattr(demand, name))
+            else:
+                columns[name] = getattr(demand, name)
+        return columns
+
+    def _to_entity(self, row: sqlite3.Row) -> Demand:
+        budget = None
+        if row["max_tokens"] is not None:
+            budget = ContextBudget.from_trusted(
+                max_tokens=row["max_tokens"], used_tokens=row["used_tokens"]
+            )
+        return Demand.from_trusted(
+            id=row["id"],
+            project_id=row["project_id"],
+            title=row["title"],
+            description=row["description"],
+            status=DemandStatus(row["status"]),
+            context_budget=budget,
+            created_at=from_text(row["created_at"]),
+            updated_at=from_text(row["updated_at"]),
+            revision=row["revision"],
+        )
@@ -0,0 +1,422 @@
+"""
+SQLiteMetaspecRepository Implementation
+
+SQLite adapter for Metaspec persistence (single-box installs).
+Implements IMetaspecRepository interface from Application Layer.
+
+Same versioning rules as the MongoDB adapter: one row per (id, version),
+the current one flagged latest = 1. Updating to a higher version inserts
+a row and clears the flag of the previous one in the same transaction.
+The row being superseded must still be at the revision the caller read.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import sqlite3
+from typing import Any, Dict, Iterable, List, Optional
+
+from application.dto.bulk_write_result import (
+    DUPLICATE_ERROR,
+    NOT_FOUND_ERROR,
+    REVISION_CONFLICT_ERROR,
+    BulkWriteResult,
+    bulk_result,
+)
+from application.dto.lazy import LazyField, LazyMetaspec
+from application.dto.page import DEFAULT_PAGE_SIZE, Page
+from application.dto.summaries import MetaspecSummary
+from application.exceptions import (
+    DuplicateEntityError,
+    RepositoryError,
+    RevisionConflictError,
+)
+from application.interfaces.i_metaspec_repository import IMetaspecRepository
+from domain.entities.metaspec import Metaspec, MetaspecType
+from infrastructure.persistence.field_patches import patch_fields
+from infrastructure.persistence.sqlite.sqlite_bulk import (
+    chunks,
+    delete_rows,
+    placeholders,
+)
+from infrastructure.persistence.sqlite.sqlite_database import (
+    SQLiteDatabase,
+    from_text,
+    to_text,
+)
+from infrastructure.persistence.sqlite.sqlite_pagination import fetch_page
+from infrastructure.persistence.sqlite.sqlite_revision import patch_row
+
+SELECT = "SELECT * FROM metaspecs"
+
+# Everything but the Markdown body
+SELECT_SUMMARY = (
+    "SELECT id, demand_id, type, version, created_at, updated_at, revision "
+    "FROM metaspecs"
+)
+
+UPSERT = (
+    "INSERT OR REPLACE INTO metaspecs (id, version, demand_id, type, content, "
+    "latest, created_at, updated_at, revision) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+class SQLiteMetaspecRepository(IMetaspecRepository):
+    """SQLite implementation of IMetaspecRepository"""
+
+    def __init__(self, database: SQLiteDatabase):
+        """
+        Initialize SQLite repository.
+
+        Args:
+            database: Shared SQLiteDatabase
+        """
+        self._db = database
+
+    async def create(self, metaspec: Metaspec) -> Metaspec:
+        """
+        Persist a new metaspec.
+
+        Raises:
+            DuplicateEntityError: If a metaspec with the same ID exists
+        """
+
+        def insert(connection: sqlite3.Connection) -> None:
+            if not self._insert_new(connection, metaspec):
+                raise DuplicateEntityError(f"Metaspec '{metaspec.id}' already exists")
+
+        await self._db.write(insert)
+        return metaspec
+
+    async def get_by_id(self, metaspec_id: str) -> Optional[Metaspec]:
+        """Retrieve the latest version of a metaspec by its UUID."""
+        row = await self._db.read(
+            lambda connection: connection.execute(
+                f"{SELECT} WHERE id = ? AND latest = 1", (metaspec_id,)
+            ).fetchone()
+        )
+        return None if row is None else self._to_entity(row)
+
+    async def get_many(self, metaspec_ids: List[str]) -> Dict[str, Metaspec]:
+        """Retrieve the latest version of many metaspecs."""
+
+        def select(connection: sqlite3.Connection) -> list:
+            rows = []
+            for chunk in chunks(list(dict.fromkeys(metaspec_ids))):
+                rows += connection.execute(
+                    f"{SELECT} WHERE id IN ({placeholders(len(chunk))}) "
+                    "AND latest = 1",
+                    chunk,
+                ).fetchall()
+            return rows
+
+        rows = await self._db.read(select)
+        return {row["id"]: self._to_entity(row) for row in rows}
+
+    async def get_latest(
+        self, demand_id: str, metaspec_type: MetaspecType
+    ) -> Optional[Metaspec]:
+        """
+        Retrieve the highest version of a demand's metaspec of a type.
+
+        Served by the (demand_id, type, version, id) index.
+        """
+        row = await self._db.read(
+            lambda connection: connection.execute(
+                f"{SELECT} WHERE demand_id = ? AND type = ? "
+                "ORDER BY version DESC, id DESC LIMIT 1",
+                (demand_id, metaspec_type.value),
+            ).fetchone()
+        )
+        return None if row is None else self._to_entity(row)
+
+    async def get_version(
+        self, demand_id: str, metaspec_type: MetaspecType, version: int
+    ) -> Optional[Metaspec]:
+        """Retrieve a specific (possibly superseded) version."""
+        row = await self._db.read(
+            lambda connection: connection.execute(
+                f"{SELECT} WHERE demand_id = ? AND type = ? AND version = ? "
+                "ORDER BY id DESC LIMIT 1",
+                (demand_id, metaspec_type.value, version),
+            ).fetchone()
+        )
+        return None if row is None else self._to_entity(row)
+
+    async def list_metaspecs(
+        self,
+        demand_id: str,
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[Metaspec]:
+        """
+        List metaspecs (latest versions), highest version first.
+
+        Served by the (demand_id, latest, version, id) index.
+
+        Raises:
+            ValueError: If limit or cursor is invalid
+        """
+        return await self._list(SELECT, demand_id, after, limit, self._to_entity)
+
+    async def get_summary(self, metaspec_id: str) -> Optional[MetaspecSummary]:
+        """Retrieve a metaspec without reading its content."""
+        row = await self._db.read(
+            lambda connection: connection.execute(
+                f"{SELECT_SUMMARY} WHERE id = ? AND latest = 1", (metaspec_id,)
+            ).fetchone()
+        )
+        return None if row is None else self._to_summary(row)
+
+    async def list_metaspec_summaries(
+        self,
+        demand_id: str,
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[MetaspecSummary]:
+        """
+        Same as list_metaspecs, without reading content.
+
+        Raises:
+            ValueError: If limit or cursor is invalid
+        """
+        return await self._list(
+            SELECT_SUMMARY, demand_id, after, limit, self._to_summary
+        )
+
+    async def get_lazy(self, metaspec_id: str) -> Optional[LazyMetaspec]:
+        """Retrieve a metaspec whose content is read on first access."""
+        summary = await self.get_summary(metaspec_id)
+        if summary is None:
+            return None
+        version = summary.version
+        return LazyMetaspec(
+            **vars(summary),
+            content_field=LazyField(lambda: self._load_content(metaspec_id, version)),
+        )
+
+    async def update(self, metaspec: Metaspec) -> Metaspec:
+        """
+        Store a new version or overwrite an existing one.
+
+        No-op if the metaspec does not exist.
+
+        Raises:
+            RevisionConflictError: If the row being superseded is not at
+                metaspec.revision
+        """
+        if await self._db.write(
+            lambda connection: self._write_version(connection, metaspec)
+        ):
+            metaspec.revision += 1
+        return metaspec
+
+    async def patch(self, metaspec: Metaspec, fields: Iterable[str]) -> Metaspec:
+        """
+        UPDATE only the columns of some attributes of one stored version.
+
+        Patching "version" stores a new version through update().
+
+        Raises:
+            ValueError: If a field is unknown or protected
+            RevisionConflictError: If the version is not at metaspec.revision
+        """
+        names = patch_fields(metaspec, fields)
+        if "version" in names:
+            return await self.update(metaspec)
+        if not names:
+            return metaspec
+        columns = self._patch_columns(metaspec, names)
+        key = {"id": metaspec.id, "version": metaspec.version}
+        if await self._db.write(
+            lambda connection: patch_row(
+                connection, "metaspecs", metaspec, columns, key=key
+            )
+        ):
+            metaspec.revision += 1
+        return metaspec
+
+    async def delete(self, metaspec_id: str) -> None:
+        """Remove a metaspec and all of its versions."""
+        await self._db.write(
+            lambda connection: connection.execute(
+                "DELETE FROM metaspecs WHERE id = ?", (metaspec_id,)
+            )
+        )
+
+    async def create_many(self, metaspecs: List[Metaspec]) -> BulkWriteResult:
+        """Persist many new metaspecs in one transaction."""
+
+        def insert(connection: sqlite3.Connection) -> BulkWriteResult:
+            errors = {
+                index: DUPLICATE_ERROR
+                for index, metaspec in enumerate(metaspecs)
+                if not self._insert_new(connection, metaspec)
+            }
+            return bulk_result([metaspec.id for metaspec in metaspecs], errors)
+
+        return await self._db.write(insert)
+
+    async def update_many(self, metaspecs: List[Metaspec]) -> BulkWriteResult:
+        """Same rules as update(), in one transaction; unknown ids fail."""
+
+        def update(connection: sqlite3.Connection) -> BulkWriteResult:
+            errors: Dict[int, str] = {}
+            for index, metaspec in enumerate(metaspecs):
+                try:
+                    if not self._write_version(connection, metaspec):
+                        errors[index] = NOT_FOUND_ERROR
+                except RevisionConflictError:
+                    errors[index] = REVISION_CONFLICT_ERROR
+            return bulk_result([metaspec.id for metaspec in metaspecs], errors)
+
+        result = await self._db.write(update)
+        for metaspec, item in zip(metaspecs, result.items):
+            if item.ok:
+                metaspec.revision += 1
+        return result
+
+    async def delete_many(self, metaspec_ids: List[str]) -> BulkWriteResult:
+        """Remove many metaspecs (all versions) in one transaction."""
+        return await self._db.write(
+            lambda connection: delete_rows(connection, "metaspecs", metaspec_ids)
+        )
+
+    async def _list(self, select, demand_id, after, limit, convert) -> Page:
+        """Keyset page of a demand's latest metaspecs (see fetch_page)."""
+        return await self._db.read(
+            lambda connection: fetch_page(
+                connection,
+                select,
+                "demand_id = ? AND latest = 1",
+                (demand_id,),
+                "version",
+                after,
+                limit,
+                convert,
+            )
+        )
+
+    def _insert_new(self, connection: sqlite3.Connection, metaspec: Metaspec) -> bool:
+        """Insert a metaspec as latest unless its id exists (transaction)."""
+        exists = connection.execute(
+            "SELECT 1 FROM metaspecs WHERE id = ? LIMIT 1", (metaspec.id,)
+        ).fetchone()
+        if exists is not None:
+            return False
+        connection.execute(
+            UPSERT, self._to_row(metaspec, latest=True, revision=metaspec.revision)
+        )
+        return True
+
+    def _write_version(
+        self, connection: sqlite3.Connection, metaspec: Metaspec
+    ) -> bool:
+        """
+        Apply the versioning rules of update() (inside a transaction).
+
+        Returns:
+            False if the metaspec does not exist
+
+        Raises:
+            RevisionConflictError: If the row being superseded is not at
+                metaspec.revision
+        """
+        current = connection.execute(
+            "SELECT version FROM metaspecs WHERE id = ? AND latest = 1",
+            (metaspec.id,),
+        ).fetchone()
+        if current is None:
+            return False
+
+        # A higher version supersedes the latest row, others the row itself
+        # (an older version missing from history is simply added)
+        superseded = connection.execute(
+            "SELECT revision FROM metaspecs WHERE id = ? AND version = ?",
+            (metaspec.id, min(metaspec.version, current["version"])),
+        ).fetchone()
+        if superseded is not None and superseded["revision"] != metaspec.revision:
+            raise RevisionConflictError(
+                "Metaspec", metaspec.id, metaspec.revision, superseded["revision"]
+            )
+
+        if metaspec.version > current["version"]:
+            connection.execute(
+                "UPDATE metaspecs SET latest = 0, revision = revision + 1 "
+                "WHERE id = ? AND latest = 1",
+                (metaspec.id,),
+            )
+        # Higher or same version becomes latest; older rewrites history only
+        latest = metaspec.version >= current["version"]
+        connection.execute(
+            UPSERT,
+            self._to_row(metaspec, latest=latest, revision=metaspec.revision + 1),
+        )
+        return True
+
+    async def _load_content(self, metaspec_id: str, version: int) -> str:
+        """
+        Read only the content of one metaspec version.
+
+        Raises:
+            RepositoryError: If the metaspec was removed meanwhile
+        """
+        row = await self._db.read(
+            lambda connection: connection.execute(
+                "SELECT content FROM metaspecs WHERE id = ? AND version = ?",
+                (metaspec_id, version),
+            ).fetchone()
+        )
+        if row is None:
+            raise RepositoryError(f"Metaspec '{metaspec_id}' no longer exists")
+        return row["content"]
+
+    def _to_row(self, metaspec: Metaspec, latest: bool, revision: int) -> tuple:
+        """Parameters of UPSERT."""
+        return (
+            metaspec.id,
+            metaspec.version,
+            metaspec.demand_id,
+            metaspec.type.value,
+            metaspec.content,
+            int(latest),
+            to_text(metaspec.created_at),
+            to_text(metaspec.updated_at),
+            revision,
+        )
+
+    def _patch_columns(
+        self, metaspec: Metaspec, names: Iterable[str]
+    ) -> Dict[str, Any]:
+        """Column values written by patch() for some attributes."""
+        columns: Dict[str, Any] = {}
+        for name in names:
+            if name == "type":
+                columns["type"] = metaspec.type.value
+            elif name in ("created_at", "updated_at"):
+                columns[name] = to_text(getattr(metaspec, name))
+            else:
+                columns[name] = getattr(metaspec, name)
+        return columns
+
+    def _to_entity(self, row: sqlite3.Row) -> Metaspec:
+        return Metaspec.from_trusted(
+            id=row["id"],
+            demand_id=row["demand_id"],
+            type=MetaspecType(row["type"]),
+            content=row["content"],
+            version=row["version"],
+            created_at=from_text(row["created_at"]),
+            updated_at=from_text(row["updated_at"]),
+            revision=row["revision"],
+        )
+
+    def _to_summary(self, row: sqlite3.Row) -> MetaspecSummary:
+        return MetaspecSummary(
+            id=row["id"],
+            demand_id=row["demand_id"],
+            type=MetaspecType(row["type"]),
+            version=row["version"],
+            created_at=from_text(row["created_at"]),
+            updated_at=from_text(row["updated_at"]),
+            revision=row["revision"],
+        )
@@ -0,0 +1,69 @@
+"""
+SQLite Keyset Pagination
+
+Same ordering and cursor format as the MongoDB repositories: newest (or
+highest) first by (sort_column, id), using a row-value comparison that
+the (…, sort_column, id) indexes serve without OFFSET.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import sqlite3
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+from application.dto.page import Page
+from infrastructure.persistence.pagination import (
+    decode_cursor,
+    encode_cursor,
+    validate_limit,
+)
+from infrastructure.persistence.sqlite.sqlite_database import to_text
+
+
+def fetch_page(
+    connection: sqlite3.Connection,
+    select: str,
+    where: str,
+    parameters: tuple,
+    sort_column: str,
+    after: Optional[str],
+    limit: int,
+    convert: Callable[[sqlite3.Row], Any],
+) -> Page:
+    """
+    Fetch one keyset page.
+
+    Args:
+        connection: Database connection
+        select: "SELECT <columns> FROM <table>" (trusted SQL)
+        where: Filter for the listing, e.g. "project_id = ?" (trusted SQL)
+        parameters: Parameters of where
+        sort_column: Column sorted on (its entity attribute has the same name)
+        after: Cursor of the previous page, None for the first page
+        limit: Page size
+        convert: Row -> item (entity or summary)
+
+    Returns:
+        Page of converted rows
+
+    Raises:
+        ValueError: If limit or cursor is invalid
+    """
+    validate_limit(limit)
+    sql = f"{select} WHERE {where}"
+    if after is not None:
+        value, last_id = decode_cursor(after)
+        if isinstance(value, datetime):
+            value = to_text(value)
+        sql += f" AND ({sort_column}, id) < (?, ?)"
+        parameters = parameters + (value, last_id)
+    sql += f" ORDER BY {sort_column} DESC, id DESC LIMIT ?"
+
+    rows = connection.execute(sql, parameters + (limit + 1,)).fetchall()
+    items = [convert(row) for row in rows[:limit]]
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor(getattr(last, sort_column), last.id)
+    return Page(items=items, next_cursor=next_cursor)
@@ -0,0 +1,283 @@
+"""
+SQLiteProjectRepository Implementation
+
+SQLite adapter for Project persistence (single-box installs).
+Implements IProjectRepository interface from Application Layer.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from application.dto.bulk_write_result import BulkWriteResult
+from application.dto.page import DEFAULT_PAGE_SIZE, Page
+from application.exceptions import DuplicateEntityError, ProjectNotFoundError
+from application.interfaces.i_project_repository import IProjectRepository
+from domain.entities.project import Project
+from domain.exceptions import ContextBudgetExceededError
+from domain.value_objects.context_budget import ContextBudget
+from infrastructure.persistence.field_patches import patch_fields
+from infrastructure.persistence.sqlite.sqlite_bulk import (
+    chunks,
+    delete_rows,
+    insert_rows,
+    placeholders,
+    update_rows,
+)
+from infrastructure.persistence.sqlite.sqlite_database import (
+    SQLiteDatabase,
+    from_text,
+    to_text,
+)
+from infrastructure.persistence.sqlite.sqlite_pagination import fetch_page
+from infrastructure.persistence.sqlite.sqlite_revision import (
+    patch_row,
+    raise_on_conflict,
+)
+
+SELECT = "SELECT * FROM projects"
+
+INSERT = (
+    "INSERT OR IGNORE INTO projects (name, description, owner_id, max_tokens, "
+    "used_tokens, created_at, updated_at, id, revision) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+UPDATE = (
+    "UPDATE projects SET name = ?, description = ?, owner_id = ?, "
+    "max_tokens = ?, used_tokens = ?, created_at = ?, updated_at = ?, "
+    "revision = revision + 1 WHERE id = ? AND revision = ?"
+)
+
+
+class SQLiteProjectRepository(IProjectRepository):
+    """SQLite implementation of IProjectRepository"""
+
+    def __init__(self, database: SQLiteDatabase):
+        """
+        Initialize SQLite repository.
+
+        Args:
+            database: Shared SQLiteDatabase
+        """
+        self._db = database
+
+    async def create(self, project: Project) -> Project:
+        """
+        Persist a new project.
+
+        Raises:
+            DuplicateEntityError: If a project with the same ID exists
+        """
+        row = self._to_row(project)
+
+        def insert(connection: sqlite3.Connection) -> None:
+            if connection.execute(INSERT, row).rowcount == 0:
+                raise DuplicateEntityError(f"Project '{project.id}' already exists")
+
+        await self._db.write(insert)
+        return project
+
+    async def get_by_id(self, project_id: str) -> Optional[Project]:
+        """Retrieve a project by its UUID."""
+        row = await self._db.read(
+            lambda connection: connection.execute(
+                f"{SELECT} WHERE id = ?", (project_id,)
+            ).fetchone()
+        )
+        return None if row is None else self._to_entity(row)
+
+    async def get_many(self, project_ids: List[str]) -> Dict[str, Project]:
+        """Retrieve many projects; ids not found are absent."""
+
+        def select(connection: sqlite3.Connection) -> list:
+            rows = []
+            for chunk in chunks(list(dict.fromkeys(project_ids))):
+                rows += connection.execute(
+                    f"{SELECT} WHERE id IN ({placeholders(len(chunk))})", chunk
+                ).fetchall()
+            return rows
+
+        rows = await self._db.read(select)
+        return {row["id"]: self._to_entity(row) for row in rows}
+
+    async def list_by_owner(
+        self,
+        owner_id: str,
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[Project]:
+        """
+        List an owner's projects, newest first (keyset pagination).
+
+        Served by the (owner_id, created_at, id) index.
+
+        Raises:
+            ValueError: If limit or cursor is invalid
+        """
+        return await self._db.read(
+            lambda connection: fetch_page(
+                connection,
+                SELECT,
+                "owner_id = ?",
+                (owner_id,),
+                "created_at",
+                after,
+                limit,
+                self._to_entity,
+            )
+        )
+
+    async def update(self, project: Project) -> Project:
+        """
+        Replace a stored project if nobody saved it since it was read
+        (no-op if it does not exist).
+
+        Raises:
+            RevisionConflictError: If the stored revision is not project.revision
+        """
+        row = self._to_row(project)
+
+        def update(connection: sqlite3.Connection) -> bool:
+            if connection.execute(UPDATE, row).rowcount == 1:
+                return True
+            raise_on_conflict(
+                connection, "projects", "Project", project.id, project.revision
+            )
+            return False
+
+        if await self._db.write(update):
+            project.revision += 1
+        return project
+
+    async def patch(self, project: Project, fields: Iterable[str]) -> Project:
+        """
+        UPDATE only the columns of some attributes (no-op if missing).
+
+        Raises:
+            ValueError: If a field is unknown or protected
+            RevisionConflictError: If the stored revision is not project.revision
+        """
+        names = patch_fields(project, fields)
+        if not names:
+            return project
+        columns = self._patch_columns(project, names)
+        if await self._db.write(
+            lambda connection: patch_row(connection, "projects", project, columns)
+        ):
+            project.revision += 1
+        return project
+
+    async def delete(self, project_id: str) -> None:
+        """Remove a project (no-op if it does not exist)."""
+        await self._db.write(
+            lambda connection: connection.execute(
+                "DELETE FROM projects WHERE id = ?", (project_id,)
+            )
+        )
+
+    async def create_many(self, projects: List[Project]) -> BulkWriteResult:
+        """Persist many new projects in one transaction."""
+        ids = [project.id for project in projects]
+        rows = [self._to_row(project) for project in projects]
+        return await self._db.write(
+            lambda connection: insert_rows(connection, INSERT, ids, rows)
+        )
+
+    async def update_many(self, projects: List[Project]) -> BulkWriteResult:
+        """Update many projects in one transaction; unknown ids fail."""
+        ids = [project.id for project in projects]
+        rows = [self._to_row(project) for project in projects]
+        result = await self._db.write(
+            lambda connection: update_rows(connection, UPDATE, "projects", ids, rows)
+        )
+        for project, item in zip(projects, result.items):
+            if item.ok:
+                project.revision += 1
+        return result
+
+    async def delete_many(self, project_ids: List[str]) -> BulkWriteResult:
+        """Remove many projects in one transaction."""
+        return await self._db.write(
+            lambda connection: delete_rows(connection, "projects", project_ids)
+        )
+
+    async def consume_tokens(self, project_id: str, tokens: int) -> ContextBudget:
+        """
+        Charge tokens to a project's budget with one conditional UPDATE.
+
+        Raises:
+            ValueError: If tokens < 0
+            ContextBudgetExceededError: If the budget has not enough tokens left
+            ProjectNotFoundError: If project does not exist
+        """
+        if tokens < 0:
+            raise ValueError("tokens must be >= 0")
+
+        def consume(connection: sqlite3.Connection) -> ContextBudget:
+            updated = connection.execute(
+                "UPDATE projects SET used_tokens = used_tokens + ?, updated_at = ?, "
+                "revision = revision + 1 "
+                "WHERE id = ? AND used_tokens + ? <= max_tokens "
+                "RETURNING max_tokens, used_tokens",
+                (tokens, to_text(datetime.utcnow()), project_id, tokens),
+            ).fetchone()
+            if updated is not None:
+                return ContextBudget.from_trusted(
+                    max_tokens=updated["max_tokens"],
+                    used_tokens=updated["used_tokens"],
+                )
+
+            row = connection.execute(f"{SELECT} WHERE id = ?", (project_id,)).fetchone()
+            if row is None:
+                raise ProjectNotFoundError(f"Project '{project_id}' not found")
+            remaining = row["max_tokens"] - row["used_tokens"]
+            raise ContextBudgetExceededError(
+                f"Cannot consume {tokens} tokens from project '{row['name']}'. "
+                f"Only {remaining} remaining."
+            )
+
+        return await self._db.write(consume)
+
+    def _to_row(self, project: Project) -> tuple:
+        """Statement parameters for INSERT / UPDATE (id, revision last)."""
+        return (
+            project.name,
+            project.description,
+            project.owner_id,
+            project.context_budget.max_tokens,
+            project.context_budget.used_tokens,
+            to_text(project.created_at),
+            to_text(project.updated_at),
+            project.id,
+            project.revision,
+        )
+
+    def _patch_columns(self, project: Project, names: Iterable[str]) -> Dict[str, Any]:
+        """Column values written by patch() for some attributes."""
+        columns: Dict[str, Any] = {}
+        for name in names:
+            if name == "context_budget":
+                columns["max_tokens"] = project.context_budget.max_tokens
+                columns["used_tokens"] = project.context_budget.used_tokens
+            elif name in ("created_at", "updated_at"):
+                columns[name] = to_text(getattr(project, name))
+            else:
+                columns[name] = getattr(project, name)
+        return columns
+
+    def _to_entity(self, row: sqlite3.Row) -> Project:
+        return Project.from_trusted(
+            id=row["id"],
+            name=row["name"],
+            description=row["description"],
+            owner_id=row["owner_id"],
+            context_budget=ContextBudget.from_trusted(
+                max_tokens=row["max_tokens"], used_tokens=row["used_tokens"]
+            ),
+            created_at=from_text(row["created_at"]),
+            updated_at=from_text(row["updated_at"]),
+            revision=row["revision"],
+        )
@@ -0,0 +1,91 @@
+"""
+SQLite Optimistic Concurrency Helpers
+
+Every entity row has a revision that each write increments. UPDATE
+statements end with "revision = revision + 1 WHERE id = ? AND revision = ?",
+so they only change a row still at the revision the caller read; when
+nothing matches, another writer saved the entity first (or it was
+deleted).
+
+patch_row() applies the same check to an UPDATE of a few columns.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import sqlite3
+from typing import Any, Dict, Optional
+
+from application.exceptions import RevisionConflictError
+
+
+def raise_on_conflict(
+    connection: sqlite3.Connection,
+    table: str,
+    entity_type: str,
+    entity_id: str,
+    expected: int,
+) -> None:
+    """
+    Explain an UPDATE whose revision check matched nothing.
+
+    Returns quietly when the row does not exist (updates of missing
+    entities are no-ops).
+
+    Args:
+        connection: Connection inside the write transaction
+        table: Table name (trusted, not user input)
+        entity_type: Entity class name for the error message
+        entity_id: Entity UUID string
+        expected: Revision the caller read
+
+    Raises:
+        RevisionConflictError: If the row exists at another revision
+    """
+    row = connection.execute(
+        f"SELECT revision FROM {table} WHERE id = ?", (entity_id,)
+    ).fetchone()
+    if row is not None:
+        raise RevisionConflictError(entity_type, entity_id, expected, row[0])
+
+
+def patch_row(
+    connection: sqlite3.Connection,
+    table: str,
+    entity: Any,
+    columns: Dict[str, Any],
+    key: Optional[Dict[str, Any]] = None,
+) -> bool:
+    """
+    Revision-checked UPDATE of some columns of one row.
+
+    Args:
+        connection: Connection inside the write transaction
+        table: Table name (trusted, not user input)
+        entity: Entity being patched (id and revision read)
+        columns: Column name (trusted) -> value to write
+        key: Columns identifying the row (default: id)
+
+    Returns:
+        False if the row does not exist
+
+    Raises:
+        RevisionConflictError: If the row exists at another revision
+    """
+    key = key or {"id": entity.id}
+    where = " AND ".join(f"{column} = ?" for column in key)
+    assignments = "".join(f"{column} = ?, " for column in columns)
+    updated = connection.execute(
+        f"UPDATE {table} SET {assignments}revision = revision + 1 "
+        f"WHERE {where} AND revision = ?",
+        (*columns.values(), *key.values(), entity.revision),
+    )
+    if updated.rowcount == 1:
+        return True
+    row = connection.execute(
+        f"SELECT revision FROM {table} WHERE {where}", tuple(key.values())
+    ).fetchone()
+    if row is not None:
+        raise RevisionConflictError(
+            type(entity).__name__, entity.id, entity.revision, row[0]
+        )
+    return False
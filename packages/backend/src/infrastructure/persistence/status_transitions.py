@@ -0,0 +1,42 @@
+"""
+Batched Status Transitions
+
+Backend-neutral part of IDemandRepository.transition_many: items that can
+be rejected before touching storage (invalid pairs, a demand listed
+twice). Every backend then applies the remaining items as conditional
+updates filtered on from_status.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+from typing import Dict, List, Set
+
+from application.dto.status_transition import StatusTransition
+from domain.exceptions import DomainException
+
+DUPLICATE_TRANSITION_ERROR = "demand already transitioned in this batch"
+
+
+def rejected_transitions(transitions: List[StatusTransition]) -> Dict[int, str]:
+    """
+    Errors of the items that must not be written, by item index.
+
+    Args:
+        transitions: Items of a transition_many call
+
+    Returns:
+        Item index -> error message (validation message, or
+        DUPLICATE_TRANSITION_ERROR for repeated demand ids)
+    """
+    errors: Dict[int, str] = {}
+    seen: Set[str] = set()
+    for index, transition in enumerate(transitions):
+        try:
+            transition.from_status.validate_transition(transition.to_status)
+        except DomainException as exc:
+            errors[index] = str(exc)
+            continue
+        if transition.demand_id in seen:
+            errors[index] = DUPLICATE_TRANSITION_ERROR
+        seen.add(transition.demand_id)
+    return errors
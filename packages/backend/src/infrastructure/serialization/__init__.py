@@ -0,0 +1,40 @@
+"""
+Serialization
+
+Compiled codecs for domain entities (BSON documents, JSON API payloads,
+checkpoint snapshots).
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+from infrastructure.serialization.entity_codecs import (
+    CHECKPOINT_CODEC,
+    CONTEXT_BUDGET_CODEC,
+    DEMAND_CODEC,
+    JSON_BACKEND,
+    METASPEC_CODEC,
+    PROJECT_CODEC,
+    EntityCodec,
+    FieldSpec,
+    codec_for,
+    dumps_json,
+    dumps_snapshot,
+    loads_json,
+    loads_snapshot,
+)
+
+__all__ = [
+    "CHECKPOINT_CODEC",
+    "CONTEXT_BUDGET_CODEC",
+    "DEMAND_CODEC",
+    "JSON_BACKEND",
+    "METASPEC_CODEC",
+    "PROJECT_CODEC",
+    "EntityCodec",
+    "FieldSpec",
+    "codec_for",
+    "dumps_json",
+    "dumps_snapshot",
+    "loads_json",
+    "loads_snapshot",
+]
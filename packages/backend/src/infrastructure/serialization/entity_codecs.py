@@ -0,0 +1,448 @@
+"""
+Entity Codecs
+
+One place for converting domain objects to and from their wire formats:
+- BSON documents (MongoDB repositories)
+- JSON API payloads (FastAPI responses / request bodies)
+- Checkpoint snapshots (JSON text)
+
+Each EntityCodec is declared once from a list of FieldSpecs and compiles
+its encode/decode functions on construction (one dict literal per entity
+instead of per-call field loops). JSON goes through orjson when installed,
+then msgspec, then the standard library.
+
+Documents read from storage are hydrated with from_trusted (no
+revalidation); payloads from clients go through the validating
+constructor. to_update encodes only some attributes, for partial
+MongoDB updates.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import dataclasses
+import functools
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from domain.entities.checkpoint import Checkpoint
+from domain.entities.demand import Demand
+from domain.entities.metaspec import Metaspec, MetaspecType
+from domain.entities.project import Project
+from domain.value_objects.context_budget import ContextBudget
+from domain.value_objects.demand_status import DemandStatus
+
+try:  # Optional fast JSON
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+try:  # Optional fast JSON
+    import msgspec
+except ImportError:  # pragma: no cover - depends on environment
+    msgspec = None
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """
+    How one entity attribute is encoded.
+
+    Attributes:
+        name: Attribute name (also the JSON payload key)
+        key: BSON document key (defaults to name)
+        nested: Codec of a nested value object
+        enum: Enum class stored by value
+        timestamp: datetime, parsed from ISO 8601 in JSON payloads
+        optional: May be None; omitted from BSON documents when None
+        stored: False when the repository stores the field itself
+            (from_document then takes it as a keyword argument)
+        default: Decoded when the key is absent from a stored document
+            (documents written before the field existed)
+    """
+
+    name: str
+    key: Optional[str] = None
+    nested: Optional["EntityCodec"] = None
+    enum: Optional[type] = None
+    timestamp: bool = False
+    optional: bool = False
+    stored: bool = True
+    default: Any = None
+
+    @property
+    def document_key(self) -> str:
+        return self.key or self.name
+
+
+class EntityCodec:
+    """Compiled encoders/decoders for one entity or value object"""
+
+    def __init__(self, cls: type, fields: List[FieldSpec]):
+        """
+        Compile codec functions.
+
+        Args:
+            cls: Dataclass to encode (must provide from_trusted)
+            fields: Encoded attributes, in document order
+        """
+        self.cls = cls
+        self.fields = tuple(fields)
+        self._by_name = {spec.name: spec for spec in self.fields}
+        namespace = _compile(cls, self.fields)
+        self.to_document: Callable[..., dict] = namespace["to_document"]
+        self.from_document: Callable[..., Any] = namespace["from_document"]
+        self.to_payload: Callable[[Any], dict] = namespace["to_payload"]
+        self.from_payload: Callable[[dict], Any] = namespace["from_payload"]
+
+    def to_update(self, entity: Any, names: Iterable[str]) -> dict:
+        """
+        MongoDB $set/$unset writing only some attributes of an entity.
+
+        Args:
+            entity: Instance of the codec's class
+            names: Stored attribute names to write
+
+        Returns:
+            Update document; optional attributes that are None are unset
+
+        Raises:
+            ValueError: If a name is not a stored field of the codec
+        """
+        document = self.to_document(entity)
+        update: Dict[str, dict] = {}
+        for name in names:
+            spec = self._by_name.get(name)
+            if spec is None or not spec.stored:
+                raise ValueError(
+                    f"{self.cls.__name__} has no stored field '{name}' to update"
+                )
+            key = spec.document_key
+            if key in document:
+                update.setdefault("$set", {})[key] = document[key]
+            else:
+                update.setdefault("$unset", {})[key] = ""
+        return update
+
+    def to_json(self, entity: Any) -> bytes:
+        """
+        Encode an entity as a JSON API payload.
+
+        Args:
+            entity: Instance of the codec's class
+
+        Returns:
+            UTF-8 JSON bytes
+        """
+        return dumps_json(self.to_payload(entity))
+
+    def from_json(self, data: Union[bytes, str]) -> Any:
+        """
+        Decode (and validate) an entity from a JSON API payload.
+
+        Args:
+            data: JSON bytes or text
+
+        Returns:
+            Entity built through its validating constructor
+        """
+        return self.from_payload(loads_json(data))
+
+
+def _compile(cls: type, fields: tuple) -> Dict[str, Any]:
+    """Generate the four codec functions for cls (see EntityCodec)."""
+    namespace: Dict[str, Any] = {
+        "_cls": cls,
+        "_from_trusted": cls.from_trusted,
+        "_parse_datetime": _parse_datetime,
+    }
+    to_document = []
+    to_document_optional = []
+    from_document_locals = []
+    from_document = []
+    to_payload = []
+    from_payload = []
+    parameters = []
+
+    for spec in fields:
+        name, key = spec.name, spec.document_key
+        value = f"entity.{name}"
+        if spec.nested is not None:
+            namespace[f"_nested_{name}"] = spec.nested
+            encode = f"_nested_{name}.to_document({value})"
+            send = f"_nested_{name}.to_payload({value})"
+            decode = f"_nested_{name}.from_document({{}})"
+            parse = f"_nested_{name}.from_payload({{}})"
+        elif spec.enum is not None:
+            namespace[f"_enum_{name}"] = spec.enum
+            encode = send = f"{value}.value"
+            decode = parse = f"_enum_{name}({{}})"
+        else:
+            encode = send = value
+            decode = "{}"
+            parse = "_parse_datetime({})" if spec.timestamp else "{}"
+
+        # Encoding: BSON document and JSON payload
+        if spec.optional and send != value:
+            send = f"None if {value} is None else {send}"
+        to_payload.append(f"        {name!r}: {send},")
+        if spec.stored and spec.optional:
+            to_document_optional += [
+                f"    if {value} is not None:",
+                f"        document[{key!r}] = {encode}",
+            ]
+        elif spec.stored:
+            to_document.append(f"        {key!r}: {encode},")
+
+        # Decoding from BSON (trusted)
+        if not spec.stored:
+            parameters.append(name)
+            from_document.append(f"        {name}={name},")
+        elif spec.optional and decode != "{}":
+            from_document_locals.append(f"    {name} = document.get({key!r})")
+            decoded = decode.format(name)
+            from_document.append(
+                f"        {name}=None if {name} is None else {decoded},"
+            )
+        else:
+            if spec.default is not None:
+                raw = f"document.get({key!r}, {spec.default!r})"
+            elif spec.optional:
+                raw = f"document.get({key!r})"
+            else:
+                raw = f"document[{key!r}]"
+            from_document.append(f"        {name}={decode.format(raw)},")
+
+        # Decoding from JSON (validated); absent keys keep the field default
+        parsed = parse.format("value")
+        if parsed != "value":
+            parsed = f"None if value is None else {parsed}"
+        from_payload += [
+            f"    if {name!r} in payload:",
+            f"        value = payload[{name!r}]",
+            f"        values[{name!r}] = {parsed}",
+        ]
+
+    signature = "document"
+    if parameters:
+        signature += ", *, " + ", ".join(parameters)
+    source = "\n".join(
+        [
+            "def to_document(entity):",
+            "    document = {",
+            *to_document,
+            "    }",
+            *to_document_optional,
+            "    return document",
+            "",
+            f"def from_document({signature}):",
+            *from_document_locals,
+            "    return _from_trusted(",
+            *from_document,
+            "    )",
+            "",
+            "def to_payload(entity):",
+            "    return {",
+            *to_payload,
+            "    }",
+            "",
+            "def from_payload(payload):",
+            "    values = {}",
+            *from_payload,
+            "    return _cls(**values)",
+        ]
+    )
+    exec(source, namespace)
+    return namespace
+
+
+def _parse_datetime(value: Union[str, datetime]) -> datetime:
+    """ISO 8601 string (or datetime) from a JSON payload."""
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+CONTEXT_BUDGET_CODEC = EntityCodec(
+    ContextBudget,
+    [FieldSpec("max_tokens"), FieldSpec("used_tokens")],
+)
+
+PROJECT_CODEC = EntityCodec(
+    Project,
+    [
+        FieldSpec("id"),
+        FieldSpec("name"),
+        FieldSpec("description"),
+        FieldSpec("owner_id", key="user_id"),  # MongoDB schema uses user_id
+        FieldSpec("context_budget", nested=CONTEXT_BUDGET_CODEC),
+        FieldSpec("created_at", timestamp=True),
+        FieldSpec("updated_at", timestamp=True, optional=True),
+        FieldSpec("revision", default=0),
+    ],
+)
+
+DEMAND_CODEC = EntityCodec(
+    Demand,
+    [
+        FieldSpec("id"),
+        FieldSpec("project_id"),
+        FieldSpec("title"),
+        FieldSpec("description"),
+        FieldSpec("status", enum=DemandStatus),
+        FieldSpec("context_budget", nested=CONTEXT_BUDGET_CODEC, optional=True),
+        FieldSpec("created_at", timestamp=True),
+        FieldSpec("updated_at", timestamp=True, optional=True),
+        FieldSpec("revision", default=0),
+    ],
+)
+
+METASPEC_CODEC = EntityCodec(
+    Metaspec,
+    [
+        FieldSpec("id"),
+        FieldSpec("demand_id"),
+        FieldSpec("type", enum=MetaspecType),
+        FieldSpec("content"),
+        FieldSpec("version"),
+        FieldSpec("created_at", timestamp=True),
+        FieldSpec("updated_at", timestamp=True, optional=True),
+        FieldSpec("revision", default=0),
+    ],
+)
+
+CHECKPOINT_CODEC = EntityCodec(
+    Checkpoint,
+    [
+        FieldSpec("id"),
+        FieldSpec("demand_id"),
+        # Stored compressed / as a delta by the repository
+        FieldSpec("context_snapshot", stored=False),
+        FieldSpec("tokens_used"),
+        FieldSpec("created_at", timestamp=True),
+        FieldSpec("expires_at", timestamp=True, optional=True),  # TTL index
+        FieldSpec("revision", default=0),
+    ],
+)
+
+_CODECS: Dict[type, EntityCodec] = {
+    codec.cls: codec
+    for codec in (
+        CONTEXT_BUDGET_CODEC,
+        PROJECT_CODEC,
+        DEMAND_CODEC,
+        METASPEC_CODEC,
+        CHECKPOINT_CODEC,
+    )
+}
+
+
+def codec_for(cls: type) -> EntityCodec:
+    """
+    Codec registered for an entity or value object class.
+
+    Args:
+        cls: Domain class (e.g. Project)
+
+    Returns:
+        EntityCodec for cls
+
+    Raises:
+        KeyError: If no codec is registered for cls
+    """
+    return _CODECS[cls]
+
+
+def _json_default(value: Any) -> Any:
+    """Fallback for values the JSON backend cannot encode natively."""
+    codec = _CODECS.get(type(value))
+    if codec is not None:
+        return codec.to_payload(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            item.name: getattr(value, item.name) for item in dataclasses.fields(value)
+        }
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    JSON_BACKEND = "orjson"
+    # Dataclasses go through _json_default so entities use their codec
+    _encode = functools.partial(
+        orjson.dumps, default=_json_default, option=orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+    _decode = orjson.loads
+elif msgspec is not None:  # pragma: no cover - depends on environment
+    JSON_BACKEND = "msgspec"
+    _encode = msgspec.json.Encoder(enc_hook=_json_default).encode
+    _decode = msgspec.json.Decoder().decode
+else:  # pragma: no cover - depends on environment
+    JSON_BACKEND = "json"
+    _encoder = json.JSONEncoder(
+        default=_json_default, separators=(",", ":"), ensure_ascii=False
+    )
+
+    def _encode(value: Any) -> bytes:
+        return _encoder.encode(value).encode("utf-8")
+
+    _decode = json.loads
+
+
+def dumps_json(value: Any) -> bytes:
+    """
+    Encode a value as compact UTF-8 JSON.
+
+    Domain entities use their registered codec; datetimes are ISO 8601.
+
+    Args:
+        value: JSON-compatible value (may contain entities)
+
+    Returns:
+        JSON bytes
+    """
+    return _encode(value)
+
+
+def loads_json(data: Union[bytes, str]) -> Any:
+    """
+    Decode JSON bytes or text.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Decoded value
+    """
+    return _decode(data)
+
+
+def dumps_snapshot(value: Any) -> str:
+    """
+    Serialize a checkpoint context snapshot.
+
+    Args:
+        value: Snapshot structure (dict/list)
+
+    Returns:
+        JSON text for Checkpoint.context_snapshot
+    """
+    return dumps_json(value).decode("utf-8")
+
+
+def loads_snapshot(snapshot: Union[bytes, str]) -> Any:
+    """
+    Parse a checkpoint context snapshot.
+
+    Args:
+        snapshot: Checkpoint.context_snapshot (JSON text)
+
+    Returns:
+        Snapshot structure
+    """
+    return loads_json(snapshot)
@@ -0,0 +1,5 @@
+"""
+HTTP API
+
+FastAPI dependencies and (later) routers.
+"""
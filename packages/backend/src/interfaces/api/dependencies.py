@@ -0,0 +1,100 @@
+"""
+API Dependencies
+
+Repositories are built once per application (in the lifespan) on top of
+the shared Motor client and handed to routes through FastAPI Depends, so
+per-repository caches live as long as the process.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from fastapi import Request
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from application.interfaces.i_checkpoint_repository import ICheckpointRepository
+from application.interfaces.i_demand_repository import IDemandRepository
+from application.interfaces.i_metaspec_repository import IMetaspecRepository
+from application.interfaces.i_project_repository import IProjectRepository
+from infrastructure.config.settings import MongoSettings
+from infrastructure.persistence.mongodb import (
+    MongoCheckpointRepository,
+    MongoDemandRepository,
+    MongoMetaspecRepository,
+    MongoProjectRepository,
+)
+from infrastructure.persistence.mongodb.mongo_pool_stats import (
+    MongoPoolStats,
+    PoolStatsSnapshot,
+)
+
+
+@dataclass
+class Repositories:
+    """Application-wide repository instances"""
+
+    projects: IProjectRepository
+    demands: IDemandRepository
+    metaspecs: IMetaspecRepository
+    checkpoints: ICheckpointRepository
+
+    @classmethod
+    def for_database(
+        cls, database: AsyncIOMotorDatabase, settings: Optional[MongoSettings] = None
+    ) -> "Repositories":
+        """
+        Build the MongoDB repositories.
+
+        Args:
+            database: Motor database of the shared client
+            settings: Source of the checkpoint codec and keyframe interval
+                (None: repository defaults)
+
+        Returns:
+            Repositories
+        """
+        checkpoint_options = {}
+        if settings is not None:
+            checkpoint_options = {
+                "codec": settings.checkpoint_codec,
+                "keyframe_interval": settings.checkpoint_keyframe_interval,
+            }
+        return cls(
+            projects=MongoProjectRepository(database),
+            demands=MongoDemandRepository(database),
+            metaspecs=MongoMetaspecRepository(database),
+            checkpoints=MongoCheckpointRepository(database, **checkpoint_options),
+        )
+
+
+def get_repositories(request: Request) -> Repositories:
+    """Repositories created by the application lifespan."""
+    return request.app.state.repositories
+
+
+def get_project_repository(request: Request) -> IProjectRepository:
+    """Dependency: project repository."""
+    return get_repositories(request).projects
+
+
+def get_demand_repository(request: Request) -> IDemandRepository:
+    """Dependency: demand repository."""
+    return get_repositories(request).demands
+
+
+def get_metaspec_repository(request: Request) -> IMetaspecRepository:
+    """Dependency: metaspec repository."""
+    return get_repositories(request).metaspecs
+
+
+def get_checkpoint_repository(request: Request) -> ICheckpointRepository:
+    """Dependency: checkpoint repository."""
+    return get_repositories(request).checkpoints
+
+
+def get_pool_stats(request: Request) -> PoolStatsSnapshot:
+    """Dependency: current MongoDB connection pool statistics."""
+    pool_stats: MongoPoolStats = request.app.state.pool_stats
+    return pool_stats.snapshot()
@@ -0,0 +1,24 @@
+"""
+JSON Responses
+
+Default response class for the API: renders through the shared entity
+codecs (orjson when installed).
+
+Only responses a route builds itself skip FastAPI's encoder. For a plain
+return value FastAPI runs jsonable_encoder first and render() just dumps
+the resulting dicts, so routes that return entities should return
+CodecJSONResponse(entity) to have them encoded by their compiled codecs.
+"""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from infrastructure.serialization.entity_codecs import dumps_json
+
+
+class CodecJSONResponse(JSONResponse):
+    """JSONResponse rendered by infrastructure.serialization"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
@@ -3,13 +3,46 @@ Context-First Platform API
 
 FastAPI application entry point.
 """
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from infrastructure.config.settings import get_mongo_settings
+from infrastructure.persistence.mongodb.mongo_client import create_mongo_client
+from infrastructure.persistence.mongodb.mongo_pool_stats import (
+    MongoPoolStats,
+    PoolStatsSnapshot,
+)
+from interfaces.api.dependencies import Repositories, get_pool_stats
+from interfaces.api.responses import CodecJSONResponse
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """One Motor client (and its connection pool) per process."""
+    settings = get_mongo_settings()
+    pool_stats = MongoPoolStats()
+    client = create_mongo_client(settings, pool_stats)
+
+    app.state.mongo_client = client
+    app.state.pool_stats = pool_stats
+    app.state.repositories = Repositories.for_database(
+        client[settings.db_name], settings
+    )
+    try:
+        yield
+    finally:
+        client.close()
+
+
 app = FastAPI(
     title="Context-First API",
     version="0.1.0",
     description="AI Development Governance & Orchestration Platform",
+    lifespan=lifespan,
+    default_response_class=CodecJSONResponse,
 )
 
 # CORS middleware
@@ -28,6 +61,12 @@ async def health():
     return {"status": "ok", "service": "context-first-api"}
 
 
+@app.get("/health/pool")
+async def pool_health(stats: PoolStatsSnapshot = Depends(get_pool_stats)):
+    """MongoDB connection pool statistics (checked-out, waiters, wait time)."""
+    return asdict(stats)
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
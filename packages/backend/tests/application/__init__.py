@@ -0,0 +1 @@
+"""Application Layer Tests"""
@@ -0,0 +1 @@
+"""Loader Tests"""
@@ -0,0 +1,122 @@
+"""
+Tests for EntityLoader
+
+Uses an in-memory fake get_many to count batched queries.
+"""
+
+import asyncio
+from typing import Dict, List
+
+import pytest
+
+from application.loaders.entity_loader import EntityLoader
+
+
+class FakeRepository:
+    """Fake repository recording every get_many call"""
+
+    def __init__(self, entities: Dict[str, str]):
+        self.entities = entities
+        self.calls: List[List[str]] = []
+        self.fail = False
+
+    async def get_many(self, ids: List[str]) -> Dict[str, str]:
+        self.calls.append(list(ids))
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        return {i: self.entities[i] for i in ids if i in self.entities}
+
+
+class TestEntityLoader:
+    """Test suite for EntityLoader"""
+
+    @pytest.fixture
+    def repository(self):
+        """Fixture: Fake repository with three entities"""
+        return FakeRepository({"a": "A", "b": "B", "c": "C"})
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_are_coalesced(self, repository):
+        """Test that loads in the same tick produce one batch query"""
+        loader = EntityLoader.for_repository(repository)
+
+        results = await asyncio.gather(
+            loader.get_by_id("a"),
+            loader.get_by_id("b"),
+            loader.get_by_id("missing"),
+        )
+
+        assert results == ["A", "B", None]
+        assert repository.calls == [["a", "b", "missing"]]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_ids_loaded_once(self, repository):
+        """Test that the same id requested twice is queried once"""
+        loader = EntityLoader.for_repository(repository)
+
+        results = await loader.load_many(["a", "a", "b"])
+
+        assert results == ["A", "A", "B"]
+        assert repository.calls == [["a", "b"]]
+
+    @pytest.mark.asyncio
+    async def test_results_are_memoized(self, repository):
+        """Test that a second tick reuses previous results"""
+        loader = EntityLoader.for_repository(repository)
+
+        await loader.get_by_id("a")
+        await loader.load_many(["a", "c"])
+
+        assert repository.calls == [["a"], ["c"]]
+
+    @pytest.mark.asyncio
+    async def test_max_batch_size_splits_batches(self, repository):
+        """Test that batches are chunked by max_batch_size"""
+        loader = EntityLoader.for_repository(repository, max_batch_size=2)
+
+        results = await loader.load_many(["a", "b", "c"])
+
+        assert results == ["A", "B", "C"]
+        assert repository.calls == [["a", "b"], ["c"]]
+
+    @pytest.mark.asyncio
+    async def test_clear_forces_reload(self, repository):
+        """Test that clear() drops memoized entities"""
+        loader = EntityLoader.for_repository(repository)
+        await loader.get_by_id("a")
+
+        repository.entities["a"] = "A2"
+        loader.clear("a")
+
+        assert await loader.get_by_id("a") == "A2"
+        assert len(repository.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_prime_skips_query(self, repository):
+        """Test that primed entities are served without querying"""
+        loader = EntityLoader.for_repository(repository)
+        loader.prime("z", "Z")
+
+        assert await loader.get_by_id("z") == "Z"
+        assert repository.calls == []
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_propagates_and_is_not_cached(self, repository):
+        """Test that a failing batch rejects all its loads and allows retry"""
+        loader = EntityLoader.for_repository(repository)
+        repository.fail = True
+
+        results = await asyncio.gather(
+            loader.get_by_id("a"),
+            loader.get_by_id("b"),
+            return_exceptions=True,
+        )
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+        repository.fail = False
+        assert await loader.get_by_id("a") == "A"
+
+    def test_invalid_max_batch_size(self, repository):
+        """Test that max_batch_size < 1 raises ValueError"""
+        with pytest.raises(ValueError, match="max_batch_size must be >= 1"):
+            EntityLoader.for_repository(repository, max_batch_size=0)
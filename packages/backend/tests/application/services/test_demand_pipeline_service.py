@@ -0,0 +1,662 @@
+"""
+Tests for DemandPipelineService
+
+Runs the real agno_agents agents on FakeModel against the in-memory
+demand repository.
+"""
+
+import asyncio
+import dataclasses
+
+import pytest
+from agno_agents.architect import ArchitectAgent
+from agno_agents.cache import CachedModel, ResponseCache
+from agno_agents.coder import CoderAgent
+from agno_agents.exceptions import TokenBudgetExceededError
+from agno_agents.models import FakeModel, ModelResponse
+from agno_agents.reviewer import (
+    CheckStatus,
+    ReviewerAgent,
+    ReviewerEnsemble,
+    default_checks,
+)
+from agno_agents.spec_writer import SpecWriterAgent
+
+from application.exceptions import DemandNotFoundError, DemandStatusConflictError
+from application.services.demand_pipeline_service import (
+    DemandPipelineService,
+    PipelineAgents,
+)
+from domain.exceptions import ContextBudgetExceededError
+from domain.value_objects.context_budget import ContextBudget
+from domain.value_objects.demand_status import DemandStatus
+from infrastructure.persistence.memory import (
+    InMemoryDemandRepository,
+    InMemoryProjectRepository,
+    InMemoryStore,
+)
+from tests.infrastructure.persistence.contract.entity_kinds import (
+    DEMANDS,
+    PARENT_ID,
+    PROJECTS,
+)
+
+APPROVING = {"reviewer": "APPROVED\nLooks good"}
+
+
+def _agents(model) -> PipelineAgents:
+    return PipelineAgents(
+        spec_writer=SpecWriterAgent(model),
+        architect=ArchitectAgent(model),
+        coder=CoderAgent(model),
+        reviewer=ReviewerAgent(model),
+    )
+
+
+class FailingCoder(CoderAgent):
+    """Coder that breaks on one spec"""
+
+    def __init__(self, model, poisoned_spec: str):
+        super().__init__(model)
+        self.poisoned_spec = poisoned_spec
+
+    async def stream_code(self, architecture, spec, budget=None):
+        if spec == self.poisoned_spec:
+            raise RuntimeError("model unavailable")
+        async for chunk in super().stream_code(architecture, spec, budget):
+            yield chunk
+
+
+class TestDemandPipelineService:
+    """Test suite for DemandPipelineService"""
+
+    @pytest.fixture
+    def repository(self):
+        """Fixture: Empty in-memory demand repository"""
+        return InMemoryDemandRepository(InMemoryStore())
+
+    async def _create(self, repository, count, projects=1):
+        demands = []
+        for index in range(count):
+            demand = DEMANDS.make(index)
+            demand.project_id = f"{PARENT_ID}_{index % projects}"
+            demands.append(demand)
+        await repository.create_many(demands)
+        return [demand.id for demand in demands]
+
+    @pytest.mark.asyncio
+    async def test_demands_run_end_to_end(self, repository):
+        """Test DRAFT -> PR_MERGED through all four agents"""
+        ids = await self._create(repository, 3, projects=3)
+        model = FakeModel(replies=APPROVING)
+
+        result = await DemandPipelineService(repository, _agents(model)).run(ids)
+
+        assert result.merged_ids == ids
+        assert not result.failures
+        outcome = result.outcomes[0]
+        assert list(outcome.artifacts) == ["spec", "architecture", "code", "review"]
+        assert outcome.artifacts["review"] == "APPROVED\nLooks good"
+        assert outcome.tokens_used > 0
+        assert result.tokens_used == sum(o.tokens_used for o in result.outcomes)
+        assert [request.agent for request in model.requests].count("coder") == 3
+        stored = await repository.get_many(ids)
+        assert {d.status for d in stored.values()} == {DemandStatus.PR_MERGED}
+
+    @pytest.mark.asyncio
+    async def test_run_is_deterministic(self):
+        """Test the same demands produce the same artifacts on every run"""
+        runs = []
+        for _ in range(2):
+            repository = InMemoryDemandRepository(InMemoryStore())
+            ids = await self._create(repository, 2)
+            result = await DemandPipelineService(
+                repository, _agents(FakeModel(replies=APPROVING))
+            ).run(ids)
+            runs.append(
+                [(o.artifacts, o.tokens_used, o.status) for o in result.outcomes]
+            )
+
+        assert runs[0] == runs[1]
+
+    @pytest.mark.asyncio
+    async def test_rejected_review_stops_at_code_complete(self, repository):
+        """Test that only an APPROVED verdict merges (Jidoka)"""
+        ids = await self._create(repository, 1)
+        model = FakeModel(replies={"reviewer": "CHANGES REQUESTED\nMissing tests"})
+
+        result = await DemandPipelineService(repository, _agents(model)).run(ids)
+
+        outcome = result.outcomes[0]
+        assert outcome.ok and outcome.approved is False
+        assert outcome.status == DemandStatus.CODE_COMPLETE
+        assert result.rejected_ids == ids
+        assert result.merged_ids == []
+        stored = await repository.get_by_id(ids[0])
+        assert stored.status == DemandStatus.CODE_COMPLETE
+
+    @pytest.mark.asyncio
+    async def test_worker_pool_bounds_concurrency(self, repository):
+        """Test that at most max_workers demands run at the same time"""
+        ids = await self._create(repository, 6, projects=6)
+        model = FakeModel(replies=APPROVING, delay=0.01)
+
+        service = DemandPipelineService(repository, _agents(model), max_workers=2)
+        result = await service.run(ids)
+
+        assert len(result.merged_ids) == 6
+        assert model.peak_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_per_project_limit(self, repository):
+        """Test that one project's demands are throttled, others are not"""
+        busy = await self._create(repository, 4)
+        other = await self._create(repository, 4, projects=4)
+        model = FakeModel(replies=APPROVING, delay=0.01)
+
+        single = DemandPipelineService(repository, _agents(model), max_workers=4)
+        await single.run(busy)
+        peak_single_project = model.peak_in_flight
+        model.peak_in_flight = 0
+        await single.run(other)
+
+        assert peak_single_project == 1
+        assert model.peak_in_flight == 4
+
+    @pytest.mark.asyncio
+    async def test_limits_hold_across_overlapping_runs(self, repository):
+        """Test concurrent run() calls share the per-project and worker limits"""
+        batches = [await self._create(repository, 2) for _ in range(2)]
+        model = FakeModel(replies=APPROVING, delay=0.01)
+        service = DemandPipelineService(repository, _agents(model), max_workers=4)
+
+        results = await asyncio.gather(*(service.run(ids) for ids in batches))
+
+        assert [len(result.merged_ids) for result in results] == [2, 2]
+        assert model.peak_in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_each_demand_gets_a_typed_outcome(self, repository):
+        """Test missing, non-DRAFT and failing demands do not stop the run"""
+        ready, started, poisoned = await self._create(repository, 3)
+        await repository.transition(
+            started, DemandStatus.DRAFT, DemandStatus.SPEC_APPROVED
+        )
+        model = FakeModel(replies=APPROVING)
+        demand = await repository.get_by_id(poisoned)
+        # FakeModel is deterministic: this is the spec the pipeline will get
+        spec = await SpecWriterAgent(model).generate(demand.title, demand.description)
+        agents = dataclasses.replace(
+            _agents(model), coder=FailingCoder(model, spec["content"])
+        )
+
+        result = await DemandPipelineService(repository, agents).run(
+            [ready, started, "missing", poisoned, ready]
+        )
+
+        by_id = {outcome.demand_id: outcome for outcome in result.outcomes}
+        assert [o.demand_id for o in result.outcomes] == [
+            ready,
+            started,
+            "missing",
+            poisoned,
+        ]
+        assert by_id[ready].merged
+        assert isinstance(by_id[started].error, DemandStatusConflictError)
+        assert isinstance(by_id["missing"].error, DemandNotFoundError)
+        assert str(by_id[poisoned].error) == "model unavailable"
+        assert by_id[poisoned].status == DemandStatus.ARCHITECTURE_DONE
+        assert list(by_id[poisoned].artifacts) == ["spec", "architecture"]
+        stored = await repository.get_by_id(poisoned)
+        assert stored.status == DemandStatus.ARCHITECTURE_DONE
+
+    @pytest.mark.asyncio
+    async def test_concurrent_move_is_reported(self, repository):
+        """Test a demand advanced by someone else mid-run is not overwritten"""
+        (demand_id,) = await self._create(repository, 1)
+
+        class MovingArchitect(ArchitectAgent):
+            async def stream_design(self, spec, budget=None):
+                await repository.transition(
+                    demand_id,
+                    DemandStatus.SPEC_APPROVED,
+                    DemandStatus.ARCHITECTURE_DONE,
+                )
+                async for chunk in super().stream_design(spec, budget):
+                    yield chunk
+
+        model = FakeModel(replies=APPROVING)
+        agents = dataclasses.replace(_agents(model), architect=MovingArchitect(model))
+
+        result = await DemandPipelineService(repository, agents).run([demand_id])
+
+        outcome = result.outcomes[0]
+        assert isinstance(outcome.error, DemandStatusConflictError)
+        assert outcome.status == DemandStatus.SPEC_APPROVED
+
+    def test_invalid_limits_raise(self, repository):
+        """Test that both limits must allow at least one demand"""
+        agents = _agents(FakeModel())
+        with pytest.raises(ValueError):
+            DemandPipelineService(repository, agents, max_workers=0)
+        with pytest.raises(ValueError):
+            DemandPipelineService(repository, agents, max_per_project=0)
+
+
+class TestPipelineResponseCache:
+    """Test suite for the pipeline on a CachedModel"""
+
+    @pytest.fixture
+    def store(self):
+        """Fixture: Shared in-memory store"""
+        return InMemoryStore()
+
+    async def _create(self, store, max_tokens=100_000):
+        """One project with one DRAFT demand (same title on every call)"""
+        project = PROJECTS.make(0)
+        project.id = f"{PARENT_ID}_{max_tokens}"
+        project.context_budget = ContextBudget(max_tokens=max_tokens, used_tokens=0)
+        projects = InMemoryProjectRepository(store)
+        if await projects.get_by_id(project.id) is None:
+            await projects.create(project)
+        demand = DEMANDS.make(0)
+        demand.project_id = project.id
+        await InMemoryDemandRepository(store).create(demand)
+        return projects, demand.id
+
+    def _service(self, store, projects, model, **agent_options):
+        agents = _agents(model)
+        if agent_options:
+            agents = dataclasses.replace(
+                agents, spec_writer=SpecWriterAgent(model, **agent_options)
+            )
+        return DemandPipelineService(
+            InMemoryDemandRepository(store), agents, projects=projects
+        )
+
+    @pytest.mark.asyncio
+    async def test_cache_hits_are_not_charged(self, store):
+        """Test a repeated demand is replayed and not billed again"""
+        model = CachedModel(FakeModel(replies=APPROVING), ResponseCache())
+        projects, first = await self._create(store)
+        _, second = await self._create(store)
+        service = self._service(store, projects, model)
+
+        billed = await service.run([first])
+        replayed = await service.run([second])
+
+        charged = billed.tokens_used
+        project = await projects.get_by_id(f"{PARENT_ID}_100000")
+        assert charged > 0
+        assert project.context_budget.used_tokens == charged
+        assert replayed.merged_ids == [second]
+        assert replayed.tokens_used == 0
+        assert replayed.outcomes[0].cache_hits == 4
+        assert replayed.cache_hit_rate == 1.0
+        assert model.stats.hit_rate == 0.5
+        assert replayed.outcomes[0].artifacts == billed.outcomes[0].artifacts
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_survives_restart(self, store, tmp_path):
+        """Test a new cache on the same directory replays earlier answers"""
+        projects, first = await self._create(store)
+        _, second = await self._create(store)
+        before = CachedModel(
+            FakeModel(replies=APPROVING), ResponseCache(directory=str(tmp_path))
+        )
+        await self._service(store, projects, before).run([first])
+
+        backend = FakeModel(replies=APPROVING)
+        after = CachedModel(backend, ResponseCache(directory=str(tmp_path)))
+        result = await self._service(store, projects, after).run([second])
+
+        assert result.merged_ids == [second]
+        assert backend.requests == []
+        assert after.stats.disk_hits == 4
+
+    @pytest.mark.asyncio
+    async def test_non_deterministic_calls_bypass_cache(self, store):
+        """Test that sampled calls always reach the model and are billed"""
+        backend = FakeModel(replies=APPROVING)
+        model = CachedModel(backend, ResponseCache())
+        projects, first = await self._create(store)
+        _, second = await self._create(store)
+        service = self._service(store, projects, model, temperature=0.7)
+
+        await service.run([first])
+        result = await service.run([second])
+
+        agents = [request.agent for request in backend.requests]
+        assert agents.count("spec_writer") == 2
+        assert model.stats.bypassed == 2
+        assert result.outcomes[0].cache_hits == 3
+        assert result.tokens_used > 0
+
+    @pytest.mark.asyncio
+    async def test_stream_over_budget_is_cancelled(self, store):
+        """Test a generation is aborted as soon as it would overrun the budget"""
+        projects, demand_id = await self._create(store, max_tokens=200)
+        model = FakeModel(replies={"architect": "component " * 500, **APPROVING})
+        service = self._service(store, projects, model)
+
+        result = await service.run([demand_id])
+
+        outcome = result.outcomes[0]
+        spec = await SpecWriterAgent(FakeModel()).generate(
+            DEMANDS.make(0).title, DEMANDS.make(0).description
+        )
+        assert isinstance(outcome.error, TokenBudgetExceededError)
+        assert outcome.error.agent == "architect"
+        assert outcome.status == DemandStatus.SPEC_APPROVED
+        assert model.streams_cancelled == 1
+        spent = spec["usage"]["total_tokens"] + outcome.error.used
+        assert outcome.tokens_used == spent
+        project = await projects.get_by_id(f"{PARENT_ID}_200")
+        assert project.context_budget.used_tokens == 200
+
+    @pytest.mark.asyncio
+    async def test_step_refused_by_budget_is_still_counted(self, store):
+        """Test a finished step the project cannot pay for is not dropped"""
+        projects, first = await self._create(store)
+        model = FakeModel(replies=APPROVING)
+        full = (await self._service(store, projects, model).run([first])).outcomes[0]
+        review = await ReviewerAgent(model).review(
+            full.artifacts["code"], full.artifacts["spec"]
+        )
+        review_tokens = review["usage"]["total_tokens"]
+        max_tokens = full.tokens_used - review_tokens // 2
+        projects, second = await self._create(store, max_tokens=max_tokens)
+
+        result = await self._service(store, projects, model).run([second])
+
+        outcome = result.outcomes[0]
+        assert isinstance(outcome.error, ContextBudgetExceededError)
+        assert outcome.status == DemandStatus.CODE_COMPLETE
+        assert outcome.tokens_used == full.tokens_used
+        project = await projects.get_by_id(f"{PARENT_ID}_{max_tokens}")
+        assert project.context_budget.used_tokens == max_tokens
+
+
+class TestAgentStreaming:
+    """Test suite for the agents' streaming methods"""
+
+    async def _read(self, chunks):
+        return [chunk async for chunk in chunks]
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_generate_output_incrementally(self):
+        """Test chunks add up to the non-streaming result"""
+        model = FakeModel(replies={"coder": "def f():\n    return 1\n"})
+        coder = CoderAgent(model)
+
+        chunks = await self._read(coder.stream_code("design", "spec"))
+        whole = await coder.code("design", "spec")
+
+        assert len(chunks) == 4
+        assert "".join(chunk["delta"] for chunk in chunks) == whole["content"]
+        totals = [chunk["usage"]["total_tokens"] for chunk in chunks]
+        assert totals == sorted(totals) and totals[0] < totals[-1]
+        assert chunks[-1]["usage"] == whole["usage"]
+
+    @pytest.mark.asyncio
+    async def test_cached_stream_is_not_held_to_budget(self):
+        """Test a replayed answer streams even with no budget left"""
+        model = CachedModel(FakeModel(), ResponseCache())
+        writer = SpecWriterAgent(model)
+        first = await self._read(writer.stream_generate("Login", "OAuth login"))
+
+        spent = ContextBudget(max_tokens=100, used_tokens=100)
+        with pytest.raises(TokenBudgetExceededError):
+            await self._read(writer.stream_generate("Login", "SAML login", spent))
+        replay = await self._read(writer.stream_generate("Login", "OAuth login", spent))
+
+        assert [chunk["cached"] for chunk in replay] == [True]
+        assert replay[0]["delta"] == "".join(chunk["delta"] for chunk in first)
+
+    @pytest.mark.asyncio
+    async def test_stream_closed_early_is_not_cached(self):
+        """Test a partial answer never ends up in the cache"""
+        backend = FakeModel(replies={"coder": "one two three"})
+        cache = ResponseCache()
+        stream = CoderAgent(CachedModel(backend, cache)).stream_code("a", "s")
+
+        await stream.__anext__()
+        await stream.aclose()
+
+        assert backend.streams_cancelled == 1
+        assert len(cache) == 0
+
+
+class TestResponseCache:
+    """Test suite for ResponseCache eviction"""
+
+    def _response(self, text):
+        return ModelResponse(text, input_tokens=1, output_tokens=1, model="fake")
+
+    @pytest.mark.asyncio
+    async def test_entries_expire_after_ttl(self, tmp_path):
+        """Test TTL in both tiers"""
+        now = [1000.0]
+        cache = ResponseCache(
+            ttl_seconds=60, directory=str(tmp_path), clock=lambda: now[0]
+        )
+        await cache.set("a" * 64, self._response("answer"))
+
+        now[0] += 59
+        assert (await cache.get("a" * 64)).text == "answer"
+        now[0] += 2
+        assert await cache.get("a" * 64) is None
+        assert cache.stats.expirations == 2  # memory entry and disk file
+        assert list(tmp_path.glob("*/*.json")) == []
+
+    @pytest.mark.asyncio
+    async def test_size_limits_evict_oldest(self, tmp_path):
+        """Test the LRU bound and the disk byte budget"""
+        cache = ResponseCache(
+            max_entries=2, directory=str(tmp_path), max_disk_bytes=400
+        )
+        keys = [f"{index:064x}" for index in range(5)]
+        for key in keys:
+            await cache.set(key, self._response(key))
+
+        sizes = [path.stat().st_size for path in tmp_path.glob("*/*.json")]
+        assert len(cache) == 2
+        assert sum(sizes) <= 400
+        assert len(sizes) < 5
+        assert await cache.get(keys[-1]) is not None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_of_one_key(self, tmp_path):
+        """Test identical concurrent calls all succeed and leave one file"""
+        cache = ResponseCache(directory=str(tmp_path))
+        model = CachedModel(FakeModel(), cache)
+        agents = [SpecWriterAgent(model) for _ in range(50)]
+
+        specs = await asyncio.gather(
+            *(agent.generate("Login", "OAuth login") for agent in agents)
+        )
+
+        assert len({spec["content"] for spec in specs}) == 1
+        assert len(list(tmp_path.glob("*/*.json"))) == 1
+        assert list(tmp_path.glob("*/*.tmp")) == []
+
+    @pytest.mark.asyncio
+    async def test_disk_write_failure_is_not_raised(self, tmp_path, caplog):
+        """Test a broken disk tier degrades to memory only"""
+        blocker = tmp_path / "not-a-directory"
+        blocker.write_text("")
+        cache = ResponseCache(directory=str(blocker))
+
+        await cache.set("a" * 64, self._response("answer"))
+
+        assert (await cache.get("a" * 64)).text == "answer"
+        assert "disk write" in caplog.text
+
+
+class StubCheck:
+    """Review check with a scripted verdict and duration"""
+
+    def __init__(
+        self, name, approved=True, delay=0.0, blocking=True, error=None, cached=False
+    ):
+        self.name = name
+        self.blocking = blocking
+        self._approved = approved
+        self._delay = delay
+        self._error = error
+        self._cached = cached
+        self.cancelled = False
+
+    async def review(self, code, spec):
+        try:
+            await asyncio.sleep(self._delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self._error is not None:
+            raise self._error
+        return {
+            "approved": self._approved,
+            "comments": f"{self.name} comments",
+            "usage": {"total_tokens": 10},
+            "cached": self._cached,
+        }
+
+
+class TestReviewerEnsemble:
+    """Test suite for ReviewerEnsemble"""
+
+    @pytest.mark.asyncio
+    async def test_checks_run_concurrently(self):
+        """Test all default checks run at once and are merged"""
+        model = FakeModel(
+            replies={
+                "reviewer": "APPROVED",
+                "security": "APPROVED",
+                "style": "APPROVED",
+            },
+            delay=0.01,
+        )
+
+        report = await ReviewerEnsemble(default_checks(model)).run("code", "spec")
+
+        assert report.approved
+        assert [r.check for r in report.results] == ["reviewer", "security", "style"]
+        assert {r.status for r in report.results} == {CheckStatus.PASSED}
+        assert model.peak_in_flight == 3
+        assert report.usage["total_tokens"] == sum(
+            r.usage["total_tokens"] for r in report.results
+        )
+
+    @pytest.mark.asyncio
+    async def test_blocking_failure_cancels_remaining_checks(self):
+        """Test the first blocking rejection stops the slower checks"""
+        slow = StubCheck("spec", delay=10)
+        checks = [slow, StubCheck("security", approved=False, delay=0.01)]
+
+        report = await asyncio.wait_for(ReviewerEnsemble(checks).run("c", "s"), 1)
+
+        assert not report.approved
+        assert report.blocking_failure.check == "security"
+        assert report.results[0].status == CheckStatus.CANCELLED
+        assert slow.cancelled
+        assert [r.check for r in report.failures] == ["security"]
+
+    @pytest.mark.asyncio
+    async def test_non_blocking_failure_is_reported_only(self):
+        """Test an advisory check cannot reject the code"""
+        checks = [StubCheck("spec"), StubCheck("style", approved=False, blocking=False)]
+
+        report = await ReviewerEnsemble(checks).run("c", "s")
+
+        assert report.approved
+        assert report.blocking_failure is None
+        assert report.results[1].status == CheckStatus.FAILED
+        assert "[style] failed\nstyle comments" in report.comments
+
+    @pytest.mark.asyncio
+    async def test_timeouts_and_errors_stop_the_line(self):
+        """Test a blocking check without a verdict counts as a rejection"""
+        hanging = ReviewerEnsemble(
+            [StubCheck("spec"), StubCheck("security", delay=10)],
+            timeouts={"security": 0.01},
+        )
+        broken = ReviewerEnsemble(
+            [StubCheck("spec", error=RuntimeError("model unavailable"))]
+        )
+
+        timed_out = await hanging.run("c", "s")
+        errored = await broken.run("c", "s")
+
+        assert not timed_out.approved
+        assert timed_out.blocking_failure.status == CheckStatus.TIMED_OUT
+        assert not errored.approved
+        assert errored.results[0].status == CheckStatus.ERROR
+        assert "model unavailable" in errored.results[0].comments
+
+    @pytest.mark.asyncio
+    async def test_ensemble_gates_the_pipeline(self):
+        """Test the ensemble drops in as the pipeline's reviewer"""
+        repository = InMemoryDemandRepository(InMemoryStore())
+        demand = DEMANDS.make(0)
+        await repository.create(demand)
+        model = FakeModel(
+            replies={"reviewer": "APPROVED", "security": "CHANGES REQUESTED\nSQLi"}
+        )
+        agents = dataclasses.replace(
+            _agents(model), reviewer=ReviewerEnsemble(default_checks(model))
+        )
+
+        result = await DemandPipelineService(repository, agents).run([demand.id])
+
+        outcome = result.outcomes[0]
+        assert outcome.approved is False
+        assert outcome.status == DemandStatus.CODE_COMPLETE
+        assert "[security] failed\nSQLi" in outcome.artifacts["review"]
+
+    @pytest.mark.asyncio
+    async def test_partly_cached_review_bills_only_fresh_checks(self):
+        """Test replayed checks of a mixed review are not charged again"""
+        store = InMemoryStore()
+        projects = InMemoryProjectRepository(store)
+        demands = InMemoryDemandRepository(store)
+        project = PROJECTS.make(0)
+        project.context_budget = ContextBudget(max_tokens=100_000, used_tokens=0)
+        await projects.create(project)
+        fresh, mixed = DEMANDS.make(0), DEMANDS.make(1)
+        mixed.title, mixed.description = fresh.title, fresh.description
+        for demand in (fresh, mixed):
+            demand.project_id = project.id
+            await demands.create(demand)
+        model = FakeModel(replies=APPROVING)
+
+        async def run(demand, checks):
+            agents = dataclasses.replace(
+                _agents(model), reviewer=ReviewerEnsemble(checks)
+            )
+            service = DemandPipelineService(demands, agents, projects=projects)
+            return (await service.run([demand.id])).outcomes[0]
+
+        alone = await run(fresh, [StubCheck("security")])
+        both = await run(mixed, [StubCheck("spec", cached=True), StubCheck("security")])
+
+        ensemble = ReviewerEnsemble(
+            [StubCheck("spec", cached=True), StubCheck("security")]
+        )
+        review = await ensemble.review("c", "s")
+        assert review["usage"]["total_tokens"] == 20
+        assert review["billable_usage"]["total_tokens"] == 10
+        assert review["cached"] is False
+        assert both.merged
+        assert both.tokens_used == alone.tokens_used
+        stored = await projects.get_by_id(project.id)
+        assert stored.context_budget.used_tokens == 2 * alone.tokens_used
+
+    def test_invalid_configuration_raises(self):
+        """Test empty, duplicate and non-positive timeout configurations"""
+        with pytest.raises(ValueError):
+            ReviewerEnsemble([])
+        with pytest.raises(ValueError):
+            ReviewerEnsemble([StubCheck("spec"), StubCheck("spec")])
+        with pytest.raises(ValueError):
+            ReviewerEnsemble([StubCheck("spec")], timeouts={"spec": 0})
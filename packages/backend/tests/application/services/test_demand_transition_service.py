@@ -0,0 +1,159 @@
+"""
+Tests for DemandTransitionService
+
+Runs against the in-memory demand repository.
+"""
+
+import pytest
+
+from application.exceptions import (
+    DemandNotFoundError,
+    DemandStatusConflictError,
+    RepositoryError,
+)
+from application.services.demand_transition_service import DemandTransitionService
+from domain.exceptions import DemandAlreadyCompletedError, InvalidStatusTransitionError
+from domain.value_objects.demand_status import DemandStatus
+from infrastructure.persistence.memory import InMemoryDemandRepository, InMemoryStore
+from tests.infrastructure.persistence.contract.entity_kinds import DEMANDS, PARENT_ID
+
+
+class RacingRepository(InMemoryDemandRepository):
+    """Advances one demand between the service's read and its write"""
+
+    def __init__(self, store: InMemoryStore, racing_id: str):
+        super().__init__(store)
+        self.racing_id = racing_id
+        self.writes = 0
+
+    async def transition_many(self, transitions):
+        self.writes += 1
+        stored = await self.get_by_id(self.racing_id)
+        await self.transition(
+            self.racing_id, stored.status, stored.status.next_status()
+        )
+        return await super().transition_many(transitions)
+
+
+class TestDemandTransitionService:
+    """Test suite for DemandTransitionService"""
+
+    @pytest.fixture
+    def repository(self):
+        """Fixture: Empty in-memory demand repository"""
+        return InMemoryDemandRepository(InMemoryStore())
+
+    async def _create(self, repository, *statuses):
+        demands = []
+        for index, status in enumerate(statuses):
+            demand = DEMANDS.make(index)
+            demand.status = status
+            demands.append(demand)
+        await repository.create_many(demands)
+        return demands
+
+    @pytest.mark.asyncio
+    async def test_release_moves_code_complete_demands(self, repository):
+        """Test CODE_COMPLETE -> PR_MERGED for many demands at once"""
+        demands = await self._create(repository, *[DemandStatus.CODE_COMPLETE] * 3)
+        ids = [demand.id for demand in demands]
+
+        result = await DemandTransitionService(repository).advance_many(
+            ids, DemandStatus.PR_MERGED
+        )
+
+        assert not result.has_failures
+        assert result.succeeded_ids == ids
+        assert all(
+            outcome.from_status == DemandStatus.CODE_COMPLETE
+            for outcome in result.outcomes
+        )
+        stored = await repository.get_many(ids)
+        assert {demand.status for demand in stored.values()} == {DemandStatus.PR_MERGED}
+        rollup = await repository.get_status_rollup(PARENT_ID)
+        assert rollup[DemandStatus.PR_MERGED] == 3
+
+    @pytest.mark.asyncio
+    async def test_each_demand_gets_a_typed_outcome(self, repository):
+        """Test invalid, completed and missing demands do not stop the batch"""
+        ready, early, merged = await self._create(
+            repository,
+            DemandStatus.CODE_COMPLETE,
+            DemandStatus.SPEC_APPROVED,
+            DemandStatus.PR_MERGED,
+        )
+
+        result = await DemandTransitionService(repository).advance_many(
+            [ready.id, early.id, merged.id, "missing", ready.id],
+            DemandStatus.PR_MERGED,
+        )
+
+        errors = [outcome.error for outcome in result.outcomes]
+        assert [outcome.demand_id for outcome in result.outcomes] == [
+            ready.id,
+            early.id,
+            merged.id,
+            "missing",
+        ]
+        assert errors[0] is None
+        assert isinstance(errors[1], InvalidStatusTransitionError)
+        assert isinstance(errors[2], DemandAlreadyCompletedError)
+        assert isinstance(errors[3], DemandNotFoundError)
+        assert result.failed_ids == [early.id, merged.id, "missing"]
+        assert (await repository.get_by_id(early.id)).status == (
+            DemandStatus.SPEC_APPROVED
+        )
+
+    @pytest.mark.asyncio
+    async def test_without_target_each_demand_advances_one_step(self, repository):
+        """Test that to_status=None uses each demand's next_status"""
+        demands = await self._create(
+            repository, DemandStatus.DRAFT, DemandStatus.ARCHITECTURE_DONE
+        )
+
+        result = await DemandTransitionService(repository).advance_many(
+            [demand.id for demand in demands]
+        )
+
+        assert [outcome.to_status for outcome in result.outcomes] == [
+            DemandStatus.SPEC_APPROVED,
+            DemandStatus.CODE_COMPLETE,
+        ]
+        assert not result.has_failures
+
+    @pytest.mark.asyncio
+    async def test_lost_race_is_a_status_conflict(self):
+        """Test a demand moved by another writer mid-batch"""
+        store = InMemoryStore()
+        demands = [DEMANDS.make(i) for i in range(2)]
+        repository = RacingRepository(store, demands[1].id)
+        await repository.create_many(demands)
+
+        result = await DemandTransitionService(repository).advance_many(
+            [demand.id for demand in demands]
+        )
+
+        conflict = result.outcomes[1].error
+        assert repository.writes == 1
+        assert result.succeeded_ids == [demands[0].id]
+        assert isinstance(conflict, DemandStatusConflictError)
+        assert isinstance(conflict, RepositoryError)
+        assert conflict.actual == DemandStatus.SPEC_APPROVED
+
+    @pytest.mark.asyncio
+    async def test_nothing_valid_skips_the_write(self, repository):
+        """Test that no batch is sent when every item is rejected"""
+        (merged,) = await self._create(repository, DemandStatus.PR_MERGED)
+        calls = []
+        original = repository.transition_many
+
+        async def spy(transitions):
+            calls.append(transitions)
+            return await original(transitions)
+
+        repository.transition_many = spy
+
+        result = await DemandTransitionService(repository).advance_many([merged.id])
+
+        assert result.failed_ids == [merged.id]
+        assert calls == []
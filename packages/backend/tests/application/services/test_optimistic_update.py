@@ -0,0 +1,114 @@
+"""
+Tests for update_with_retry
+
+Runs against the in-memory and SQLite repositories.
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from application.exceptions import RevisionConflictError
+from application.services.optimistic_update import update_with_retry
+from domain.exceptions import ContextBudgetExceededError
+from infrastructure.persistence.memory import InMemoryProjectRepository, InMemoryStore
+from infrastructure.persistence.sqlite import SQLiteDatabase, SQLiteProjectRepository
+from tests.infrastructure.persistence.contract.entity_kinds import PROJECTS
+
+
+def _consume(tokens):
+    """Domain operation that yields to the event loop before saving."""
+
+    async def operation(project):
+        project.consume_tokens(tokens)
+        await asyncio.sleep(0)
+
+    return operation
+
+
+class AlwaysRacingRepository(InMemoryProjectRepository):
+    """Saves a concurrent edit before every patch()"""
+
+    def __init__(self, store: InMemoryStore):
+        super().__init__(store)
+        self.patches = 0
+
+    async def patch(self, project, fields):
+        self.patches += 1
+        stored = await self.get_by_id(project.id)
+        await self.update(stored)
+        return await super().patch(project, fields)
+
+
+class TestUpdateWithRetry:
+    """Test suite for update_with_retry"""
+
+    @pytest_asyncio.fixture(params=["memory", "sqlite"])
+    async def repository(self, request, tmp_path):
+        """Fixture: Empty project repository of each local backend"""
+        if request.param == "memory":
+            yield InMemoryProjectRepository(InMemoryStore())
+            return
+        database = SQLiteDatabase(str(tmp_path / "retry.db"))
+        yield SQLiteProjectRepository(database)
+        await database.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_operations_all_apply(self, repository):
+        """Test that racing read-modify-writes are retried, not lost"""
+        project = PROJECTS.make(0)
+        await repository.create(project)
+
+        await asyncio.gather(
+            *(update_with_retry(repository, project.id, _consume(10)) for _ in range(4))
+        )
+
+        stored = await repository.get_by_id(project.id)
+        assert stored.context_budget.used_tokens == 40
+        assert stored.revision == 4
+
+    @pytest.mark.asyncio
+    async def test_returns_saved_entity(self, repository):
+        """Test that the written entity is returned with its new revision"""
+        project = PROJECTS.make(0)
+        await repository.create(project)
+
+        updated = await update_with_retry(repository, project.id, _consume(5))
+
+        assert updated.revision == 1
+        assert await repository.get_by_id(project.id) == updated
+
+    @pytest.mark.asyncio
+    async def test_missing_entity_returns_none(self, repository):
+        """Test that an unknown id is not an error"""
+        assert await update_with_retry(repository, "missing", _consume(5)) is None
+
+    @pytest.mark.asyncio
+    async def test_domain_errors_propagate(self, repository):
+        """Test that a failing operation aborts without writing"""
+        project = PROJECTS.make(0)
+        await repository.create(project)
+
+        with pytest.raises(ContextBudgetExceededError):
+            await update_with_retry(repository, project.id, _consume(10_000))
+
+        assert (await repository.get_by_id(project.id)).revision == 0
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self):
+        """Test that the last conflict is raised once attempts run out"""
+        repository = AlwaysRacingRepository(InMemoryStore())
+        project = PROJECTS.make(0)
+        await repository.create(project)
+
+        with pytest.raises(RevisionConflictError):
+            await update_with_retry(repository, project.id, _consume(1), max_attempts=3)
+
+        assert repository.patches == 3
+
+    @pytest.mark.asyncio
+    async def test_invalid_max_attempts_raises(self, repository):
+        """Test that at least one attempt is required"""
+        with pytest.raises(ValueError):
+            await update_with_retry(repository, "id", _consume(1), max_attempts=0)
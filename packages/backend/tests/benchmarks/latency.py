@@ -0,0 +1,98 @@
+"""
+Benchmark Latency Recording
+
+Per-operation timings summarised as ops/sec and p50/p99, and a JSON
+writer so results can be compared between releases.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import json
+import os
+import platform
+import statistics
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Iterator, List
+
+
+@dataclass(frozen=True)
+class LatencySummary:
+    """
+    Timings of one operation.
+
+    Attributes:
+        operation: Operation name (e.g. "get_by_id")
+        samples: Number of timed calls
+        ops_per_sec: Calls per second over the timed calls
+        p50_ms: Median latency in milliseconds
+        p99_ms: 99th percentile latency in milliseconds
+    """
+
+    operation: str
+    samples: int
+    ops_per_sec: float
+    p50_ms: float
+    p99_ms: float
+
+
+class LatencyRecorder:
+    """Collects per-call durations of one operation"""
+
+    def __init__(self, operation: str):
+        self.operation = operation
+        self._durations: List[float] = []
+
+    @contextmanager
+    def measure(self) -> Iterator[None]:
+        """Time the enclosed call."""
+        start = time.perf_counter()
+        yield
+        self._durations.append(time.perf_counter() - start)
+
+    def summary(self) -> LatencySummary:
+        """
+        Summarise the recorded calls.
+
+        Raises:
+            ValueError: If fewer than two calls were recorded
+        """
+        if len(self._durations) < 2:
+            raise ValueError("at least two samples are needed")
+        cuts = statistics.quantiles(self._durations, n=100, method="inclusive")
+        return LatencySummary(
+            operation=self.operation,
+            samples=len(self._durations),
+            ops_per_sec=len(self._durations) / sum(self._durations),
+            p50_ms=cuts[49] * 1000,
+            p99_ms=cuts[98] * 1000,
+        )
+
+
+def write_results(path: str, suite: str, results: List[dict]) -> None:
+    """
+    Write benchmark results as JSON.
+
+    Args:
+        path: Output file (parent directories are created)
+        suite: Benchmark suite name
+        results: One dict per measurement (see LatencySummary plus context)
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    payload = {
+        "suite": suite,
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(payload, file, indent=2)
+
+
+def summary_dict(summary: LatencySummary, **context) -> dict:
+    """Summary fields plus context (backend, entity, documents, ...)."""
+    return {**context, **asdict(summary)}
@@ -0,0 +1,117 @@
+"""
+Benchmark: MongoDB vs SQLite vs In-memory Demand Repository
+
+Head-to-head throughput of the same workload on each backend:
+create() one by one (concurrently), create_many(), get_by_id() and
+paging through list_by_project().
+
+Run with: pytest -m benchmark -s
+Size with: BENCHMARK_DEMANDS=5000 (default)
+The MongoDB leg needs the Docker Compose database (see conftest.py).
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import asyncio
+import os
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from domain.entities.demand import Demand
+from infrastructure.persistence.memory import InMemoryDemandRepository, InMemoryStore
+from infrastructure.persistence.mongodb.mongo_demand_repository import (
+    MongoDemandRepository,
+)
+from infrastructure.persistence.sqlite import SQLiteDatabase, SQLiteDemandRepository
+
+DEMAND_COUNT = int(os.environ.get("BENCHMARK_DEMANDS", "5000"))
+PAGE_SIZE = 100
+
+
+def _make_demands(count: int) -> list[Demand]:
+    """Helper: Build a backlog of DRAFT demands with distinct timestamps"""
+    start = datetime.utcnow()
+    return [
+        Demand(
+            id=str(uuid.uuid4()),
+            project_id="project_benchmark",
+            title=f"Imported demand {i}",
+            description="Imported from backlog",
+            created_at=start + timedelta(milliseconds=i),
+        )
+        for i in range(count)
+    ]
+
+
+async def _run_workload(repo) -> dict:
+    """Helper: Run the workload, returning ops/s per operation"""
+    rates = {}
+
+    single = _make_demands(DEMAND_COUNT)
+    start = time.perf_counter()
+    await asyncio.gather(*(repo.create(demand) for demand in single))
+    rates["create"] = DEMAND_COUNT / (time.perf_counter() - start)
+
+    bulk = _make_demands(DEMAND_COUNT)
+    start = time.perf_counter()
+    result = await repo.create_many(bulk)
+    rates["create_many"] = DEMAND_COUNT / (time.perf_counter() - start)
+    assert not result.has_failures
+
+    start = time.perf_counter()
+    for demand in single:
+        assert await repo.get_by_id(demand.id) is not None
+    rates["get_by_id"] = DEMAND_COUNT / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    listed, cursor = 0, None
+    while True:
+        page = await repo.list_by_project(
+            "project_benchmark", after=cursor, limit=PAGE_SIZE
+        )
+        listed += len(page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+    rates["list"] = listed / (time.perf_counter() - start)
+    assert listed == 2 * DEMAND_COUNT
+
+    return rates
+
+
+def _report(backend: str, rates: dict) -> None:
+    summary = ", ".join(f"{name}={rate:,.0f} docs/s" for name, rate in rates.items())
+    print(f"\n[backend throughput] {backend} ({DEMAND_COUNT} demands): {summary}")
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_mongo_throughput(mongodb_database: AsyncIOMotorDatabase):
+    """Benchmark: MongoDemandRepository workload"""
+    _report("mongodb", await _run_workload(MongoDemandRepository(mongodb_database)))
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_sqlite_throughput(tmp_path):
+    """Benchmark: SQLiteDemandRepository workload (WAL, group commit)"""
+    database = SQLiteDatabase(str(tmp_path / "benchmark.db"))
+    try:
+        _report("sqlite", await _run_workload(SQLiteDemandRepository(database)))
+        print(
+            f"[backend throughput] sqlite commits: {database.committed_batches} "
+            f"transactions for {database.committed_writes} writes"
+        )
+    finally:
+        await database.close()
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_memory_throughput():
+    """Benchmark: InMemoryDemandRepository workload (upper bound)"""
+    _report("memory", await _run_workload(InMemoryDemandRepository(InMemoryStore())))
@@ -0,0 +1,75 @@
+"""
+Benchmark: Single-document vs Bulk Ingestion
+
+Compares create() in a loop (one round trip per demand) with
+create_many() (one unordered insert_many) against real MongoDB.
+
+Run with: pytest -m benchmark -s
+Size with: BENCHMARK_DEMANDS=5000 (default)
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import os
+import time
+import uuid
+from datetime import datetime
+
+import pytest
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from domain.entities.demand import Demand
+from infrastructure.persistence.mongodb.mongo_demand_repository import (
+    MongoDemandRepository,
+)
+
+DEMAND_COUNT = int(os.environ.get("BENCHMARK_DEMANDS", "5000"))
+
+
+def _make_demands(count: int) -> list[Demand]:
+    """Helper: Build a backlog of DRAFT demands"""
+    return [
+        Demand(
+            id=str(uuid.uuid4()),
+            project_id="project_benchmark",
+            title=f"Imported demand {i}",
+            description="Imported from backlog",
+            created_at=datetime.utcnow(),
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_bulk_vs_single_ingestion(mongodb_database: AsyncIOMotorDatabase):
+    """Benchmark: create_many throughput vs create() loop"""
+    repo = MongoDemandRepository(mongodb_database)
+    collection = mongodb_database["demands"]
+
+    # Single-document ingestion
+    single = _make_demands(DEMAND_COUNT)
+    start = time.perf_counter()
+    for demand in single:
+        await repo.create(demand)
+    single_seconds = time.perf_counter() - start
+    assert await collection.count_documents({}) == DEMAND_COUNT
+
+    await collection.delete_many({})
+
+    # Bulk ingestion
+    bulk = _make_demands(DEMAND_COUNT)
+    start = time.perf_counter()
+    result = await repo.create_many(bulk)
+    bulk_seconds = time.perf_counter() - start
+    assert not result.has_failures
+    assert await collection.count_documents({}) == DEMAND_COUNT
+
+    single_rate = DEMAND_COUNT / single_seconds
+    bulk_rate = DEMAND_COUNT / bulk_seconds
+    print(
+        f"\n[bulk ingestion] {DEMAND_COUNT} demands: "
+        f"single={single_rate:,.0f} docs/s ({single_seconds:.2f}s), "
+        f"bulk={bulk_rate:,.0f} docs/s ({bulk_seconds:.2f}s), "
+        f"speedup={bulk_rate / single_rate:.1f}x"
+    )
@@ -0,0 +1,112 @@
+"""
+Benchmark: Domain Object Memory and Instantiation Cost
+
+Bytes per instance (tracemalloc) and instances/s for the slots-based
+entities and value objects, next to a plain dict-backed dataclass with the
+same fields as reference (no validation, so its rate is an upper bound
+for the layout alone).
+
+Run with: pytest -m benchmark -s
+Size with: BENCHMARK_INSTANCES=100000 (default)
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import dataclasses
+import os
+import time
+import tracemalloc
+from datetime import datetime
+
+import pytest
+
+from domain.entities.checkpoint import Checkpoint
+from domain.entities.demand import Demand
+from domain.entities.metaspec import Metaspec, MetaspecType
+from domain.entities.project import Project
+from domain.value_objects.context_budget import ContextBudget
+
+INSTANCE_COUNT = int(os.environ.get("BENCHMARK_INSTANCES", "100000"))
+
+NOW = datetime(2025, 1, 1)
+BUDGET = ContextBudget(max_tokens=100_000, used_tokens=0)
+
+# Field values shared by every instance, so only the object layout is measured
+FIELDS = {
+    ContextBudget: dict(max_tokens=100_000, used_tokens=10),
+    Project: dict(
+        id="proj-1",
+        name="Project",
+        description="Benchmark",
+        owner_id="user-1",
+        context_budget=BUDGET,
+        created_at=NOW,
+    ),
+    Demand: dict(
+        id="demand-1",
+        project_id="proj-1",
+        title="Demand",
+        description="Benchmark",
+        context_budget=BUDGET,
+        created_at=NOW,
+    ),
+    Metaspec: dict(
+        id="meta-1",
+        demand_id="demand-1",
+        type=MetaspecType.TECHNICAL,
+        content="# Spec",
+        created_at=NOW,
+    ),
+    Checkpoint: dict(
+        id="ckpt-1",
+        demand_id="demand-1",
+        context_snapshot="{}",
+        tokens_used=1,
+        created_at=NOW,
+    ),
+}
+
+
+def _dict_backed(cls: type) -> type:
+    """Helper: Same fields as cls, as a regular (non-slots) dataclass"""
+    return dataclasses.make_dataclass(
+        f"Dict{cls.__name__}",
+        [(item.name, item.type) for item in dataclasses.fields(cls)],
+        frozen=cls.__dataclass_params__.frozen,
+    )
+
+
+def _measure(factory, values: dict) -> tuple:
+    """Helper: (bytes per instance, instances per second)"""
+    start = time.perf_counter()
+    for _ in range(INSTANCE_COUNT):
+        factory(**values)
+    rate = INSTANCE_COUNT / (time.perf_counter() - start)
+
+    # Separate pass: tracing slows allocation down
+    tracemalloc.start()
+    instances = [factory(**values) for _ in range(INSTANCE_COUNT)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(instances) == INSTANCE_COUNT
+    return size / INSTANCE_COUNT, rate
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("cls", list(FIELDS), ids=lambda cls: cls.__name__)
+def test_domain_footprint(cls: type):
+    """Benchmark: memory and instantiation of INSTANCE_COUNT objects"""
+    values = FIELDS[cls]
+    reference = _dict_backed(cls)
+    complete = {
+        item.name: getattr(cls(**values), item.name) for item in dataclasses.fields(cls)
+    }
+
+    slots_bytes, slots_rate = _measure(cls, values)
+    dict_bytes, dict_rate = _measure(reference, complete)
+    print(
+        f"\n[domain footprint] {cls.__name__} ({INSTANCE_COUNT} instances): "
+        f"slots={slots_bytes:.0f} B/obj {slots_rate:,.0f}/s, "
+        f"dict={dict_bytes:.0f} B/obj {dict_rate:,.0f}/s"
+    )
+    assert not hasattr(cls(**values), "__dict__")
@@ -0,0 +1,133 @@
+"""
+Benchmark: Validated vs Trusted Entity Hydration
+
+Time to rebuild entities from stored fields with the constructor (runs
+__post_init__ validation) and with from_trusted (skips it), the path the
+repositories use for data read back from storage.
+
+Run with: pytest -m benchmark -s
+Size with: BENCHMARK_HYDRATE=100000 (default)
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import os
+import time
+from datetime import datetime
+
+import pytest
+
+from domain.entities.checkpoint import Checkpoint
+from domain.entities.demand import Demand
+from domain.entities.metaspec import Metaspec, MetaspecType
+from domain.entities.project import Project
+from domain.value_objects.context_budget import ContextBudget
+from domain.value_objects.demand_status import DemandStatus
+
+HYDRATE_COUNT = int(os.environ.get("BENCHMARK_HYDRATE", "100000"))
+
+NOW = datetime(2025, 1, 1)
+# Realistic payloads: validation scans the Markdown / strips the snapshot
+CONTENT = "# Spec\n\n" + "Requirement line without headers.\n" * 200
+SNAPSHOT = '{"messages": [' + ", ".join(['{"role": "user"}'] * 500) + "]}"
+
+
+def _project_row(i: int) -> dict:
+    return dict(
+        id=f"proj-{i}",
+        name=f"Project {i}",
+        description="Benchmark",
+        owner_id="user-1",
+        budget=(100_000, i),
+        created_at=NOW,
+        updated_at=None,
+    )
+
+
+def _build_project(factory, budget_factory, row: dict) -> Project:
+    max_tokens, used_tokens = row["budget"]
+    return factory(
+        id=row["id"],
+        name=row["name"],
+        description=row["description"],
+        owner_id=row["owner_id"],
+        context_budget=budget_factory(max_tokens=max_tokens, used_tokens=used_tokens),
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
+    )
+
+
+CASES = {
+    "project": (
+        _project_row,
+        lambda row: _build_project(Project, ContextBudget, row),
+        lambda row: _build_project(
+            Project.from_trusted, ContextBudget.from_trusted, row
+        ),
+    ),
+    "demand": (
+        lambda i: dict(
+            id=f"demand-{i}",
+            project_id="proj-1",
+            title=f"Demand {i}",
+            description="Benchmark",
+            status=DemandStatus.CODE_COMPLETE,
+            context_budget=None,
+            created_at=NOW,
+            updated_at=NOW,
+        ),
+        lambda row: Demand(**row),
+        lambda row: Demand.from_trusted(**row),
+    ),
+    "metaspec": (
+        lambda i: dict(
+            id=f"meta-{i}",
+            demand_id="demand-1",
+            type=MetaspecType.TECHNICAL,
+            content=CONTENT,
+            version=1,
+            created_at=NOW,
+            updated_at=None,
+        ),
+        lambda row: Metaspec(**row),
+        lambda row: Metaspec.from_trusted(**row),
+    ),
+    "checkpoint": (
+        lambda i: dict(
+            id=f"ckpt-{i}",
+            demand_id="demand-1",
+            context_snapshot=SNAPSHOT,
+            tokens_used=i + 1,
+            created_at=NOW,
+            expires_at=None,
+        ),
+        lambda row: Checkpoint(**row),
+        lambda row: Checkpoint.from_trusted(**row),
+    ),
+}
+
+
+def _rate(build, rows: list) -> float:
+    start = time.perf_counter()
+    for row in rows:
+        build(row)
+    return len(rows) / (time.perf_counter() - start)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("entity", list(CASES))
+def test_hydration_throughput(entity: str):
+    """Benchmark: constructor vs from_trusted for HYDRATE_COUNT entities"""
+    make_row, validated, trusted = CASES[entity]
+    rows = [make_row(i) for i in range(HYDRATE_COUNT)]
+
+    # Both paths must produce equal entities
+    assert validated(rows[0]) == trusted(rows[0])
+
+    validated_rate = _rate(validated, rows)
+    trusted_rate = _rate(trusted, rows)
+    print(
+        f"\n[hydration] {entity} ({HYDRATE_COUNT} entities): "
+        f"validated={validated_rate:,.0f}/s, trusted={trusted_rate:,.0f}/s "
+        f"({trusted_rate / validated_rate:.2f}x)"
+    )
@@ -0,0 +1,134 @@
+"""
+Benchmark: Repository Operations per Backend
+
+Latency and throughput of create, get_by_id, update, delete and list
+(keyset pages) for each aggregate and backend, with the collection
+pre-filled to 1k / 100k / 1M documents. Results are printed and written
+to JSON to track regressions between releases.
+
+Run with: pytest -m benchmark -s tests/benchmarks/test_repository_benchmark.py
+Configure with:
+    BENCHMARK_SIZES=1000,100000,1000000 (default)
+    BENCHMARK_BACKENDS=memory,sqlite,mongodb (default)
+    BENCHMARK_KINDS=projects,demands,metaspecs,checkpoints (default)
+    BENCHMARK_SAMPLES=1000 timed calls per operation (default)
+    BENCHMARK_RESULTS=benchmark-results/repositories.json (default)
+The MongoDB leg needs the Docker Compose database (see conftest.py).
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import os
+import random
+
+import pytest
+
+from tests.benchmarks.latency import LatencyRecorder, summary_dict, write_results
+from tests.infrastructure.persistence.contract.entity_kinds import ENTITY_KINDS
+
+
+def _env_list(name: str, default: str) -> list[str]:
+    return [value for value in os.environ.get(name, default).split(",") if value]
+
+
+SIZES = [int(size) for size in _env_list("BENCHMARK_SIZES", "1000,100000,1000000")]
+BACKENDS = _env_list("BENCHMARK_BACKENDS", "memory,sqlite,mongodb")
+KINDS = [
+    kind
+    for kind in ENTITY_KINDS
+    if kind.name
+    in _env_list("BENCHMARK_KINDS", "projects,demands,metaspecs,checkpoints")
+]
+SAMPLES = int(os.environ.get("BENCHMARK_SAMPLES", "1000"))
+RESULTS_PATH = os.environ.get(
+    "BENCHMARK_RESULTS", "benchmark-results/repositories.json"
+)
+
+SEED_BATCH = 10_000
+PAGE_SIZE = 100
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    """(backend name, Repositories) from tests/conftest.py *_repositories."""
+    return request.param, request.getfixturevalue(f"{request.param}_repositories")
+
+
+@pytest.fixture(scope="module")
+def benchmark_results():
+    """Measurements of the module, written to RESULTS_PATH at the end."""
+    results: list[dict] = []
+    yield results
+    if results:
+        write_results(RESULTS_PATH, "repositories", results)
+        print(f"\n[repository benchmark] results written to {RESULTS_PATH}")
+
+
+async def _seed(repo, kind, count: int) -> list:
+    """Helper: Fill the repository with count entities (batched)."""
+    ids = []
+    for start in range(0, count, SEED_BATCH):
+        entities = [kind.make(i) for i in range(start, min(count, start + SEED_BATCH))]
+        result = await repo.create_many(entities)
+        assert not result.has_failures
+        ids.extend(entity.id for entity in entities)
+    return ids
+
+
+async def _measure(repo, kind, size: int, ids: list) -> list:
+    """Helper: Time SAMPLES calls of each operation."""
+    rng = random.Random(size)
+    recorders = {
+        name: LatencyRecorder(name)
+        for name in ("create", "get_by_id", "update", "list", "delete")
+    }
+
+    created = [kind.make(size + i) for i in range(SAMPLES)]
+    for entity in created:
+        with recorders["create"].measure():
+            await repo.create(entity)
+
+    for entity_id in rng.choices(ids, k=SAMPLES):
+        with recorders["get_by_id"].measure():
+            await repo.get_by_id(entity_id)
+
+    for entity in created:
+        kind.change(entity)
+        with recorders["update"].measure():
+            await repo.update(entity)
+
+    # Walk consecutive pages from the newest: later pages cost the same
+    cursor = None
+    for _ in range(SAMPLES):
+        with recorders["list"].measure():
+            page = await kind.list_page(repo, cursor, PAGE_SIZE)
+        cursor = page.next_cursor
+
+    for entity in created:
+        with recorders["delete"].measure():
+            await repo.delete(entity.id)
+
+    return [recorder.summary() for recorder in recorders.values()]
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("kind", KINDS, ids=repr)
+async def test_repository_operations(backend, kind, size, benchmark_results):
+    """Benchmark: CRUD and list latency at a given collection size"""
+    backend, repositories = backend
+    repo = kind.repository(repositories)
+    ids = await _seed(repo, kind, size)
+
+    summaries = await _measure(repo, kind, size, ids)
+
+    for summary in summaries:
+        benchmark_results.append(
+            summary_dict(summary, backend=backend, entity=kind.name, documents=size)
+        )
+        print(
+            f"\n[repository benchmark] {backend} {kind.name} n={size:,} "
+            f"{summary.operation}: {summary.ops_per_sec:,.0f} ops/s, "
+            f"p50={summary.p50_ms:.3f}ms p99={summary.p99_ms:.3f}ms"
+        )
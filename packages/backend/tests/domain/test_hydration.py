@@ -0,0 +1,97 @@
+"""
+Tests for trusted hydration (from_trusted)
+"""
+
+from datetime import datetime
+
+import pytest
+
+from src.domain.entities.checkpoint import Checkpoint
+from src.domain.entities.demand import Demand
+from src.domain.entities.metaspec import Metaspec, MetaspecType
+from src.domain.entities.project import Project
+from src.domain.exceptions import InvalidMetaspecError
+from src.domain.value_objects.context_budget import ContextBudget
+from src.domain.value_objects.demand_status import DemandStatus
+
+
+class TestFromTrusted:
+    """Test suite for from_trusted on entities and value objects"""
+
+    def test_equals_validated_instance(self):
+        """Test from_trusted builds the same object as the constructor"""
+        created_at = datetime(2025, 1, 1, 12, 0, 0)
+        values = dict(
+            id="demand-1",
+            project_id="proj-1",
+            title="Feature",
+            description="Details",
+            status=DemandStatus.SPEC_APPROVED,
+            context_budget=ContextBudget.from_trusted(max_tokens=100, used_tokens=10),
+            created_at=created_at,
+            updated_at=created_at,
+        )
+        assert Demand.from_trusted(**values) == Demand(**values)
+
+    def test_skips_validation(self):
+        """Test from_trusted does not run __post_init__"""
+        # Constructor would reject empty content
+        with pytest.raises(InvalidMetaspecError):
+            Metaspec(
+                id="meta-1",
+                demand_id="demand-1",
+                type=MetaspecType.BUSINESS,
+                content="",
+            )
+
+        metaspec = Metaspec.from_trusted(
+            id="meta-1", demand_id="demand-1", type=MetaspecType.BUSINESS, content=""
+        )
+        assert metaspec.content == ""
+
+    def test_applies_defaults(self):
+        """Test missing optional fields get their dataclass defaults"""
+        checkpoint = Checkpoint.from_trusted(
+            id="ckpt-1", demand_id="demand-1", context_snapshot="{}", tokens_used=1
+        )
+        assert isinstance(checkpoint.created_at, datetime)
+        assert checkpoint.expires_at is None
+
+        metaspec = Metaspec.from_trusted(
+            id="meta-1", demand_id="demand-1", type=MetaspecType.TECHNICAL, content="#"
+        )
+        assert metaspec.version == 1
+
+    def test_missing_required_field_raises(self):
+        """Test a missing required field is reported"""
+        with pytest.raises(TypeError, match="owner_id"):
+            Project.from_trusted(
+                id="proj-1",
+                name="Project",
+                description="",
+                context_budget=ContextBudget(max_tokens=1, used_tokens=0),
+            )
+
+    def test_unknown_field_raises(self):
+        """Test an unknown field is reported"""
+        with pytest.raises(TypeError, match="user_id"):
+            ContextBudget.from_trusted(max_tokens=1, used_tokens=0, user_id="x")
+
+    def test_frozen_value_object_stays_frozen(self):
+        """Test ContextBudget from from_trusted is still immutable"""
+        budget = ContextBudget.from_trusted(max_tokens=100, used_tokens=10)
+        assert budget.remaining_tokens == 90
+        with pytest.raises(AttributeError):
+            budget.used_tokens = 0
+
+    def test_entity_behaviour_works(self):
+        """Test hydrated entities keep their business methods"""
+        project = Project.from_trusted(
+            id="proj-1",
+            name="Project",
+            description="",
+            owner_id="user-1",
+            context_budget=ContextBudget.from_trusted(max_tokens=100, used_tokens=0),
+        )
+        project.consume_tokens(40)
+        assert project.context_budget.used_tokens == 40
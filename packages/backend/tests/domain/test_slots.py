@@ -0,0 +1,74 @@
+"""
+Tests for the compact (__slots__) layout of entities and value objects
+"""
+
+import copy
+import pickle
+from datetime import datetime
+
+import pytest
+
+from src.domain.entities.checkpoint import Checkpoint
+from src.domain.entities.demand import Demand
+from src.domain.entities.metaspec import Metaspec, MetaspecType
+from src.domain.entities.project import Project
+from src.domain.value_objects.context_budget import ContextBudget
+
+
+def _instances():
+    budget = ContextBudget(max_tokens=1000, used_tokens=100)
+    created_at = datetime(2025, 1, 1)
+    return [
+        budget,
+        Project(
+            id="proj-1",
+            name="Project",
+            description="",
+            owner_id="user-1",
+            context_budget=budget,
+            created_at=created_at,
+        ),
+        Demand(
+            id="demand-1",
+            project_id="proj-1",
+            title="Feature",
+            description="",
+            context_budget=budget,
+            created_at=created_at,
+        ),
+        Metaspec(
+            id="meta-1",
+            demand_id="demand-1",
+            type=MetaspecType.BUSINESS,
+            content="# Spec",
+            created_at=created_at,
+        ),
+        Checkpoint(
+            id="ckpt-1",
+            demand_id="demand-1",
+            context_snapshot="{}",
+            tokens_used=1,
+            created_at=created_at,
+        ),
+    ]
+
+
+@pytest.mark.parametrize("instance", _instances(), ids=lambda i: type(i).__name__)
+class TestSlots:
+    """Test suite for slots-based domain objects"""
+
+    def test_has_no_instance_dict(self, instance):
+        """Test instances carry no per-instance __dict__"""
+        assert not hasattr(instance, "__dict__")
+
+    def test_rejects_unknown_attributes(self, instance):
+        """Test typos in attribute names fail instead of adding state"""
+        # frozen + slots on Python 3.11 raises TypeError here (CPython gh-90562)
+        with pytest.raises((AttributeError, TypeError)):
+            instance.unknown_field = 1
+
+    def test_copy_and_pickle_round_trip(self, instance):
+        """Test copies used by repositories and caches stay equal"""
+        assert copy.copy(instance) == instance
+        assert copy.deepcopy(instance) == instance
+        assert pickle.loads(pickle.dumps(instance)) == instance
@@ -4,6 +4,10 @@ Tests for DemandStatus Value Object
 
 import pytest
 from src.domain.value_objects.demand_status import DemandStatus
+from src.domain.exceptions import (
+    DemandAlreadyCompletedError,
+    InvalidStatusTransitionError,
+)
 
 
 class TestDemandStatus:
@@ -80,3 +84,12 @@ class TestDemandStatus:
         assert not DemandStatus.ARCHITECTURE_DONE.is_final()
         assert not DemandStatus.CODE_COMPLETE.is_final()
         assert DemandStatus.PR_MERGED.is_final()
+
+    def test_validate_transition(self):
+        """Test validate_transition accepts the next status only"""
+        DemandStatus.DRAFT.validate_transition(DemandStatus.SPEC_APPROVED)
+
+        with pytest.raises(InvalidStatusTransitionError):
+            DemandStatus.DRAFT.validate_transition(DemandStatus.CODE_COMPLETE)
+        with pytest.raises(DemandAlreadyCompletedError):
+            DemandStatus.PR_MERGED.validate_transition(DemandStatus.DRAFT)
@@ -0,0 +1,253 @@
+"""
+Tests for CachedRepository
+
+Uses an in-memory fake repository that counts calls and an in-process
+stand-in for the Redis client (get / mget / set / delete).
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import pytest
+
+from application.dto.bulk_write_result import BulkItemResult, BulkWriteResult
+from application.dto.status_transition import StatusTransition
+from domain.entities.project import Project
+from domain.value_objects.context_budget import ContextBudget
+from domain.value_objects.demand_status import DemandStatus
+from infrastructure.cache.cached_repository import CachedRepository
+from infrastructure.cache.redis_tier import RedisCacheTier
+from infrastructure.persistence.memory import InMemoryDemandRepository, InMemoryStore
+from tests.infrastructure.persistence.contract.entity_kinds import DEMANDS
+
+
+class FakeProjectRepository:
+    """Fake repository recording every read"""
+
+    def __init__(self, projects: List[Project]):
+        self.projects = {project.id: project for project in projects}
+        self.reads: List[str] = []
+
+    async def get_by_id(self, project_id: str) -> Optional[Project]:
+        self.reads.append(project_id)
+        return self.projects.get(project_id)
+
+    async def get_many(self, project_ids: List[str]) -> Dict[str, Project]:
+        self.reads.extend(project_ids)
+        return {i: self.projects[i] for i in project_ids if i in self.projects}
+
+    async def update(self, project: Project) -> Project:
+        self.projects[project.id] = project
+        return project
+
+    async def delete(self, project_id: str) -> None:
+        self.projects.pop(project_id, None)
+
+    async def delete_many(self, project_ids: List[str]) -> BulkWriteResult:
+        for project_id in project_ids:
+            self.projects.pop(project_id, None)
+        return BulkWriteResult(
+            items=[
+                BulkItemResult(index=i, id=p, ok=True)
+                for i, p in enumerate(project_ids)
+            ]
+        )
+
+    async def consume_tokens(self, project_id: str, tokens: int) -> ContextBudget:
+        project = self.projects[project_id]
+        project.consume_tokens(tokens)
+        return project.context_budget
+
+    async def list_by_owner(self, owner_id: str) -> List[Project]:
+        return [p for p in self.projects.values() if p.owner_id == owner_id]
+
+
+class FakeRedis:
+    """In-process stand-in for a redis.asyncio client"""
+
+    def __init__(self):
+        self.data: Dict[str, bytes] = {}
+        self.expiry: Dict[str, Optional[int]] = {}
+
+    async def get(self, name: str) -> Optional[bytes]:
+        return self.data.get(name)
+
+    async def mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        return [self.data.get(key) for key in keys]
+
+    async def set(self, name: str, value: bytes, ex: Optional[int] = None) -> bool:
+        self.data[name] = value
+        self.expiry[name] = ex
+        return True
+
+    async def delete(self, *names: str) -> int:
+        return sum(self.data.pop(name, None) is not None for name in names)
+
+
+def _make_project(project_id: str) -> Project:
+    """Helper: Project with an empty 1000-token budget"""
+    return Project(
+        id=project_id,
+        name=f"Project {project_id}",
+        description="Cached project",
+        owner_id="user_1",
+        context_budget=ContextBudget(max_tokens=1000, used_tokens=0),
+        created_at=datetime.utcnow(),
+    )
+
+
+class TestCachedRepository:
+    """Test suite for CachedRepository"""
+
+    @pytest.fixture
+    def repository(self):
+        """Fixture: Fake repository with two projects"""
+        return FakeProjectRepository([_make_project("p1"), _make_project("p2")])
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_served_from_cache(self, repository):
+        """Test that repeated reads reach the repository once"""
+        cached = CachedRepository(repository)
+
+        first = await cached.get_by_id("p1")
+        second = await cached.get_by_id("p1")
+
+        assert first == second
+        assert repository.reads == ["p1"]
+        assert (cached.stats.hits, cached.stats.misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_returned_entities_are_copies(self, repository):
+        """Test that mutating a returned entity does not change the cache"""
+        cached = CachedRepository(repository)
+        project = await cached.get_by_id("p1")
+
+        project.consume_tokens(500)
+
+        again = await cached.get_by_id("p1")
+        assert again.context_budget.used_tokens == 0
+
+    @pytest.mark.asyncio
+    async def test_get_many_loads_only_misses(self, repository):
+        """Test that get_many queries only ids not already cached"""
+        cached = CachedRepository(repository)
+        await cached.get_by_id("p1")
+
+        found = await cached.get_many(["p1", "p2", "missing"])
+
+        assert set(found) == {"p1", "p2"}
+        assert repository.reads == ["p1", "p2", "missing"]
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate(self, repository):
+        """Test that update, delete and consume_tokens drop cached entries"""
+        cached = CachedRepository(repository)
+        project = await cached.get_by_id("p1")
+
+        project.description = "Changed"
+        await cached.update(project)
+        assert (await cached.get_by_id("p1")).description == "Changed"
+
+        budget = await cached.consume_tokens("p1", 300)
+        assert budget.used_tokens == 300
+        assert (await cached.get_by_id("p1")).context_budget.used_tokens == 300
+
+        await cached.delete_many(["p1"])
+        assert await cached.get_by_id("p1") is None
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry_reloads(self, repository):
+        """Test that an expired entry is read again from the repository"""
+        now = [0.0]
+        cached = CachedRepository(repository, ttl_seconds=5, clock=lambda: now[0])
+        await cached.get_by_id("p1")
+
+        now[0] = 6
+        await cached.get_by_id("p1")
+
+        assert repository.reads == ["p1", "p1"]
+        assert cached.stats.expirations == 1
+
+    @pytest.mark.asyncio
+    async def test_evictions_counted(self, repository):
+        """Test that a full cache reports evictions"""
+        cached = CachedRepository(repository, max_entries=1)
+
+        await cached.get_by_id("p1")
+        await cached.get_by_id("p2")
+
+        assert cached.stats.evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_other_methods_pass_through(self, repository):
+        """Test that methods without caching are forwarded unchanged"""
+        cached = CachedRepository(repository)
+
+        projects = await cached.list_by_owner("user_1")
+
+        assert len(projects) == 2
+
+    @pytest.mark.asyncio
+    async def test_second_tier_shared_between_instances(self, repository):
+        """Test that a second process hits the Redis tier, not the repository"""
+        redis = FakeRedis()
+        first = CachedRepository(
+            repository, second_tier=RedisCacheTier(redis, "projects", ttl_seconds=60)
+        )
+        second = CachedRepository(
+            repository, second_tier=RedisCacheTier(redis, "projects", ttl_seconds=60)
+        )
+
+        await first.get_by_id("p1")
+        found = await second.get_many(["p1"])
+
+        assert found["p1"].id == "p1"
+        assert repository.reads == ["p1"]
+        assert redis.expiry == {"projects:p1": 60}
+        assert second.second_tier_stats.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_second_tier_invalidated_on_write(self, repository):
+        """Test that writes remove the id from the Redis tier"""
+        redis = FakeRedis()
+        cached = CachedRepository(
+            repository, second_tier=RedisCacheTier(redis, "projects")
+        )
+        await cached.get_by_id("p1")
+
+        await cached.delete("p1")
+
+        assert redis.data == {}
+        assert await cached.get_by_id("p1") is None
+
+
+@pytest.mark.asyncio
+async def test_transition_invalidates():
+    """Test that a compare-and-set transition drops the cached demand"""
+    cached = CachedRepository(InMemoryDemandRepository(InMemoryStore()))
+    demand = DEMANDS.make(0)
+    await cached.create(demand)
+    await cached.get_by_id(demand.id)
+
+    await cached.transition(demand.id, DemandStatus.DRAFT, DemandStatus.SPEC_APPROVED)
+
+    assert (await cached.get_by_id(demand.id)).status == DemandStatus.SPEC_APPROVED
+
+
+@pytest.mark.asyncio
+async def test_transition_many_invalidates():
+    """Test that a batched transition drops every cached demand it names"""
+    cached = CachedRepository(InMemoryDemandRepository(InMemoryStore()))
+    demands = [DEMANDS.make(i) for i in range(2)]
+    await cached.create_many(demands)
+    await cached.get_many([demand.id for demand in demands])
+
+    await cached.transition_many(
+        [
+            StatusTransition(d.id, DemandStatus.DRAFT, DemandStatus.SPEC_APPROVED)
+            for d in demands
+        ]
+    )
+
+    stored = await cached.get_many([demand.id for demand in demands])
+    assert {d.status for d in stored.values()} == {DemandStatus.SPEC_APPROVED}
@@ -0,0 +1,79 @@
+"""
+Tests for LRUTTLCache
+
+Uses a manual clock so TTL expiry is deterministic.
+"""
+
+import pytest
+
+from infrastructure.cache.lru_ttl_cache import LRUTTLCache
+
+
+class FakeClock:
+    """Manually advanced time source"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLRUTTLCache:
+    """Test suite for LRUTTLCache"""
+
+    def test_hit_and_miss_counters(self):
+        """Test that lookups are counted as hits or misses"""
+        cache = LRUTTLCache(max_entries=2)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+        assert cache.stats.hit_rate == 0.5
+
+    def test_least_recently_used_is_evicted(self):
+        """Test that a full cache drops the least recently used entry"""
+        cache = LRUTTLCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats.evictions == 1
+
+    def test_entries_expire_after_ttl(self):
+        """Test that entries older than the TTL are misses"""
+        clock = FakeClock()
+        cache = LRUTTLCache(max_entries=2, ttl_seconds=10, clock=clock)
+        cache.set("a", 1)
+
+        clock.now = 10
+        assert cache.get("a") == 1
+        clock.now = 10.5
+        assert cache.get("a") is None
+        assert cache.stats.expirations == 1
+        assert len(cache) == 0
+
+    def test_items_skip_expired_entries(self):
+        """Test that items() lists live entries without touching counters"""
+        clock = FakeClock()
+        cache = LRUTTLCache(max_entries=3, ttl_seconds=10, clock=clock)
+        cache.set("a", 1)
+        clock.now = 5
+        cache.set("b", 2)
+
+        clock.now = 12
+        assert cache.items() == [("b", 2)]
+        assert (cache.stats.hits, cache.stats.misses) == (0, 0)
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"max_entries": 0}, {"max_entries": 1, "ttl_seconds": 0}]
+    )
+    def test_invalid_configuration(self, kwargs):
+        """Test that non-positive size or TTL raises ValueError"""
+        with pytest.raises(ValueError):
+            LRUTTLCache(**kwargs)
@@ -0,0 +1,58 @@
+"""
+Tests for MongoSettings
+
+Settings are read from MONGODB_* environment variables.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from infrastructure.config.settings import MongoSettings
+
+
+class TestMongoSettings:
+    """Test suite for MongoSettings"""
+
+    def test_pool_settings_from_environment(self, monkeypatch):
+        """Test that pool, compression and timeout settings come from env"""
+        monkeypatch.setenv("MONGODB_URI", "mongodb://db.internal:27017")
+        monkeypatch.setenv("MONGODB_MAX_POOL_SIZE", "50")
+        monkeypatch.setenv("MONGODB_MIN_POOL_SIZE", "10")
+        monkeypatch.setenv("MONGODB_MAX_IDLE_TIME_MS", "60000")
+        monkeypatch.setenv("MONGODB_COMPRESSORS", "zstd,zlib")
+        monkeypatch.setenv("MONGODB_WAIT_QUEUE_TIMEOUT_MS", "2000")
+
+        settings = MongoSettings(_env_file=None)
+
+        assert settings.uri == "mongodb://db.internal:27017"
+        assert settings.max_pool_size == 50
+        assert settings.min_pool_size == 10
+        assert settings.max_idle_time_ms == 60000
+        assert settings.compressors == "zstd,zlib"
+        assert settings.wait_queue_timeout_ms == 2000
+
+    def test_defaults(self, monkeypatch):
+        """Test pymongo-like pool defaults with fail-fast timeouts"""
+        for name in ("MONGODB_URI", "MONGODB_MAX_POOL_SIZE", "MONGODB_MIN_POOL_SIZE"):
+            monkeypatch.delenv(name, raising=False)
+
+        settings = MongoSettings(_env_file=None)
+
+        assert settings.max_pool_size == 100
+        assert settings.min_pool_size == 0
+        assert settings.server_selection_timeout_ms == 5000
+
+    def test_checkpoint_settings_from_environment(self, monkeypatch):
+        """Test that the checkpoint codec and keyframe interval come from env"""
+        monkeypatch.setenv("MONGODB_CHECKPOINT_CODEC", "")
+        monkeypatch.setenv("MONGODB_CHECKPOINT_KEYFRAME_INTERVAL", "10")
+
+        settings = MongoSettings(_env_file=None)
+
+        assert settings.checkpoint_codec is None
+        assert settings.checkpoint_keyframe_interval == 10
+
+    def test_min_pool_size_above_max_raises(self):
+        """Test that min_pool_size > max_pool_size is rejected"""
+        with pytest.raises(ValidationError, match="min_pool_size"):
+            MongoSettings(_env_file=None, max_pool_size=5, min_pool_size=10)
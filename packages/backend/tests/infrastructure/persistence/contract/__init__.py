@@ -0,0 +1 @@
+"""Repository Contract Tests"""
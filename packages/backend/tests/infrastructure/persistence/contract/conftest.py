@@ -0,0 +1,20 @@
+"""
+Contract Test Fixtures
+
+Every contract test runs once per backend. The MongoDB leg needs the
+Docker Compose database (see tests/conftest.py).
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import pytest
+
+from interfaces.api.dependencies import Repositories
+
+BACKENDS = ["memory", "sqlite", "mongodb"]
+
+
+@pytest.fixture(params=BACKENDS)
+def repositories(request) -> Repositories:
+    """Repositories of each backend (tests/conftest.py *_repositories)."""
+    return request.getfixturevalue(f"{request.param}_repositories")
@@ -0,0 +1,134 @@
+"""
+Entity Kinds for Repository Contract Tests
+
+Describes each aggregate generically (factory, edit, listing) so the
+same CRUD contract and benchmarks run for projects, demands, metaspecs
+and checkpoints. Timestamps are whole seconds so they survive MongoDB's
+millisecond precision.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Optional
+
+from application.dto.page import Page
+from domain.entities.checkpoint import Checkpoint
+from domain.entities.demand import Demand
+from domain.entities.metaspec import Metaspec, MetaspecType
+from domain.entities.project import Project
+from domain.value_objects.context_budget import ContextBudget
+from interfaces.api.dependencies import Repositories
+
+BASE_TIME = datetime(2025, 1, 1)
+
+# Listing group shared by every generated entity (owner, project, demand)
+PARENT_ID = "contract_parent"
+
+
+@dataclass(frozen=True)
+class EntityKind:
+    """
+    How to exercise one repository generically.
+
+    Attributes:
+        name: Aggregate name (test ids)
+        repository: Picks the repository out of Repositories
+        make: Builds the i-th entity; higher i lists first
+        change: Edits an entity in place (same listing position)
+        list_page: Lists PARENT_ID's entities (repository, after, limit)
+    """
+
+    name: str
+    repository: Callable[[Repositories], Any]
+    make: Callable[[int], Any]
+    change: Callable[[Any], None]
+    list_page: Callable[[Any, Optional[str], int], Awaitable[Page]]
+
+    def __repr__(self) -> str:
+        return self.name
+
+
+def _make_project(i: int) -> Project:
+    return Project(
+        id=str(uuid.uuid4()),
+        name=f"Project {i}",
+        description="Description",
+        owner_id=PARENT_ID,
+        context_budget=ContextBudget(max_tokens=1000, used_tokens=0),
+        created_at=BASE_TIME + timedelta(seconds=i),
+    )
+
+
+def _make_demand(i: int) -> Demand:
+    return Demand(
+        id=str(uuid.uuid4()),
+        project_id=PARENT_ID,
+        title=f"Demand {i}",
+        description="Description",
+        created_at=BASE_TIME + timedelta(seconds=i),
+    )
+
+
+def _make_metaspec(i: int) -> Metaspec:
+    return Metaspec(
+        id=str(uuid.uuid4()),
+        demand_id=PARENT_ID,
+        type=MetaspecType.BUSINESS,
+        content=f"# Spec {i}",
+        version=i + 1,
+        created_at=BASE_TIME + timedelta(seconds=i),
+    )
+
+
+def _make_checkpoint(i: int) -> Checkpoint:
+    return Checkpoint(
+        id=str(uuid.uuid4()),
+        demand_id=PARENT_ID,
+        context_snapshot=f'{{"messages": ["turn {i}"]}}',
+        tokens_used=i + 1,
+        created_at=BASE_TIME + timedelta(seconds=i),
+    )
+
+
+def _set(name: str, value: Any) -> Callable[[Any], None]:
+    return lambda entity: setattr(entity, name, value)
+
+
+PROJECTS = EntityKind(
+    name="projects",
+    repository=lambda repositories: repositories.projects,
+    make=_make_project,
+    change=_set("description", "Changed"),
+    list_page=lambda repo, after, limit: repo.list_by_owner(PARENT_ID, after, limit),
+)
+
+DEMANDS = EntityKind(
+    name="demands",
+    repository=lambda repositories: repositories.demands,
+    make=_make_demand,
+    change=_set("title", "Changed"),
+    list_page=lambda repo, after, limit: repo.list_by_project(
+        PARENT_ID, after=after, limit=limit
+    ),
+)
+
+METASPECS = EntityKind(
+    name="metaspecs",
+    repository=lambda repositories: repositories.metaspecs,
+    make=_make_metaspec,
+    change=_set("content", "# Changed"),
+    list_page=lambda repo, after, limit: repo.list_metaspecs(PARENT_ID, after, limit),
+)
+
+CHECKPOINTS = EntityKind(
+    name="checkpoints",
+    repository=lambda repositories: repositories.checkpoints,
+    make=_make_checkpoint,
+    change=_set("context_snapshot", '{"messages": ["changed"]}'),
+    list_page=lambda repo, after, limit: repo.list_checkpoints(PARENT_ID, after, limit),
+)
+
+ENTITY_KINDS = [PROJECTS, DEMANDS, METASPECS, CHECKPOINTS]
@@ -0,0 +1,343 @@
+"""
+Entity-specific Repository Contracts
+
+Operations only some repositories have: token consumption, status
+filters, metaspec versions, and summary / lazy reads. Run on each backend.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import asyncio
+
+import pytest
+
+from application.dto.status_transition import STATUS_CONFLICT_ERROR, StatusTransition
+from application.exceptions import (
+    DemandNotFoundError,
+    DemandStatusConflictError,
+    ProjectNotFoundError,
+    RepositoryError,
+)
+from domain.entities.metaspec import Metaspec, MetaspecType
+from domain.exceptions import (
+    ContextBudgetExceededError,
+    DemandAlreadyCompletedError,
+    InvalidStatusTransitionError,
+)
+from domain.value_objects.demand_status import DemandStatus
+from tests.infrastructure.persistence.contract.entity_kinds import (
+    CHECKPOINTS,
+    DEMANDS,
+    METASPECS,
+    PARENT_ID,
+    PROJECTS,
+)
+
+
+class TestProjectContract:
+    """consume_tokens contract"""
+
+    @pytest.mark.asyncio
+    async def test_consume_tokens_charges_budget(self, repositories):
+        """Test that consumed tokens are persisted"""
+        project = PROJECTS.make(0)
+        await repositories.projects.create(project)
+
+        budget = await repositories.projects.consume_tokens(project.id, 300)
+
+        stored = await repositories.projects.get_by_id(project.id)
+        assert budget.used_tokens == 300
+        assert stored.context_budget == budget
+
+    @pytest.mark.asyncio
+    async def test_concurrent_consumption_never_overruns(self, repositories):
+        """Test that concurrent charges never exceed max_tokens"""
+        project = PROJECTS.make(0)
+        await repositories.projects.create(project)
+
+        results = await asyncio.gather(
+            *(repositories.projects.consume_tokens(project.id, 300) for _ in range(5)),
+            return_exceptions=True,
+        )
+
+        succeeded = [result for result in results if not isinstance(result, Exception)]
+        failed = [result for result in results if isinstance(result, Exception)]
+        stored = await repositories.projects.get_by_id(project.id)
+        assert len(succeeded) == 3
+        assert all(isinstance(error, ContextBudgetExceededError) for error in failed)
+        assert stored.context_budget.used_tokens == 900
+
+    @pytest.mark.asyncio
+    async def test_consume_tokens_errors(self, repositories):
+        """Test invalid amounts and unknown projects"""
+        project = PROJECTS.make(0)
+        await repositories.projects.create(project)
+
+        with pytest.raises(ValueError):
+            await repositories.projects.consume_tokens(project.id, -1)
+        with pytest.raises(ProjectNotFoundError):
+            await repositories.projects.consume_tokens("missing", 1)
+
+
+class TestDemandContract:
+    """list_by_project status filter and status count contract"""
+
+    @pytest.mark.asyncio
+    async def test_status_filter_follows_updates(self, repositories):
+        """Test that a status listing reflects persisted transitions"""
+        demands = [DEMANDS.make(i) for i in range(3)]
+        await repositories.demands.create_many(demands)
+
+        demands[0].transition_to(DemandStatus.SPEC_APPROVED)
+        await repositories.demands.update(demands[0])
+
+        drafts = await repositories.demands.list_by_project(
+            PARENT_ID, status=DemandStatus.DRAFT
+        )
+        approved = await repositories.demands.list_by_project(
+            PARENT_ID, status=DemandStatus.SPEC_APPROVED
+        )
+        assert [demand.id for demand in drafts.items] == [
+            demands[2].id,
+            demands[1].id,
+        ]
+        assert [demand.id for demand in approved.items] == [demands[0].id]
+        assert approved.items[0].status == DemandStatus.SPEC_APPROVED
+
+    @pytest.mark.asyncio
+    async def test_status_counts_follow_writes(self, repositories):
+        """Test count_by_status and the rollup after every kind of write"""
+        repo = repositories.demands
+        demands = [DEMANDS.make(i) for i in range(5)]
+        await repo.create_many(demands[:4])
+        await repo.create(demands[4])
+
+        demands[0].transition_to(DemandStatus.SPEC_APPROVED)
+        await repo.update(demands[0])
+        for demand in demands[1:3]:
+            demand.advance_to_next_status()
+            demand.advance_to_next_status()
+        await repo.update_many(demands[1:3])
+        await repo.delete(demands[3].id)
+        await repo.delete_many([demands[4].id, "missing-demand"])
+
+        expected = {
+            DemandStatus.DRAFT: 0,
+            DemandStatus.SPEC_APPROVED: 1,
+            DemandStatus.ARCHITECTURE_DONE: 2,
+            DemandStatus.CODE_COMPLETE: 0,
+            DemandStatus.PR_MERGED: 0,
+        }
+        counts = await repo.count_by_status(PARENT_ID)
+        assert counts == expected
+        assert list(counts) == list(DemandStatus)
+        assert await repo.get_status_rollup(PARENT_ID) == expected
+
+    @pytest.mark.asyncio
+    async def test_status_counts_of_unknown_project(self, repositories):
+        """Test that a project without demands counts zero everywhere"""
+        zero = {status: 0 for status in DemandStatus}
+
+        assert await repositories.demands.count_by_status("missing-project") == zero
+        assert await repositories.demands.get_status_rollup("missing-project") == zero
+
+    @pytest.mark.asyncio
+    async def test_transition_is_compare_and_set(self, repositories):
+        """Test transition moves the status and keeps the other fields"""
+        repo = repositories.demands
+        demand = DEMANDS.make(0)
+        await repo.create(demand)
+
+        await repo.transition(demand.id, DemandStatus.DRAFT, DemandStatus.SPEC_APPROVED)
+
+        stored = await repo.get_by_id(demand.id)
+        assert stored.status == DemandStatus.SPEC_APPROVED
+        assert stored.updated_at is not None
+        assert (stored.title, stored.description) == (
+            demand.title,
+            demand.description,
+        )
+        rollup = await repo.get_status_rollup(PARENT_ID)
+        assert rollup[DemandStatus.DRAFT] == 0
+        assert rollup[DemandStatus.SPEC_APPROVED] == 1
+
+    @pytest.mark.asyncio
+    async def test_transition_errors(self, repositories):
+        """Test stale, missing, invalid and completed transitions"""
+        repo = repositories.demands
+        demand = DEMANDS.make(0)
+        demand.transition_to(DemandStatus.SPEC_APPROVED)
+        await repo.create(demand)
+
+        with pytest.raises(DemandStatusConflictError) as conflict:
+            await repo.transition(
+                demand.id, DemandStatus.DRAFT, DemandStatus.SPEC_APPROVED
+            )
+        assert conflict.value.actual == DemandStatus.SPEC_APPROVED
+        assert conflict.value.expected == DemandStatus.DRAFT
+
+        with pytest.raises(DemandNotFoundError):
+            await repo.transition(
+                "missing-demand", DemandStatus.DRAFT, DemandStatus.SPEC_APPROVED
+            )
+        with pytest.raises(InvalidStatusTransitionError):
+            await repo.transition(
+                demand.id, DemandStatus.SPEC_APPROVED, DemandStatus.PR_MERGED
+            )
+        with pytest.raises(DemandAlreadyCompletedError):
+            await repo.transition(demand.id, DemandStatus.PR_MERGED, DemandStatus.DRAFT)
+        assert (await repo.get_by_id(demand.id)).status == DemandStatus.SPEC_APPROVED
+
+    @pytest.mark.asyncio
+    async def test_concurrent_transitions_have_one_winner(self, repositories):
+        """Test that racing workers advance a demand exactly once"""
+        repo = repositories.demands
+        demand = DEMANDS.make(0)
+        await repo.create(demand)
+
+        results = await asyncio.gather(
+            *(
+                repo.transition(
+                    demand.id, DemandStatus.DRAFT, DemandStatus.SPEC_APPROVED
+                )
+                for _ in range(5)
+            ),
+            return_exceptions=True,
+        )
+
+        conflicts = [r for r in results if isinstance(r, DemandStatusConflictError)]
+        assert results.count(None) == 1
+        assert len(conflicts) == 4
+        rollup = await repo.get_status_rollup(PARENT_ID)
+        assert rollup[DemandStatus.SPEC_APPROVED] == 1
+
+    @pytest.mark.asyncio
+    async def test_transition_many_reports_each_item(self, repositories):
+        """Test that failing items do not stop the rest of the batch"""
+        repo = repositories.demands
+        fresh, stale, done = DEMANDS.make(0), DEMANDS.make(1), DEMANDS.make(2)
+        stale.transition_to(DemandStatus.SPEC_APPROVED)
+        await repo.create_many([fresh, stale, done])
+        move = (DemandStatus.DRAFT, DemandStatus.SPEC_APPROVED)
+
+        result = await repo.transition_many(
+            [
+                StatusTransition(fresh.id, *move),
+                StatusTransition(stale.id, *move),
+                StatusTransition("missing-demand", *move),
+                StatusTransition(done.id, DemandStatus.DRAFT, DemandStatus.PR_MERGED),
+                StatusTransition(fresh.id, *move),
+            ]
+        )
+
+        assert [item.ok for item in result.items] == [
+            True,
+            False,
+            False,
+            False,
+            False,
+        ]
+        assert result.items[1].error == STATUS_CONFLICT_ERROR
+        assert result.succeeded_ids == [fresh.id]
+        stored = await repo.get_many([fresh.id, done.id])
+        assert stored[fresh.id].status == DemandStatus.SPEC_APPROVED
+        assert stored[fresh.id].updated_at is not None
+        assert stored[done.id].status == DemandStatus.DRAFT
+        rollup = await repo.get_status_rollup(PARENT_ID)
+        assert rollup[DemandStatus.DRAFT] == 1
+        assert rollup[DemandStatus.SPEC_APPROVED] == 2
+
+
+class TestMetaspecContract:
+    """Metaspec versioning contract"""
+
+    @pytest.mark.asyncio
+    async def test_new_version_keeps_history(self, repositories):
+        """Test that a higher version becomes latest and v1 stays readable"""
+        metaspec = METASPECS.make(0)
+        await repositories.metaspecs.create(metaspec)
+
+        metaspec.content = "# Spec v2"
+        metaspec.increment_version()
+        await repositories.metaspecs.update(metaspec)
+
+        latest = await repositories.metaspecs.get_latest(
+            PARENT_ID, MetaspecType.BUSINESS
+        )
+        first = await repositories.metaspecs.get_version(
+            PARENT_ID, MetaspecType.BUSINESS, 1
+        )
+        listed = await repositories.metaspecs.list_metaspecs(PARENT_ID)
+        assert (latest.id, latest.version) == (metaspec.id, 2)
+        assert latest.content == "# Spec v2"
+        assert first.content == "# Spec 0"
+        assert [item.version for item in listed.items] == [2]
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_every_version(self, repositories):
+        """Test that delete() drops old versions too"""
+        metaspec = METASPECS.make(0)
+        await repositories.metaspecs.create(metaspec)
+        metaspec.increment_version()
+        await repositories.metaspecs.update(metaspec)
+
+        await repositories.metaspecs.delete(metaspec.id)
+
+        for version in (1, 2):
+            assert (
+                await repositories.metaspecs.get_version(
+                    PARENT_ID, MetaspecType.BUSINESS, version
+                )
+                is None
+            )
+
+    @pytest.mark.asyncio
+    async def test_lazy_content(self, repositories, monkeypatch):
+        """Test that lazy content loads on access and fails once deleted"""
+        metaspec = METASPECS.make(0)
+        await repositories.metaspecs.create(metaspec)
+
+        def validate_again(entity):
+            raise AssertionError("stored content validated again")
+
+        # Stored content is trusted: to_entity must not rescan it
+        monkeypatch.setattr(Metaspec, "_validate_content", validate_again)
+
+        lazy = await repositories.metaspecs.get_lazy(metaspec.id)
+        orphan = await repositories.metaspecs.get_lazy(metaspec.id)
+        entity = await lazy.to_entity()
+        await repositories.metaspecs.delete(metaspec.id)
+
+        assert entity == metaspec
+        with pytest.raises(RepositoryError):
+            await orphan.content()
+
+
+class TestCheckpointContract:
+    """Checkpoint summary and lazy read contract"""
+
+    @pytest.mark.asyncio
+    async def test_summaries_match_entities(self, repositories):
+        """Test that summary pages list the same checkpoints as full pages"""
+        checkpoints = [CHECKPOINTS.make(i) for i in range(3)]
+        await repositories.checkpoints.create_many(checkpoints)
+
+        full = await repositories.checkpoints.list_checkpoints(PARENT_ID)
+        summaries = await repositories.checkpoints.list_checkpoint_summaries(PARENT_ID)
+        summary = await repositories.checkpoints.get_summary(checkpoints[0].id)
+
+        assert [item.id for item in summaries.items] == [item.id for item in full.items]
+        assert summary.tokens_used == checkpoints[0].tokens_used
+        assert await repositories.checkpoints.get_summary("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_lazy_snapshot(self, repositories):
+        """Test that the lazy snapshot equals the stored one"""
+        checkpoint = CHECKPOINTS.make(0)
+        await repositories.checkpoints.create(checkpoint)
+
+        lazy = await repositories.checkpoints.get_lazy(checkpoint.id)
+
+        assert not lazy.is_loaded
+        assert await lazy.context_snapshot() == checkpoint.context_snapshot
+        assert await repositories.checkpoints.get_lazy("missing") is None
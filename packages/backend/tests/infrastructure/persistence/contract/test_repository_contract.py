@@ -0,0 +1,305 @@
+"""
+Repository CRUD Contract
+
+Behaviour every I*Repository implementation must share, run for each
+aggregate (projects, demands, metaspecs, checkpoints) on each backend
+(memory, sqlite, mongodb).
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import copy
+import dataclasses
+from datetime import timedelta
+
+import pytest
+
+from application.dto.bulk_write_result import REVISION_CONFLICT_ERROR
+from application.dto.page import MAX_PAGE_SIZE
+from application.exceptions import DuplicateEntityError, RevisionConflictError
+from tests.infrastructure.persistence.contract.entity_kinds import ENTITY_KINDS
+
+
+@pytest.fixture(params=ENTITY_KINDS, ids=repr)
+def kind(request):
+    return request.param
+
+
+class TestRepositoryContract:
+    """CRUD contract of the I*Repository interfaces"""
+
+    @pytest.mark.asyncio
+    async def test_create_then_get_returns_equal_entity(self, repositories, kind):
+        """Test that an entity reads back equal to what was created"""
+        repo = kind.repository(repositories)
+        entity = kind.make(0)
+
+        created = await repo.create(entity)
+
+        assert created == entity
+        assert await repo.get_by_id(entity.id) == entity
+
+    @pytest.mark.asyncio
+    async def test_get_missing_returns_none(self, repositories, kind):
+        """Test that an unknown id reads as None"""
+        repo = kind.repository(repositories)
+
+        assert await repo.get_by_id("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_create_existing_id_raises(self, repositories, kind):
+        """Test that creating an existing id raises DuplicateEntityError"""
+        repo = kind.repository(repositories)
+        entity = kind.make(0)
+        await repo.create(entity)
+
+        with pytest.raises(DuplicateEntityError):
+            await repo.create(entity)
+
+    @pytest.mark.asyncio
+    async def test_update_persists_changes(self, repositories, kind):
+        """Test that update() replaces the stored entity"""
+        repo = kind.repository(repositories)
+        entity = kind.make(0)
+        await repo.create(entity)
+
+        kind.change(entity)
+        await repo.update(entity)
+
+        assert await repo.get_by_id(entity.id) == entity
+
+    @pytest.mark.asyncio
+    async def test_update_missing_does_not_create(self, repositories, kind):
+        """Test that update() of an unknown id stores nothing"""
+        repo = kind.repository(repositories)
+        entity = kind.make(0)
+
+        await repo.update(entity)
+
+        assert await repo.get_by_id(entity.id) is None
+
+    @pytest.mark.asyncio
+    async def test_update_increments_revision(self, repositories, kind):
+        """Test that each update() bumps the stored and passed revision"""
+        repo = kind.repository(repositories)
+        entity = kind.make(0)
+        await repo.create(entity)
+
+        await repo.update(entity)
+        kind.change(entity)
+        await repo.update(entity)
+
+        assert entity.revision == 2
+        assert (await repo.get_by_id(entity.id)).revision == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_update_raises_revision_conflict(self, repositories, kind):
+        """Test that an update based on an outdated read is rejected"""
+        repo = kind.repository(repositories)
+        entity = kind.make(0)
+        await repo.create(entity)
+        first = await repo.get_by_id(entity.id)
+        stale = await repo.get_by_id(entity.id)
+
+        kind.change(first)
+        await repo.update(first)
+        with pytest.raises(RevisionConflictError) as raised:
+            await repo.update(stale)
+
+        assert (raised.value.expected, raised.value.actual) == (0, 1)
+        assert stale.revision == 0
+        assert await repo.get_by_id(entity.id) == first
+
+    @pytest.mark.asyncio
+    async def test_update_many_reports_revision_conflicts(self, repositories, kind):
+        """Test that stale items fail individually in update_many()"""
+        repo = kind.repository(repositories)
+        entities = [kind.make(i) for i in range(2)]
+        await repo.create_many(entities)
+        stale = await repo.get_by_id(entities[0].id)
+        await repo.update(entities[0])
+
+        kind.change(stale)
+        kind.change(entities[1])
+        result = await repo.update_many([stale, entities[1]])
+
+        assert result.failures[0].id == stale.id
+        assert result.failures[0].error == REVISION_CONFLICT_ERROR
+        assert result.succeeded_ids == [entities[1].id]
+        assert (stale.revision, entities[1].revision) == (0, 1)
+        assert await repo.get_by_id(entities[0].id) == entities[0]
+
+    @pytest.mark.asyncio
+    async def test_patch_writes_only_named_fields(self, repositories, kind):
+        """Test that patch() leaves attributes it was not given unchanged"""
+        repo = kind.repository(repositories)
+        entity = kind.make(0)
+        await repo.create(entity)
+        original = copy.deepcopy(entity)
+
+        kind.change(entity)
+        entity.created_at += timedelta(seconds=30)
+        await repo.patch(entity, ["created_at"])
+
+        assert entity.revision == 1
+        assert await repo.get_by_id(entity.id) == dataclasses.replace(
+            original, created_at=entity.created_at, revision=1
+        )
+
+    @pytest.mark.asyncio
+    async def test_stale_patch_raises_revision_conflict(self, repositories, kind):
+        """Test that patch() applies the same revision check as update()"""
+        repo = kind.repository(repositories)
+        entity = kind.make(0)
+        await repo.create(entity)
+        stale = await repo.get_by_id(entity.id)
+        await repo.update(entity)
+
+        stale.created_at += timedelta(seconds=30)
+        with pytest.raises(RevisionConflictError):
+            await repo.patch(stale, ["created_at"])
+
+        assert await repo.get_by_id(entity.id) == entity
+
+    @pytest.mark.asyncio
+    async def test_patch_missing_does_not_create(self, repositories, kind):
+        """Test that patch() of an unknown id stores nothing"""
+        repo = kind.repository(repositories)
+        entity = kind.make(0)
+
+        await repo.patch(entity, ["created_at"])
+
+        assert entity.revision == 0
+        assert await repo.get_by_id(entity.id) is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("field", ["id", "revision", "unknown"])
+    async def test_patch_rejects_protected_fields(self, repositories, kind, field):
+        """Test that patch() refuses fields it must not write"""
+        repo = kind.repository(repositories)
+        entity = kind.make(0)
+        await repo.create(entity)
+
+        with pytest.raises(ValueError):
+            await repo.patch(entity, [field])
+
+    @pytest.mark.asyncio
+    async def test_delete_is_idempotent(self, repositories, kind):
+        """Test that delete() removes the entity and tolerates a second call"""
+        repo = kind.repository(repositories)
+        entity = kind.make(0)
+        await repo.create(entity)
+
+        await repo.delete(entity.id)
+        await repo.delete(entity.id)
+
+        assert await repo.get_by_id(entity.id) is None
+        assert (await kind.list_page(repo, None, 10)).items == []
+
+    @pytest.mark.asyncio
+    async def test_returned_entities_are_detached(self, repositories, kind):
+        """Test that editing a returned entity does not change stored data"""
+        repo = kind.repository(repositories)
+        entity = kind.make(0)
+        await repo.create(entity)
+        original = copy.deepcopy(entity)
+
+        found = await repo.get_by_id(entity.id)
+        kind.change(found)
+        kind.change(entity)
+
+        assert await repo.get_by_id(entity.id) == original
+
+    @pytest.mark.asyncio
+    async def test_get_many_skips_missing_and_duplicate_ids(self, repositories, kind):
+        """Test that get_many() maps each found id once"""
+        repo = kind.repository(repositories)
+        entities = [kind.make(i) for i in range(3)]
+        await repo.create_many(entities)
+
+        found = await repo.get_many(
+            [entities[0].id, entities[0].id, "missing", entities[2].id]
+        )
+
+        assert found == {entities[0].id: entities[0], entities[2].id: entities[2]}
+
+    @pytest.mark.asyncio
+    async def test_create_many_reports_duplicates_per_item(self, repositories, kind):
+        """Test that duplicates fail individually without aborting the batch"""
+        repo = kind.repository(repositories)
+        existing = kind.make(0)
+        await repo.create(existing)
+        fresh = [kind.make(i) for i in range(1, 3)]
+
+        result = await repo.create_many([existing, fresh[0], fresh[0], fresh[1]])
+
+        assert [item.ok for item in result.items] == [False, True, False, True]
+        assert result.failed_ids == [existing.id, fresh[0].id]
+        assert await repo.get_many([entity.id for entity in fresh]) == {
+            entity.id: entity for entity in fresh
+        }
+
+    @pytest.mark.asyncio
+    async def test_update_many_reports_missing_per_item(self, repositories, kind):
+        """Test that unknown ids fail individually in update_many()"""
+        repo = kind.repository(repositories)
+        stored = kind.make(0)
+        await repo.create(stored)
+        missing = kind.make(1)
+
+        kind.change(stored)
+        result = await repo.update_many([missing, stored])
+
+        assert result.failed_ids == [missing.id]
+        assert result.succeeded_ids == [stored.id]
+        assert await repo.get_by_id(stored.id) == stored
+        assert await repo.get_by_id(missing.id) is None
+
+    @pytest.mark.asyncio
+    async def test_delete_many_accepts_missing_ids(self, repositories, kind):
+        """Test that delete_many() succeeds for every id, known or not"""
+        repo = kind.repository(repositories)
+        entities = [kind.make(i) for i in range(2)]
+        await repo.create_many(entities)
+
+        result = await repo.delete_many([entities[0].id, "missing"])
+
+        assert not result.has_failures
+        assert await repo.get_many([entity.id for entity in entities]) == {
+            entities[1].id: entities[1]
+        }
+
+    @pytest.mark.asyncio
+    async def test_list_pages_are_ordered_and_complete(self, repositories, kind):
+        """Test that keyset pages walk every entity newest first, once"""
+        repo = kind.repository(repositories)
+        entities = [kind.make(i) for i in range(7)]
+        await repo.create_many(entities)
+
+        pages, cursor = [], None
+        while True:
+            page = await kind.list_page(repo, cursor, 3)
+            pages.append([entity.id for entity in page.items])
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        expected = [entity.id for entity in reversed(entities)]
+        assert pages == [expected[0:3], expected[3:6], expected[6:7]]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("limit", [0, MAX_PAGE_SIZE + 1])
+    async def test_list_rejects_invalid_limit(self, repositories, kind, limit):
+        """Test that page sizes outside 1..MAX_PAGE_SIZE raise ValueError"""
+        repo = kind.repository(repositories)
+
+        with pytest.raises(ValueError):
+            await kind.list_page(repo, None, limit)
+
+    @pytest.mark.asyncio
+    async def test_list_rejects_invalid_cursor(self, repositories, kind):
+        """Test that a malformed cursor raises ValueError"""
+        repo = kind.repository(repositories)
+
+        with pytest.raises(ValueError):
+            await kind.list_page(repo, "not-a-cursor", 10)
@@ -0,0 +1,378 @@
+"""
+Tests for the in-memory repositories
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from application.dto.bulk_write_result import (
+    DUPLICATE_ERROR,
+    NOT_FOUND_ERROR,
+)
+from application.exceptions import (
+    DuplicateEntityError,
+    ProjectNotFoundError,
+    RepositoryError,
+)
+from domain.entities.checkpoint import Checkpoint
+from domain.entities.demand import Demand
+from domain.entities.metaspec import Metaspec, MetaspecType
+from domain.entities.project import Project
+from domain.exceptions import ContextBudgetExceededError
+from domain.value_objects.context_budget import ContextBudget
+from domain.value_objects.demand_status import DemandStatus
+from infrastructure.persistence.memory import (
+    InMemoryCheckpointRepository,
+    InMemoryDemandRepository,
+    InMemoryMetaspecRepository,
+    InMemoryProjectRepository,
+    InMemoryStore,
+)
+
+BASE_TIME = datetime(2025, 1, 1)
+
+
+def _make_project(owner_id: str = "owner_1", minutes: int = 0) -> Project:
+    return Project(
+        id=str(uuid.uuid4()),
+        name="Project",
+        description="Description",
+        owner_id=owner_id,
+        context_budget=ContextBudget(max_tokens=1000, used_tokens=0),
+        created_at=BASE_TIME + timedelta(minutes=minutes),
+    )
+
+
+def _make_demand(
+    project_id: str = "project_1",
+    status: DemandStatus = DemandStatus.DRAFT,
+    minutes: int = 0,
+) -> Demand:
+    return Demand(
+        id=str(uuid.uuid4()),
+        project_id=project_id,
+        title="Demand",
+        description="Description",
+        status=status,
+        created_at=BASE_TIME + timedelta(minutes=minutes),
+    )
+
+
+def _make_metaspec(
+    demand_id: str = "demand_1",
+    metaspec_type: MetaspecType = MetaspecType.BUSINESS,
+    version: int = 1,
+) -> Metaspec:
+    return Metaspec(
+        id=str(uuid.uuid4()),
+        demand_id=demand_id,
+        type=metaspec_type,
+        content=f"# Spec v{version}",
+        version=version,
+    )
+
+
+def _make_checkpoint(demand_id: str = "demand_1", minutes: int = 0) -> Checkpoint:
+    return Checkpoint(
+        id=str(uuid.uuid4()),
+        demand_id=demand_id,
+        context_snapshot='{"messages": []}',
+        tokens_used=10,
+        created_at=BASE_TIME + timedelta(minutes=minutes),
+    )
+
+
+@pytest.fixture
+def store() -> InMemoryStore:
+    return InMemoryStore()
+
+
+class TestInMemoryProjectRepository:
+    """Tests for InMemoryProjectRepository"""
+
+    @pytest.mark.asyncio
+    async def test_create_and_get(self, store):
+        """Test that a created project can be read back"""
+        repo = InMemoryProjectRepository(store)
+        project = _make_project()
+
+        await repo.create(project)
+
+        assert await repo.get_by_id(project.id) == project
+        assert await repo.get_by_id("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_create_duplicate_raises(self, store):
+        """Test that creating an existing id raises DuplicateEntityError"""
+        repo = InMemoryProjectRepository(store)
+        project = _make_project()
+        await repo.create(project)
+
+        with pytest.raises(DuplicateEntityError):
+            await repo.create(project)
+
+    @pytest.mark.asyncio
+    async def test_reads_are_isolated_from_stored_state(self, store):
+        """Test that mutating inputs or results does not change the store"""
+        repo = InMemoryProjectRepository(store)
+        project = _make_project()
+        await repo.create(project)
+
+        project.name = "Changed input"
+        found = await repo.get_by_id(project.id)
+        found.name = "Changed output"
+
+        assert (await repo.get_by_id(project.id)).name == "Project"
+
+    @pytest.mark.asyncio
+    async def test_update_and_delete(self, store):
+        """Test that update replaces and delete removes (idempotently)"""
+        repo = InMemoryProjectRepository(store)
+        project = _make_project()
+        await repo.create(project)
+
+        project.name = "Renamed"
+        await repo.update(project)
+        renamed = await repo.get_by_id(project.id)
+        await repo.delete(project.id)
+        await repo.delete(project.id)
+
+        assert renamed.name == "Renamed"
+        assert await repo.get_by_id(project.id) is None
+        assert (await repo.list_by_owner("owner_1")).items == []
+
+    @pytest.mark.asyncio
+    async def test_list_by_owner_pages_newest_first(self, store):
+        """Test that keyset pages follow created_at descending"""
+        repo = InMemoryProjectRepository(store)
+        projects = [_make_project(minutes=minute) for minute in range(5)]
+        await repo.create_many(projects)
+        await repo.create(_make_project(owner_id="someone_else"))
+
+        first = await repo.list_by_owner("owner_1", limit=3)
+        second = await repo.list_by_owner("owner_1", after=first.next_cursor, limit=3)
+
+        expected = [project.id for project in reversed(projects)]
+        assert [project.id for project in first.items] == expected[:3]
+        assert [project.id for project in second.items] == expected[3:]
+        assert second.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_bulk_results_report_per_item_errors(self, store):
+        """Test that bulk writes report duplicates and unknown ids per item"""
+        repo = InMemoryProjectRepository(store)
+        project = _make_project()
+
+        created = await repo.create_many([project, project])
+        updated = await repo.update_many([project, _make_project()])
+        deleted = await repo.delete_many([project.id, "missing"])
+
+        assert created.succeeded_ids == [project.id]
+        assert created.items[1].error == DUPLICATE_ERROR
+        assert updated.items[1].error == NOT_FOUND_ERROR
+        assert not deleted.has_failures
+
+    @pytest.mark.asyncio
+    async def test_get_many_skips_unknown_ids(self, store):
+        """Test that get_many returns only stored ids, once each"""
+        repo = InMemoryProjectRepository(store)
+        project = _make_project()
+        await repo.create(project)
+
+        found = await repo.get_many([project.id, project.id, "missing"])
+
+        assert list(found) == [project.id]
+
+    @pytest.mark.asyncio
+    async def test_consume_tokens(self, store):
+        """Test that consume_tokens charges the budget and enforces its limit"""
+        repo = InMemoryProjectRepository(store)
+        project = _make_project()
+        await repo.create(project)
+
+        budget = await repo.consume_tokens(project.id, 600)
+
+        assert budget.used_tokens == 600
+        assert (await repo.get_by_id(project.id)).updated_at is not None
+        with pytest.raises(ContextBudgetExceededError):
+            await repo.consume_tokens(project.id, 500)
+        with pytest.raises(ProjectNotFoundError):
+            await repo.consume_tokens("missing", 1)
+        with pytest.raises(ValueError):
+            await repo.consume_tokens(project.id, -1)
+
+
+class TestInMemoryDemandRepository:
+    """Tests for InMemoryDemandRepository"""
+
+    @pytest.mark.asyncio
+    async def test_list_by_project_filters_by_status(self, store):
+        """Test that the status index follows status changes"""
+        repo = InMemoryDemandRepository(store)
+        draft = _make_demand(minutes=1)
+        approved_demand = _make_demand(status=DemandStatus.SPEC_APPROVED, minutes=2)
+        await repo.create_many(
+            [draft, approved_demand, _make_demand(project_id="other")]
+        )
+
+        draft.transition_to(DemandStatus.SPEC_APPROVED)
+        await repo.update(draft)
+
+        all_items = await repo.list_by_project("project_1")
+        drafts = await repo.list_by_project("project_1", status=DemandStatus.DRAFT)
+        approved = await repo.list_by_project(
+            "project_1", status=DemandStatus.SPEC_APPROVED
+        )
+
+        assert [demand.id for demand in all_items.items] == [
+            approved_demand.id,
+            draft.id,
+        ]
+        assert drafts.items == []
+        assert [demand.id for demand in approved.items] == [
+            approved_demand.id,
+            draft.id,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_raises(self, store):
+        """Test that a malformed cursor is rejected like in MongoDB"""
+        repo = InMemoryDemandRepository(store)
+
+        with pytest.raises(ValueError):
+            await repo.list_by_project("project_1", after="not-a-cursor")
+
+
+class TestInMemoryMetaspecRepository:
+    """Tests for InMemoryMetaspecRepository"""
+
+    @pytest.mark.asyncio
+    async def test_versions_are_append_only(self, store):
+        """Test that a higher version is appended and old ones stay readable"""
+        repo = InMemoryMetaspecRepository(store)
+        metaspec = _make_metaspec()
+        await repo.create(metaspec)
+
+        metaspec.content = "# Spec v2"
+        metaspec.increment_version()
+        await repo.update(metaspec)
+
+        latest = await repo.get_latest("demand_1", MetaspecType.BUSINESS)
+        first = await repo.get_version("demand_1", MetaspecType.BUSINESS, 1)
+        listed = await repo.list_metaspecs("demand_1")
+
+        assert (await repo.get_by_id(metaspec.id)).version == 2
+        assert latest.content == "# Spec v2"
+        assert first.content == "# Spec v1"
+        assert await repo.get_version("demand_1", MetaspecType.BUSINESS, 3) is None
+        assert [item.version for item in listed.items] == [2]
+
+    @pytest.mark.asyncio
+    async def test_older_version_rewrites_history_only(self, store):
+        """Test that updating an older version keeps the latest unchanged"""
+        repo = InMemoryMetaspecRepository(store)
+        metaspec = _make_metaspec(version=2)
+        await repo.create(metaspec)
+
+        older = _make_metaspec(version=1)
+        older.id = metaspec.id
+        older.content = "# Backfilled v1"
+        result = await repo.update_many([older, _make_metaspec()])
+
+        assert result.items[1].error == NOT_FOUND_ERROR
+        assert (await repo.get_by_id(metaspec.id)).version == 2
+        backfilled = await repo.get_version("demand_1", MetaspecType.BUSINESS, 1)
+        assert backfilled.content == "# Backfilled v1"
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_all_versions(self, store):
+        """Test that delete drops every version of the metaspec"""
+        repo = InMemoryMetaspecRepository(store)
+        metaspec = _make_metaspec()
+        await repo.create(metaspec)
+        metaspec.increment_version()
+        await repo.update(metaspec)
+
+        await repo.delete(metaspec.id)
+
+        assert await repo.get_latest("demand_1", MetaspecType.BUSINESS) is None
+        assert await repo.get_version("demand_1", MetaspecType.BUSINESS, 1) is None
+
+    @pytest.mark.asyncio
+    async def test_lazy_content(self, store):
+        """Test that lazy content is read on access and fails once deleted"""
+        repo = InMemoryMetaspecRepository(store)
+        metaspec = _make_metaspec()
+        await repo.create(metaspec)
+
+        lazy = await repo.get_lazy(metaspec.id)
+        gone = await repo.get_lazy(metaspec.id)
+        content = await lazy.content()
+        await repo.delete(metaspec.id)
+
+        assert content == "# Spec v1"
+        with pytest.raises(RepositoryError):
+            await gone.content()
+
+
+class TestInMemoryCheckpointRepository:
+    """Tests for InMemoryCheckpointRepository"""
+
+    @pytest.mark.asyncio
+    async def test_summaries_and_lazy_snapshot(self, store):
+        """Test that summaries omit the snapshot and lazy reads load it"""
+        repo = InMemoryCheckpointRepository(store)
+        checkpoints = [_make_checkpoint(minutes=minute) for minute in range(3)]
+        await repo.create_many(checkpoints)
+
+        page = await repo.list_checkpoint_summaries("demand_1", limit=2)
+        lazy = await repo.get_lazy(checkpoints[0].id)
+        entity = await lazy.to_entity()
+
+        assert [item.id for item in page.items] == [
+            checkpoints[2].id,
+            checkpoints[1].id,
+        ]
+        assert not hasattr(page.items[0], "context_snapshot")
+        assert entity == checkpoints[0]
+
+
+class TestInMemoryStoreSnapshot:
+    """Tests for InMemoryStore persistence"""
+
+    @pytest.mark.asyncio
+    async def test_save_and_reload(self, tmp_path):
+        """Test that a saved store reloads its rows and indexes"""
+        path = str(tmp_path / "store.pickle")
+        store = InMemoryStore(snapshot_path=path)
+        project = _make_project()
+        metaspec = _make_metaspec()
+        await InMemoryProjectRepository(store).create(project)
+        await InMemoryMetaspecRepository(store).create(metaspec)
+
+        store.save()
+        reloaded = InMemoryStore(snapshot_path=path)
+
+        page = await InMemoryProjectRepository(reloaded).list_by_owner("owner_1")
+        latest = await InMemoryMetaspecRepository(reloaded).get_latest(
+            "demand_1", MetaspecType.BUSINESS
+        )
+        assert page.items == [project]
+        assert latest == metaspec
+
+    def test_save_without_path_raises(self):
+        """Test that save() needs a path"""
+        with pytest.raises(ValueError):
+            InMemoryStore().save()
+
+    def test_load_rejects_unknown_format(self, tmp_path):
+        """Test that files of another format are refused"""
+        path = tmp_path / "store.pickle"
+        path.write_bytes(b"\x80\x04}\x94.")
+
+        with pytest.raises(ValueError):
+            InMemoryStore(snapshot_path=str(path))
@@ -7,6 +7,7 @@ Database is cleaned before each test (see conftest.py).
 IAD-7: Repository Pattern + MongoDB
 """
 
+import asyncio
 import json
 import uuid
 from datetime import datetime, timedelta
@@ -14,10 +15,13 @@ from datetime import datetime, timedelta
 import pytest
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
+from application.exceptions import RepositoryError
 from domain.entities.checkpoint import Checkpoint
+from infrastructure.config.settings import MongoSettings
 from infrastructure.persistence.mongodb.mongo_checkpoint_repository import (
     MongoCheckpointRepository,
 )
+from interfaces.api.dependencies import Repositories
 
 
 @pytest.mark.asyncio
@@ -307,3 +311,399 @@ async def test_multiple_checkpoints_isolation(mongodb_database: AsyncIOMotorData
     assert found2.expires_at is not None
     assert '{"checkpoint": 1}' in found1.context_snapshot
     assert '{"checkpoint": 2}' in found2.context_snapshot
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_update_delete_checkpoints(
+    mongodb_database: AsyncIOMotorDatabase,
+):
+    """Test: create_many / update_many / delete_many round trip"""
+    # Arrange
+    repo = MongoCheckpointRepository(mongodb_database)
+    checkpoints = [
+        Checkpoint(
+            id=str(uuid.uuid4()),
+            demand_id="demand_123",
+            context_snapshot=json.dumps({"step": i}),
+            tokens_used=100 * (i + 1),
+            created_at=datetime.utcnow(),
+        )
+        for i in range(3)
+    ]
+
+    # Act & Assert - create
+    created = await repo.create_many(checkpoints)
+    assert created.succeeded_ids == [checkpoint.id for checkpoint in checkpoints]
+
+    # Act & Assert - update
+    for checkpoint in checkpoints:
+        checkpoint.tokens_used += 1
+    updated = await repo.update_many(checkpoints)
+    assert not updated.has_failures
+    found = await repo.get_by_id(checkpoints[0].id)
+    assert found.tokens_used == 101
+
+    # Act & Assert - delete
+    deleted = await repo.delete_many([checkpoint.id for checkpoint in checkpoints])
+    assert not deleted.has_failures
+    assert await repo.get_by_id(checkpoints[0].id) is None
+
+
+@pytest.mark.asyncio
+async def test_get_many_checkpoints(mongodb_database: AsyncIOMotorDatabase):
+    """Test: get_many returns found checkpoints keyed by id"""
+    # Arrange
+    repo = MongoCheckpointRepository(mongodb_database)
+    checkpoint = Checkpoint(
+        id=str(uuid.uuid4()),
+        demand_id="demand_123",
+        context_snapshot='{"batched": true}',
+        tokens_used=10,
+        created_at=datetime.utcnow(),
+    )
+    await repo.create(checkpoint)
+
+    # Act
+    found = await repo.get_many([checkpoint.id, str(uuid.uuid4())])
+
+    # Assert
+    assert list(found) == [checkpoint.id]
+    assert found[checkpoint.id].tokens_used == 10
+
+
+@pytest.mark.asyncio
+async def test_snapshot_stored_compressed(mongodb_database: AsyncIOMotorDatabase):
+    """Test: context_snapshot is stored compressed with a codec marker"""
+    # Arrange
+    stats = []
+    repo = MongoCheckpointRepository(mongodb_database, on_codec_stats=stats.append)
+    snapshot = json.dumps(
+        {"messages": [{"role": "user", "content": "same turn"}] * 500}
+    )
+    checkpoint = Checkpoint(
+        id=str(uuid.uuid4()),
+        demand_id="demand_123",
+        context_snapshot=snapshot,
+        tokens_used=500,
+        created_at=datetime.utcnow(),
+    )
+
+    # Act
+    await repo.create(checkpoint)
+    found = await repo.get_by_id(checkpoint.id)
+
+    # Assert
+    assert found.context_snapshot == snapshot
+
+    document = await mongodb_database["checkpoints"].find_one({"id": checkpoint.id})
+    assert document["snapshot_codec"] == "zlib"
+    assert document["snapshot_size"] == len(snapshot)
+    assert isinstance(document["context_snapshot"], bytes)
+    assert len(document["context_snapshot"]) < len(snapshot) / 10
+
+    assert [s.operation for s in stats] == ["encode", "decode"]
+    assert stats[0].checkpoint_id == checkpoint.id
+    assert stats[0].ratio > 10
+
+
+@pytest.mark.asyncio
+async def test_legacy_uncompressed_snapshot_loads(
+    mongodb_database: AsyncIOMotorDatabase,
+):
+    """Test: Documents without codec marker are read as plain JSON"""
+    # Arrange
+    repo = MongoCheckpointRepository(mongodb_database)
+    checkpoint_id = str(uuid.uuid4())
+    await mongodb_database["checkpoints"].insert_one(
+        {
+            "id": checkpoint_id,
+            "demand_id": "demand_123",
+            "context_snapshot": '{"legacy": true}',
+            "tokens_used": 10,
+            "created_at": datetime.utcnow(),
+        }
+    )
+
+    # Act
+    found = await repo.get_by_id(checkpoint_id)
+
+    # Assert
+    assert found.context_snapshot == '{"legacy": true}'
+
+
+@pytest.mark.asyncio
+async def test_uncompressed_mode_and_mixed_codecs(
+    mongodb_database: AsyncIOMotorDatabase,
+):
+    """Test: codec=None writes plain JSON; any stored codec is readable"""
+    # Arrange
+    plain_repo = MongoCheckpointRepository(mongodb_database, codec=None)
+    zlib_repo = MongoCheckpointRepository(mongodb_database)
+    checkpoint = Checkpoint(
+        id=str(uuid.uuid4()),
+        demand_id="demand_123",
+        context_snapshot='{"plain": true}',
+        tokens_used=10,
+        created_at=datetime.utcnow(),
+    )
+
+    # Act
+    await zlib_repo.create(checkpoint)
+    found = await plain_repo.get_by_id(checkpoint.id)
+
+    # Assert
+    assert found.context_snapshot == '{"plain": true}'
+
+    found.context_snapshot = '{"plain": "again"}'
+    await plain_repo.update(found)
+    document = await mongodb_database["checkpoints"].find_one({"id": checkpoint.id})
+    assert document["context_snapshot"] == '{"plain": "again"}'
+    assert "snapshot_codec" not in document
+
+
+def _conversation(turns: int) -> str:
+    """Helper: Conversation snapshot with the given number of turns"""
+    messages = [
+        {"role": "user" if i % 2 == 0 else "assistant", "content": f"Turn {i} " * 20}
+        for i in range(turns)
+    ]
+    return json.dumps({"messages": messages, "state": "active"})
+
+
+async def _create_session(repo, demand_id: str, count: int, **kwargs):
+    """Helper: Create `count` successive checkpoints for one demand"""
+    start = datetime.utcnow()
+    checkpoints = []
+    for i in range(count):
+        checkpoint = Checkpoint(
+            id=str(uuid.uuid4()),
+            demand_id=demand_id,
+            context_snapshot=_conversation(i + 1),
+            tokens_used=100 * (i + 1),
+            created_at=start + timedelta(seconds=i),
+            **kwargs,
+        )
+        await repo.create(checkpoint)
+        checkpoints.append(checkpoint)
+    return checkpoints
+
+
+@pytest.mark.asyncio
+async def test_delta_chain_keyframes_and_rebuild(
+    mongodb_database: AsyncIOMotorDatabase,
+):
+    """Test: Delta mode stores keyframes every N and rebuilds exact snapshots"""
+    # Arrange
+    repo = MongoCheckpointRepository(mongodb_database, codec=None, keyframe_interval=4)
+
+    # Act
+    checkpoints = await _create_session(repo, "demand_delta", 10)
+
+    # Assert - every 4th checkpoint is a keyframe, the others are deltas
+    collection = mongodb_database["checkpoints"]
+    kinds = []
+    for checkpoint in checkpoints:
+        document = await collection.find_one({"id": checkpoint.id})
+        kinds.append(document["snapshot_kind"])
+    assert kinds == ["keyframe", "delta", "delta", "delta"] * 2 + ["keyframe", "delta"]
+
+    # Assert - deltas are much smaller than the full snapshot
+    last = await collection.find_one({"id": checkpoints[-1].id})
+    assert len(last["context_snapshot"]) * 5 < len(checkpoints[-1].context_snapshot)
+
+    # Assert - get_by_id and get_many rebuild the exact snapshots
+    for checkpoint in checkpoints:
+        found = await repo.get_by_id(checkpoint.id)
+        assert found.context_snapshot == checkpoint.context_snapshot
+
+    found_many = await repo.get_many([c.id for c in checkpoints])
+    for checkpoint in checkpoints:
+        assert found_many[checkpoint.id].context_snapshot == checkpoint.context_snapshot
+
+    # Assert - a repository without delta mode can still read the chain
+    reader = MongoCheckpointRepository(mongodb_database)
+    found = await reader.get_by_id(checkpoints[3].id)
+    assert found.context_snapshot == checkpoints[3].context_snapshot
+
+
+@pytest.mark.asyncio
+async def test_delta_chain_survives_parent_delete(
+    mongodb_database: AsyncIOMotorDatabase,
+):
+    """Test: Deleting a keyframe or delta keeps dependent checkpoints readable"""
+    # Arrange
+    repo = MongoCheckpointRepository(mongodb_database, keyframe_interval=10)
+    checkpoints = await _create_session(repo, "demand_delta", 5)
+
+    # Act
+    await repo.delete(checkpoints[0].id)  # keyframe
+    await repo.delete(checkpoints[2].id)  # delta in the middle
+
+    # Assert
+    assert await repo.get_by_id(checkpoints[0].id) is None
+    for checkpoint in [checkpoints[1], checkpoints[3], checkpoints[4]]:
+        found = await repo.get_by_id(checkpoint.id)
+        assert found.context_snapshot == checkpoint.context_snapshot
+
+    # Bulk delete of the rest of the chain except the head
+    result = await repo.delete_many([checkpoints[1].id, checkpoints[3].id])
+    assert not result.has_failures
+    found = await repo.get_by_id(checkpoints[4].id)
+    assert found.context_snapshot == checkpoints[4].context_snapshot
+
+
+@pytest.mark.asyncio
+async def test_delta_chain_update_rebases_children(
+    mongodb_database: AsyncIOMotorDatabase,
+):
+    """Test: Changing a parent's snapshot keeps its children correct"""
+    # Arrange
+    repo = MongoCheckpointRepository(mongodb_database, keyframe_interval=10)
+    checkpoints = await _create_session(repo, "demand_delta", 4)
+
+    # Act
+    checkpoints[1].context_snapshot = json.dumps({"rewritten": True})
+    await repo.update(checkpoints[1])
+    checkpoints[2].tokens_used = 999
+    result = await repo.update_many([checkpoints[2]])
+
+    # Assert
+    assert not result.has_failures
+    for checkpoint in checkpoints:
+        found = await repo.get_by_id(checkpoint.id)
+        assert found.context_snapshot == checkpoint.context_snapshot
+        assert found.tokens_used == checkpoint.tokens_used
+
+    # New checkpoints still chain correctly after the update
+    extra = await _create_session(repo, "demand_delta", 1)
+    found = await repo.get_by_id(extra[0].id)
+    assert found.context_snapshot == extra[0].context_snapshot
+
+
+@pytest.mark.asyncio
+async def test_delta_chain_extends_ancestor_expiry(
+    mongodb_database: AsyncIOMotorDatabase,
+):
+    """Test: Ancestors of a delta never expire before the delta (TTL index)"""
+    # Arrange
+    repo = MongoCheckpointRepository(mongodb_database, keyframe_interval=10)
+    soon = datetime.utcnow() + timedelta(hours=1)
+    later = datetime.utcnow() + timedelta(days=7)
+    first = await _create_session(repo, "demand_delta", 1, expires_at=soon)
+
+    # Act
+    second = await _create_session(repo, "demand_delta", 1, expires_at=later)
+
+    # Assert
+    collection = mongodb_database["checkpoints"]
+    keyframe = await collection.find_one({"id": first[0].id})
+    delta = await collection.find_one({"id": second[0].id})
+    assert delta["snapshot_kind"] == "delta"
+    assert keyframe["expires_at"] == delta["expires_at"]
+
+
+@pytest.mark.asyncio
+async def test_settings_configure_checkpoint_storage(
+    mongodb_database: AsyncIOMotorDatabase,
+):
+    """Test: Repositories.for_database applies the checkpoint settings"""
+    # Arrange
+    settings = MongoSettings(
+        _env_file=None, checkpoint_codec="", checkpoint_keyframe_interval=2
+    )
+    repo = Repositories.for_database(mongodb_database, settings).checkpoints
+
+    # Act
+    checkpoints = await _create_session(repo, "demand_settings", 3)
+
+    # Assert - uncompressed, with a keyframe every 2 checkpoints
+    collection = mongodb_database["checkpoints"]
+    documents = [await collection.find_one({"id": c.id}) for c in checkpoints]
+    assert [d["snapshot_kind"] for d in documents] == ["keyframe", "delta", "keyframe"]
+    assert all("snapshot_codec" not in d for d in documents)
+
+
+def test_invalid_keyframe_interval(mongodb_database: AsyncIOMotorDatabase):
+    """Test: keyframe_interval < 1 raises ValueError"""
+    with pytest.raises(ValueError, match="keyframe_interval must be >= 1"):
+        MongoCheckpointRepository(mongodb_database, keyframe_interval=0)
+
+
+@pytest.mark.asyncio
+async def test_list_checkpoints_keyset_pagination(
+    mongodb_database: AsyncIOMotorDatabase,
+):
+    """Test: list_checkpoints pages newest first and rebuilds delta snapshots"""
+    # Arrange
+    repo = MongoCheckpointRepository(mongodb_database, keyframe_interval=3)
+    checkpoints = await _create_session(repo, "demand_pages", 7)
+
+    # Act
+    first = await repo.list_checkpoints("demand_pages", limit=4)
+    rest = await repo.list_checkpoints("demand_pages", after=first.next_cursor)
+
+    # Assert
+    listed = first.items + rest.items
+    assert [c.id for c in listed] == [c.id for c in reversed(checkpoints)]
+    for found, expected in zip(listed, reversed(checkpoints)):
+        assert found.context_snapshot == expected.context_snapshot
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_summaries_exclude_snapshot(
+    mongodb_database: AsyncIOMotorDatabase,
+):
+    """Test: Summaries carry metadata only, even for delta checkpoints"""
+    # Arrange
+    repo = MongoCheckpointRepository(mongodb_database, keyframe_interval=3)
+    checkpoints = await _create_session(repo, "demand_summary", 4)
+
+    # Act
+    summary = await repo.get_summary(checkpoints[-1].id)
+    page = await repo.list_checkpoint_summaries("demand_summary", limit=2)
+
+    # Assert
+    assert summary.tokens_used == checkpoints[-1].tokens_used
+    assert not hasattr(summary, "context_snapshot")
+    assert [s.id for s in page.items] == [checkpoints[3].id, checkpoints[2].id]
+    assert page.has_more
+    assert await repo.get_summary("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_lazy_checkpoint_rebuilds_snapshot_on_access(
+    mongodb_database: AsyncIOMotorDatabase,
+):
+    """Test: get_lazy rebuilds the (delta) snapshot once, on first access"""
+    # Arrange
+    repo = MongoCheckpointRepository(mongodb_database, keyframe_interval=3)
+    checkpoints = await _create_session(repo, "demand_lazy", 3)
+    expected = checkpoints[-1]
+
+    # Act
+    lazy = await repo.get_lazy(expected.id)
+    loaded_before = lazy.is_loaded
+    snapshots = await asyncio.gather(lazy.context_snapshot(), lazy.context_snapshot())
+    entity = await lazy.to_entity()
+
+    # Assert
+    assert loaded_before is False
+    assert snapshots == [expected.context_snapshot] * 2
+    assert entity.id == expected.id
+    assert entity.context_snapshot == expected.context_snapshot
+
+
+@pytest.mark.asyncio
+async def test_lazy_checkpoint_deleted_before_access(
+    mongodb_database: AsyncIOMotorDatabase,
+):
+    """Test: Accessing a lazy snapshot of a deleted checkpoint raises"""
+    # Arrange
+    repo = MongoCheckpointRepository(mongodb_database)
+    (checkpoint,) = await _create_session(repo, "demand_lazy", 1)
+    lazy = await repo.get_lazy(checkpoint.id)
+    await repo.delete(checkpoint.id)
+
+    # Act / Assert
+    with pytest.raises(RepositoryError, match="no longer exists"):
+        await lazy.context_snapshot()
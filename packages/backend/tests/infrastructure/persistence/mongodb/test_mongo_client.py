@@ -0,0 +1,93 @@
+"""
+Tests for the MongoDB client factory and pool statistics
+
+No server is needed: the client connects lazily and pool events are
+fed to the listener directly.
+"""
+
+import threading
+
+from infrastructure.config.settings import MongoSettings
+from infrastructure.persistence.mongodb.mongo_client import create_mongo_client
+from infrastructure.persistence.mongodb.mongo_pool_stats import MongoPoolStats
+
+
+def test_client_uses_pool_settings():
+    """Test: Settings are passed to the driver's pool options"""
+    # Arrange
+    settings = MongoSettings(
+        _env_file=None,
+        uri="mongodb://localhost:27017",
+        max_pool_size=20,
+        min_pool_size=2,
+        max_idle_time_ms=30_000,
+        compressors="zlib",
+        wait_queue_timeout_ms=1_000,
+    )
+
+    # Act
+    client = create_mongo_client(settings, MongoPoolStats())
+
+    # Assert
+    try:
+        options = client.delegate.options
+        assert options.pool_options.max_pool_size == 20
+        assert options.pool_options.min_pool_size == 2
+        assert options.pool_options.max_idle_time_seconds == 30
+        assert options.pool_options.wait_queue_timeout == 1
+        assert options.server_selection_timeout == 5
+        assert "zlib" in options.pool_options._compression_settings.compressors
+    finally:
+        client.close()
+
+
+def test_pool_stats_gauges_and_wait_time():
+    """Test: Checkout events drive checked_out, waiters and wait time"""
+    # Arrange
+    stats = MongoPoolStats()
+    stats.connection_created(None)
+
+    # Act
+    stats.connection_check_out_started(None)
+    waiting = stats.snapshot()
+    stats.connection_checked_out(None)
+    in_use = stats.snapshot()
+    stats.connection_checked_in(None)
+    stats.connection_check_out_started(None)
+    stats.connection_check_out_failed(None)
+
+    # Assert
+    assert (waiting.waiters, waiting.checked_out) == (1, 0)
+    assert (in_use.waiters, in_use.checked_out) == (0, 1)
+    final = stats.snapshot()
+    assert final.open_connections == 1
+    assert final.checked_out == 0
+    assert final.checkouts == 1
+    assert final.checkout_failures == 1
+    assert final.wait_time_max_ms >= final.wait_time_avg_ms >= 0
+
+
+def test_pool_stats_concurrent_threads():
+    """Test: Counters stay consistent with events from many threads"""
+    # Arrange
+    stats = MongoPoolStats()
+
+    def worker():
+        for _ in range(1000):
+            stats.connection_check_out_started(None)
+            stats.connection_checked_out(None)
+            stats.connection_checked_in(None)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+
+    # Act
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Assert
+    snapshot = stats.snapshot()
+    assert snapshot.checkouts == 8000
+    assert snapshot.checked_out == 0
+    assert snapshot.waiters == 0
@@ -8,17 +8,22 @@ IAD-7: Repository Pattern + MongoDB
 """
 
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import pytest
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
+from application.dto.status_transition import STATUS_CONFLICT_ERROR, StatusTransition
 from domain.entities.demand import Demand
 from domain.value_objects.context_budget import ContextBudget
 from domain.value_objects.demand_status import DemandStatus
 from infrastructure.persistence.mongodb.mongo_demand_repository import (
     MongoDemandRepository,
 )
+from infrastructure.persistence.mongodb.mongo_pagination import (
+    keyset_filter,
+    keyset_sort,
+)
 
 
 @pytest.mark.asyncio
@@ -274,3 +279,365 @@ async def test_multiple_demands_isolation(mongodb_database: AsyncIOMotorDatabase
     assert found2.status == DemandStatus.SPEC_APPROVED
     assert found1.context_budget is None
     assert found2.context_budget is not None
+
+
+def _make_demand(title: str, project_id: str = "project_123") -> Demand:
+    """Helper: Build a DRAFT demand with a fresh UUID"""
+    return Demand(
+        id=str(uuid.uuid4()),
+        project_id=project_id,
+        title=title,
+        description=f"Description of {title}",
+        status=DemandStatus.DRAFT,
+        created_at=datetime.utcnow(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_many_demands(mongodb_database: AsyncIOMotorDatabase):
+    """Test: create_many persists every demand in one batch"""
+    # Arrange
+    repo = MongoDemandRepository(mongodb_database)
+    demands = [_make_demand(f"Bulk {i}") for i in range(10)]
+
+    # Act
+    result = await repo.create_many(demands)
+
+    # Assert
+    assert not result.has_failures
+    assert result.succeeded_ids == [demand.id for demand in demands]
+    for demand in demands:
+        found = await repo.get_by_id(demand.id)
+        assert found is not None
+        assert found.title == demand.title
+
+
+@pytest.mark.asyncio
+async def test_create_many_reports_partial_failures(
+    mongodb_database: AsyncIOMotorDatabase,
+):
+    """Test: Duplicate ids fail individually without aborting the batch"""
+    # Arrange
+    await mongodb_database["demands"].create_index("id", unique=True)
+    repo = MongoDemandRepository(mongodb_database)
+    existing = _make_demand("Existing")
+    await repo.create(existing)
+    fresh = [_make_demand("Fresh 1"), _make_demand("Fresh 2")]
+
+    # Act
+    result = await repo.create_many([fresh[0], existing, fresh[1]])
+
+    # Assert
+    assert result.has_failures
+    assert result.failed_ids == [existing.id]
+    assert result.failures[0].index == 1
+    assert result.failures[0].error is not None
+    assert result.succeeded_ids == [fresh[0].id, fresh[1].id]
+    assert await repo.get_by_id(fresh[1].id) is not None
+
+
+@pytest.mark.asyncio
+async def test_create_many_empty(mongodb_database: AsyncIOMotorDatabase):
+    """Test: create_many with no demands is a no-op"""
+    # Arrange
+    repo = MongoDemandRepository(mongodb_database)
+
+    # Act
+    result = await repo.create_many([])
+
+    # Assert
+    assert result.items == []
+    assert not result.has_failures
+
+
+@pytest.mark.asyncio
+async def test_update_many_demands(mongodb_database: AsyncIOMotorDatabase):
+    """Test: update_many persists changes and reports missing demands"""
+    # Arrange
+    repo = MongoDemandRepository(mongodb_database)
+    demands = [_make_demand(f"Bulk {i}") for i in range(3)]
+    await repo.create_many(demands)
+    missing = _make_demand("Never Created")
+
+    for demand in demands:
+        demand.transition_to(DemandStatus.SPEC_APPROVED)
+
+    # Act
+    result = await repo.update_many(demands + [missing])
+
+    # Assert
+    assert result.failed_ids == [missing.id]
+    assert result.succeeded_ids == [demand.id for demand in demands]
+    for demand in demands:
+        found = await repo.get_by_id(demand.id)
+        assert found.status == DemandStatus.SPEC_APPROVED
+        assert found.updated_at is not None
+
+
+@pytest.mark.asyncio
+async def test_delete_many_demands(mongodb_database: AsyncIOMotorDatabase):
+    """Test: delete_many removes every listed demand"""
+    # Arrange
+    repo = MongoDemandRepository(mongodb_database)
+    demands = [_make_demand(f"Bulk {i}") for i in range(3)]
+    await repo.create_many(demands)
+    kept = _make_demand("Kept")
+    await repo.create(kept)
+
+    # Act
+    result = await repo.delete_many([demand.id for demand in demands])
+
+    # Assert
+    assert not result.has_failures
+    for demand in demands:
+        assert await repo.get_by_id(demand.id) is None
+    assert await repo.get_by_id(kept.id) is not None
+
+
+@pytest.mark.asyncio
+async def test_get_many_demands(mongodb_database: AsyncIOMotorDatabase):
+    """Test: get_many returns found demands keyed by id in one query"""
+    # Arrange
+    repo = MongoDemandRepository(mongodb_database)
+    demands = [_make_demand(f"Board {i}") for i in range(3)]
+    await repo.create_many(demands)
+    missing_id = str(uuid.uuid4())
+
+    # Act
+    found = await repo.get_many([demands[0].id, demands[2].id, missing_id])
+
+    # Assert
+    assert set(found) == {demands[0].id, demands[2].id}
+    assert found[demands[0].id].title == "Board 0"
+    assert found[demands[2].id].title == "Board 2"
+    assert await repo.get_many([]) == {}
+
+
+async def _create_backlog(repo, project_id: str, count: int) -> list[Demand]:
+    """Helper: Create `count` demands with increasing created_at"""
+    start = datetime.utcnow()
+    demands = [
+        Demand(
+            id=str(uuid.uuid4()),
+            project_id=project_id,
+            title=f"Demand {i}",
+            description="Paginated",
+            status=DemandStatus.DRAFT if i % 2 == 0 else DemandStatus.SPEC_APPROVED,
+            created_at=start + timedelta(seconds=i),
+        )
+        for i in range(count)
+    ]
+    await repo.create_many(demands)
+    return demands
+
+
+@pytest.mark.asyncio
+async def test_list_by_project_keyset_pagination(
+    mongodb_database: AsyncIOMotorDatabase,
+):
+    """Test: Walking pages returns every demand once, newest first"""
+    # Arrange
+    repo = MongoDemandRepository(mongodb_database)
+    demands = await _create_backlog(repo, "project_pages", 25)
+    await _create_backlog(repo, "project_other", 5)
+
+    # Act
+    seen = []
+    after = None
+    while True:
+        page = await repo.list_by_project("project_pages", after=after, limit=10)
+        seen.extend(page.items)
+        if not page.has_more:
+            break
+        after = page.next_cursor
+
+    # Assert
+    assert [d.id for d in seen] == [d.id for d in reversed(demands)]
+    assert len(page.items) == 5
+
+
+@pytest.mark.asyncio
+async def test_list_by_project_with_status(mongodb_database: AsyncIOMotorDatabase):
+    """Test: status filter combines with keyset pagination"""
+    # Arrange
+    repo = MongoDemandRepository(mongodb_database)
+    demands = await _create_backlog(repo, "project_pages", 10)
+    drafts = [d for d in demands if d.status == DemandStatus.DRAFT]
+
+    # Act
+    first = await repo.list_by_project(
+        "project_pages", status=DemandStatus.DRAFT, limit=3
+    )
+    second = await repo.list_by_project(
+        "project_pages", status=DemandStatus.DRAFT, after=first.next_cursor, limit=3
+    )
+
+    # Assert
+    listed = first.items + second.items
+    assert all(d.status == DemandStatus.DRAFT for d in listed)
+    assert [d.id for d in listed] == [d.id for d in reversed(drafts)][:5]
+    assert not second.has_more
+
+
+@pytest.mark.asyncio
+async def test_list_by_project_invalid_arguments(
+    mongodb_database: AsyncIOMotorDatabase,
+):
+    """Test: Invalid cursor and limit raise ValueError"""
+    # Arrange
+    repo = MongoDemandRepository(mongodb_database)
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="Invalid pagination cursor"):
+        await repo.list_by_project("project_pages", after="not-a-cursor")
+    with pytest.raises(ValueError, match="limit must be between"):
+        await repo.list_by_project("project_pages", limit=0)
+
+
+@pytest.mark.asyncio
+async def test_list_by_project_deep_page_uses_index(
+    mongodb_database: AsyncIOMotorDatabase,
+):
+    """Test: explain() of a deep page shows an index scan and no skip/sort"""
+    # Arrange - same index as docker/mongo-init.js
+    collection = mongodb_database["demands"]
+    await collection.create_index([("project_id", 1), ("created_at", -1), ("id", -1)])
+    repo = MongoDemandRepository(mongodb_database)
+    await _create_backlog(repo, "project_explain", 60)
+
+    after = None
+    for _ in range(4):
+        page = await repo.list_by_project("project_explain", after=after, limit=10)
+        after = page.next_cursor
+
+    # Act
+    explain = await (
+        collection.find(
+            keyset_filter({"project_id": "project_explain"}, "created_at", after)
+        )
+        .sort(keyset_sort("created_at"))
+        .limit(11)
+        .explain()
+    )
+
+    # Assert
+    plan = str(explain["queryPlanner"]["winningPlan"])
+    assert "IXSCAN" in plan
+    assert "COLLSCAN" not in plan
+    assert "'stage': 'SORT'" not in plan
+    assert explain["executionStats"]["totalDocsExamined"] <= 2 * 11
+
+
+@pytest.mark.asyncio
+async def test_rebuild_status_rollup_repairs_drift(
+    mongodb_database: AsyncIOMotorDatabase,
+):
+    """Test: rebuild_status_rollup recomputes counts changed behind its back"""
+    repo = MongoDemandRepository(mongodb_database)
+    await repo.create_many(
+        [
+            Demand(
+                id=str(uuid.uuid4()),
+                project_id="project_rollup",
+                title=f"Demand {i}",
+                description="",
+                created_at=datetime.utcnow(),
+            )
+            for i in range(3)
+        ]
+    )
+    # Write outside the repository: the rollup does not see it
+    await mongodb_database["demands"].update_many(
+        {"project_id": "project_rollup"}, {"$set": {"status": "pr_merged"}}
+    )
+    assert (await repo.get_status_rollup("project_rollup"))[DemandStatus.DRAFT] == 3
+
+    counts = await repo.rebuild_status_rollup("project_rollup")
+
+    assert counts[DemandStatus.PR_MERGED] == 3
+    assert await repo.get_status_rollup("project_rollup") == counts
+
+
+@pytest.mark.asyncio
+async def test_transition_many_detects_writes_after_its_read(
+    mongodb_database: AsyncIOMotorDatabase, monkeypatch
+):
+    """Test: items whose demand moved after the pre-read are conflicts"""
+    repo = MongoDemandRepository(mongodb_database)
+    demands = [
+        Demand(
+            id=str(uuid.uuid4()),
+            project_id="project_race",
+            title=f"Demand {i}",
+            description="",
+            created_at=datetime.utcnow(),
+        )
+        for i in range(2)
+    ]
+    await repo.create_many(demands)
+    read_status_keys = repo._status_keys
+
+    async def read_then_race(demand_ids):
+        # Another writer advances demands[1] right after our read
+        keys = await read_status_keys(demand_ids)
+        await mongodb_database["demands"].update_one(
+            {"id": demands[1].id},
+            {"$set": {"status": "spec_approved", "updated_at": datetime(2020, 1, 1)}},
+        )
+        return keys
+
+    monkeypatch.setattr(repo, "_status_keys", read_then_race)
+
+    result = await repo.transition_many(
+        [
+            StatusTransition(d.id, DemandStatus.DRAFT, DemandStatus.SPEC_APPROVED)
+            for d in demands
+        ]
+    )
+
+    assert result.succeeded_ids == [demands[0].id]
+    assert result.items[1].error == STATUS_CONFLICT_ERROR
+    # Only the item this batch wrote is counted (the other write bypassed it)
+    rollup = await repo.get_status_rollup("project_race")
+    assert rollup[DemandStatus.SPEC_APPROVED] == 1
+    assert rollup[DemandStatus.DRAFT] == 1
+
+
+@pytest.mark.asyncio
+async def test_patch_sends_only_named_fields(
+    mongodb_database: AsyncIOMotorDatabase, monkeypatch
+):
+    """Test: patch() $sets the named fields and keeps the rollup in step"""
+    repo = MongoDemandRepository(mongodb_database)
+    demand = Demand(
+        id=str(uuid.uuid4()),
+        project_id="project_patch",
+        title="Demand",
+        description="A long description that a status change must not resend",
+        status=DemandStatus.DRAFT,
+        created_at=datetime.utcnow(),
+    )
+    await repo.create(demand)
+    sent = []
+    find_one_and_update = repo._collection.find_one_and_update
+
+    async def spy(query, update, **kwargs):
+        sent.append(update)
+        return await find_one_and_update(query, update, **kwargs)
+
+    monkeypatch.setattr(repo._collection, "find_one_and_update", spy)
+
+    demand.advance_to_next_status()
+    await repo.patch(demand, ["status", "updated_at"])
+
+    assert sent == [
+        {
+            "$set": {"status": "spec_approved", "updated_at": demand.updated_at},
+            "$inc": {"revision": 1},
+        }
+    ]
+    stored = await repo.get_by_id(demand.id)
+    assert (stored.status, stored.revision) == (DemandStatus.SPEC_APPROVED, 1)
+    rollup = await repo.get_status_rollup("project_patch")
+    assert rollup[DemandStatus.DRAFT] == 0
+    assert rollup[DemandStatus.SPEC_APPROVED] == 1
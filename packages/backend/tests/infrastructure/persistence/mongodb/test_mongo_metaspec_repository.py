@@ -7,12 +7,14 @@ Database is cleaned before each test (see conftest.py).
 IAD-7: Repository Pattern + MongoDB
 """
 
+import copy
 import uuid
 from datetime import datetime
 
 import pytest
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
+from application.exceptions import RevisionConflictError
 from domain.entities.metaspec import Metaspec, MetaspecType
 from infrastructure.persistence.mongodb.mongo_metaspec_repository import (
     MongoMetaspecRepository,
@@ -262,3 +264,412 @@ async def test_multiple_metaspecs_isolation(mongodb_database: AsyncIOMotorDataba
     assert found2.version == 3
     assert "Content 1" in found1.content
     assert "Content 2" in found2.content
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_update_delete_metaspecs(
+    mongodb_database: AsyncIOMotorDatabase,
+):
+    """Test: create_many / update_many / delete_many round trip"""
+    # Arrange
+    repo = MongoMetaspecRepository(mongodb_database)
+    metaspecs = [
+        Metaspec(
+            id=str(uuid.uuid4()),
+            demand_id="demand_123",
+            type=MetaspecType.BUSINESS,
+            content=f"# Spec {i}\n\nBulk content",
+            created_at=datetime.utcnow(),
+        )
+        for i in range(3)
+    ]
+
+    # Act & Assert - create
+    created = await repo.create_many(metaspecs)
+    assert created.succeeded_ids == [metaspec.id for metaspec in metaspecs]
+
+    # Act & Assert - update
+    for metaspec in metaspecs:
+        metaspec.increment_version()
+    updated = await repo.update_many(metaspecs)
+    assert not updated.has_failures
+    found = await repo.get_by_id(metaspecs[0].id)
+    assert found.version == 2
+
+    # Act & Assert - delete
+    deleted = await repo.delete_many([metaspec.id for metaspec in metaspecs])
+    assert not deleted.has_failures
+    assert await repo.get_by_id(metaspecs[0].id) is None
+
+
+@pytest.mark.asyncio
+async def test_get_many_metaspecs(mongodb_database: AsyncIOMotorDatabase):
+    """Test: get_many returns found metaspecs keyed by id"""
+    # Arrange
+    repo = MongoMetaspecRepository(mongodb_database)
+    metaspec = Metaspec(
+        id=str(uuid.uuid4()),
+        demand_id="demand_123",
+        type=MetaspecType.TECHNICAL,
+        content="# Technical\n\nBatched lookup",
+        created_at=datetime.utcnow(),
+    )
+    await repo.create(metaspec)
+
+    # Act
+    found = await repo.get_many([metaspec.id, str(uuid.uuid4())])
+
+    # Assert
+    assert list(found) == [metaspec.id]
+    assert found[metaspec.id].type == MetaspecType.TECHNICAL
+
+
+@pytest.mark.asyncio
+async def test_list_metaspecs_keyset_pagination(
+    mongodb_database: AsyncIOMotorDatabase,
+):
+    """Test: list_metaspecs pages by version, highest first"""
+    # Arrange
+    repo = MongoMetaspecRepository(mongodb_database)
+    metaspecs = [
+        Metaspec(
+            id=str(uuid.uuid4()),
+            demand_id="demand_pages",
+            type=MetaspecType.BUSINESS,
+            content=f"# Spec v{version}",
+            version=version,
+            created_at=datetime.utcnow(),
+        )
+        for version in range(1, 6)
+    ]
+    await repo.create_many(metaspecs)
+
+    # Act
+    first = await repo.list_metaspecs("demand_pages", limit=2)
+    rest = await repo.list_metaspecs("demand_pages", after=first.next_cursor)
+
+    # Assert
+    assert [m.version for m in first.items] == [5, 4]
+    assert [m.version for m in rest.items] == [3, 2, 1]
+    assert not rest.has_more
+
+
+@pytest.mark.asyncio
+async def test_summaries_exclude_content(mongodb_database: AsyncIOMotorDatabase):
+    """Test: get_summary / list_metaspec_summaries return no content"""
+    # Arrange
+    repo = MongoMetaspecRepository(mongodb_database)
+    metaspec = Metaspec(
+        id=str(uuid.uuid4()),
+        demand_id="demand_summary",
+        type=MetaspecType.TECHNICAL,
+        content="# Architecture\n\n" + "x" * 10_000,
+        version=2,
+        created_at=datetime.utcnow(),
+    )
+    await repo.create(metaspec)
+
+    # Act
+    summary = await repo.get_summary(metaspec.id)
+    page = await repo.list_metaspec_summaries("demand_summary")
+
+    # Assert
+    assert summary.version == 2
+    assert summary.type == MetaspecType.TECHNICAL
+    assert not hasattr(summary, "content")
+    assert page.items == [summary]
+    assert await repo.get_summary("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_lazy_metaspec_loads_content_on_access(
+    mongodb_database: AsyncIOMotorDatabase,
+):
+    """Test: get_lazy fetches content only when content() is awaited"""
+    # Arrange
+    repo = MongoMetaspecRepository(mongodb_database)
+    metaspec = Metaspec(
+        id=str(uuid.uuid4()),
+        demand_id="demand_lazy",
+        type=MetaspecType.BUSINESS,
+        content="# Business\n\nLazy content",
+        version=1,
+        created_at=datetime.utcnow(),
+    )
+    await repo.create(metaspec)
+
+    # Act
+    lazy = await repo.get_lazy(metaspec.id)
+    loaded_before = lazy.is_loaded
+    content = await lazy.content()
+    entity = await lazy.to_entity()
+
+    # Assert
+    assert loaded_before is False
+    assert lazy.is_loaded is True
+    assert content == metaspec.content
+    assert entity.content == metaspec.content
+    assert entity.version == metaspec.version
+    assert await repo.get_lazy("missing") is None
+
+
+def _make_metaspec(demand_id: str, metaspec_type: MetaspecType, version: int = 1):
+    """Helper: Metaspec whose content names its version"""
+    return Metaspec(
+        id=str(uuid.uuid4()),
+        demand_id=demand_id,
+        type=metaspec_type,
+        content=f"# {metaspec_type.value} v{version}",
+        version=version,
+        created_at=datetime.utcnow(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_update_appends_new_version(mongodb_database: AsyncIOMotorDatabase):
+    """Test: Bumping the version keeps older versions readable"""
+    # Arrange
+    repo = MongoMetaspecRepository(mongodb_database)
+    metaspec = _make_metaspec("demand_versions", MetaspecType.BUSINESS)
+    await repo.create(metaspec)
+
+    # Act
+    for _ in range(2):
+        metaspec.increment_version()
+        metaspec.content = f"# business v{metaspec.version}"
+        await repo.update(metaspec)
+
+    # Assert
+    first = await repo.get_version("demand_versions", MetaspecType.BUSINESS, 1)
+    latest = await repo.get_latest("demand_versions", MetaspecType.BUSINESS)
+    found = await repo.get_by_id(metaspec.id)
+    page = await repo.list_metaspecs("demand_versions")
+    assert first.content == "# business v1"
+    assert latest.version == 3
+    assert found.content == "# business v3"
+    assert [m.version for m in page.items] == [3]
+    assert await mongodb_database["metaspecs"].count_documents({}) == 3
+
+
+@pytest.mark.asyncio
+async def test_patch_content_and_version(mongodb_database: AsyncIOMotorDatabase):
+    """Test: Content patches edit in place; a version patch appends"""
+    # Arrange
+    repo = MongoMetaspecRepository(mongodb_database)
+    metaspec = _make_metaspec("demand_patch", MetaspecType.BUSINESS)
+    await repo.create(metaspec)
+
+    # Act
+    metaspec.content = "# business v1, edited"
+    await repo.patch(metaspec, ["content"])
+    metaspec.increment_version()
+    metaspec.content = "# business v2"
+    await repo.patch(metaspec, ["content", "version", "updated_at"])
+
+    # Assert
+    first = await repo.get_version("demand_patch", MetaspecType.BUSINESS, 1)
+    found = await repo.get_by_id(metaspec.id)
+    assert (first.content, first.revision) == ("# business v1, edited", 2)
+    assert (found.content, found.version, found.revision) == ("# business v2", 2, 2)
+    assert await mongodb_database["metaspecs"].count_documents({}) == 2
+
+
+@pytest.mark.asyncio
+async def test_update_same_version_overwrites(mongodb_database: AsyncIOMotorDatabase):
+    """Test: Updating without a version bump edits the current version"""
+    # Arrange
+    repo = MongoMetaspecRepository(mongodb_database)
+    metaspec = _make_metaspec("demand_versions", MetaspecType.TECHNICAL)
+    await repo.create(metaspec)
+
+    # Act
+    metaspec.content = "# technical v1 (typo fixed)"
+    await repo.update(metaspec)
+
+    # Assert
+    found = await repo.get_by_id(metaspec.id)
+    assert found.content == "# technical v1 (typo fixed)"
+    assert await mongodb_database["metaspecs"].count_documents({}) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_latest_by_type(mongodb_database: AsyncIOMotorDatabase):
+    """Test: get_latest filters by type and returns None when absent"""
+    # Arrange
+    repo = MongoMetaspecRepository(mongodb_database)
+    await repo.create_many(
+        [
+            _make_metaspec("demand_types", MetaspecType.BUSINESS, version=4),
+            _make_metaspec("demand_types", MetaspecType.TECHNICAL, version=2),
+        ]
+    )
+
+    # Act
+    technical = await repo.get_latest("demand_types", MetaspecType.TECHNICAL)
+    missing = await repo.get_latest("demand_types", MetaspecType.ARCHITECTURE)
+
+    # Assert
+    assert technical.type == MetaspecType.TECHNICAL
+    assert technical.version == 2
+    assert missing is None
+    assert await repo.get_version("demand_types", MetaspecType.TECHNICAL, 9) is None
+
+
+@pytest.mark.asyncio
+async def test_latest_cache_invalidated_on_write(
+    mongodb_database: AsyncIOMotorDatabase,
+):
+    """Test: Cached get_latest is served from memory until the next write"""
+    # Arrange
+    repo = MongoMetaspecRepository(mongodb_database)
+    metaspec = _make_metaspec("demand_cache", MetaspecType.BUSINESS)
+    await repo.create(metaspec)
+    await repo.get_latest("demand_cache", MetaspecType.BUSINESS)
+
+    # Act - bypass the repository: cache still answers
+    await mongodb_database["metaspecs"].update_one(
+        {"id": metaspec.id}, {"$set": {"content": "# changed behind the cache"}}
+    )
+    cached = await repo.get_latest("demand_cache", MetaspecType.BUSINESS)
+    metaspec.increment_version()
+    await repo.update(metaspec)
+    fresh = await repo.get_latest("demand_cache", MetaspecType.BUSINESS)
+    await repo.delete(metaspec.id)
+    deleted = await repo.get_latest("demand_cache", MetaspecType.BUSINESS)
+
+    # Assert
+    assert cached.content == "# business v1"
+    assert fresh.version == 2
+    assert deleted is None
+
+
+@pytest.mark.asyncio
+async def test_latest_cache_expires_after_ttl(mongodb_database: AsyncIOMotorDatabase):
+    """Test: Writes of other processes show up once the cached entry expires"""
+    # Arrange
+    now = [0.0]
+    repo = MongoMetaspecRepository(
+        mongodb_database, latest_cache_ttl=5.0, clock=lambda: now[0]
+    )
+    metaspec = _make_metaspec("demand_ttl", MetaspecType.BUSINESS)
+    await repo.create(metaspec)
+    await repo.get_latest("demand_ttl", MetaspecType.BUSINESS)
+
+    # Act - another process changes the document
+    await mongodb_database["metaspecs"].update_one(
+        {"id": metaspec.id}, {"$set": {"content": "# written elsewhere"}}
+    )
+    now[0] = 5.0
+    stale = await repo.get_latest("demand_ttl", MetaspecType.BUSINESS)
+    now[0] = 5.5
+    fresh = await repo.get_latest("demand_ttl", MetaspecType.BUSINESS)
+
+    # Assert
+    assert stale.content == "# business v1"
+    assert fresh.content == "# written elsewhere"
+
+
+@pytest.mark.asyncio
+async def test_update_many_appends_versions(mongodb_database: AsyncIOMotorDatabase):
+    """Test: update_many appends versions and reports unknown ids"""
+    # Arrange
+    repo = MongoMetaspecRepository(mongodb_database)
+    metaspecs = [
+        _make_metaspec("demand_bulk", MetaspecType.BUSINESS),
+        _make_metaspec("demand_bulk", MetaspecType.TECHNICAL),
+    ]
+    await repo.create_many(metaspecs)
+    for metaspec in metaspecs:
+        metaspec.increment_version()
+    unknown = _make_metaspec("demand_bulk", MetaspecType.ARCHITECTURE)
+
+    # Act
+    result = await repo.update_many(metaspecs + [unknown])
+    await repo.delete_many([metaspecs[0].id])
+
+    # Assert
+    assert result.failed_ids == [unknown.id]
+    business = await repo.get_version("demand_bulk", MetaspecType.BUSINESS, 1)
+    technical = await repo.get_many([metaspecs[1].id])
+    assert business is None
+    assert technical[metaspecs[1].id].version == 2
+    assert await mongodb_database["metaspecs"].count_documents({}) == 2
+
+
+async def _race_for_version_2(mongodb_database: AsyncIOMotorDatabase):
+    """Helper: Writer A appends v2 while writer B still sees v1 as latest"""
+    await mongodb_database["metaspecs"].create_index(
+        [("id", 1), ("version", -1)], unique=True
+    )
+    winner = MongoMetaspecRepository(mongodb_database)
+    loser = MongoMetaspecRepository(mongodb_database)
+    metaspec = _make_metaspec("demand_race", MetaspecType.BUSINESS)
+    await winner.create(metaspec)
+    stale = copy.copy(metaspec)
+    stale_versions = await loser._current_versions([metaspec.id])
+
+    async def read_before_winner(metaspec_ids):
+        return dict(stale_versions)
+
+    loser._current_versions = read_before_winner
+    metaspec.increment_version()
+    await winner.update(metaspec)
+    stale.increment_version()
+    return winner, loser, metaspec, stale
+
+
+async def _assert_winner_kept(repo, metaspec):
+    """Helper: v2 of the winner is stored and latest, v1 is demoted"""
+    latest = await repo.get_latest("demand_race", MetaspecType.BUSINESS)
+    found = await repo.get_many([metaspec.id])
+    old = await repo.get_version("demand_race", MetaspecType.BUSINESS, 1)
+    assert latest.version == 2
+    assert found[metaspec.id].revision == metaspec.revision
+    assert old is not None
+
+
+@pytest.mark.asyncio
+async def test_losing_append_keeps_winner_version(
+    mongodb_database: AsyncIOMotorDatabase,
+):
+    """Test: The loser of a same-version append never deletes the winner's"""
+    # Arrange
+    winner, loser, metaspec, stale = await _race_for_version_2(mongodb_database)
+
+    # Act
+    with pytest.raises(RevisionConflictError):
+        await loser.update(stale)
+
+    # Assert
+    await _assert_winner_kept(winner, metaspec)
+
+
+@pytest.mark.asyncio
+async def test_failed_bulk_append_undoes_its_demote(
+    mongodb_database: AsyncIOMotorDatabase,
+):
+    """Test: An append whose insert lost still restores the version it demoted"""
+    # Arrange - another writer inserted v2 but has not demoted v1 yet
+    collection = mongodb_database["metaspecs"]
+    await collection.create_index([("id", 1), ("version", -1)], unique=True)
+    repo = MongoMetaspecRepository(mongodb_database)
+    metaspec = _make_metaspec("demand_race", MetaspecType.BUSINESS)
+    await repo.create(metaspec)
+    theirs = await collection.find_one({"id": metaspec.id}, {"_id": 0})
+    theirs.update(version=2, revision=1, write_token="theirs")
+    await collection.insert_one(dict(theirs))
+    await collection.update_one(
+        {"id": metaspec.id, "version": 2}, {"$set": {"latest": False}}
+    )
+    metaspec.increment_version()
+
+    # Act
+    result = await repo.update_many([metaspec])
+
+    # Assert - v1 is still latest, their v2 is untouched
+    assert result.failed_ids == [metaspec.id]
+    v1 = await collection.find_one({"id": metaspec.id, "version": 1})
+    v2 = await collection.find_one({"id": metaspec.id, "version": 2})
+    assert v1["latest"] is True
+    assert "write_token" not in v1
+    assert v2["write_token"] == "theirs"
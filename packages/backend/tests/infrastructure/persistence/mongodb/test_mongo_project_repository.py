@@ -7,13 +7,16 @@ Database is cleaned before each test (see conftest.py).
 IAD-7: Repository Pattern + MongoDB
 """
 
+import asyncio
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import pytest
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
+from application.exceptions import ProjectNotFoundError
 from domain.entities.project import Project
+from domain.exceptions import ContextBudgetExceededError
 from domain.value_objects.context_budget import ContextBudget
 from infrastructure.persistence.mongodb.mongo_project_repository import (
     MongoProjectRepository,
@@ -197,3 +200,175 @@ async def test_multiple_projects_isolation(mongodb_database: AsyncIOMotorDatabas
     assert found2.name == "Project 2"
     assert found1.owner_id == "user_1"
     assert found2.owner_id == "user_2"
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_update_delete_projects(
+    mongodb_database: AsyncIOMotorDatabase,
+):
+    """Test: create_many / update_many / delete_many round trip"""
+    # Arrange
+    repo = MongoProjectRepository(mongodb_database)
+    projects = [
+        Project(
+            id=str(uuid.uuid4()),
+            name=f"Bulk Project {i}",
+            description="Bulk project",
+            owner_id="user_123",
+            context_budget=ContextBudget(max_tokens=100000, used_tokens=0),
+            created_at=datetime.utcnow(),
+        )
+        for i in range(3)
+    ]
+
+    # Act & Assert - create
+    created = await repo.create_many(projects)
+    assert created.succeeded_ids == [project.id for project in projects]
+
+    # Act & Assert - update
+    for project in projects:
+        project.consume_tokens(1000)
+    updated = await repo.update_many(projects)
+    assert not updated.has_failures
+    found = await repo.get_by_id(projects[0].id)
+    assert found.context_budget.used_tokens == 1000
+
+    # Act & Assert - delete
+    deleted = await repo.delete_many([project.id for project in projects])
+    assert not deleted.has_failures
+    assert await repo.get_by_id(projects[0].id) is None
+
+
+@pytest.mark.asyncio
+async def test_get_many_projects(mongodb_database: AsyncIOMotorDatabase):
+    """Test: get_many returns found projects keyed by id"""
+    # Arrange
+    repo = MongoProjectRepository(mongodb_database)
+    project = Project(
+        id=str(uuid.uuid4()),
+        name="Batched",
+        description="Batched lookup",
+        owner_id="user_123",
+        context_budget=ContextBudget(max_tokens=1000, used_tokens=0),
+        created_at=datetime.utcnow(),
+    )
+    await repo.create(project)
+
+    # Act
+    found = await repo.get_many([project.id, project.id, str(uuid.uuid4())])
+
+    # Assert
+    assert list(found) == [project.id]
+    assert found[project.id].name == "Batched"
+
+
+def _make_project(max_tokens: int = 1000, used_tokens: int = 0) -> Project:
+    """Helper: Build a project with the given budget"""
+    return Project(
+        id=str(uuid.uuid4()),
+        name="Budget Project",
+        description="Token consumption",
+        owner_id="user_123",
+        context_budget=ContextBudget(max_tokens=max_tokens, used_tokens=used_tokens),
+        created_at=datetime.utcnow(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_consume_tokens_atomic_increment(mongodb_database: AsyncIOMotorDatabase):
+    """Test: consume_tokens increments used_tokens server-side"""
+    # Arrange
+    repo = MongoProjectRepository(mongodb_database)
+    project = _make_project(max_tokens=1000, used_tokens=100)
+    await repo.create(project)
+
+    # Act
+    budget = await repo.consume_tokens(project.id, 250)
+
+    # Assert
+    assert budget == ContextBudget(max_tokens=1000, used_tokens=350)
+    found = await repo.get_by_id(project.id)
+    assert found.context_budget.used_tokens == 350
+    assert found.updated_at is not None
+
+
+@pytest.mark.asyncio
+async def test_consume_tokens_exceeded(mongodb_database: AsyncIOMotorDatabase):
+    """Test: consume_tokens raises when the guard fails and writes nothing"""
+    # Arrange
+    repo = MongoProjectRepository(mongodb_database)
+    project = _make_project(max_tokens=1000, used_tokens=900)
+    await repo.create(project)
+
+    # Act & Assert
+    with pytest.raises(ContextBudgetExceededError, match="Only 100 remaining"):
+        await repo.consume_tokens(project.id, 101)
+
+    budget = await repo.consume_tokens(project.id, 100)
+    assert budget.remaining_tokens == 0
+
+
+@pytest.mark.asyncio
+async def test_consume_tokens_concurrent_never_overruns(
+    mongodb_database: AsyncIOMotorDatabase,
+):
+    """Test: Concurrent charges are all counted and never exceed max_tokens"""
+    # Arrange
+    repo = MongoProjectRepository(mongodb_database)
+    project = _make_project(max_tokens=1000)
+    await repo.create(project)
+
+    # Act - 15 x 100 tokens against a 1000 token budget
+    results = await asyncio.gather(
+        *(repo.consume_tokens(project.id, 100) for _ in range(15)),
+        return_exceptions=True,
+    )
+
+    # Assert
+    succeeded = [r for r in results if isinstance(r, ContextBudget)]
+    failed = [r for r in results if isinstance(r, ContextBudgetExceededError)]
+    assert len(succeeded) == 10
+    assert len(failed) == 5
+    found = await repo.get_by_id(project.id)
+    assert found.context_budget.used_tokens == 1000
+
+
+@pytest.mark.asyncio
+async def test_consume_tokens_invalid(mongodb_database: AsyncIOMotorDatabase):
+    """Test: Negative tokens and unknown projects are rejected"""
+    # Arrange
+    repo = MongoProjectRepository(mongodb_database)
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="tokens must be >= 0"):
+        await repo.consume_tokens("any", -1)
+    with pytest.raises(ProjectNotFoundError):
+        await repo.consume_tokens(str(uuid.uuid4()), 1)
+
+
+@pytest.mark.asyncio
+async def test_list_by_owner_keyset_pagination(
+    mongodb_database: AsyncIOMotorDatabase,
+):
+    """Test: list_by_owner pages through the owner's projects, newest first"""
+    # Arrange
+    repo = MongoProjectRepository(mongodb_database)
+    start = datetime.utcnow()
+    projects = []
+    for i in range(5):
+        project = _make_project()
+        project.owner_id = "user_pages"
+        project.created_at = start + timedelta(seconds=i)
+        projects.append(project)
+    await repo.create_many(projects)
+    await repo.create(_make_project())  # other owner
+
+    # Act
+    first = await repo.list_by_owner("user_pages", limit=3)
+    second = await repo.list_by_owner("user_pages", after=first.next_cursor, limit=3)
+
+    # Assert
+    listed = [p.id for p in first.items + second.items]
+    assert listed == [p.id for p in reversed(projects)]
+    assert first.has_more
+    assert not second.has_more
@@ -0,0 +1,444 @@
+"""
+Tests for the SQLite repositories
+
+Each test gets its own database file in tmp_path.
+
+IAD-7: Repository Pattern + MongoDB
+"""
+
+import asyncio
+import dataclasses
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+
+from application.dto.bulk_write_result import (
+    DUPLICATE_ERROR,
+    NOT_FOUND_ERROR,
+)
+from application.exceptions import (
+    DuplicateEntityError,
+    ProjectNotFoundError,
+    RepositoryError,
+)
+from domain.entities.checkpoint import Checkpoint
+from domain.entities.demand import Demand
+from domain.entities.metaspec import Metaspec, MetaspecType
+from domain.entities.project import Project
+from domain.exceptions import ContextBudgetExceededError
+from domain.value_objects.context_budget import ContextBudget
+from domain.value_objects.demand_status import DemandStatus
+from infrastructure.persistence.sqlite import (
+    SQLiteCheckpointRepository,
+    SQLiteDatabase,
+    SQLiteDemandRepository,
+    SQLiteMetaspecRepository,
+    SQLiteProjectRepository,
+)
+
+BASE_TIME = datetime(2025, 1, 1)
+
+
+def _make_project(owner_id: str = "owner_1", minutes: int = 0) -> Project:
+    return Project(
+        id=str(uuid.uuid4()),
+        name="Project",
+        description="Description",
+        owner_id=owner_id,
+        context_budget=ContextBudget(max_tokens=1000, used_tokens=0),
+        created_at=BASE_TIME + timedelta(minutes=minutes),
+    )
+
+
+def _make_demand(
+    project_id: str = "project_1",
+    status: DemandStatus = DemandStatus.DRAFT,
+    minutes: int = 0,
+) -> Demand:
+    return Demand(
+        id=str(uuid.uuid4()),
+        project_id=project_id,
+        title="Demand",
+        description="Description",
+        status=status,
+        created_at=BASE_TIME + timedelta(minutes=minutes),
+    )
+
+
+def _make_metaspec(version: int = 1) -> Metaspec:
+    return Metaspec(
+        id=str(uuid.uuid4()),
+        demand_id="demand_1",
+        type=MetaspecType.BUSINESS,
+        content=f"# Spec v{version}",
+        version=version,
+    )
+
+
+def _make_checkpoint(minutes: int = 0) -> Checkpoint:
+    return Checkpoint(
+        id=str(uuid.uuid4()),
+        demand_id="demand_1",
+        context_snapshot='{"messages": ["' + "hello " * 200 + '"]}',
+        tokens_used=10,
+        created_at=BASE_TIME + timedelta(minutes=minutes),
+    )
+
+
+def _make_copy(entity, **changes):
+    """Copy of an entity with some fields replaced."""
+    copied = dataclasses.replace(entity)
+    for name, value in changes.items():
+        setattr(copied, name, value)
+    return copied
+
+
+@pytest_asyncio.fixture
+async def database(tmp_path):
+    database = SQLiteDatabase(str(tmp_path / "context-first.db"))
+    yield database
+    await database.close()
+
+
+class TestSQLiteDatabase:
+    """Tests for SQLiteDatabase"""
+
+    @pytest.mark.asyncio
+    async def test_uses_wal_journal(self, database):
+        """Test that the database runs in WAL mode"""
+        mode = await database.read(
+            lambda connection: connection.execute("PRAGMA journal_mode").fetchone()
+        )
+
+        assert mode[0] == "wal"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_share_transactions(self, database):
+        """Test that writes queued together are committed in one batch"""
+        repo = SQLiteDemandRepository(database)
+
+        await asyncio.gather(*(repo.create(_make_demand()) for _ in range(50)))
+
+        assert database.committed_writes == 50
+        assert database.committed_batches < 50
+
+    @pytest.mark.asyncio
+    async def test_failed_write_does_not_affect_its_batch(self, database):
+        """Test that a failing write is rolled back alone"""
+        repo = SQLiteProjectRepository(database)
+        existing = _make_project()
+        await repo.create(existing)
+        fresh = _make_project()
+
+        results = await asyncio.gather(
+            repo.create(existing), repo.create(fresh), return_exceptions=True
+        )
+
+        assert isinstance(results[0], DuplicateEntityError)
+        assert await repo.get_by_id(fresh.id) == fresh
+
+    @pytest.mark.asyncio
+    async def test_data_survives_reopen(self, tmp_path):
+        """Test that committed rows are read back after reopening the file"""
+        path = str(tmp_path / "reopen.db")
+        database = SQLiteDatabase(path)
+        project = _make_project()
+        await SQLiteProjectRepository(database).create(project)
+        await database.close()
+
+        reopened = SQLiteDatabase(path)
+        found = await SQLiteProjectRepository(reopened).get_by_id(project.id)
+        await reopened.close()
+
+        assert found == project
+
+    @pytest.mark.asyncio
+    async def test_revision_column_is_added_on_upgrade(self, tmp_path):
+        """Test that opening a version 2 file adds the revision columns"""
+        path = str(tmp_path / "upgrade.db")
+        database = SQLiteDatabase(path)
+        project = _make_project()
+        await SQLiteProjectRepository(database).create(project)
+
+        def downgrade(connection):
+            connection.execute("ALTER TABLE projects DROP COLUMN revision")
+            connection.execute("PRAGMA user_version=2")
+
+        await database.write(downgrade)
+        await database.close()
+
+        reopened = SQLiteDatabase(path)
+        repo = SQLiteProjectRepository(reopened)
+        found = await repo.get_by_id(project.id)
+        migrated_revision = found.revision
+        await repo.update(found)
+        updated = await repo.get_by_id(project.id)
+        await reopened.close()
+
+        assert migrated_revision == 0
+        assert updated.revision == 1
+
+    def test_invalid_batch_size_raises(self, tmp_path):
+        """Test that max_batch_size must be positive"""
+        with pytest.raises(ValueError):
+            SQLiteDatabase(str(tmp_path / "invalid.db"), max_batch_size=0)
+
+
+class TestSQLiteProjectRepository:
+    """Tests for SQLiteProjectRepository"""
+
+    @pytest.mark.asyncio
+    async def test_crud_roundtrip(self, database):
+        """Test create, read, update and delete of a project"""
+        repo = SQLiteProjectRepository(database)
+        project = _make_project()
+
+        await repo.create(project)
+        created = await repo.get_by_id(project.id)
+        project.name = "Renamed"
+        await repo.update(project)
+        renamed = await repo.get_by_id(project.id)
+        await repo.delete(project.id)
+
+        assert created == _make_copy(project, name="Project", revision=0)
+        assert renamed.name == "Renamed"
+        assert await repo.get_by_id(project.id) is None
+
+    @pytest.mark.asyncio
+    async def test_create_duplicate_raises(self, database):
+        """Test that creating an existing id raises DuplicateEntityError"""
+        repo = SQLiteProjectRepository(database)
+        project = _make_project()
+        await repo.create(project)
+
+        with pytest.raises(DuplicateEntityError):
+            await repo.create(project)
+
+    @pytest.mark.asyncio
+    async def test_list_by_owner_pages_newest_first(self, database):
+        """Test that keyset pages follow created_at descending"""
+        repo = SQLiteProjectRepository(database)
+        projects = [_make_project(minutes=minute) for minute in range(5)]
+        await repo.create_many(projects)
+        await repo.create(_make_project(owner_id="someone_else"))
+
+        first = await repo.list_by_owner("owner_1", limit=3)
+        second = await repo.list_by_owner("owner_1", after=first.next_cursor, limit=3)
+
+        expected = [project.id for project in reversed(projects)]
+        assert [project.id for project in first.items] == expected[:3]
+        assert [project.id for project in second.items] == expected[3:]
+        assert second.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_list_uses_owner_index(self, database):
+        """Test that the listing query is served by projects_owner"""
+        plan = await database.read(
+            lambda connection: connection.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM projects WHERE owner_id = ? "
+                "AND (created_at, id) < (?, ?) ORDER BY created_at DESC, id DESC",
+                ("owner_1", "2025", "id"),
+            ).fetchall()
+        )
+
+        details = " ".join(row["detail"] for row in plan)
+        assert "projects_owner" in details
+        assert "TEMP B-TREE" not in details
+
+    @pytest.mark.asyncio
+    async def test_bulk_results_report_per_item_errors(self, database):
+        """Test that bulk writes report duplicates and unknown ids per item"""
+        repo = SQLiteProjectRepository(database)
+        project = _make_project()
+
+        created = await repo.create_many([project, project])
+        updated = await repo.update_many([project, _make_project()])
+        deleted = await repo.delete_many([project.id, "missing"])
+        found = await repo.get_many([project.id])
+
+        assert created.succeeded_ids == [project.id]
+        assert created.items[1].error == DUPLICATE_ERROR
+        assert updated.items[1].error == NOT_FOUND_ERROR
+        assert not deleted.has_failures
+        assert found == {}
+
+    @pytest.mark.asyncio
+    async def test_consume_tokens(self, database):
+        """Test that consume_tokens charges the budget and enforces its limit"""
+        repo = SQLiteProjectRepository(database)
+        project = _make_project()
+        await repo.create(project)
+
+        budgets = await asyncio.gather(
+            *(repo.consume_tokens(project.id, 100) for _ in range(6))
+        )
+
+        assert max(budget.used_tokens for budget in budgets) == 600
+        with pytest.raises(ContextBudgetExceededError):
+            await repo.consume_tokens(project.id, 500)
+        with pytest.raises(ProjectNotFoundError):
+            await repo.consume_tokens("missing", 1)
+        with pytest.raises(ValueError):
+            await repo.consume_tokens(project.id, -1)
+
+
+class TestSQLiteDemandRepository:
+    """Tests for SQLiteDemandRepository"""
+
+    @pytest.mark.asyncio
+    async def test_list_by_project_filters_by_status(self, database):
+        """Test that status listings follow updates"""
+        repo = SQLiteDemandRepository(database)
+        draft = _make_demand(minutes=1)
+        approved = _make_demand(status=DemandStatus.SPEC_APPROVED, minutes=2)
+        await repo.create_many([draft, approved, _make_demand(project_id="other")])
+
+        draft.transition_to(DemandStatus.SPEC_APPROVED)
+        await repo.update(draft)
+
+        drafts = await repo.list_by_project("project_1", status=DemandStatus.DRAFT)
+        listed = await repo.list_by_project(
+            "project_1", status=DemandStatus.SPEC_APPROVED
+        )
+
+        assert drafts.items == []
+        assert [demand.id for demand in listed.items] == [approved.id, draft.id]
+
+    @pytest.mark.asyncio
+    async def test_rollup_is_backfilled_on_upgrade(self, tmp_path):
+        """Test that opening a version 1 file fills the status rollup"""
+        path = str(tmp_path / "upgrade.db")
+        database = SQLiteDatabase(path)
+        await SQLiteDemandRepository(database).create_many(
+            [_make_demand(), _make_demand(status=DemandStatus.PR_MERGED)]
+        )
+
+        def downgrade(connection):
+            connection.execute("DELETE FROM demand_status_rollups")
+            connection.execute("PRAGMA user_version=1")
+
+        await database.write(downgrade)
+        await database.close()
+
+        reopened = SQLiteDatabase(path)
+        rollup = await SQLiteDemandRepository(reopened).get_status_rollup("project_1")
+        await reopened.close()
+
+        assert rollup[DemandStatus.DRAFT] == 1
+        assert rollup[DemandStatus.PR_MERGED] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_raises(self, database):
+        """Test that a malformed cursor is rejected"""
+        repo = SQLiteDemandRepository(database)
+
+        with pytest.raises(ValueError):
+            await repo.list_by_project("project_1", after="not-a-cursor")
+
+
+class TestSQLiteMetaspecRepository:
+    """Tests for SQLiteMetaspecRepository"""
+
+    @pytest.mark.asyncio
+    async def test_versions_are_append_only(self, database):
+        """Test that a higher version is appended and old ones stay readable"""
+        repo = SQLiteMetaspecRepository(database)
+        metaspec = _make_metaspec()
+        await repo.create(metaspec)
+
+        metaspec.content = "# Spec v2"
+        metaspec.increment_version()
+        await repo.update(metaspec)
+
+        latest = await repo.get_latest("demand_1", MetaspecType.BUSINESS)
+        first = await repo.get_version("demand_1", MetaspecType.BUSINESS, 1)
+        listed = await repo.list_metaspec_summaries("demand_1")
+
+        assert (await repo.get_by_id(metaspec.id)).version == 2
+        assert latest.content == "# Spec v2"
+        assert first.content == "# Spec v1"
+        assert [item.version for item in listed.items] == [2]
+
+    @pytest.mark.asyncio
+    async def test_older_version_rewrites_history_only(self, database):
+        """Test that updating an older version keeps the latest unchanged"""
+        repo = SQLiteMetaspecRepository(database)
+        metaspec = _make_metaspec(version=2)
+        await repo.create(metaspec)
+
+        older = _make_copy(metaspec, version=1, content="# Backfilled v1")
+        result = await repo.update_many([older, _make_metaspec()])
+
+        assert result.items[1].error == NOT_FOUND_ERROR
+        assert (await repo.get_by_id(metaspec.id)).version == 2
+        backfilled = await repo.get_version("demand_1", MetaspecType.BUSINESS, 1)
+        assert backfilled.content == "# Backfilled v1"
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_all_versions(self, database):
+        """Test that delete drops every version and breaks lazy reads"""
+        repo = SQLiteMetaspecRepository(database)
+        metaspec = _make_metaspec()
+        await repo.create(metaspec)
+        metaspec.increment_version()
+        await repo.update(metaspec)
+        lazy = await repo.get_lazy(metaspec.id)
+
+        await repo.delete(metaspec.id)
+
+        assert await repo.get_version("demand_1", MetaspecType.BUSINESS, 1) is None
+        with pytest.raises(RepositoryError):
+            await lazy.content()
+
+
+class TestSQLiteCheckpointRepository:
+    """Tests for SQLiteCheckpointRepository"""
+
+    @pytest.mark.asyncio
+    async def test_snapshots_are_stored_compressed(self, database):
+        """Test that the snapshot is a compressed BLOB and reads back intact"""
+        stats = []
+        repo = SQLiteCheckpointRepository(database, on_codec_stats=stats.append)
+        checkpoint = _make_checkpoint()
+
+        await repo.create(checkpoint)
+        stored = await database.read(
+            lambda connection: connection.execute(
+                "SELECT snapshot, snapshot_codec FROM checkpoints"
+            ).fetchone()
+        )
+
+        assert stored["snapshot_codec"] == "zlib"
+        assert len(stored["snapshot"]) < len(checkpoint.context_snapshot)
+        assert await repo.get_by_id(checkpoint.id) == checkpoint
+        assert [stat.operation for stat in stats] == ["encode", "decode"]
+
+    @pytest.mark.asyncio
+    async def test_uncompressed_rows_stay_readable(self, database):
+        """Test that rows written without codec are read by any repository"""
+        checkpoint = _make_checkpoint()
+        await SQLiteCheckpointRepository(database, codec=None).create(checkpoint)
+
+        found = await SQLiteCheckpointRepository(database).get_by_id(checkpoint.id)
+
+        assert found.context_snapshot == checkpoint.context_snapshot
+
+    @pytest.mark.asyncio
+    async def test_summaries_skip_snapshot(self, database):
+        """Test that summary pages and lazy reads work without the BLOB"""
+        repo = SQLiteCheckpointRepository(database)
+        checkpoints = [_make_checkpoint(minutes=minute) for minute in range(3)]
+        await repo.create_many(checkpoints)
+
+        page = await repo.list_checkpoint_summaries("demand_1", limit=2)
+        rest = await repo.list_checkpoints("demand_1", after=page.next_cursor)
+        lazy = await repo.get_lazy(checkpoints[0].id)
+
+        assert [item.id for item in page.items] == [
+            checkpoints[2].id,
+            checkpoints[1].id,
+        ]
+        assert rest.items == [checkpoints[0]]
+        assert await lazy.to_entity() == checkpoints[0]
@@ -0,0 +1,55 @@
+"""
+Tests for Checkpoint Snapshot Codecs
+"""
+
+import json
+
+import pytest
+
+from infrastructure.persistence.snapshot_codecs import (
+    available_codecs,
+    decode_snapshot,
+    encode_snapshot,
+    get_codec,
+)
+
+
+class TestSnapshotCodecs:
+    """Test suite for snapshot codecs"""
+
+    @pytest.fixture
+    def snapshot(self):
+        """Fixture: Large, repetitive conversation snapshot"""
+        messages = [
+            {"role": "user", "content": f"Please refine the spec, step {i}"}
+            for i in range(200)
+        ]
+        return json.dumps({"messages": messages, "state": "active"})
+
+    def test_zlib_always_available(self):
+        """Test that zlib (stdlib) is always available"""
+        assert "zlib" in available_codecs()
+
+    @pytest.mark.parametrize("name", ["zlib", "zstd", "lz4"])
+    def test_round_trip(self, name, snapshot):
+        """Test that encode/decode returns the original snapshot"""
+        if name not in available_codecs():
+            pytest.skip(f"{name} codec not installed")
+        codec = get_codec(name)
+
+        encoded, encode_stats = encode_snapshot(codec, "checkpoint-1", snapshot)
+        decoded, decode_stats = decode_snapshot(codec, "checkpoint-1", encoded)
+
+        assert decoded == snapshot
+        assert encode_stats.codec == name
+        assert encode_stats.operation == "encode"
+        assert decode_stats.operation == "decode"
+        assert encode_stats.raw_size == len(snapshot.encode("utf-8"))
+        assert encode_stats.encoded_size == len(encoded)
+        assert encode_stats.ratio > 5
+        assert encode_stats.seconds >= 0
+
+    def test_unknown_codec(self):
+        """Test that unknown codec raises ValueError"""
+        with pytest.raises(ValueError, match="Unknown snapshot codec"):
+            get_codec("brotli")
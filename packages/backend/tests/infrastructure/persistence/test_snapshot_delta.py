@@ -0,0 +1,47 @@
+"""
+Tests for Checkpoint Snapshot Deltas
+"""
+
+import json
+
+import pytest
+
+from infrastructure.persistence.snapshot_delta import (
+    apply_snapshot_delta,
+    diff_snapshot,
+)
+
+
+class TestSnapshotDelta:
+    """Test suite for diff_snapshot / apply_snapshot_delta"""
+
+    @pytest.mark.parametrize(
+        "base,target",
+        [
+            ('{"m": [1]}', '{"m": [1, 2]}'),
+            ('{"m": [1, 2]}', '{"m": [1]}'),
+            ('{"state": "a", "m": [1]}', '{"state": "b", "m": [1, 2]}'),
+            ("", '{"m": []}'),
+            ('{"m": []}', '{"m": []}'),
+            ("aaaa", "aa"),
+            ('{"text": "ção 🚀"}', '{"text": "ção 🚀🚀"}'),
+        ],
+    )
+    def test_round_trip(self, base, target):
+        """Test that applying the delta rebuilds the target exactly"""
+        delta = diff_snapshot(base, target)
+        assert apply_snapshot_delta(base, delta) == target
+
+    def test_appended_turn_produces_small_delta(self):
+        """Test that appending a turn stores only the new turn"""
+        messages = [{"role": "user", "content": f"turn {i}"} for i in range(500)]
+        base = json.dumps({"messages": messages})
+        target = json.dumps(
+            {"messages": messages + [{"role": "assistant", "content": "new"}]}
+        )
+
+        delta = diff_snapshot(base, target)
+
+        assert len(delta) < 100
+        assert "new" in json.loads(delta)["i"]
+        assert apply_snapshot_delta(base, delta) == target
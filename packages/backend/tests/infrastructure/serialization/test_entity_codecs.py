@@ -0,0 +1,253 @@
+"""
+Tests for the compiled entity codecs
+
+BSON documents, JSON payloads and snapshot helpers, plus the stdlib JSON
+fallback (module loaded again with orjson and msgspec hidden).
+"""
+
+import importlib.util
+import sys
+from datetime import datetime
+
+import pytest
+
+from domain.entities.checkpoint import Checkpoint
+from domain.entities.demand import Demand
+from domain.entities.metaspec import Metaspec, MetaspecType
+from domain.entities.project import Project
+from domain.exceptions import InvalidMetaspecError
+from domain.value_objects.context_budget import ContextBudget
+from domain.value_objects.demand_status import DemandStatus
+from infrastructure.serialization import entity_codecs
+from infrastructure.serialization.entity_codecs import (
+    CHECKPOINT_CODEC,
+    DEMAND_CODEC,
+    METASPEC_CODEC,
+    PROJECT_CODEC,
+    codec_for,
+    dumps_json,
+    dumps_snapshot,
+    loads_json,
+    loads_snapshot,
+)
+
+CREATED_AT = datetime(2025, 1, 1, 12, 30, 0)
+
+
+def _project() -> Project:
+    return Project(
+        id="proj-1",
+        name="Project",
+        description="Description",
+        owner_id="user-1",
+        context_budget=ContextBudget(max_tokens=1000, used_tokens=100),
+        created_at=CREATED_AT,
+    )
+
+
+def _demand(**changes) -> Demand:
+    values = dict(
+        id="demand-1",
+        project_id="proj-1",
+        title="Feature",
+        description="Details",
+        status=DemandStatus.SPEC_APPROVED,
+        created_at=CREATED_AT,
+    )
+    values.update(changes)
+    return Demand(**values)
+
+
+def _metaspec() -> Metaspec:
+    return Metaspec(
+        id="meta-1",
+        demand_id="demand-1",
+        type=MetaspecType.TECHNICAL,
+        content="# Spec\n\nçã 😀",
+        version=2,
+        created_at=CREATED_AT,
+        updated_at=CREATED_AT,
+    )
+
+
+def _checkpoint() -> Checkpoint:
+    return Checkpoint(
+        id="ckpt-1",
+        demand_id="demand-1",
+        context_snapshot='{"messages": []}',
+        tokens_used=5,
+        created_at=CREATED_AT,
+    )
+
+
+class TestDocuments:
+    """Test suite for BSON document encoding"""
+
+    def test_project_document_layout(self):
+        """Test field renames, nested value object and omitted None"""
+        document = PROJECT_CODEC.to_document(_project())
+
+        assert document == {
+            "id": "proj-1",
+            "name": "Project",
+            "description": "Description",
+            "user_id": "user-1",
+            "context_budget": {"max_tokens": 1000, "used_tokens": 100},
+            "created_at": CREATED_AT,
+            "revision": 0,
+        }
+
+    def test_documents_without_revision_decode_as_zero(self):
+        """Test documents written before revisions existed"""
+        document = PROJECT_CODEC.to_document(_project())
+        del document["revision"]
+
+        assert PROJECT_CODEC.from_document(document).revision == 0
+
+    def test_demand_enum_and_optional_budget(self):
+        """Test enums are stored by value and a None budget is omitted"""
+        document = DEMAND_CODEC.to_document(_demand())
+
+        assert document["status"] == "spec_approved"
+        assert "context_budget" not in document
+        assert "updated_at" not in document
+
+    @pytest.mark.parametrize(
+        "codec, entity",
+        [
+            (PROJECT_CODEC, _project()),
+            (DEMAND_CODEC, _demand()),
+            (
+                DEMAND_CODEC,
+                _demand(context_budget=ContextBudget(max_tokens=10, used_tokens=1)),
+            ),
+            (METASPEC_CODEC, _metaspec()),
+        ],
+    )
+    def test_round_trip(self, codec, entity):
+        """Test from_document(to_document(entity)) == entity"""
+        assert codec.from_document(codec.to_document(entity)) == entity
+
+    def test_checkpoint_snapshot_is_left_to_the_repository(self):
+        """Test context_snapshot is not stored and is passed back explicitly"""
+        checkpoint = _checkpoint()
+        document = CHECKPOINT_CODEC.to_document(checkpoint)
+
+        assert "context_snapshot" not in document
+        restored = CHECKPOINT_CODEC.from_document(
+            document, context_snapshot=checkpoint.context_snapshot
+        )
+        assert restored == checkpoint
+
+    def test_from_document_is_trusted(self):
+        """Test stored documents are not revalidated"""
+        document = METASPEC_CODEC.to_document(_metaspec())
+        document["content"] = ""
+
+        assert METASPEC_CODEC.from_document(document).content == ""
+
+
+class TestUpdates:
+    """Test suite for partial MongoDB updates"""
+
+    def test_to_update_sets_only_named_fields(self):
+        """Test document keys, encoded values and $unset for None"""
+        update = PROJECT_CODEC.to_update(_project(), ["owner_id", "updated_at"])
+
+        assert update == {"$set": {"user_id": "user-1"}, "$unset": {"updated_at": ""}}
+
+    def test_to_update_encodes_nested_and_enum_values(self):
+        """Test status by value and budget as a nested document"""
+        demand = _demand(context_budget=ContextBudget(max_tokens=10, used_tokens=1))
+
+        update = DEMAND_CODEC.to_update(demand, ["status", "context_budget"])
+
+        assert update == {
+            "$set": {
+                "status": "spec_approved",
+                "context_budget": {"max_tokens": 10, "used_tokens": 1},
+            }
+        }
+
+    @pytest.mark.parametrize("name", ["context_snapshot", "unknown"])
+    def test_to_update_rejects_unstored_fields(self, name):
+        """Test fields the codec does not store are refused"""
+        with pytest.raises(ValueError):
+            CHECKPOINT_CODEC.to_update(_checkpoint(), [name])
+
+
+class TestJson:
+    """Test suite for JSON payloads"""
+
+    def test_payload_uses_attribute_names(self):
+        """Test API payloads expose owner_id, ISO datetimes and nulls"""
+        payload = loads_json(PROJECT_CODEC.to_json(_project()))
+
+        assert payload["owner_id"] == "user-1"
+        assert payload["created_at"] == "2025-01-01T12:30:00"
+        assert payload["updated_at"] is None
+        assert payload["context_budget"] == {"max_tokens": 1000, "used_tokens": 100}
+
+    @pytest.mark.parametrize(
+        "entity", [_project(), _demand(), _metaspec(), _checkpoint()]
+    )
+    def test_round_trip(self, entity):
+        """Test from_json(to_json(entity)) == entity"""
+        codec = codec_for(type(entity))
+        assert codec.from_json(codec.to_json(entity)) == entity
+
+    def test_from_json_validates(self):
+        """Test client payloads go through the validating constructor"""
+        payload = METASPEC_CODEC.to_payload(_metaspec())
+        payload["content"] = ""
+
+        with pytest.raises(InvalidMetaspecError):
+            METASPEC_CODEC.from_json(dumps_json(payload))
+
+    def test_from_json_applies_defaults(self):
+        """Test absent optional keys keep the entity defaults"""
+        demand = DEMAND_CODEC.from_json(
+            b'{"id": "d", "project_id": "p", "title": "t", "description": ""}'
+        )
+
+        assert demand.status == DemandStatus.DRAFT
+        assert isinstance(demand.created_at, datetime)
+
+    def test_dumps_json_encodes_nested_entities(self):
+        """Test entities inside containers use their codec"""
+        body = loads_json(dumps_json({"items": [_project()], "count": 1}))
+
+        assert body["items"][0]["owner_id"] == "user-1"
+        assert body["count"] == 1
+
+    def test_snapshot_helpers_round_trip(self):
+        """Test snapshot text survives dumps/loads, including non-ASCII"""
+        snapshot = {"messages": [{"role": "user", "content": "olá 😀"}]}
+
+        assert loads_snapshot(dumps_snapshot(snapshot)) == snapshot
+
+
+class TestStdlibFallback:
+    """Test suite for the stdlib JSON backend"""
+
+    @pytest.fixture
+    def stdlib_codecs(self, monkeypatch):
+        """Fixture: Fresh copy of the module with fast backends hidden"""
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        monkeypatch.setitem(sys.modules, "msgspec", None)
+        spec = importlib.util.spec_from_file_location(
+            "entity_codecs_stdlib", entity_codecs.__file__
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    def test_same_output_as_fast_backend(self, stdlib_codecs):
+        """Test the fallback produces equivalent JSON"""
+        assert stdlib_codecs.JSON_BACKEND == "json"
+        for entity in (_project(), _demand(), _metaspec(), _checkpoint()):
+            codec = stdlib_codecs.codec_for(type(entity))
+            data = codec.to_json(entity)
+            assert isinstance(data, bytes)
+            assert loads_json(data) == loads_json(dumps_json(entity))
+            assert codec.from_json(data) == entity
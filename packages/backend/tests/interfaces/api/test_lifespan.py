@@ -0,0 +1,40 @@
+"""
+Tests for the application lifespan and dependency wiring
+
+The lifespan context is entered directly; the Motor client connects
+lazily, so no server is needed.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from infrastructure.persistence.mongodb import MongoProjectRepository
+from interfaces.api.dependencies import get_pool_stats, get_project_repository
+from main import app, pool_health
+
+
+class TestLifespan:
+    """Test suite for the FastAPI lifespan"""
+
+    @pytest.mark.asyncio
+    async def test_one_client_and_shared_repositories(self):
+        """Test that the lifespan builds one client and repositories once"""
+        async with app.router.lifespan_context(app):
+            request = SimpleNamespace(app=app)
+            first = get_project_repository(request)
+            second = get_project_repository(request)
+
+            assert isinstance(first, MongoProjectRepository)
+            assert first is second
+            assert app.state.mongo_client is not None
+
+    @pytest.mark.asyncio
+    async def test_pool_stats_endpoint(self):
+        """Test that /health/pool reports the pool gauges"""
+        async with app.router.lifespan_context(app):
+            stats = get_pool_stats(SimpleNamespace(app=app))
+            body = await pool_health(stats)
+
+        assert set(body) >= {"checked_out", "waiters", "wait_time_avg_ms"}
+        assert body["checked_out"] == 0
@@ -0,0 +1,71 @@
+"""
+Tests for the default JSON response class
+"""
+
+from datetime import datetime
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from domain.entities.project import Project
+from domain.value_objects.context_budget import ContextBudget
+from infrastructure.serialization.entity_codecs import dumps_json, loads_json
+from interfaces.api import responses
+from interfaces.api.responses import CodecJSONResponse
+from main import app
+
+
+def _project() -> Project:
+    return Project(
+        id="proj-1",
+        name="Project",
+        description="",
+        owner_id="user-1",
+        context_budget=ContextBudget(max_tokens=10, used_tokens=0),
+        created_at=datetime(2025, 1, 1),
+    )
+
+
+class TestCodecJSONResponse:
+    """Test suite for CodecJSONResponse"""
+
+    def test_is_the_app_default(self):
+        """Test the app renders responses with CodecJSONResponse"""
+        assert app.router.default_response_class is CodecJSONResponse
+
+    def test_renders_entities(self):
+        """Test entities and datetimes render through the codecs"""
+        project = _project()
+        response = CodecJSONResponse({"project": project})
+
+        body = loads_json(response.body)
+        assert response.media_type == "application/json"
+        assert body["project"]["owner_id"] == "user-1"
+        assert body["project"]["created_at"] == "2025-01-01T00:00:00"
+
+    def test_explicit_response_skips_jsonable_encoder(self, monkeypatch):
+        """Test only routes returning CodecJSONResponse hand entities to the codec"""
+        rendered = []
+
+        def spy(content):
+            rendered.append(content)
+            return dumps_json(content)
+
+        monkeypatch.setattr(responses, "dumps_json", spy)
+        api = FastAPI(default_response_class=CodecJSONResponse)
+
+        @api.get("/explicit")
+        async def explicit():
+            return CodecJSONResponse(_project())
+
+        @api.get("/implicit")
+        async def implicit():
+            return _project()
+
+        client = TestClient(api)
+        explicit_body = client.get("/explicit").content
+        client.get("/implicit")
+
+        assert isinstance(rendered[0], Project)
+        assert explicit_body == dumps_json(_project())
+        assert isinstance(rendered[1], dict)  # already run through jsonable_encoder